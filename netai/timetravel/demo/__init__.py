@@ -1 +1,7 @@
-from .extension import *
\ No newline at end of file
+try:
+    import omni.ext  # noqa: F401
+except ImportError:
+    # Kit 밖(벤치마크, 테스트 스크립트)에서는 확장 없이 데이터 모듈만 사용
+    pass
+else:
+    from .extension import *
@@ -0,0 +1,4 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmarks for the Time Travel data path (run with plain CPython, no Kit needed)
+"""
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+"""
+Vectorized query_batch vs. a Python loop over get_interpolated_at_time
+
+    python -m netai.timetravel.demo.benchmarks.bench_batch_query --days 7 --sensors 30 --times 10000
+"""
+import argparse
+import datetime
+import json
+import time
+
+import numpy as np
+
+from ..developing.data_model import BATCH_MODES, CHANNELS
+from .bench_keyframe import NS, START_S, build_cache
+
+
+def run(args) -> dict:
+    cache = build_cache(args.days, args.sensors, args.interval)
+    sensor_ids = cache.get_sensor_ids()
+    rng = np.random.default_rng(0)
+    times_ns = np.sort(START_S * NS + rng.integers(0, args.days * 86400 * NS, args.times)).astype(np.int64)
+
+    # 기존 방식: 시점 x 센서마다 Python 호출
+    loop_count = min(args.times, args.loop_times)
+    loop_times = [datetime.datetime.fromtimestamp(int(t) / NS) for t in times_ns[:loop_count]]
+    t0 = time.perf_counter()
+    out = np.empty((loop_count, len(sensor_ids), len(CHANNELS)), dtype=np.float32)
+    for i, t in enumerate(loop_times):
+        for s, objid in enumerate(sensor_ids):
+            values = cache.get_sensor_data(objid).get_interpolated_at_time(t)
+            out[i, s] = [values[name] for name in CHANNELS]
+    loop_seconds = time.perf_counter() - t0
+
+    results = {
+        'settings': vars(args),
+        'points': args.times * len(sensor_ids),
+        'python_loop': {
+            'times': loop_count,
+            'seconds': loop_seconds,
+            'us_per_point': loop_seconds / (loop_count * len(sensor_ids)) * 1e6,
+            'projected_seconds': loop_seconds * args.times / loop_count,
+        },
+    }
+    for mode in BATCH_MODES:
+        t0 = time.perf_counter()
+        batch = cache.query_batch(times_ns, sensor_ids, mode)
+        seconds = time.perf_counter() - t0
+        results[f'batch_{mode}'] = {
+            'seconds': seconds,
+            'us_per_point': seconds / batch[..., 0].size * 1e6,
+            'speedup': results['python_loop']['projected_seconds'] / seconds,
+        }
+        if mode == 'linear':
+            results['max_abs_diff_vs_loop'] = float(np.nanmax(np.abs(batch[:loop_count] - out)))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--days", type=int, default=7)
+    parser.add_argument("--sensors", type=int, default=30)
+    parser.add_argument("--interval", type=int, default=60, help="seconds between readings per sensor")
+    parser.add_argument("--times", type=int, default=10000, help="timestamps per batch")
+    parser.add_argument("--loop-times", type=int, default=2000, help="timestamps timed with the Python loop")
+    args = parser.parse_args()
+
+    print(json.dumps(run(args), indent=2, default=str))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+"""
+Keyframe + delta store vs. per-second LKV precompute vs. per-sensor binary search
+
+    python -m netai.timetravel.demo.benchmarks.bench_keyframe --days 1 7 31 --sensors 30
+
+The per-second baseline mirrors the dense LKV timeline the CSV TimeController used to
+precompute (one dict of sensor -> entry per second). It is only built up to --dense-max-days;
+beyond that its memory is extrapolated from the per-second size.
+"""
+import argparse
+import datetime
+import json
+import statistics
+import sys
+import time
+
+import numpy as np
+
+from ..developing.data_model import SensorDataCache
+from ..developing.keyframe_store import KeyframeDeltaStore
+
+NS = 1_000_000_000
+START_S = 1_747_958_400  # 2025-05-23T00:00:00Z
+
+
+def build_cache(days: int, sensors: int, interval_s: int) -> SensorDataCache:
+    """Per-sensor readings with a random phase, as reported by the FMS gateways"""
+    rng = np.random.default_rng(0)
+    steps = days * 86400 // interval_s
+    cache = SensorDataCache()
+    for objid in range(20, 20 + sensors):
+        sensor = cache.get_sensor_data(objid)
+        phase = int(rng.integers(0, interval_s))
+        sensor.timestamps = (START_S + phase + np.arange(steps, dtype=np.int64) * interval_s) * NS
+        # 0.1도 단위로 기록되는 값 - 같은 값이 이어지는 구간이 생김
+        sensor.temp_cold = np.round(21.0 + np.cumsum(rng.normal(0, 0.02, steps)), 1).astype(np.float32)
+        sensor.temp_hot = np.round(23.0 + np.cumsum(rng.normal(0, 0.02, steps)), 1).astype(np.float32)
+        sensor.humidity_cold = np.round(40.0 + np.cumsum(rng.normal(0, 0.05, steps)), 1).astype(np.float32)
+        sensor.humidity_hot = np.round(35.0 + np.cumsum(rng.normal(0, 0.05, steps)), 1).astype(np.float32)
+        sensor.size = sensor.capacity = steps
+    return cache
+
+
+def _latency(fn, targets) -> dict:
+    samples = []
+    for t in targets:
+        t0 = time.perf_counter()
+        fn(int(t))
+        samples.append(time.perf_counter() - t0)
+    samples.sort()
+    return {
+        'median_us': statistics.median(samples) * 1e6,
+        'p99_us': samples[max(0, int(len(samples) * 0.99) - 1)] * 1e6,
+    }
+
+
+def _binary_search_state(cache: SensorDataCache, sensor_ids):
+    sensors = [cache.find_sensor_data(objid) for objid in sensor_ids]
+
+    def lookup(t_ns: int):
+        state = {}
+        for sensor in sensors:
+            idx = int(np.searchsorted(sensor.timestamps[:sensor.size], t_ns, side='right')) - 1
+            if idx >= 0:
+                state[sensor.sensor_id] = idx
+        return state
+    return lookup
+
+
+def _dense_timeline(cache: SensorDataCache, sensor_ids, days: int):
+    """Second-keyed LKV dict copies, as the CSV controller precomputes them"""
+    events = {}
+    for objid in sensor_ids:
+        sensor = cache.find_sensor_data(objid)
+        for i, ts in enumerate(sensor.timestamps[:sensor.size] // NS):
+            events.setdefault(int(ts), []).append((objid, {'TEMPERATURE1': float(sensor.temp_cold[i])}))
+
+    t0 = time.perf_counter()
+    timeline = {}
+    lkv = {}
+    for second in range(START_S, START_S + days * 86400):
+        for objid, entry in events.get(second, ()):
+            lkv[objid] = entry
+        key = datetime.datetime.fromtimestamp(second, datetime.timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        timeline[key] = lkv.copy()
+    build_seconds = time.perf_counter() - t0
+    nbytes = sum(sys.getsizeof(k) + sys.getsizeof(v) for k, v in timeline.items()) + sys.getsizeof(timeline)
+    return timeline, build_seconds, nbytes
+
+
+def run_dataset(days: int, args) -> dict:
+    cache = build_cache(days, args.sensors, args.interval)
+    sensor_ids = cache.get_sensor_ids()
+    rng = np.random.default_rng(1)
+    seeks = (START_S + rng.uniform(0, days * 86400, args.seeks)) * NS
+    frames = (START_S + np.arange(args.frames) * args.frame_s) * NS
+
+    store = KeyframeDeltaStore.from_cache(cache, args.keyframe_every, args.keyframe_every_s)
+    result = {
+        'raw_mb': cache.nbytes() / 1024 / 1024,
+        'keyframe_store': dict(store.get_stats(), mb=store.nbytes() / 1024 / 1024),
+        'keyframe_seek': _latency(store.seek, seeks),
+        'keyframe_sequential': _latency(store.advance, frames),
+        'binary_search_seek': _latency(_binary_search_state(cache, sensor_ids), seeks),
+    }
+
+    if days <= args.dense_max_days:
+        timeline, build_seconds, nbytes = _dense_timeline(cache, sensor_ids, days)
+
+        def dense_lookup(t_ns: int):
+            key = datetime.datetime.fromtimestamp(t_ns // NS, datetime.timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+            return timeline.get(key)
+
+        result['dense_timeline'] = {
+            'build_seconds': build_seconds,
+            'mb': nbytes / 1024 / 1024,
+            'seek': _latency(dense_lookup, seeks),
+        }
+        del timeline
+    return result
+
+
+def run(args) -> dict:
+    results = {'settings': vars(args)}
+    per_second_mb = None
+    for days in args.days:
+        dataset = run_dataset(days, args)
+        if 'dense_timeline' in dataset:
+            per_second_mb = dataset['dense_timeline']['mb'] / (days * 86400)
+        elif per_second_mb is not None:
+            dataset['dense_timeline'] = {'mb': per_second_mb * days * 86400, 'projected': True}
+        results[f'{days}d'] = dataset
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--days", type=int, nargs="+", default=[1, 7, 31])
+    parser.add_argument("--sensors", type=int, default=30)
+    parser.add_argument("--interval", type=int, default=60, help="seconds between readings per sensor")
+    parser.add_argument("--keyframe-every", type=int, default=256, help="deltas between keyframes")
+    parser.add_argument("--keyframe-every-s", type=float, default=None, help="also keyframe every N seconds")
+    parser.add_argument("--seeks", type=int, default=2000)
+    parser.add_argument("--frames", type=int, default=5000)
+    parser.add_argument("--frame-s", type=float, default=1.0, help="simulated seconds per playback frame")
+    parser.add_argument("--dense-max-days", type=int, default=7)
+    args = parser.parse_args()
+
+    print(json.dumps(run(args), indent=2, default=str))
+
+
+if __name__ == "__main__":
+    main()
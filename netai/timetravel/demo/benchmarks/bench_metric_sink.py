@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+"""
+Recording overhead of the buffered metric sink vs. the per-metric CSV append it replaced
+
+    python -m netai.timetravel.demo.benchmarks.bench_metric_sink --metrics 200000
+
+Reports nanoseconds per metric for MetricSink.record, PerformanceMonitor.record_metric,
+an OperationTimer block and the old open/append/close (call_overhead_ns is the same loop
+calling an empty function), plus the flusher's drain cost per metric for CSV and binary
+logs and the drop count while a flusher runs.
+"""
+import argparse
+import csv
+import json
+import os
+import tempfile
+import time
+
+from ..developing.metric_sink import MetricSink
+from ..developing.performance_monitor import PerformanceMetric, PerformanceMonitor
+
+
+def _ns_per_call(fn, count: int) -> float:
+    t0 = time.perf_counter_ns()
+    for i in range(count):
+        fn(i)
+    return (time.perf_counter_ns() - t0) / count
+
+
+def _legacy_append(path):
+    def record(i):
+        with open(path, 'a', newline='') as f:
+            csv.writer(f).writerow([time.time(), 'frame', 1.0, 100.0, 5.0, 24, 100, 60.0, 0])
+    return record
+
+
+def run(args) -> dict:
+    results = {'settings': vars(args)}
+    with tempfile.TemporaryDirectory(prefix="metric_sink_") as directory:
+        # 기록 비용 (flusher 없이 - 순수 핫 패스), 같은 인자의 빈 호출 비용도 함께
+        def noop(*_args):
+            pass
+        results['call_overhead_ns'] = _ns_per_call(lambda i: noop('frame', 0.001, 0.0, 100.0, 5.0, 24, 100, 60.0), args.metrics)
+        sink = MetricSink(args.metrics)
+        results['sink_record_ns'] = _ns_per_call(lambda i: sink.record('frame', 0.001, 0.0, 100.0, 5.0, 24, 100, 60.0), args.metrics)
+
+        monitor = PerformanceMonitor(buffer_size=args.metrics, log_file=os.path.join(directory, "monitor.csv"),
+                                     flush_interval=3600)
+        metric = PerformanceMetric(time.time(), 'frame', 0.001, 100.0, 5.0, 24, 100, 60.0)
+        results['record_metric_ns'] = _ns_per_call(lambda i: monitor.record_metric(metric), args.metrics)
+        monitor.sink.drain()
+
+        def timed_block(i):
+            with monitor.start_operation('frame') as timer:
+                timer.set_data_info(24, 100)
+        results['operation_timer_ns'] = _ns_per_call(timed_block, args.metrics)
+        monitor.close()
+
+        legacy_count = min(args.metrics, args.legacy_metrics)
+        results['legacy_csv_append_ns'] = _ns_per_call(_legacy_append(os.path.join(directory, "legacy.csv")), legacy_count)
+
+        # flusher 쪽 비용: 배치 하나를 패킹/집계/기록
+        for log_format in ('csv', 'binary'):
+            sink = MetricSink(args.metrics, os.path.join(directory, f"drain.{log_format}"), log_format)
+            for i in range(args.metrics):
+                sink.record('frame' if i % 3 else 'seek', 0.001, float(i), 100.0, 5.0, 24, 100, 60.0)
+            t0 = time.perf_counter_ns()
+            sink.drain()
+            results[f'drain_{log_format}_ns_per_metric'] = (time.perf_counter_ns() - t0) / args.metrics
+            results[f'{log_format}_bytes_per_metric'] = sink.get_stats()['bytes_written'] / args.metrics
+            sink.close()
+
+        # flusher가 도는 동안 연속 기록 - 링이 작으면 drop이 생김
+        sink = MetricSink(args.ring, os.path.join(directory, "live.bin"), 'binary', flush_interval=0.05).start()
+        t0 = time.perf_counter()
+        for i in range(args.metrics):
+            sink.record('frame', 0.001, float(i))
+        seconds = time.perf_counter() - t0
+        sink.close()
+        results['live'] = dict(sink.get_stats(), metrics_per_second=args.metrics / seconds)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--metrics", type=int, default=200000)
+    parser.add_argument("--legacy-metrics", type=int, default=5000, help="metrics timed with the old per-row append")
+    parser.add_argument("--ring", type=int, default=65536, help="ring capacity for the live run")
+    args = parser.parse_args()
+
+    print(json.dumps(run(args), indent=2, default=str))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+"""
+Per-frame cost of high-speed playback: point sample vs. raw-slice max vs. range index max
+
+    python -m netai.timetravel.demo.benchmarks.bench_playback --days 31 --sensors 32 --speed 1000
+"""
+import argparse
+import datetime
+import json
+import statistics
+import time
+
+import numpy as np
+
+from ..engine.range_index import SensorRangeIndex
+from .bench_pyramid import NS, START_S, build_cache
+
+
+def _frame_stats(samples, budget_ms: float) -> dict:
+    samples = sorted(s * 1000 for s in samples)
+    return {
+        'frames': len(samples),
+        'median_ms': statistics.median(samples),
+        'p99_ms': samples[max(0, int(len(samples) * 0.99) - 1)],
+        'max_ms': samples[-1],
+        'over_budget': sum(1 for s in samples if s > budget_ms),
+    }
+
+
+def run(args) -> dict:
+    cache = build_cache(args.days, args.sensors, args.interval)
+    index = SensorRangeIndex.build(cache, args.block_size)
+    sensor_ids = cache.get_sensor_ids()
+    sensors = [cache.find_sensor_data(objid) for objid in sensor_ids]
+
+    # 컨트롤러와 같은 환산: 재생 속도 1 = 실제 1초당 시뮬레이션 60초
+    frame_s = args.speed * 60 / args.fps
+    frame_edges = (START_S + np.arange(0, args.days * 86400, frame_s)) * NS
+    frame_edges = frame_edges.astype(np.int64)[:args.max_frames + 1]
+    budget_ms = 1000 / args.fps
+
+    point, scan, indexed = [], [], []
+    for start_ns, end_ns in zip(frame_edges[:-1], frame_edges[1:]):
+        start_ns, end_ns = int(start_ns), int(end_ns)
+        target = datetime.datetime.fromtimestamp(end_ns / NS)
+
+        t0 = time.perf_counter()
+        for sensor in sensors:
+            sensor.get_interpolated_at_time(target)
+        point.append(time.perf_counter() - t0)
+
+        t0 = time.perf_counter()
+        for sensor in sensors:
+            lo = np.searchsorted(sensor.timestamps, start_ns)
+            hi = np.searchsorted(sensor.timestamps, end_ns, side='right')
+            if hi > lo:
+                [float(channel[lo:hi].max()) for channel in
+                 (sensor.temp_cold, sensor.temp_hot, sensor.humidity_cold, sensor.humidity_hot)]
+        scan.append(time.perf_counter() - t0)
+
+        t0 = time.perf_counter()
+        for objid in sensor_ids:
+            index.reduce(objid, start_ns, end_ns, 'max')
+        indexed.append(time.perf_counter() - t0)
+
+    return {
+        'settings': vars(args),
+        'sim_seconds_per_frame': frame_s,
+        'frame_budget_ms': budget_ms,
+        'index': index.get_stats(),
+        'source_mb': cache.nbytes() / 1024 / 1024,
+        'point_sample': _frame_stats(point, budget_ms),
+        'raw_slice_max': _frame_stats(scan, budget_ms),
+        'range_index_max': _frame_stats(indexed, budget_ms),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--days", type=int, default=31)
+    parser.add_argument("--sensors", type=int, default=32)
+    parser.add_argument("--interval", type=int, default=60, help="seconds between readings per sensor")
+    parser.add_argument("--speed", type=float, default=1000.0, help="controller playback speed")
+    parser.add_argument("--fps", type=float, default=60.0)
+    parser.add_argument("--block-size", type=int, default=32)
+    parser.add_argument("--max-frames", type=int, default=3000)
+    args = parser.parse_args()
+
+    print(json.dumps(run(args), indent=2, default=str))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+"""
+Aggregate pyramid build time, memory and state-over-interval query latency
+
+    python -m netai.timetravel.demo.benchmarks.bench_pyramid --days 31 --sensors 24 --interval 60
+"""
+import argparse
+import json
+import statistics
+import time
+
+import numpy as np
+
+from ..developing.data_model import SensorDataCache
+from ..developing.pyramid import SensorPyramidIndex
+
+NS = 1_000_000_000
+START_S = 1_747_958_400  # 2025-05-23T00:00:00Z
+
+
+def build_cache(days: int, sensors: int, interval_s: int) -> SensorDataCache:
+    """Columnar cache with synthetic readings (배열을 직접 채워서 파싱 비용 제외)"""
+    rng = np.random.default_rng(0)
+    steps = days * 86400 // interval_s
+    timestamps = (START_S + np.arange(steps, dtype=np.int64) * interval_s) * NS
+    cache = SensorDataCache()
+    for objid in range(20, 20 + sensors):
+        sensor = cache.get_sensor_data(objid)
+        sensor.timestamps = timestamps.copy()
+        sensor.temp_cold = rng.normal(21.0, 1.0, steps).astype(np.float32)
+        sensor.temp_hot = rng.normal(23.0, 1.0, steps).astype(np.float32)
+        sensor.humidity_cold = rng.normal(40.0, 3.0, steps).astype(np.float32)
+        sensor.humidity_hot = rng.normal(35.0, 3.0, steps).astype(np.float32)
+        sensor.size = sensor.capacity = steps
+    return cache
+
+
+def _query_latency(index: SensorPyramidIndex, sensor_ids, span_s: float, total_s: int, count: int) -> dict:
+    rng = np.random.default_rng(1)
+    samples = []
+    for _ in range(count):
+        start = START_S + rng.uniform(0, max(1.0, total_s - span_s))
+        objid = sensor_ids[int(rng.integers(len(sensor_ids)))]
+        t0 = time.perf_counter()
+        index.state_over(objid, int(start * NS), int((start + span_s) * NS))
+        samples.append(time.perf_counter() - t0)
+    samples.sort()
+    return {
+        'median_us': statistics.median(samples) * 1e6,
+        'p99_us': samples[int(len(samples) * 0.99) - 1] * 1e6,
+        'max_us': samples[-1] * 1e6,
+    }
+
+
+def _scan_latency(cache: SensorDataCache, sensor_ids, span_s: float, total_s: int, count: int) -> dict:
+    """Same query answered by slicing the raw arrays (비교 기준)"""
+    rng = np.random.default_rng(1)
+    samples = []
+    for _ in range(count):
+        start = START_S + rng.uniform(0, max(1.0, total_s - span_s))
+        sensor = cache.find_sensor_data(sensor_ids[int(rng.integers(len(sensor_ids)))])
+        t0 = time.perf_counter()
+        lo = np.searchsorted(sensor.timestamps, int(start * NS))
+        hi = np.searchsorted(sensor.timestamps, int((start + span_s) * NS), side='right')
+        for channel in (sensor.temp_cold, sensor.temp_hot, sensor.humidity_cold, sensor.humidity_hot):
+            window = channel[lo:hi]
+            if len(window):
+                window.min(), window.max(), window.mean()
+        samples.append(time.perf_counter() - t0)
+    return {'median_us': statistics.median(samples) * 1e6}
+
+
+def run(args) -> dict:
+    cache = build_cache(args.days, args.sensors, args.interval)
+    index = SensorPyramidIndex.build(cache)
+    sensor_ids = cache.get_sensor_ids()
+    total_s = args.days * 86400
+
+    spans = {'1m': 60, '1h': 3600, '1d': 86400, '1w': 7 * 86400, 'full': total_s}
+    stats = index.get_stats()
+    return {
+        'settings': vars(args),
+        'source_records': cache.get_total_records(),
+        'source_mb': cache.nbytes() / 1024 / 1024,
+        'build_seconds': stats['build_seconds'],
+        'pyramid_mb': stats['nbytes'] / 1024 / 1024,
+        'buckets_by_level': stats['buckets_by_level'],
+        'pyramid_query': {
+            name: _query_latency(index, sensor_ids, span, total_s, args.queries)
+            for name, span in spans.items() if span <= total_s
+        },
+        'raw_scan_query': {
+            name: _scan_latency(cache, sensor_ids, span, total_s, args.queries)
+            for name, span in spans.items() if span <= total_s
+        },
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--days", type=int, default=31)
+    parser.add_argument("--sensors", type=int, default=24)
+    parser.add_argument("--interval", type=int, default=60, help="seconds between readings per sensor")
+    parser.add_argument("--queries", type=int, default=2000)
+    args = parser.parse_args()
+
+    print(json.dumps(run(args), indent=2, default=str))
+
+
+if __name__ == "__main__":
+    main()
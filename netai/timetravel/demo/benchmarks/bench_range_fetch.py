@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+"""
+Single-stream get_object vs. concurrent ranged GETs against a local stand-in server
+
+    python -m netai.timetravel.demo.benchmarks.bench_range_fetch --days 7 --bandwidth 20e6
+"""
+import argparse
+import datetime
+import io
+import json
+import statistics
+import time
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from ..developing.range_fetcher import RangedObjectFetcher, make_time_row_group_filter
+from .s3_standin import S3StandIn
+
+BUCKET = "fms-temphum"
+KEY = "2025-05/week_bench.parquet"
+
+
+def build_weekly_parquet(days: int, sensors: int, interval_s: int) -> bytes:
+    """Synthetic weekly FMS parquet, one row group per day"""
+    start = np.datetime64("2025-05-22T00:00:00", "ms")
+    steps = days * 86400 // interval_s
+    offsets = np.repeat(np.arange(steps, dtype=np.int64) * interval_s * 1000, sensors)
+    timestamps = start + offsets.astype("timedelta64[ms]")
+    obj_ids = np.tile(np.arange(sensors, dtype=np.int64) + 20, steps)
+    rng = np.random.default_rng(0)
+    n = len(obj_ids)
+
+    table = pa.table({
+        "timestamp": pa.array(np.datetime_as_string(timestamps, unit="ms")).cast(pa.string()),
+        "objId": obj_ids,
+        "rsctypeId": pa.array(["FTH"] * n),
+        "TEMPERATURE1": rng.normal(21.0, 1.0, n).astype(np.float32),
+        "TEMPERATURE": rng.normal(23.0, 1.0, n).astype(np.float32),
+        "HUMIDITY1": rng.normal(40.0, 3.0, n).astype(np.float32),
+        "HUMIDITY": rng.normal(35.0, 3.0, n).astype(np.float32),
+        # 로더가 읽지 않는 컬럼 (ranged 읽기에서 건너뜀)
+        "payload": np.frombuffer(rng.bytes(8 * n), dtype=np.int64),
+    })
+    sink = io.BytesIO()
+    pq.write_table(table, sink, row_group_size=max(1, n // days), compression="snappy")
+    return sink.getvalue()
+
+
+def _time(fn, repeat: int):
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - t0)
+    return {
+        'median_s': statistics.median(samples),
+        'min_s': min(samples),
+        'max_s': max(samples),
+    }
+
+
+def run(args) -> dict:
+    data = build_weekly_parquet(args.days, args.sensors, args.interval)
+    standin = S3StandIn(base_latency=args.latency, tail_latency=args.tail_latency,
+                        tail_probability=args.tail_prob, bandwidth=args.bandwidth).start()
+    standin.put(BUCKET, KEY, data)
+    client = standin.make_client(pool_size=args.workers * 2)
+
+    def single_stream():
+        response = client.get_object(BUCKET, KEY)
+        try:
+            assert len(response.read()) == len(data)
+        finally:
+            response.close()
+            response.release_conn()
+
+    fetcher = RangedObjectFetcher(client, BUCKET, max_workers=args.workers,
+                                  part_size=args.part_size, hedge_after=args.hedge_after)
+    unhedged = RangedObjectFetcher(client, BUCKET, max_workers=args.workers,
+                                   part_size=args.part_size, hedge_after=None)
+
+    day_start = datetime.datetime(2025, 5, 23)
+    row_filter = make_time_row_group_filter("timestamp", day_start, day_start + datetime.timedelta(days=1))
+    columns = ["timestamp", "objId", "TEMPERATURE1", "TEMPERATURE", "HUMIDITY1", "HUMIDITY"]
+
+    try:
+        results = {
+            'object_mb': len(data) / 1024 / 1024,
+            'settings': vars(args),
+            'single_stream_get': _time(single_stream, args.repeat),
+            'parallel_ranged_get': _time(lambda: fetcher.fetch_object(KEY), args.repeat),
+            'parallel_ranged_get_no_hedge': _time(lambda: unhedged.fetch_object(KEY), args.repeat),
+            'selective_read_one_day': _time(
+                lambda: fetcher.read_table(KEY, columns=columns, row_group_filter=row_filter), args.repeat),
+            'fetcher_stats': fetcher.get_stats(),
+            'server_requests': standin.request_count,
+        }
+    finally:
+        fetcher.shutdown()
+        unhedged.shutdown()
+        standin.stop()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--days", type=int, default=7)
+    parser.add_argument("--sensors", type=int, default=24)
+    parser.add_argument("--interval", type=int, default=10, help="seconds between readings per sensor")
+    parser.add_argument("--latency", type=float, default=0.02, help="first-byte latency per request (s)")
+    parser.add_argument("--tail-latency", type=float, default=0.5, help="extra latency for slow requests (s)")
+    parser.add_argument("--tail-prob", type=float, default=0.05, help="probability of a slow request")
+    parser.add_argument("--bandwidth", type=float, default=20e6, help="per-stream bytes/s (0 = unlimited)")
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--part-size", type=int, default=2 * 1024 * 1024)
+    parser.add_argument("--hedge-after", type=float, default=0.2)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    args.bandwidth = args.bandwidth or None
+
+    print(json.dumps(run(args), indent=2, default=str))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+"""
+TimeController USD write path against the in-memory stage stand-in (no Kit needed)
+
+    python -m netai.timetravel.demo.benchmarks.bench_stage_write --sensors 24 1000 --backend mock
+
+Times _update_rack_attributes (new values / same values), update_dynamic_colormap,
+_ensure_base_time, write_time and a full _update_all_racks at each scale, and reports
+the stage calls (GetPrimAtPath, Get/Set, customData get/set) each one makes.
+"""
+import argparse
+import json
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from ..config import SENSOR_DATA_CONFIG, objid_to_airrack
+from . import synthetic_fms
+from .usd_standin import UsdStandIn
+
+
+def _measure(standin, fn, arguments) -> dict:
+    standin.calls.clear()
+    samples = []
+    for argument in arguments:
+        t0 = time.perf_counter()
+        fn(argument)
+        samples.append(time.perf_counter() - t0)
+    samples = np.sort(np.asarray(samples)) * 1e6
+    return {
+        'count': len(samples),
+        'p50_us': float(np.percentile(samples, 50)),
+        'p95_us': float(np.percentile(samples, 95)),
+        'p99_us': float(np.percentile(samples, 99)),
+        'calls_per_op': {name: count / len(samples) for name, count in sorted(standin.calls.items())},
+    }
+
+
+def _entry(sensor_id, values):
+    temps, hums = SENSOR_DATA_CONFIG["temperature_columns"], SENSOR_DATA_CONFIG["humidity_columns"]
+    return {
+        temps["cold"]: values[0], temps["hot"]: values[1], hums["cold"]: values[2], hums["hot"]: values[3],
+        SENSOR_DATA_CONFIG["obj_id_column"]: str(sensor_id), 'normalized_timestamp': "2025-03-27T00:00:00.000Z",
+    }
+
+
+def run_scale(sensors: int, args) -> dict:
+    with UsdStandIn(sensors=sensors, backend=args.backend) as standin, \
+            tempfile.TemporaryDirectory(prefix="fms_stage_") as directory:
+        from ..controller import TimeController, compute_color_from_temperature, update_dynamic_colormap
+        from ..engine import load_timeline_index
+
+        controller = TimeController()
+        synthetic_fms.generate(directory, sensors=sensors, days=args.days, formats=('csv',), seed=args.seed)
+        controller.engine.set_index(load_timeline_index(os.path.join(directory, SENSOR_DATA_CONFIG["csv_file"])))
+        controller._rack_paths = list(standin.racks)
+        controller._rack_to_sensor_map = standin.rack_to_sensor_map()
+        controller.engine.reset_applied()
+
+        rng = np.random.default_rng(args.seed)
+        # 실제 랙(컬러맵 갱신 포함)과 합성 랙 구분
+        real = [(path, sid) for path, sid in standin.racks.items() if sid in objid_to_airrack]
+        rack_path, sensor_id = real[0]
+        changing = [_entry(sensor_id, 20 + rng.random(4)) for _ in range(args.ops)]
+        same = [_entry(sensor_id, (21.0, 25.0, 40.0, 35.0))] * args.ops
+        clock = controller.engine.clock
+        times = [clock.time_at_progress(p) for p in rng.random(args.applies)]
+
+        def apply_all(target_time):
+            clock.seek(target_time)
+            controller._update_all_racks()
+
+        result = {
+            'sensors': sensors,
+            'racks': len(standin.racks),
+            'backend': standin.backend,
+            'rack_attributes_changed': _measure(standin, lambda e: controller._update_rack_attributes(rack_path, e), changing),
+            'rack_attributes_same': _measure(standin, lambda e: controller._update_rack_attributes(rack_path, e), same),
+            'dynamic_colormap': _measure(
+                standin, lambda t: update_dynamic_colormap(t, compute_color_from_temperature(t), objid_to_airrack[sensor_id]),
+                list(19 + 5 * rng.random(args.ops))),
+            'ensure_base_time': _measure(standin, lambda _: controller._ensure_base_time(), range(args.ops)),
+            'write_time': _measure(standin, controller.write_time, times),
+            'update_all_racks': _measure(standin, apply_all, times),
+        }
+        result['timeline_set_current_time'] = standin.timeline.calls['set_current_time']
+        controller.on_shutdown()
+        return result
+
+
+def run(args) -> dict:
+    return {
+        'settings': vars(args),
+        'scales': {str(sensors): run_scale(sensors, args) for sensors in args.sensors},
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sensors", type=int, nargs="+", default=[24, 1000])
+    parser.add_argument("--backend", default="auto", choices=["auto", "mock", "usd"])
+    parser.add_argument("--days", type=float, default=0.1, help="synthetic data for the full-apply timing")
+    parser.add_argument("--ops", type=int, default=2000, help="calls per single-rack operation")
+    parser.add_argument("--applies", type=int, default=100, help="full _update_all_racks calls")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(json.dumps(run(args), indent=2, default=str))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,392 @@
+# -*- coding: utf-8 -*-
+"""
+Scripted end-to-end benchmark of the data path at several scales (no Kit needed)
+
+    python -m netai.timetravel.demo.benchmarks.bench_suite --scales 24x1 200x7 1000x7 --out results.json
+    python -m netai.timetravel.demo.benchmarks.bench_suite --scales 24x1 --baseline baseline.json
+    python -m netai.timetravel.demo.benchmarks.bench_suite --compare baseline.json results.json
+
+Each scale (SENSORSxDAYS) generates a synthetic_fms dataset and times:
+
+    csv_ingest        read_csv_readings (TimeController CSV path)
+    index_build       SensorTimelineIndex.build (LKV / change-point index)
+    parquet_ingest    weekly parquet files -> SensorDataCache
+    keyframe_build    KeyframeDeltaStore.from_cache
+    engine_build      TimelineEngine construction over the built index (+ RSS delta)
+    random_seek       LKV state at random times
+    playback_frame    TimelineEngine.tick per 60 fps frame, written to the in-memory stage
+    batch_query       SensorDataCache.query_batch per mode
+    stage_apply       every rack written to the in-memory stage
+
+Latencies are reported as p50/p95/p99 (us), one-shot stages as seconds per run, and
+every stage also as its tracemalloc peak (MB, from a separate untimed run); engine_build
+also reports the process RSS growth of keeping one engine (needs psutil). --baseline
+or --compare flags stages that got slower or bigger than a stored result; the exit
+status is 1 when there are regressions.
+"""
+import argparse
+import datetime
+import glob
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+from ..config import SENSOR_DATA_CONFIG, USD_ATTRIBUTE_CONFIG
+from ..developing.config import PARQUET_COLUMN_MAPPING
+from ..developing.data_model import BATCH_MODES, CHANNELS, SensorDataCache
+from ..developing.keyframe_store import KeyframeDeltaStore
+from ..engine import PlaybackClock, SensorTimelineIndex, StageWriter, TimelineEngine, read_csv_readings
+from . import synthetic_fms
+
+NS = 1_000_000_000
+START = datetime.datetime(2025, 3, 27)
+
+# compare 대상 지표 - 작을수록 좋은 값만
+COMPARED_METRICS = ('p50_us', 'p95_us', 'p99_us', 'seconds', 'peak_mb')
+
+
+class InMemoryStage(StageWriter):
+    """
+    Rack prims as dicts, written the way TimeController._update_rack_attributes
+    does it: read each channel attribute and set it only when the value changed.
+    """
+
+    def __init__(self, rack_paths):
+        names = USD_ATTRIBUTE_CONFIG["rack_attributes"]
+        self._attributes = [names[key] for key in CHANNELS]
+        self._columns = [SENSOR_DATA_CONFIG["temperature_columns"]["cold"], SENSOR_DATA_CONFIG["temperature_columns"]["hot"],
+                         SENSOR_DATA_CONFIG["humidity_columns"]["cold"], SENSOR_DATA_CONFIG["humidity_columns"]["hot"]]
+        self.prims = {rack_path: dict.fromkeys(self._attributes, 0.0) for rack_path in rack_paths}
+        self.current_time = None
+        self.gets = 0
+        self.sets = 0
+
+    def write_time(self, current_time):
+        self.current_time = current_time
+
+    def write_racks(self, updates):
+        for rack_path, entry in updates.items():
+            prim = self.prims.get(rack_path)
+            if prim is None:
+                continue
+            for attribute, column in zip(self._attributes, self._columns):
+                value = float(entry.get(column, 0.0))
+                self.gets += 1
+                if prim[attribute] != value:
+                    prim[attribute] = value
+                    self.sets += 1
+
+
+def parse_scale(text: str):
+    """'1000x7' -> (1000 sensors, 7.0 days)"""
+    try:
+        sensors, days = text.lower().split('x')
+        return int(sensors), float(days)
+    except ValueError:
+        raise ValueError(f"Invalid scale: {text} (expected SENSORSxDAYS, e.g. 200x7)")
+
+
+def _latency(samples) -> dict:
+    samples = np.sort(np.asarray(samples)) * 1e6
+    return {
+        'count': len(samples),
+        'mean_us': float(samples.mean()),
+        'p50_us': float(np.percentile(samples, 50)),
+        'p95_us': float(np.percentile(samples, 95)),
+        'p99_us': float(np.percentile(samples, 99)),
+        'max_us': float(samples[-1]),
+    }
+
+
+def _peak_mb(fn, *args) -> float:
+    """tracemalloc peak of one untimed call (numpy buffers included)"""
+    tracemalloc.start()
+    try:
+        fn(*args)
+        return tracemalloc.get_traced_memory()[1] / 1024 / 1024
+    finally:
+        tracemalloc.stop()
+
+
+def _rss_mb():
+    """Resident set size of this process (MB), None without psutil"""
+    if not PSUTIL_AVAILABLE:
+        return None
+    return psutil.Process().memory_info().rss / 1024 / 1024
+
+
+def _one_shot(fn, repeat: int):
+    """Best-of-repeat seconds (median too), plus the memory peak; returns (stats, last result)"""
+    seconds = []
+    result = None
+    for _ in range(repeat):
+        result = None  # 이전 결과를 놓아 측정 사이 메모리가 쌓이지 않게
+        t0 = time.perf_counter()
+        result = fn()
+        seconds.append(time.perf_counter() - t0)
+    stats = {
+        'seconds': min(seconds),
+        'median_seconds': float(np.median(seconds)),
+        'runs': repeat,
+        'peak_mb': _peak_mb(fn),
+    }
+    return stats, result
+
+
+def _per_call(fn, arguments, peak_arguments=()) -> dict:
+    samples = []
+    for argument in arguments:
+        t0 = time.perf_counter()
+        fn(argument)
+        samples.append(time.perf_counter() - t0)
+    stats = _latency(samples)
+    if len(peak_arguments):
+        stats['peak_mb'] = _peak_mb(lambda: [fn(argument) for argument in peak_arguments])
+    return stats
+
+
+def load_parquet_cache(paths) -> SensorDataCache:
+    """Weekly FMS parquet files -> SensorDataCache (KST timestamps, like the optimized controller)"""
+    import pyarrow.parquet as pq
+
+    m = PARQUET_COLUMN_MAPPING
+    cache = SensorDataCache()
+    for path in paths:
+        table = pq.read_table(path, columns=[m['timestamp'], m['objid']] + [m[key] for key in CHANNELS])
+        # KST 문자열 -> ns (naive), objId별로 묶어서 배열째로 추가
+        times_ns = table.column(m['timestamp']).to_numpy(zero_copy_only=False).astype('datetime64[ns]').astype(np.int64)
+        obj_ids = table.column(m['objid']).to_numpy()
+        channels = [table.column(m[key]).to_numpy() for key in CHANNELS]
+        order = np.argsort(obj_ids, kind='stable')
+        bounds = np.flatnonzero(np.diff(obj_ids[order])) + 1
+        for rows in np.split(order, bounds):
+            sensor = cache.get_sensor_data(int(obj_ids[rows[0]]))
+            needed = sensor.size + len(rows)
+            if needed > sensor.capacity:
+                sensor._grow_arrays(needed)
+            end = sensor.size + len(rows)
+            sensor.timestamps[sensor.size:end] = times_ns[rows]
+            for name, values in zip(('temp_cold', 'temp_hot', 'humidity_cold', 'humidity_hot'), channels):
+                getattr(sensor, name)[sensor.size:end] = values[rows]
+            sensor.size = end
+            sensor._is_sorted = False
+    cache.optimize()
+    return cache
+
+
+class _StepClock:
+    """Wall clock for PlaybackClock that moves one frame per call"""
+
+    def __init__(self, frame_s: float):
+        self.t = 0.0
+        self.frame_s = frame_s
+
+    def __call__(self):
+        self.t += self.frame_s
+        return self.t
+
+
+def run_scale(sensors: int, days: float, args, directory: str) -> dict:
+    rng = np.random.default_rng(args.seed)
+    t0 = time.perf_counter()
+    summary = synthetic_fms.generate(directory, sensors=sensors, days=days, start=START, seed=args.seed,
+                                     formats=('csv', 'parquet') if synthetic_fms.PYARROW_AVAILABLE else ('csv',))
+    result = {
+        'sensors': sensors,
+        'days': days,
+        'rows': summary['rows'],
+        'dataset_mb': summary['bytes'] / 1024 / 1024,
+        'generate_seconds': time.perf_counter() - t0,
+        'stages': {},
+    }
+    stages = result['stages']
+    csv_path = os.path.join(directory, SENSOR_DATA_CONFIG["csv_file"])
+
+    # ---- ingest / build ----
+    stages['csv_ingest'], readings = _one_shot(lambda: read_csv_readings(csv_path), args.repeat)
+    stages['index_build'], index = _one_shot(lambda: SensorTimelineIndex.build(readings), args.repeat)
+    stages['index_build']['index_mb'] = index.nbytes() / 1024 / 1024
+    del readings
+
+    parquet_paths = sorted(glob.glob(os.path.join(directory, "parquet", "*.parquet")))
+    cache = None
+    if parquet_paths:
+        stages['parquet_ingest'], cache = _one_shot(lambda: load_parquet_cache(parquet_paths), args.repeat)
+        stages['keyframe_build'], store = _one_shot(lambda: KeyframeDeltaStore.from_cache(cache), args.repeat)
+        stages['keyframe_build']['store_mb'] = store.nbytes() / 1024 / 1024
+        del store
+
+    # ---- 조회 ----
+    start_ms, end_ms = (SensorTimelineIndex.to_ms(t) for t in index.time_range())
+    seek_times = [SensorTimelineIndex.from_ms(int(ms)) for ms in rng.integers(start_ms, end_ms + 1, args.seeks)]
+    stages['random_seek'] = _per_call(index.at, seek_times, seek_times[:args.peak_calls])
+
+    rack_to_sensor_map = {rack_path: str(sensor_id) for rack_path, sensor_id in
+                          synthetic_fms.make_rack_mapping(synthetic_fms.make_sensor_ids(sensors)).items()}
+    rack_paths = list(rack_to_sensor_map)
+
+    # 엔진 생성: 인덱스 위에 랙 매핑/시계를 얹는 비용 (생성 시 전체 행을 훑는 작업이 생기면 여기서 드러남)
+    start_time, end_time = index.time_range()
+    rss_before = _rss_mb()
+    kept = TimelineEngine(index, rack_paths, rack_to_sensor_map)
+    rss_after = _rss_mb()
+    stages['engine_build'], _ = _one_shot(lambda: TimelineEngine(index, rack_paths, rack_to_sensor_map), args.repeat)
+    stages['engine_build']['rss_delta_mb'] = rss_after - rss_before if rss_before is not None else None
+    del kept
+
+    # 재생: 컨트롤러와 같은 환산 (속도 1 = 실제 1초당 60초), 프레임마다 tick -> 스테이지 쓰기
+    stage = InMemoryStage(rack_paths)
+    frame_s = 1.0 / args.fps
+    clock = PlaybackClock(start_time, end_time, speed=args.speed, time_scale=60, now=_StepClock(frame_s))
+    engine = TimelineEngine(index, rack_paths, rack_to_sensor_map, writer=stage, clock=clock)
+    clock.toggle()
+    frame_samples = []
+    for _ in range(args.frames):
+        t0 = time.perf_counter()
+        if engine.tick() is None:
+            break
+        frame_samples.append(time.perf_counter() - t0)
+    stages['playback_frame'] = dict(_latency(frame_samples), frame_budget_us=1e6 / args.fps,
+                                    sim_seconds_per_frame=frame_s * args.speed * 60)
+
+    if cache is not None:
+        sensor_ids = cache.get_sensor_ids()
+        start_ns = int(cache.find_sensor_data(sensor_ids[0]).timestamps[0])
+        batch_times = [np.sort(start_ns + rng.integers(0, int(days * 86400) * NS, args.batch_times)).astype(np.int64)
+                       for _ in range(args.batches)]
+        for mode in BATCH_MODES:
+            stats = _per_call(lambda times: cache.query_batch(times, sensor_ids, mode), batch_times, batch_times[:1])
+            stats['us_per_point'] = stats['p50_us'] / (args.batch_times * len(sensor_ids))
+            stages[f'batch_query_{mode}'] = stats
+
+    # 전체 랙 쓰기: 같은 스테이지에 시각을 바꿔가며 apply_all
+    apply_stage = InMemoryStage(rack_paths)
+    engine = TimelineEngine(index, rack_paths, rack_to_sensor_map, writer=apply_stage,
+                            clock=PlaybackClock(start_time, end_time))
+
+    def apply_at(time_value):
+        engine.clock.seek(time_value)
+        engine.apply_all()
+
+    stages['stage_apply'] = _per_call(apply_at, seek_times[:args.applies])
+    applies = max(1, stages['stage_apply']['count'])
+    stages['stage_apply'].update(racks=len(rack_paths), gets_per_apply=apply_stage.gets / applies,
+                                 sets_per_apply=apply_stage.sets / applies,
+                                 peak_mb=_peak_mb(lambda: [apply_at(t) for t in seek_times[:args.peak_calls]]))
+    return result
+
+
+def run(args) -> dict:
+    results = {
+        'settings': vars(args),
+        'environment': {
+            'python': sys.version.split()[0],
+            'numpy': np.__version__,
+            'pyarrow': synthetic_fms.pa.__version__ if synthetic_fms.PYARROW_AVAILABLE else None,
+            'platform': platform.platform(),
+            'processor': platform.processor() or platform.machine(),
+        },
+        'scales': {},
+    }
+    for scale in args.scales:
+        sensors, days = parse_scale(scale)
+        with tempfile.TemporaryDirectory(prefix="fms_bench_") as directory:
+            results['scales'][scale] = run_scale(sensors, days, args, directory)
+    return results
+
+
+def compare(baseline: dict, current: dict, threshold: float = 0.2, min_us: float = 5.0) -> dict:
+    """
+    Stage metrics of current that are more than threshold (fraction) worse
+    than in baseline. Latencies under min_us in both runs are treated as
+    noise. Scales or stages missing on either side are listed, not flagged.
+    """
+    regressions, improvements, missing = [], [], []
+    for scale, base_scale in baseline.get('scales', {}).items():
+        current_scale = current.get('scales', {}).get(scale)
+        if current_scale is None:
+            missing.append(scale)
+            continue
+        for stage, base_stats in base_scale['stages'].items():
+            current_stats = current_scale['stages'].get(stage)
+            if current_stats is None:
+                missing.append(f"{scale}/{stage}")
+                continue
+            for metric in COMPARED_METRICS:
+                before, after = base_stats.get(metric), current_stats.get(metric)
+                if not before or after is None:
+                    continue
+                if metric.endswith('_us') and max(before, after) < min_us:
+                    continue
+                change = after / before - 1.0
+                entry = {'scale': scale, 'stage': stage, 'metric': metric,
+                         'baseline': before, 'current': after, 'change': change}
+                if change > threshold:
+                    regressions.append(entry)
+                elif change < -threshold:
+                    improvements.append(entry)
+    return {
+        'threshold': threshold,
+        'regressions': regressions,
+        'improvements': improvements,
+        'missing': missing,
+    }
+
+
+def _load(path: str) -> dict:
+    with open(path) as f:
+        return json.load(f)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scales", nargs="+", default=["24x1", "200x7"], help="SENSORSxDAYS datasets to run")
+    parser.add_argument("--repeat", type=int, default=3, help="runs of each ingest/build stage")
+    parser.add_argument("--seeks", type=int, default=2000)
+    parser.add_argument("--frames", type=int, default=2000, help="playback frames (stops early at the end)")
+    parser.add_argument("--fps", type=float, default=60.0)
+    parser.add_argument("--speed", type=float, default=10.0, help="controller playback speed")
+    parser.add_argument("--batches", type=int, default=20)
+    parser.add_argument("--batch-times", type=int, default=1000, help="timestamps per query_batch call")
+    parser.add_argument("--applies", type=int, default=300, help="full stage writes")
+    parser.add_argument("--peak-calls", type=int, default=50, help="calls traced for per-call memory peaks")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", help="write the results JSON here (default: stdout)")
+    parser.add_argument("--baseline", help="results JSON to compare this run against")
+    parser.add_argument("--compare", nargs=2, metavar=("BASELINE", "CURRENT"), help="only compare two stored results")
+    parser.add_argument("--threshold", type=float, default=0.2, help="slowdown fraction flagged as a regression")
+    parser.add_argument("--min-us", type=float, default=5.0, help="ignore latency changes below this")
+    args = parser.parse_args()
+
+    if args.compare:
+        report = compare(_load(args.compare[0]), _load(args.compare[1]), args.threshold, args.min_us)
+        print(json.dumps(report, indent=2))
+        sys.exit(1 if report['regressions'] else 0)
+
+    results = run(args)
+    if args.baseline:
+        results['comparison'] = compare(_load(args.baseline), results, args.threshold, args.min_us)
+    text = json.dumps(results, indent=2, default=str)
+    if args.out:
+        with open(args.out, 'w') as f:
+            f.write(text)
+    else:
+        print(text)
+    if args.baseline and results['comparison']['regressions']:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
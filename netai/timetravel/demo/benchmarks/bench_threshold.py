@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+"""
+Threshold exceedance index: build time, memory and "all racks over threshold in [t0, t1]" latency
+
+    python -m netai.timetravel.demo.benchmarks.bench_threshold --days 31 --sensors 30
+"""
+import argparse
+import json
+import time
+
+import numpy as np
+
+from ..developing.threshold_index import ThresholdIntervalIndex
+from .bench_keyframe import NS, START_S, build_cache
+
+
+def _scan(cache, sensor_ids, threshold):
+    """Baseline: mask the raw samples of every sensor for each query"""
+    sensors = [cache.find_sensor_data(objid) for objid in sensor_ids]
+
+    def query(window):
+        start_ns, end_ns = window
+        over = {}
+        for sensor in sensors:
+            n = sensor.size
+            lo, hi = np.searchsorted(sensor.timestamps[:n], [start_ns, end_ns])
+            hot = sensor.temp_hot[lo:hi] > threshold
+            if hot.any():
+                over[sensor.sensor_id] = int(hot.sum())
+        return over
+    return query
+
+
+def run(args) -> dict:
+    cache = build_cache(args.days, args.sensors, args.interval)
+    sensor_ids = cache.get_sensor_ids()
+    thresholds = tuple(('temperature_hot', t) for t in args.thresholds)
+    index = ThresholdIntervalIndex.build(cache, thresholds)
+
+    rng = np.random.default_rng(2)
+    span_ns = args.days * 86400 * NS
+    windows = []
+    for _ in range(args.queries):
+        length = int(rng.uniform(0.01, 1.0) * span_ns)
+        start = START_S * NS + int(rng.integers(0, span_ns - length + 1))
+        windows.append((start, start + length))
+
+    threshold = args.thresholds[0]
+    latency = {}
+    for name, fn in (('index', lambda w: index.sensors_over('temperature_hot', threshold, *w)),
+                     ('raw_scan', _scan(cache, sensor_ids, threshold))):
+        samples = []
+        for window in windows:
+            t0 = time.perf_counter()
+            fn(window)
+            samples.append(time.perf_counter() - t0)
+        samples.sort()
+        latency[name] = {
+            'median_ms': samples[len(samples) // 2] * 1e3,
+            'p99_ms': samples[max(0, int(len(samples) * 0.99) - 1)] * 1e3,
+        }
+    return {
+        'settings': vars(args),
+        'raw_mb': cache.nbytes() / 1024 / 1024,
+        'index': index.get_stats(),
+        'sensors_over': latency,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--days", type=int, default=31)
+    parser.add_argument("--sensors", type=int, default=30)
+    parser.add_argument("--interval", type=int, default=60, help="seconds between readings per sensor")
+    parser.add_argument("--thresholds", type=float, nargs="+", default=[23.0, 24.0])
+    parser.add_argument("--queries", type=int, default=500)
+    args = parser.parse_args()
+
+    print(json.dumps(run(args), indent=2, default=str))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+"""
+Local S3-compatible stand-in server with injected latency (HEAD / ranged GET only)
+"""
+import email.utils
+import hashlib
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Tuple
+
+_RANGE_RE = re.compile(r"bytes=(\d+)-(\d*)")
+
+
+class S3StandIn:
+    """
+    Minimal object server understood by the Minio client.
+
+    Every request waits base_latency seconds (plus tail_latency with
+    probability tail_probability) before the first byte, and each response
+    stream is throttled to bandwidth bytes per second, so single-stream and
+    parallel downloads can be compared on one machine.
+    """
+
+    def __init__(self, base_latency: float = 0.02, tail_latency: float = 0.0,
+                 tail_probability: float = 0.0, bandwidth: Optional[float] = None,
+                 seed: int = 0):
+        self.base_latency = base_latency
+        self.tail_latency = tail_latency
+        self.tail_probability = tail_probability
+        self.bandwidth = bandwidth
+        self.objects: Dict[Tuple[str, str], bytes] = {}
+        self._etags: Dict[Tuple[str, str], str] = {}
+        self.request_count = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server = None
+        self._thread = None
+
+    # ---------------------------------------------------------------- objects
+    def put(self, bucket: str, key: str, data: bytes):
+        self.objects[(bucket, key)] = data
+        # 요청마다 전체 객체를 해시하지 않도록 미리 계산
+        self._etags[(bucket, key)] = self.etag(data)
+
+    @staticmethod
+    def etag(data: bytes) -> str:
+        return hashlib.md5(data).hexdigest()
+
+    # ---------------------------------------------------------------- server
+    @property
+    def endpoint(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"{host}:{port}"
+
+    def start(self) -> "S3StandIn":
+        standin = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # 헤더와 본문이 나뉘어 전송될 때 Nagle + delayed ACK로 요청마다 ~40ms 지연되는 것 방지
+            disable_nagle_algorithm = True
+
+            def log_message(self, *_args):
+                pass
+
+            def _lookup(self):
+                path = self.path.split("?", 1)[0].lstrip("/")
+                bucket, _, key = path.partition("/")
+                return standin.objects.get((bucket, key)), standin._etags.get((bucket, key))
+
+            def _delay(self):
+                with standin._lock:
+                    standin.request_count += 1
+                    tail = standin._random.random() < standin.tail_probability
+                time.sleep(standin.base_latency + (standin.tail_latency if tail else 0.0))
+
+            def _headers(self, etag: str, length: int):
+                self.send_header("Content-Length", str(length))
+                self.send_header("Content-Type", "application/octet-stream")
+                self.send_header("ETag", f'"{etag}"')
+                self.send_header("Last-Modified", email.utils.formatdate(usegmt=True))
+                self.send_header("Accept-Ranges", "bytes")
+
+            def do_HEAD(self):
+                data, etag = self._lookup()
+                self._delay()
+                if data is None:
+                    self.send_response(404)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                self._headers(etag, len(data))
+                self.end_headers()
+
+            def do_GET(self):
+                data, etag = self._lookup()
+                self._delay()
+                if data is None:
+                    self.send_response(404)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+
+                start, end = 0, len(data) - 1
+                match = _RANGE_RE.match(self.headers.get("Range", ""))
+                if match:
+                    start = int(match.group(1))
+                    end = int(match.group(2)) if match.group(2) else len(data) - 1
+                    end = min(end, len(data) - 1)
+                    self.send_response(206)
+                    self.send_header("Content-Range", f"bytes {start}-{end}/{len(data)}")
+                else:
+                    self.send_response(200)
+                body = memoryview(data)[start:end + 1]
+                self._headers(etag, len(body))
+                self.end_headers()
+
+                # 스트림별 대역폭 제한
+                step = 64 * 1024
+                for pos in range(0, len(body), step):
+                    chunk = body[pos:pos + step]
+                    self.wfile.write(chunk)
+                    if standin.bandwidth:
+                        time.sleep(len(chunk) / standin.bandwidth)
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def make_client(self, pool_size: int = 16):
+        """Minio client pointed at this stand-in (region set to skip location lookups)"""
+        from ..developing.range_fetcher import create_pooled_minio_client
+        return create_pooled_minio_client(
+            self.endpoint, access_key="benchmark", secret_key="benchmark",
+            secure=False, pool_size=pool_size, region="us-east-1"
+        )
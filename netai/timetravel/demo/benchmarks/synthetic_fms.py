@@ -0,0 +1,362 @@
+# -*- coding: utf-8 -*-
+"""
+Synthetic FMS temperature/humidity dataset at configurable scale
+
+    python -m netai.timetravel.demo.benchmarks.synthetic_fms --out /tmp/fms --sensors 1000 --days 7
+
+Writes the CSV the TimeController reads (SENSOR_DATA_CONFIG columns), weekly Parquet
+files in the PARQUET_COLUMN_MAPPING schema for the OptimizedTimeController, and a
+matching rack_sensor_map.txt / rack_directory.txt. The first 24 sensors are the real
+OBJ_IDS on their real racks; the rest get synthetic RACK_Sxxxxx racks.
+
+Streams are generated one day at a time (memory stays flat for months of data) and
+carry the quirks of the real gateway feed: reporting-interval jitter, outages,
+duplicated timestamps and rows written out of order.
+"""
+import argparse
+import csv
+import datetime
+import json
+import os
+import time
+
+import numpy as np
+
+from ..config import OBJ_IDS, RACK_SENSOR_MAPPING, SENSOR_DATA_CONFIG
+from ..developing.config import PARQUET_COLUMN_MAPPING
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+KST = datetime.timedelta(hours=9)
+RSCTYPE_ID = "FTH"
+CHANNEL_KEYS = ('temperature_cold', 'temperature_hot', 'humidity_cold', 'humidity_hot')
+
+
+def make_sensor_ids(count: int) -> list:
+    """The real OBJ_IDS first, then synthetic IDs from 1000 up"""
+    if count < 1:
+        raise ValueError(f"count must be >= 1, got {count}")
+    real = list(OBJ_IDS[:count])
+    return real + list(range(1000, 1000 + count - len(real)))
+
+
+def make_rack_mapping(sensor_ids) -> dict:
+    """rack path -> sensor ID: real racks for the real sensors, RACK_Sxxxxx for the rest"""
+    real_racks = {int(sensor_id): rack_path for rack_path, sensor_id in RACK_SENSOR_MAPPING.items()}
+    return {real_racks.get(sensor_id, f"/datacenter/RACK_S{sensor_id:05d}"): sensor_id
+            for sensor_id in sensor_ids}
+
+
+class SyntheticFmsStream:
+    """
+    Day-by-day generator of FMS readings for a fixed set of sensors.
+
+    Each sensor reports every interval_s seconds at its own phase, plus
+    jitter. Values combine a per-sensor baseline, a daily cycle and an AR(1)
+    drift, all rounded to 0.01 like the gateway. Humidity moves opposite to
+    temperature. Outages drop whole runs of readings (Poisson count per
+    day, exponential length). Duplicates repeat a reading's timestamp, with
+    the same or a slightly different value. Out-of-order rows are swapped
+    with a later row up to reorder_window rows away.
+    """
+
+    def __init__(self, sensor_ids, start: datetime.datetime, interval_s: float = 60.0, jitter: float = 0.2,
+                 gaps_per_day: float = 0.5, gap_minutes: float = 30.0, duplicate_rate: float = 0.004,
+                 out_of_order_rate: float = 0.002, reorder_window: int = 50, seed: int = 0):
+        if interval_s <= 0:
+            raise ValueError(f"interval_s must be > 0, got {interval_s}")
+        self.sensor_ids = np.asarray(sensor_ids, dtype=np.int64)
+        self.start = start
+        self.interval_ms = int(round(interval_s * 1000))
+        self.jitter = jitter
+        self.gaps_per_day = gaps_per_day
+        self.gap_ms = gap_minutes * 60_000
+        self.duplicate_rate = duplicate_rate
+        self.out_of_order_rate = out_of_order_rate
+        self.reorder_window = max(1, reorder_window)
+        self._rng = np.random.default_rng(seed)
+
+        n = len(self.sensor_ids)
+        rng = self._rng
+        # 센서별 고정 특성: 보고 위상, 기준값, 일주기 진폭/위상
+        self._phase_ms = rng.integers(0, self.interval_ms, n)
+        self._base_cold = rng.uniform(19.5, 23.5, n)
+        self._hot_offset = rng.uniform(2.0, 6.0, n)
+        self._base_humidity = rng.uniform(30.0, 45.0, n)
+        self._amplitude = rng.uniform(0.3, 1.2, n)
+        self._cycle_phase = rng.uniform(0, 2 * np.pi, n)
+        self._drift = np.zeros((n, 2))  # AR(1) 상태 (온도, 습도) - 청크 사이에 이어짐
+        self._start_ms = int((start - datetime.datetime(1970, 1, 1)).total_seconds() * 1000)
+        # 청크 경계를 보고 주기의 배수로 맞춰 청크 사이 순서가 뒤섞이지 않게 함
+        self._slots_per_chunk = max(1, int(round(86_400_000 / self.interval_ms)))
+
+    def chunks(self, duration_s: float):
+        """Yield dicts of columns (times_ms, obj_ids, 4 channels) covering duration_s, about a day each"""
+        total_slots = int(np.ceil(duration_s * 1000 / self.interval_ms))
+        end_ms = self._start_ms + int(duration_s * 1000)
+        for first in range(0, total_slots, self._slots_per_chunk):
+            slots = np.arange(first, min(first + self._slots_per_chunk, total_slots))
+            chunk = self._chunk(slots)
+            keep = chunk['times_ms'] < end_ms
+            yield {key: column[keep] for key, column in chunk.items()}
+
+    def _chunk(self, slots):
+        rng = self._rng
+        n = len(self.sensor_ids)
+        m = len(slots)
+
+        # 시각: 슬롯 시작 + 센서 위상 + 지터 (슬롯 안으로 감싸서 청크 사이 순서 유지)
+        offsets = self._phase_ms[None, :] + rng.normal(0, self.jitter * self.interval_ms, (m, n))
+        offsets = np.mod(offsets, self.interval_ms).astype(np.int64)
+        times = self._start_ms + slots[:, None] * self.interval_ms + offsets  # [m, n]
+
+        # AR(1) 드리프트 - 슬롯 순서대로 (센서 방향은 벡터화)
+        drift = np.empty((m, n, 2))
+        state = self._drift
+        shocks = rng.normal(0, 1, (m, n, 2)) * np.array([0.05, 0.15])
+        for i in range(m):
+            state = 0.98 * state + shocks[i]
+            drift[i] = state
+        self._drift = state
+
+        day_fraction = (times % 86_400_000) / 86_400_000
+        cycle = self._amplitude * np.sin(2 * np.pi * day_fraction + self._cycle_phase)
+        cold = self._base_cold + cycle + drift[..., 0]
+        hot = cold + self._hot_offset + rng.normal(0, 0.05, (m, n))
+        humidity_cold = self._base_humidity - 1.5 * (cycle + drift[..., 0]) + drift[..., 1]
+        humidity_hot = humidity_cold - self._hot_offset * 1.2 + rng.normal(0, 0.1, (m, n))
+
+        columns = {
+            'times_ms': times.ravel(),
+            'obj_ids': np.broadcast_to(self.sensor_ids, (m, n)).ravel().copy(),
+            'temperature_cold': cold.ravel(),
+            'temperature_hot': hot.ravel(),
+            'humidity_cold': np.clip(humidity_cold, 5, 95).ravel(),
+            'humidity_hot': np.clip(humidity_hot, 5, 95).ravel(),
+        }
+        keep = ~self._outage_mask(times).ravel()
+        columns = {key: column[keep] for key, column in columns.items()}
+        for key in CHANNEL_KEYS:
+            columns[key] = np.round(columns[key], 2)
+
+        order = np.argsort(columns['times_ms'], kind='stable')
+        columns = {key: column[order] for key, column in columns.items()}
+        columns = self._add_duplicates(columns)
+        return self._shuffle_locally(columns)
+
+    def _outage_mask(self, times):
+        """[m, n] True where the sensor is in an outage"""
+        m, n = times.shape
+        mask = np.zeros((m, n), dtype=bool)
+        chunk_days = m * self.interval_ms / 86_400_000
+        counts = self._rng.poisson(self.gaps_per_day * chunk_days, n)
+        for s in np.flatnonzero(counts):
+            for _ in range(counts[s]):
+                gap_start = self._rng.integers(times[0, s], times[-1, s] + 1)
+                gap_end = gap_start + self._rng.exponential(self.gap_ms)
+                mask[:, s] |= (times[:, s] >= gap_start) & (times[:, s] < gap_end)
+        return mask
+
+    def _add_duplicates(self, columns):
+        n = len(columns['times_ms'])
+        picked = np.flatnonzero(self._rng.random(n) < self.duplicate_rate)
+        if not len(picked):
+            return columns
+        # 같은 시각 재전송 - 절반은 같은 값, 절반은 0.01~0.05 다른 값
+        extra = {key: column[picked].copy() for key, column in columns.items()}
+        changed = self._rng.random(len(picked)) < 0.5
+        for key in CHANNEL_KEYS:
+            extra[key][changed] = np.round(extra[key][changed] + self._rng.choice([-0.05, -0.01, 0.01, 0.05], changed.sum()), 2)
+        positions = np.concatenate([np.arange(n), picked])  # 원본 바로 뒤에 삽입
+        order = np.argsort(positions, kind='stable')
+        return {key: np.concatenate([columns[key], extra[key]])[order] for key in columns}
+
+    def _shuffle_locally(self, columns):
+        n = len(columns['times_ms'])
+        order = np.arange(n)
+        for i in np.flatnonzero(self._rng.random(n) < self.out_of_order_rate):
+            j = min(n - 1, i + int(self._rng.integers(1, self.reorder_window + 1)))
+            order[i], order[j] = order[j], order[i]
+        return {key: column[order] for key, column in columns.items()}
+
+
+def format_timestamps(times_ms: np.ndarray) -> np.ndarray:
+    """int64 ms -> '2025-03-27T00:00:01.018Z' (the CSV @timestamp format)"""
+    text = np.datetime_as_string(times_ms.astype('datetime64[ms]'), unit='ms')
+    return np.char.add(text, 'Z')
+
+
+class _CsvWriter:
+    def __init__(self, path):
+        self._file = open(path, 'w', newline='')
+        self._writer = csv.writer(self._file)
+        temps, hums = SENSOR_DATA_CONFIG["temperature_columns"], SENSOR_DATA_CONFIG["humidity_columns"]
+        self._writer.writerow([SENSOR_DATA_CONFIG["timestamp_column"], SENSOR_DATA_CONFIG["obj_id_column"], "rsctypeId",
+                               temps["cold"], temps["hot"], hums["cold"], hums["hot"]])
+
+    def write(self, columns):
+        stamps = format_timestamps(columns['times_ms'])
+        values = [np.char.mod('%.2f', columns[key]) for key in CHANNEL_KEYS]
+        self._writer.writerows(zip(stamps, columns['obj_ids'].tolist(), [RSCTYPE_ID] * len(stamps), *values))
+
+    def close(self):
+        self._file.close()
+
+
+class _WeeklyParquetWriter:
+    """One file per KST week (week_NN_YYYYMMDD_YYYYMMDD_kst.parquet), one row group per chunk"""
+
+    def __init__(self, directory, start: datetime.datetime):
+        if not PYARROW_AVAILABLE:
+            raise ImportError("PyArrow is required for parquet output")
+        self._directory = directory
+        self._start_kst = start + KST
+        self._week = None
+        self._writer = None
+        self._pending_path = None
+        self.paths = []
+
+    def write(self, columns):
+        kst_days = (columns['times_ms'] + int(KST.total_seconds() * 1000)) // 86_400_000
+        epoch_day = (self._start_kst - datetime.datetime(1970, 1, 1)).days
+        weeks = (kst_days - epoch_day) // 7
+        for week in np.unique(weeks):
+            rows = weeks == week
+            self._writer_for(int(week)).write_table(self._table({key: column[rows] for key, column in columns.items()}))
+
+    def _writer_for(self, week):
+        if week != self._week:
+            self.close()
+            first = (self._start_kst + datetime.timedelta(days=7 * week)).date()
+            last = first + datetime.timedelta(days=6)
+            name = f"week_{week + 1:02d}_{first:%Y%m%d}_{last:%Y%m%d}_kst.parquet"
+            path = os.path.join(self._directory, name)
+            self._writer = pq.ParquetWriter(path, self._schema(), compression='snappy')
+            self._week = week
+            self.paths.append(path)
+        return self._writer
+
+    @staticmethod
+    def _schema():
+        m = PARQUET_COLUMN_MAPPING
+        return pa.schema([
+            (m['timestamp'], pa.string()),
+            ('timestamp_utc', pa.string()),
+            (m['objid'], pa.int64()),
+            (m['rsctypeid'], pa.string()),
+            (m['temperature_cold'], pa.float32()),
+            (m['temperature_hot'], pa.float32()),
+            (m['humidity_cold'], pa.float32()),
+            (m['humidity_hot'], pa.float32()),
+        ])
+
+    def _table(self, columns):
+        m = PARQUET_COLUMN_MAPPING
+        # parquet의 timestamp는 KST, timestamp_utc는 UTC (로더가 UTC에 9시간을 더함)
+        kst = np.datetime_as_string((columns['times_ms'] + int(KST.total_seconds() * 1000)).astype('datetime64[ms]'), unit='ms')
+        utc = np.datetime_as_string(columns['times_ms'].astype('datetime64[ms]'), unit='ms')
+        data = {
+            m['timestamp']: kst,
+            'timestamp_utc': utc,
+            m['objid']: columns['obj_ids'],
+            m['rsctypeid']: np.full(len(kst), RSCTYPE_ID),
+        }
+        for key in CHANNEL_KEYS:
+            data[m[key]] = columns[key].astype(np.float32)
+        return pa.table(data, schema=self._schema())
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+
+def write_rack_files(mapping: dict, directory: str):
+    """rack_sensor_map.txt + rack_directory.txt in the formats the TimeController loads"""
+    with open(os.path.join(directory, "rack_sensor_map.txt"), 'w') as f:
+        f.write("# 랙 경로와 센서 ID 매핑 (synthetic_fms)\n# 형식: 랙_경로 센서ID\n")
+        for rack_path, sensor_id in mapping.items():
+            f.write(f"{rack_path} {sensor_id}\n")
+    with open(os.path.join(directory, "rack_directory.txt"), 'w') as f:
+        f.write(" ".join("/Root" + rack_path for rack_path in mapping))
+
+
+def generate(out_dir: str, sensors: int = 24, days: float = 1.0, start: datetime.datetime = datetime.datetime(2025, 3, 27),
+             formats=('csv', 'parquet'), **stream_options) -> dict:
+    """Write the dataset under out_dir and return a summary (rows, files, seconds)"""
+    for fmt in formats:
+        if fmt not in ('csv', 'parquet'):
+            raise ValueError(f"Unknown format: {fmt} (expected 'csv' or 'parquet')")
+    os.makedirs(out_dir, exist_ok=True)
+    t0 = time.perf_counter()
+
+    sensor_ids = make_sensor_ids(sensors)
+    mapping = make_rack_mapping(sensor_ids)
+    write_rack_files(mapping, out_dir)
+
+    writers = []
+    csv_path = os.path.join(out_dir, SENSOR_DATA_CONFIG["csv_file"])
+    if 'csv' in formats:
+        writers.append(_CsvWriter(csv_path))
+    parquet_writer = None
+    if 'parquet' in formats:
+        parquet_dir = os.path.join(out_dir, "parquet")
+        os.makedirs(parquet_dir, exist_ok=True)
+        parquet_writer = _WeeklyParquetWriter(parquet_dir, start)
+        writers.append(parquet_writer)
+
+    stream = SyntheticFmsStream(sensor_ids, start, **stream_options)
+    rows = 0
+    try:
+        for columns in stream.chunks(days * 86400):
+            rows += len(columns['times_ms'])
+            for writer in writers:
+                writer.write(columns)
+    finally:
+        for writer in writers:
+            writer.close()
+
+    files = [csv_path] if 'csv' in formats else []
+    files += parquet_writer.paths if parquet_writer else []
+    return {
+        'sensors': len(sensor_ids),
+        'days': days,
+        'start': start.isoformat(),
+        'rows': rows,
+        'files': files,
+        'bytes': sum(os.path.getsize(path) for path in files),
+        'seconds': time.perf_counter() - t0,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--out", required=True, help="output directory")
+    parser.add_argument("--sensors", type=int, default=24)
+    parser.add_argument("--days", type=float, default=1.0, help="duration (fractions for hours, e.g. 0.25)")
+    parser.add_argument("--start", default="2025-03-27T00:00:00", help="first reading time (UTC, like the CSV)")
+    parser.add_argument("--interval", type=float, default=60.0, help="seconds between readings per sensor")
+    parser.add_argument("--jitter", type=float, default=0.2, help="reporting jitter as a fraction of the interval")
+    parser.add_argument("--gaps-per-day", type=float, default=0.5, help="outages per sensor per day")
+    parser.add_argument("--gap-minutes", type=float, default=30.0, help="mean outage length")
+    parser.add_argument("--duplicate-rate", type=float, default=0.004, help="fraction of rows re-sent with the same timestamp")
+    parser.add_argument("--out-of-order-rate", type=float, default=0.002, help="fraction of rows written out of order")
+    parser.add_argument("--formats", nargs="+", default=["csv", "parquet"], choices=["csv", "parquet"])
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    summary = generate(
+        args.out, sensors=args.sensors, days=args.days,
+        start=datetime.datetime.strptime(args.start, "%Y-%m-%dT%H:%M:%S"), formats=args.formats,
+        interval_s=args.interval, jitter=args.jitter, gaps_per_day=args.gaps_per_day, gap_minutes=args.gap_minutes,
+        duplicate_rate=args.duplicate_rate, out_of_order_rate=args.out_of_order_rate, seed=args.seed)
+    print(json.dumps(summary, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+"""
+Record N seconds of TimeController playback on the in-memory stage stand-in as a Chrome trace
+
+    python -m netai.timetravel.demo.benchmarks.trace_playback --sensors 24 --seconds 5 --out playback_trace.json
+
+Plays synthetic data at --speed, calling update() at --fps like the Kit update loop
+(with a seek every --seek-every frames), and writes the frame / resolve / colormap /
+USD apply spans as trace-event JSON for chrome://tracing or ui.perfetto.dev.
+Prints the recorder stats as JSON.
+"""
+import argparse
+import json
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from ..config import SENSOR_DATA_CONFIG
+from ..tracing import TraceRecorder
+from . import synthetic_fms
+from .usd_standin import UsdStandIn
+
+
+def run(args) -> dict:
+    with UsdStandIn(sensors=args.sensors, backend=args.backend) as standin, \
+            tempfile.TemporaryDirectory(prefix="fms_trace_") as directory:
+        from ..controller import TimeController
+        from ..engine import load_timeline_index
+
+        controller = TimeController()
+        synthetic_fms.generate(directory, sensors=args.sensors, days=args.days, formats=('csv',), seed=args.seed)
+        controller.engine.set_index(load_timeline_index(os.path.join(directory, SENSOR_DATA_CONFIG["csv_file"])))
+        controller._rack_paths = list(standin.racks)
+        controller._rack_to_sensor_map = standin.rack_to_sensor_map()
+        controller.engine.reset_applied()
+        controller.set_playback_speed(args.speed)
+        rng = np.random.default_rng(args.seed)
+
+        recorder = TraceRecorder(capacity=args.capacity).start(args.seconds)
+        controller.toggle_playback()
+        frame_interval = 1.0 / args.fps
+        frames = 0
+        deadline = time.perf_counter() + args.seconds
+        while time.perf_counter() < deadline:
+            frame_start = time.perf_counter()
+            if args.seek_every and frames and frames % args.seek_every == 0:
+                controller.set_current_time(controller.engine.clock.time_at_progress(float(rng.random())))
+            controller.update()
+            frames += 1
+            time.sleep(max(0.0, frame_interval - (time.perf_counter() - frame_start)))
+        recorder.stop()
+        controller.on_shutdown()
+
+        spans = recorder.export(args.out)
+        return dict(recorder.get_stats(), frames=frames, spans_written=spans, out=os.path.abspath(args.out))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sensors", type=int, default=24)
+    parser.add_argument("--backend", default="auto", choices=["auto", "mock", "usd"])
+    parser.add_argument("--days", type=float, default=0.1)
+    parser.add_argument("--seconds", type=float, default=5.0, help="wall-clock seconds to record")
+    parser.add_argument("--fps", type=float, default=60.0)
+    parser.add_argument("--speed", type=float, default=60.0, help="playback speed")
+    parser.add_argument("--seek-every", type=int, default=120, help="frames between random seeks (0: never)")
+    parser.add_argument("--capacity", type=int, default=200_000, help="max spans kept while recording")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", default="playback_trace.json")
+    args = parser.parse_args()
+
+    print(json.dumps(run(args), indent=2, default=str))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,450 @@
+# -*- coding: utf-8 -*-
+"""
+In-memory stand-ins for omni.usd / omni.timeline (and pxr when it is missing)
+
+    with UsdStandIn(sensors=1000) as standin:
+        from netai.timetravel.demo.controller import TimeController
+        controller = TimeController()
+        ...
+        print(standin.stage.calls)
+
+The stage is either a counting mock (backend='mock': every GetPrimAtPath, attribute
+Get/Set and customData get/set is counted) or a real Usd.Stage.CreateInMemory() when
+usd-core is installed (backend='usd'). Both are populated with the datacenter layout
+the controllers expect: /Root/datacenter/RACK_* racks with the four channel attributes,
+/Root/Air_Rack_*/Steam_0x/flowOffscreen/colormap prims and /Root/TimeManager.
+"""
+import sys
+import types
+from collections import Counter
+from typing import Dict
+
+from ..config import DEFAULT_TIME_CONFIG, USD_ATTRIBUTE_CONFIG, objid_to_airrack
+from . import synthetic_fms
+
+STEAM_COUNT = 3
+COLORMAP_X_POINTS = [0.1563, 0.3885, 0.5862, 0.80139]
+
+
+def _has_real_usd() -> bool:
+    try:
+        from pxr import Usd
+        return isinstance(getattr(Usd, 'Stage', None), type) and hasattr(Usd.Stage, 'CreateInMemory')
+    except ImportError:
+        return False
+
+
+# ---------------------------------------------------------------- mock stage
+class StandInAttribute:
+    __slots__ = ('_stage', 'name', 'type_name', 'value')
+
+    def __init__(self, stage, name, type_name, value=None):
+        self._stage = stage
+        self.name = name
+        self.type_name = type_name
+        self.value = value
+
+    def IsValid(self):
+        return self._stage is not None
+
+    def __bool__(self):
+        return self.IsValid()
+
+    def GetName(self):
+        return self.name
+
+    def Get(self, *_time):
+        if self._stage is not None:
+            self._stage.calls['Get'] += 1
+        return self.value
+
+    def Set(self, value, *_time):
+        if self._stage is None:
+            return False
+        self._stage.calls['Set'] += 1
+        self.value = value
+        return True
+
+
+class StandInPrim:
+    """A prim of StandInStage; an invalid prim (path None) answers IsValid() == False"""
+
+    def __init__(self, stage, path, type_name=""):
+        self._stage = stage
+        self.path = path
+        self.type_name = type_name
+        self.attributes: Dict[str, StandInAttribute] = {}
+        self.custom_data = {}
+        self.children = {}  # 이름 -> 자식 prim (생성 순서 유지)
+
+    def IsValid(self):
+        return self.path is not None
+
+    def __bool__(self):
+        return self.IsValid()
+
+    def GetPath(self):
+        return self.path
+
+    def GetPrim(self):
+        return self
+
+    def GetName(self):
+        return self.path.rsplit('/', 1)[-1] if self.path else ""
+
+    def GetTypeName(self):
+        return self.type_name
+
+    def GetChildren(self):
+        return list(self.children.values())
+
+    def HasAttribute(self, name):
+        return name in self.attributes
+
+    def GetAttribute(self, name):
+        attribute = self.attributes.get(name)
+        if attribute is None:
+            return StandInAttribute(None, name, None)
+        return attribute
+
+    def CreateAttribute(self, name, type_name, custom=True):
+        self._stage.calls['CreateAttribute'] += 1
+        attribute = self.attributes.get(name)
+        if attribute is None:
+            attribute = self.attributes[name] = StandInAttribute(self._stage, name, type_name)
+        return attribute
+
+    def GetCustomDataByKey(self, key):
+        self._stage.calls['GetCustomDataByKey'] += 1
+        return self.custom_data.get(key)
+
+    def SetCustomDataByKey(self, key, value):
+        self._stage.calls['SetCustomDataByKey'] += 1
+        self.custom_data[key] = value
+
+    def GetCustomData(self):
+        self._stage.calls['GetCustomDataByKey'] += 1
+        return dict(self.custom_data)
+
+
+class StandInStage:
+    """
+    Dict-backed stage with the subset of the Usd.Stage / Usd.Prim API the
+    controllers use. calls counts every stage access by method name.
+    """
+
+    def __init__(self):
+        self.calls = Counter()
+        self._prims = {}
+        self._invalid = StandInPrim(self, None)
+        self._pseudo_root = StandInPrim(self, "/")
+
+    def GetPrimAtPath(self, path):
+        self.calls['GetPrimAtPath'] += 1
+        return self._prims.get(str(path), self._invalid)
+
+    def GetPseudoRoot(self):
+        return self._pseudo_root
+
+    def DefinePrim(self, path, type_name=""):
+        path = str(path)
+        self.calls['DefinePrim'] += 1
+        prim = self._prims.get(path)
+        if prim is not None:
+            prim.type_name = type_name or prim.type_name
+            return prim
+        parent_path = path.rsplit('/', 1)[0] or "/"
+        parent = self._pseudo_root if parent_path == "/" else self.DefinePrim(parent_path)
+        prim = self._prims[path] = StandInPrim(self, path, type_name)
+        parent.children[prim.GetName()] = prim
+        return prim
+
+    def Traverse(self):
+        return iter(list(self._prims.values()))
+
+    def reset_calls(self):
+        self.calls.clear()
+
+
+# ---------------------------------------------------------------- mock pxr
+def _make_mock_pxr() -> types.ModuleType:
+    """Just enough of pxr for the controllers to import and write to a StandInStage"""
+    pxr = types.ModuleType('pxr')
+
+    class Vec4f(tuple):
+        def __new__(cls, *values):
+            return super().__new__(cls, values)
+
+    class ValueTypeNames:
+        Float = 'float'
+        Double = 'double'
+        Int = 'int'
+        Bool = 'bool'
+        String = 'string'
+        Token = 'token'
+        FloatArray = 'float[]'
+        Float4Array = 'float4[]'
+        Color4fArray = 'color4f[]'
+
+    class Xform:
+        @staticmethod
+        def Define(stage, path):
+            return stage.DefinePrim(path, 'Xform')
+
+    class TimeCode(float):
+        @staticmethod
+        def Default():
+            return TimeCode(float('nan'))
+
+    class Stage:
+        @staticmethod
+        def CreateInMemory(*_args):
+            return StandInStage()
+
+    pxr.Gf = types.SimpleNamespace(Vec4f=Vec4f, Vec3f=Vec4f)
+    pxr.Vt = types.SimpleNamespace(Vec4fArray=list, FloatArray=list)
+    pxr.Sdf = types.SimpleNamespace(ValueTypeNames=ValueTypeNames, Path=str)
+    pxr.UsdGeom = types.SimpleNamespace(Xform=Xform)
+    pxr.Usd = types.SimpleNamespace(Stage=Stage, TimeCode=TimeCode)
+    return pxr
+
+
+_modules = {}
+
+
+def _stand_in_modules() -> dict:
+    """
+    The mock pxr and omni modules, created once per process: modules imported
+    while installed keep references to them across install/uninstall cycles.
+    """
+    if not _modules:
+        pxr = _make_mock_pxr()
+        _modules['pxr'] = pxr
+        for name in ('Gf', 'Vt', 'Sdf', 'UsdGeom', 'Usd'):
+            _modules[f'pxr.{name}'] = getattr(pxr, name)
+        omni = _modules['omni'] = types.ModuleType('omni')
+        for name in ('usd', 'timeline'):
+            module = _modules[f'omni.{name}'] = types.ModuleType(f'omni.{name}')
+            setattr(omni, name, module)
+    return _modules
+
+
+# ---------------------------------------------------------------- omni
+class StandInSelection:
+    def __init__(self):
+        self.paths = []
+
+    def get_selected_prim_paths(self):
+        return list(self.paths)
+
+
+class StandInEventStream:
+    """Stage event stream that keeps its subscribers but never pushes events"""
+
+    def __init__(self):
+        self.subscribers = []
+
+    def create_subscription_to_pop(self, callback, name=None):
+        self.subscribers.append(callback)
+        return callback
+
+
+class StandInUsdContext:
+    """omni.usd context subset: the stage, selection and stage event stream (for the Time Window)"""
+
+    def __init__(self, stage):
+        self.stage = stage
+        self.selection = StandInSelection()
+        self.events = StandInEventStream()
+
+    def get_stage(self):
+        return self.stage
+
+    def get_selection(self):
+        return self.selection
+
+    def get_stage_event_stream(self):
+        return self.events
+
+
+class StandInTimeline:
+    """omni.timeline interface subset: current/start/end time codes and play state"""
+
+    def __init__(self, start_time: float = 0.0, end_time: float = 0.0, time_codes_per_second: float = 1.0):
+        self.calls = Counter()
+        self.current_time = start_time
+        self.start_time = start_time
+        self.end_time = end_time
+        self.time_codes_per_second = time_codes_per_second
+        self.playing = False
+
+    def set_current_time(self, value):
+        self.calls['set_current_time'] += 1
+        self.current_time = value
+
+    def get_current_time(self):
+        return self.current_time
+
+    def set_start_time(self, value):
+        self.start_time = value
+
+    def get_start_time(self):
+        return self.start_time
+
+    def set_end_time(self, value):
+        self.end_time = value
+
+    def get_end_time(self):
+        return self.end_time
+
+    def set_time_codes_per_second(self, value):
+        self.time_codes_per_second = value
+
+    def get_time_codes_per_seconds(self):
+        return self.time_codes_per_second
+
+    def play(self):
+        self.playing = True
+
+    def pause(self):
+        self.playing = False
+
+    def stop(self):
+        self.playing = False
+        self.current_time = self.start_time
+
+    def is_playing(self):
+        return self.playing
+
+    def is_stopped(self):
+        return not self.playing
+
+
+# ---------------------------------------------------------------- layout
+def build_datacenter(stage, sensors: int = 24, steams: int = STEAM_COUNT, time_manager: bool = True) -> dict:
+    """
+    Define the rack, colormap and TimeManager prims for `sensors` sensors on
+    stage (StandInStage or Usd.Stage). Racks follow synthetic_fms: the real
+    racks first, then /Root/datacenter/RACK_Sxxxxx. Returns {rack path
+    (with /Root): sensor ID}.
+    """
+    if isinstance(stage, StandInStage):
+        float_type, float_array, vec4_array = 'float', 'float[]', 'float4[]'
+    else:
+        from pxr import Sdf
+        float_type = Sdf.ValueTypeNames.Float
+        float_array = Sdf.ValueTypeNames.FloatArray
+        vec4_array = Sdf.ValueTypeNames.Float4Array
+
+    sensor_ids = synthetic_fms.make_sensor_ids(sensors)
+    racks = {"/Root" + rack_path: sensor_id for rack_path, sensor_id in synthetic_fms.make_rack_mapping(sensor_ids).items()}
+    channel_names = list(USD_ATTRIBUTE_CONFIG["rack_attributes"].values())
+    for rack_path in racks:
+        prim = stage.DefinePrim(rack_path, 'Xform')
+        for name in channel_names:
+            prim.CreateAttribute(name, float_type).Set(float('nan'))
+
+    # 실제 센서는 config의 Air_Rack 경로, 나머지는 Air_Rack_Sxxxxx
+    for sensor_id in sensor_ids:
+        air_rack = objid_to_airrack.get(sensor_id, f"/Root/Air_Rack_S{sensor_id:05d}")
+        for steam in range(1, steams + 1):
+            prim = stage.DefinePrim(f"{air_rack}/Steam_{steam:02d}/flowOffscreen/colormap", 'Colormap')
+            prim.CreateAttribute("xPoints", float_array).Set(list(COLORMAP_X_POINTS))
+            prim.CreateAttribute("rgbaPoints", vec4_array)
+
+    if time_manager:
+        prim = stage.DefinePrim(USD_ATTRIBUTE_CONFIG["time_manager_path"], 'Xform')
+        prim.SetCustomDataByKey("baseTime", DEFAULT_TIME_CONFIG["base_time"])
+    return racks
+
+
+class UsdStandIn:
+    """
+    Routes omni.usd.get_context() and omni.timeline.get_timeline_interface()
+    to an in-memory stage and timeline while installed.
+
+    Where omni (or pxr) cannot be imported, stand-in modules are registered
+    in sys.modules so the controllers import without Kit; otherwise only
+    the two entry points are patched. uninstall() restores everything.
+    """
+
+    def __init__(self, sensors: int = 24, backend: str = 'mock', steams: int = STEAM_COUNT,
+                 time_manager: bool = True):
+        if backend == 'auto':
+            backend = 'usd' if _has_real_usd() else 'mock'
+        if backend not in ('mock', 'usd'):
+            raise ValueError(f"Unknown backend: {backend} (expected 'mock', 'usd' or 'auto')")
+        if backend == 'usd':
+            if not _has_real_usd():
+                raise ImportError("usd-core (pxr.Usd) is required for backend='usd'")
+            from pxr import Usd
+            self.stage = Usd.Stage.CreateInMemory()
+        else:
+            self.stage = StandInStage()
+        self.backend = backend
+        self.racks = build_datacenter(self.stage, sensors, steams, time_manager)
+        self.calls.clear()  # 레이아웃 생성 호출은 세지 않음
+        self.context = StandInUsdContext(self.stage)
+        self.timeline = StandInTimeline()
+        self._saved_modules = {}
+        self._saved_functions = []
+
+    @property
+    def calls(self) -> Counter:
+        """Stage call counts (empty for the real USD backend)"""
+        return getattr(self.stage, 'calls', Counter())
+
+    def rack_to_sensor_map(self) -> dict:
+        """{rack path: sensor ID string}, as TimeController loads rack_sensor_map.txt"""
+        return {rack_path: str(sensor_id) for rack_path, sensor_id in self.racks.items()}
+
+    def install(self) -> "UsdStandIn":
+        if self._saved_modules or self._saved_functions:
+            return self
+        modules = _stand_in_modules()
+        if self.backend == 'mock':
+            try:
+                import pxr  # noqa: F401
+            except ImportError:
+                for name in ('pxr', 'pxr.Gf', 'pxr.Vt', 'pxr.Sdf', 'pxr.UsdGeom', 'pxr.Usd'):
+                    self._register(name, modules[name])
+
+        try:
+            import omni.usd
+            import omni.timeline
+        except ImportError:
+            for name in ('omni', 'omni.usd', 'omni.timeline'):
+                if name not in sys.modules:
+                    self._register(name, modules[name])
+
+        self._patch(sys.modules['omni.usd'], 'get_context', lambda *_args: self.context)
+        self._patch(sys.modules['omni.timeline'], 'get_timeline_interface', lambda *_args: self.timeline)
+        return self
+
+    def uninstall(self):
+        for module, name, original in reversed(self._saved_functions):
+            if original is None:
+                delattr(module, name)
+            else:
+                setattr(module, name, original)
+        self._saved_functions = []
+        for name, original in self._saved_modules.items():
+            if original is None:
+                sys.modules.pop(name, None)
+            else:
+                sys.modules[name] = original
+        self._saved_modules = {}
+
+    def _register(self, name, module):
+        self._saved_modules.setdefault(name, sys.modules.get(name))
+        sys.modules[name] = module
+
+    def _patch(self, module, name, function):
+        self._saved_functions.append((module, name, getattr(module, name, None)))
+        setattr(module, name, function)
+
+    def __enter__(self):
+        return self.install()
+
+    def __exit__(self, *_exc):
+        self.uninstall()
@@ -60,7 +60,10 @@ SENSOR_DATA_CONFIG = {
     "humidity_columns": {
         "cold": "HUMIDITY1", 
         "hot": "HUMIDITY"
-    }
+    },
+    # 로딩 시 센서별 시간 버킷 집계 (1ms = 원본 정밀도, 1000/5000/60000으로 늘리면 메모리 감소)
+    "bucket_ms": 1,
+    "bucket_reducer": "last",  # last / mean / max
 }
 
 # USD 속성 설정
@@ -81,6 +84,17 @@ USD_ATTRIBUTE_CONFIG = {
 
 # 로그 설정
 LOG_PREFIX = "[netai.timetravel.demo]"
+LOG_CONFIG = {
+    "level": "INFO",           # 이 레벨 미만은 기록하지 않음 (핫 루프에서 비용 없음)
+    "echo_level": "WARNING",   # 이 레벨 이상만 콘솔 출력, 나머지는 링 버퍼에만
+    "capacity": 4096,          # 링 버퍼 레코드 수
+    "echo_per_second": 20      # 초당 콘솔 출력 상한 (0 = 제한 없음)
+}
+
+# 시간 컨트롤러 선택
+CONTROLLER_CONFIG = {
+    "backend": "csv"   # "csv": 로컬 CSV TimeController, "parquet": 주간 parquet 점진 로딩 (OptimizedTimeController)
+}
 
 # 기본 시간 설정
 DEFAULT_TIME_CONFIG = {
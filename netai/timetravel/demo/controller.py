@@ -4,10 +4,10 @@ import datetime
 import time
 import omni.timeline
 import os
-import csv
 from datetime import datetime as dt
 import random
 
+
 '''
 정확한 timestamp 매칭 + last known value 방식으로 센서 데이터 업데이트
 '''
@@ -22,6 +22,10 @@ from .config import (
     DEFAULT_TIME_CONFIG,
     objid_to_airrack,
 )
+from .engine import SensorTimelineIndex, StageWriter, TimelineEngine, load_timeline_index, parse_timestamp
+from .ringlog import logger
+from .tracing import COLORMAP, SCRUB, tracer
+
 # --- Dynamic colormap update function ----------------------------------------------
 # --- Color‐mapping function (unchanged) ---
 def compute_color_from_temperature(T):
@@ -78,7 +82,10 @@ def update_dynamic_colormap(temperature, color_rgba_cl,prefix_prim_path):
     
     The xPoints (positions) remain fixed.
     """
-    print("Updating dynamic colormap for temperature:", temperature)
+    # 프레임마다 호출되므로 모든 로그는 DEBUG (꺼져 있으면 포맷도 하지 않음)
+    debug = logger.debug_enabled
+    if debug:
+        logger.debug("Updating dynamic colormap for temperature: %s", temperature)
     
     # Clamp temperature to the [15, 30] range:
     # T_min = 15.0
@@ -123,27 +130,36 @@ def update_dynamic_colormap(temperature, color_rgba_cl,prefix_prim_path):
         stage = omni.usd.get_context().get_stage()
         prim = stage.GetPrimAtPath(prm_path)
         if not prim.IsValid():
-            print("Colormap prim not found at:", prm_path)
+            logger.warning_once(("colormap prim", prm_path), "Colormap prim not found at: %s", prm_path)
             return
         
         xPoints_attr = prim.GetAttribute("xPoints")
         if xPoints_attr.IsValid():
             xPoints_attr.Set(new_xPoints)
-            print("xPoints updated:", new_xPoints)
+            if debug:
+                logger.debug("xPoints updated: %s", new_xPoints)
         else:
-            print("xPoints attribute not found on prim.")
+            logger.warning_once(("xPoints", prm_path), "xPoints attribute not found on prim: %s", prm_path)
         
         rgbaPoints_attr = prim.GetAttribute("rgbaPoints")
         if rgbaPoints_attr.IsValid():
             rgbaPoints_attr.Set(new_rgbaPoints)
-            print("rgbaPoints updated:", new_rgbaPoints)
+            if debug:
+                logger.debug("rgbaPoints updated: %s", new_rgbaPoints)
         else:
-            print("rgbaPoints attribute not found on prim.")
-        print(f"Updated colormap for {prm_path} with temperature {steam_temperature}°C: {computed_color}")
+            logger.warning_once(("rgbaPoints", prm_path), "rgbaPoints attribute not found on prim: %s", prm_path)
+        if debug:
+            logger.debug("Updated colormap for %s with temperature %s°C: %s", prm_path, steam_temperature, computed_color)
 
 
-class TimeController:
-    """USD Stage의 시간을 관리하고 데이터센터 센서 데이터를 연동하는 컨트롤러"""
+class TimeController(StageWriter):
+    """
+    USD Stage의 시간을 관리하고 데이터센터 센서 데이터를 연동하는 컨트롤러
+    
+    Loading, indexing, LKV state and the playback clock live in a headless
+    TimelineEngine; this class is its USD adapter (StageWriter) plus the
+    stage-side rack discovery and debugging helpers.
+    """
     
     def __init__(self):
         """시간 컨트롤러 초기화"""
@@ -162,19 +178,15 @@ class TimeController:
         # 기존 데이터 초기화 - 스테이지에서 랙 검색 및 속성 초기화
         self._initialize_rack_attributes()
         
+        # 헤드리스 엔진: 밀리초 타임라인 인덱스, 랙 매핑, LKV, 재생 시계 (USD 쓰기는 이 객체가 담당)
+        self._engine = TimelineEngine(writer=self)
+        
         # 랙 목록 및 매핑 초기화
         self._rack_paths = []
         self._rack_to_sensor_map = {}  # 랙 경로 -> 센서 ID 매핑
         self._load_rack_paths()
 
-        # 고성능 사전 계산된 타임라인
-        self._second_timeline = {}  # 모든 초에 대해 사전 계산된 데이터
-
-
         # 센서 데이터 초기화
-        self._sensor_data = {}  # 정규화된 timestamp 기준으로 그룹화된 센서 데이터
-        self._sorted_timestamps = []  # 정렬된 timestamp 목록
-        self._last_known_values = {}  # 각 랙의 마지막 알려진 값 저장
         self._load_sensor_data()
         
         # 속성 캐시 초기화
@@ -184,11 +196,6 @@ class TimeController:
         # 센서 데이터 기반으로 시간 범위 초기화
         self._initialize_time_range()
         
-        # 재생 상태 초기화
-        self._is_playing = False
-        self._playback_speed = 1.0
-        self._last_update_time = time.time()
-        
         # 시간 관리자에 baseTime 설정 확인 및 설정
         self._ensure_base_time()
         
@@ -196,16 +203,78 @@ class TimeController:
         self._update_stage_time()
         
         # 매핑된 랙 수 출력
-        unique_sensors = set()
-        if self._sensor_data:
-            for sensors in self._sensor_data.values():
-                unique_sensors.update(sensors.keys())
-        
-        print(f"{LOG_PREFIX} 초기화 완료. 매핑된 랙 수: {len(self._rack_to_sensor_map)}, 데이터가 있는 센서 수: {len(unique_sensors)}")
+        print(f"{LOG_PREFIX} 초기화 완료. 매핑된 랙 수: {len(self._rack_to_sensor_map)}, 데이터가 있는 센서 수: {self.get_sensor_count()}")
         
         # 디버깅: 매핑 상태 출력
         self._debug_mapping_status()
     
+    # ========== 엔진 상태 (기존 속성 이름 유지) ==========
+    
+    @property
+    def engine(self):
+        return self._engine
+    
+    @property
+    def _timeline_index(self):
+        return self._engine.index
+    
+    @property
+    def _sensor_data(self):
+        """정규화된 timestamp 기준으로 그룹화된 센서 데이터 (정확 매치 헬퍼용)"""
+        return self._engine.rows_by_timestamp
+    
+    @property
+    def _rack_paths(self):
+        return self._engine.rack_paths
+    
+    @_rack_paths.setter
+    def _rack_paths(self, rack_paths):
+        self._engine.rack_paths = list(rack_paths)
+    
+    @property
+    def _rack_to_sensor_map(self):
+        return self._engine.rack_to_sensor_map
+    
+    @_rack_to_sensor_map.setter
+    def _rack_to_sensor_map(self, mapping):
+        self._engine.rack_to_sensor_map = mapping
+    
+    @property
+    def _last_known_values(self):
+        return self._engine.last_known_values
+    
+    @property
+    def _start_time(self):
+        return self._engine.clock.start_time
+    
+    @_start_time.setter
+    def _start_time(self, value):
+        self._engine.clock.start_time = value
+    
+    @property
+    def _end_time(self):
+        return self._engine.clock.end_time
+    
+    @_end_time.setter
+    def _end_time(self, value):
+        self._engine.clock.end_time = value
+    
+    @property
+    def _current_time(self):
+        return self._engine.clock.current_time
+    
+    @_current_time.setter
+    def _current_time(self, value):
+        self._engine.clock.current_time = value
+    
+    @property
+    def _is_playing(self):
+        return self._engine.clock.playing
+    
+    @property
+    def _playback_speed(self):
+        return self._engine.clock.speed
+    
     def _setup_stage_caching(self):
         """ Stage 캐싱 설정 """
         
@@ -427,257 +496,34 @@ class TimeController:
             return False
     
     def _load_sensor_data(self):
-        """센서 데이터 CSV 파일 로드 - timestamp를 센티초 단위로 정규화"""
+        """센서 데이터 CSV 파일 로드 - timestamp를 밀리초 단위로 정규화"""
         try:
             csv_path = os.path.join(os.path.dirname(__file__), SENSOR_DATA_CONFIG["csv_file"])
             
-            with open(csv_path, 'r') as file:
-                reader = csv.DictReader(file)
-                data_list = list(reader)
-            
-            # timestamp 기준으로 데이터 그룹화 + 정규화
-            for entry in data_list:
-                original_timestamp = entry.get(SENSOR_DATA_CONFIG["timestamp_column"])
-                if not original_timestamp:
-                    continue
-                
-                # 🚀 핵심: timestamp를 센티초 단위로 정규화
-                normalized_timestamp = self._normalize_timestamp_to_seconds(original_timestamp)
-                if not normalized_timestamp:
-                    continue
-                
-                obj_id = entry.get(SENSOR_DATA_CONFIG["obj_id_column"], "unknown")
-                
-                # 숫자 형식으로 변환
-                temp_columns = SENSOR_DATA_CONFIG["temperature_columns"]
-                hum_columns = SENSOR_DATA_CONFIG["humidity_columns"]
-                
-                for field in [temp_columns["cold"], temp_columns["hot"], hum_columns["cold"], hum_columns["hot"]]:
-                    if field in entry:
-                        try:
-                            entry[field] = float(entry[field])
-                        except (ValueError, TypeError):
-                            entry[field] = 0.0
-                
-                # 원본 timestamp도 보관 (디버깅용)
-                entry['original_timestamp'] = original_timestamp
-                entry['normalized_timestamp'] = normalized_timestamp
-                
-                # 정규화된 timestamp를 key로 사용하여 데이터 저장
-                if normalized_timestamp not in self._sensor_data:
-                    self._sensor_data[normalized_timestamp] = {}
-                
-                self._sensor_data[normalized_timestamp][obj_id] = entry
-            
-            # 🚀 정규화된 timestamp 정렬
-            # self._sorted_timestamps = sorted(self._sensor_data.keys())
-            self._sorted_timestamps = list(self._sensor_data.keys())
+            # 🚀 핵심: 엔진 로더가 센서 x 버킷 단위로 벡터화 집계 후 밀리초 타임라인 인덱스 생성
+            self._engine.set_index(load_timeline_index(csv_path))
+            print(f"{LOG_PREFIX} 타임라인 인덱스: {len(self._timeline_index)}개 행 "
+                  f"({SENSOR_DATA_CONFIG.get('bucket_ms', 1)}ms 버킷, {SENSOR_DATA_CONFIG.get('bucket_reducer', 'last')}), "
+                  f"{len(self._timeline_index.sensor_ids)}개 센서, {self._timeline_index.nbytes() / 1024:.1f} KB")
             
-            # 결과 요약
-            total_timestamps = len(self._sensor_data)
-            total_entries = sum(len(sensors) for sensors in self._sensor_data.values())
-            unique_sensors = set()
-            for sensors in self._sensor_data.values():
-                unique_sensors.update(sensors.keys())
+            # 결과 요약 (인덱스 생성 시 미리 계산됨)
+            summary = self._timeline_index.summary
+            print(f"{LOG_PREFIX} 로드된 센서 데이터: {summary['rows']}개 데이터, {summary['timestamps']}개 정규화된 타임스탬프, {summary['sensors']}개 센서")
             
-            print(f"{LOG_PREFIX} 로드된 센서 데이터: {total_entries}개 데이터, {total_timestamps}개 정규화된 타임스탬프, {len(unique_sensors)}개 센서")
-            
-            if self._sorted_timestamps:
-                print(f"{LOG_PREFIX} 정규화된 시간 범위: {self._sorted_timestamps[0]} ~ {self._sorted_timestamps[-1]}")
-            
-            # 🚀 핵심: 사전 계산 실행
-            self.precompute_cumulative_lkv_timeline()
-            # self.precompute_second_timeline()
+            time_range = self._timeline_index.time_range()
+            if time_range:
+                print(f"{LOG_PREFIX} 정규화된 시간 범위: {time_range[0]} ~ {time_range[1]}")
             
         except Exception as e:
             print(f"{LOG_PREFIX} 센서 데이터 로드 오류: {e}")
-            self._sensor_data = {}
-            self._sorted_timestamps = []
-
-    def precompute_cumulative_lkv_timeline(self):
-        """센서별 누적 LKV로 초단위 타임라인 사전 계산"""
-        print(f"{LOG_PREFIX} === 센서별 누적 LKV 타임라인 계산 시작 ===")
-        
-        if not self._sorted_timestamps:
-            print(f"{LOG_PREFIX} 센서 데이터가 없어 사전 계산을 건너뜁니다.")
-            return
-        
-        # 1. 모든 센서 ID 수집
-        all_sensor_ids = set()
-        for sensors in self._sensor_data.values():
-            all_sensor_ids.update(sensors.keys())
-        
-        print(f"{LOG_PREFIX} 전체 센서 수: {len(all_sensor_ids)}")
-        print(f"{LOG_PREFIX} 센서 ID들: {sorted(all_sensor_ids)}")
-        
-        # 2. 시간 범위 설정
-        start_dt = self._parse_timestamp(self._sorted_timestamps[0])
-        end_dt = self._parse_timestamp(self._sorted_timestamps[-1])
-        
-        if not start_dt or not end_dt:
-            print(f"{LOG_PREFIX} 시간 파싱 실패")
-            return
-        
-        print(f"{LOG_PREFIX} 계산 범위: {start_dt} ~ {end_dt}")
-        
-        # 3. 센서별 LKV 저장소 초기화
-        sensor_lkv = {}  # {sensor_id: 최신_데이터}
-        
-        # 4. 초기 LKV 설정 - 각 센서의 첫 번째 데이터로 초기화
-        print(f"{LOG_PREFIX} 센서별 초기 LKV 설정 중...")
-        for sensor_id in all_sensor_ids:
-            # 각 센서의 첫 번째 등장 시점 찾기
-            for timestamp in self._sorted_timestamps:
-                if sensor_id in self._sensor_data[timestamp]:
-                    sensor_lkv[sensor_id] = self._sensor_data[timestamp][sensor_id]
-                    print(f"{LOG_PREFIX}   {sensor_id}: 초기 LKV 설정 ({timestamp})")
-                    break
-            
-            if sensor_id not in sensor_lkv:
-                print(f"{LOG_PREFIX}   ⚠️  {sensor_id}: 초기 데이터를 찾을 수 없음")
-        
-        # 5. 매 초마다 누적 LKV 계산
-        self._second_timeline = {}
-        current_time = start_dt
-        total_seconds = 0
-        update_events = 0
-        
-        print(f"{LOG_PREFIX} 매 초 누적 LKV 계산 시작...")
-        
-        while current_time <= end_dt:
-            second_key = current_time.strftime("%Y-%m-%dT%H:%M:%SZ")
-            
-            # 현재 시점에 실제 데이터가 있으면 해당 센서들의 LKV 업데이트
-            if second_key in self._sensor_data:
-                current_updates = self._sensor_data[second_key]
-                
-                for sensor_id, new_data in current_updates.items():
-                    if sensor_id in sensor_lkv:  # 알려진 센서만 업데이트
-                        sensor_lkv[sensor_id] = new_data
-                        update_events += 1
-                
-                if len(current_updates) > 0:
-                    updated_sensors = list(current_updates.keys())
-                    print(f"{LOG_PREFIX} {second_key}: {len(current_updates)}개 센서 업데이트 {updated_sensors}")
-            
-            # 현재 시점의 모든 센서 LKV를 second_timeline에 저장
-            self._second_timeline[second_key] = sensor_lkv.copy()  # 깊은 복사 중요!
-            
-            total_seconds += 1
-            current_time += datetime.timedelta(seconds=1)
-            
-            # 진행 상황 출력 (1000초마다)
-            if total_seconds % 1000 == 0:
-                print(f"{LOG_PREFIX} 진행: {total_seconds:,}초 처리 완료...")
-        
-        print(f"{LOG_PREFIX} === 누적 LKV 계산 완료 ===")
-        print(f"{LOG_PREFIX} 총 처리 초 수: {total_seconds:,}")
-        print(f"{LOG_PREFIX} 센서 업데이트 이벤트: {update_events:,}")
-        print(f"{LOG_PREFIX} 센서별 평균 업데이트: {update_events/len(all_sensor_ids):.1f}회")
-        
-        # 6. 검증: 몇 개 시점 확인
-        print(f"\n{LOG_PREFIX} === 누적 LKV 검증 ===")
-        sample_times = [start_dt + datetime.timedelta(seconds=i) for i in [0, 60, 300, 600]]
-        
-        for sample_time in sample_times:
-            sample_key = sample_time.strftime("%Y-%m-%dT%H:%M:%SZ")
-            sample_data = self._second_timeline.get(sample_key)
-            
-            if sample_data:
-                print(f"{LOG_PREFIX} {sample_key}: ✅ {len(sample_data)}개 센서 (전체 센서 커버)")
-                
-                # 첫 3개 센서 샘플 값 확인
-                for i, (sensor_id, data) in enumerate(list(sample_data.items())[:3]):
-                    temp_val = data.get('TEMPERATURE1', 'N/A')
-                    print(f"{LOG_PREFIX}   {sensor_id}: TEMPERATURE1={temp_val}")
-            else:
-                print(f"{LOG_PREFIX} {sample_key}: ❌ 데이터 없음")
-                
-    def _normalize_timestamp_to_seconds(self, timestamp_str):
-        """타임스탬프를 센티초 단위로 정규화"""
-        try:
-            # 1. 원본 timestamp 파싱
-            dt = self._parse_timestamp(timestamp_str)
-            if not dt:
-                return None
-            
-            # 2. 센티초 단위로 변환 (마이크로초 뒤 4자리 제거)
-            # normalized = dt.strftime("%Y-%m-%dT%H:%M:%S.%f")[:-4] + "Z"
-            normalized = dt.strftime("%Y-%m-%dT%H:%M:%SZ")
-            return normalized
-            
-        except Exception as e:
-            print(f"{LOG_PREFIX} 타임스탬프 정규화 오류 ({timestamp_str}): {e}")
-            return None
-        
-    def precompute_second_timeline(self):
-        """모든 초에 대해 LKV 데이터 미리 할당 - 고성능 사전 계산"""
-        print(f"{LOG_PREFIX} === 초단위 타임라인 사전 계산 시작 ===")
-        
-        if not self._sorted_timestamps:
-            print(f"{LOG_PREFIX} 센서 데이터가 없어 사전 계산을 건너뜁니다.")
-            return
-        
-        self._second_timeline = {}
-        current_lkv_data = None
-        
-        # 시작/끝 시간 확인
-        start_dt = self._parse_timestamp(self._sorted_timestamps[0])
-        end_dt = self._parse_timestamp(self._sorted_timestamps[-1])
-        
-        if not start_dt or not end_dt:
-            print(f"{LOG_PREFIX} 시작/끝 시간 파싱 실패")
-            return
-        
-        print(f"{LOG_PREFIX} 사전 계산 범위: {start_dt} ~ {end_dt}")
-        
-        # 시작 시간부터 끝 시간까지 모든 초 순회
-        current_time = start_dt
-        total_seconds = 0
-        actual_data_count = 0
-        lkv_count = 0
-        
-        while current_time <= end_dt:
-            second_key = current_time.strftime("%Y-%m-%dT%H:%M:%SZ")
-            
-            # 실제 센서 데이터가 있으면 LKV 업데이트
-            if second_key in self._sensor_data:
-                current_lkv_data = self._sensor_data[second_key]
-                actual_data_count += 1
-                print(f"{LOG_PREFIX} 실제 데이터 발견: {second_key} ({len(current_lkv_data)}개 센서)")
-            
-            # 현재 초에 LKV 할당 (실제 데이터 또는 이전 데이터)
-            if current_lkv_data:
-                self._second_timeline[second_key] = current_lkv_data
-                if second_key not in self._sensor_data:
-                    lkv_count += 1
-            else:
-                # 아직 데이터가 없는 경우 (시작 지점)
-                self._second_timeline[second_key] = None
-            
-            total_seconds += 1
-            current_time += datetime.timedelta(seconds=1)
-        
-        print(f"{LOG_PREFIX} === 사전 계산 완료 ===")
-        print(f"{LOG_PREFIX} 총 초 수: {total_seconds:,}개")
-        print(f"{LOG_PREFIX} 실제 데이터: {actual_data_count:,}개")
-        print(f"{LOG_PREFIX} LKV 할당: {lkv_count:,}개")
-        print(f"{LOG_PREFIX} 압축 비율: {actual_data_count}/{total_seconds} = {actual_data_count/total_seconds*100:.1f}%")
-        
-        # 메모리 사용량 추정
-        estimated_mb = total_seconds * 0.5 / 1024  # 대략적 추정
-        print(f"{LOG_PREFIX} 예상 메모리 사용량: ~{estimated_mb:.1f} MB")
-
+            self._engine.set_index(SensorTimelineIndex())
         
     def _initialize_time_range(self):
         """센서 데이터 기반으로 시간 범위 초기화"""
         try:
-            if self._sorted_timestamps:
-                first_timestamp = self._sorted_timestamps[0]
-                last_timestamp = self._sorted_timestamps[-1]
-                
-                self._start_time = self._parse_timestamp(first_timestamp)
-                self._end_time = self._parse_timestamp(last_timestamp)
+            time_range = self._timeline_index.time_range()
+            if time_range:
+                self._start_time, self._end_time = time_range
                 self._current_time = self._start_time
                 
                 print(f"{LOG_PREFIX} 시간 범위 설정: {self._start_time} ~ {self._end_time}")
@@ -696,12 +542,7 @@ class TimeController:
     def _parse_timestamp(self, timestamp_str):
         """타임스탬프 문자열을 datetime으로 파싱"""
         try:
-            if "." in timestamp_str and timestamp_str.endswith("Z"):
-                return dt.strptime(timestamp_str, "%Y-%m-%dT%H:%M:%S.%fZ")
-            elif timestamp_str.endswith("Z"):
-                return dt.strptime(timestamp_str, "%Y-%m-%dT%H:%M:%SZ")
-            else:
-                return dt.strptime(timestamp_str, "%Y-%m-%dT%H:%M:%S")
+            return parse_timestamp(timestamp_str)
         except Exception as e:
             print(f"{LOG_PREFIX} 타임스탬프 파싱 오류: {e}")
             return None
@@ -781,7 +622,7 @@ class TimeController:
                 hum1 = float(hum1)
                 hum2 = float(hum2)
             except (ValueError, TypeError):
-                print(f"{LOG_PREFIX} 유효하지 않은 데이터 값 - 기본값 사용")
+                logger.warning("유효하지 않은 데이터 값 - 기본값 사용 (%s)", rack_path)
                 temp1 = temp2 = hum1 = hum2 = 0.0
             
             attr_config = USD_ATTRIBUTE_CONFIG["rack_attributes"]
@@ -821,7 +662,8 @@ class TimeController:
                 current_value = rack_prim.GetCustomDataByKey(key)
                 if current_value != value:
                     rack_prim.SetCustomDataByKey(key, value)
-                    print(f"{LOG_PREFIX} {rack_path} 속성 업데이트: {key} = {value}")
+                    if logger.debug_enabled:
+                        logger.debug("%s 속성 업데이트: %s = %s", rack_path, key, value)
 
 
             normalized_path = rack_path.replace("/Root", "")
@@ -832,51 +674,32 @@ class TimeController:
                 try:
                     obj_id = int(obj_id_str)
                 except ValueError:
-                    print(f"Invalid obj_id format for path {normalized_path}")
+                    logger.warning_once(("obj_id format", normalized_path), "Invalid obj_id format for path %s", normalized_path)
                     obj_id = None
             else:
-                print(f"Rack path not found in mapping: {normalized_path}")
+                # 매 프레임 반복되는 조건 - 경로당 한 번만 경고 (링 버퍼를 같은 메시지로 채우지 않음)
+                logger.warning_once(("rack mapping", normalized_path), "Rack path not found in mapping: %s", normalized_path)
                 obj_id = None
 
             if obj_id is not None:
-                # Step 3: Use temp1 directly
-                t1_value = temp1
+                with tracer.span(COLORMAP, {'rack': rack_path} if tracer.enabled else None):
+                    # Step 3: Use temp1 directly
+                    t1_value = temp1
 
-                # Step 4: Compute color
-                rgba_col = compute_color_from_temperature(t1_value)
+                    # Step 4: Compute color
+                    rgba_col = compute_color_from_temperature(t1_value)
 
-                # Step 5: Optionally update dynamic colormap
-                # if obj_id < 26:
-                path = objid_to_airrack[obj_id]
-                update_dynamic_colormap(t1_value, rgba_col, path)
+                    # Step 5: Optionally update dynamic colormap
+                    # if obj_id < 26:
+                    path = objid_to_airrack[obj_id]
+                    update_dynamic_colormap(t1_value, rgba_col, path)
         
         except Exception as e:
-            print(f"{LOG_PREFIX} 객체 속성 업데이트 오류 ({rack_path}): {e}")
+            logger.error("객체 속성 업데이트 오류 (%s): %s", rack_path, e)
     
     def get_sensor_id_for_rack(self, rack_path):
         """특정 랙에 매핑된 센서 ID 가져오기"""
-        # 직접 매핑 확인
-        if rack_path in self._rack_to_sensor_map:
-            return self._rack_to_sensor_map.get(rack_path)
-        
-        # 끝부분 비교
-        rack_name = rack_path.split('/')[-1] if '/' in rack_path else rack_path
-        for path, sensor_id in self._rack_to_sensor_map.items():
-            if path.endswith('/' + rack_name):
-                return sensor_id
-        
-        # 경로 변형 시도
-        variations = []
-        if rack_path.startswith('/World/'):
-            variations.append(rack_path[6:])
-        elif not rack_path.startswith('/World'):
-            variations.append('/World' + rack_path)
-        
-        for var_path in variations:
-            if var_path in self._rack_to_sensor_map:
-                return self._rack_to_sensor_map.get(var_path)
-        
-        return None
+        return self._engine.sensor_id_for_rack(rack_path)
     
     def _update_all_racks(self):
         """고성능 초단위 사전 계산된 데이터로 랙 업데이트"""
@@ -930,7 +753,7 @@ class TimeController:
         #     print(f"{LOG_PREFIX} [고성능] 사용 가능한 시간 (예시): {available_times}")
             
         #     return 0             
-        return self._update_all_racks_with_debug()
+        return self._engine.apply_all()
     
     def debug_specific_time_data(self, target_time=None):
         """특정 시점의 second_data 상세 분석"""
@@ -942,17 +765,17 @@ class TimeController:
             time_str = target_time
             target_dt = self._parse_timestamp(target_time)
         else:
-            time_str = target_time.strftime("%Y-%m-%dT%H:%M:%SZ")
+            time_str = target_time.strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
             target_dt = target_time
         
         print(f"\n{LOG_PREFIX} ========== 특정 시점 데이터 분석 ==========")
         print(f"{LOG_PREFIX} 분석 시점: {time_str}")
         print(f"{LOG_PREFIX} 현재 컨트롤러 시간: {self._current_time.strftime('%Y-%m-%dT%H:%M:%SZ')}")
         
-        # 1. _second_timeline에서 데이터 조회
-        second_data = self._second_timeline.get(time_str)
+        # 1. 타임라인 인덱스에서 데이터 조회 (해당 시점의 LKV)
+        second_data = self._timeline_index.at(target_dt) if target_dt else None
         
-        print(f"\n{LOG_PREFIX} === _second_timeline 조회 결과 ===")
+        print(f"\n{LOG_PREFIX} === 타임라인 인덱스 조회 결과 ===")
         if second_data is None:
             print(f"{LOG_PREFIX} ❌ second_data: None (데이터 없음)")
         else:
@@ -1026,95 +849,45 @@ class TimeController:
             'would_update': second_data is not None
         }   
     def debug_time_movement(self, from_time, to_time):
-        """시간 이동 전후 데이터 비교"""
+        """시간 이동 전후 데이터 비교 - 값이 바뀐 랙/채널과 변화량만 출력"""
         print(f"\n{LOG_PREFIX} ========== 시간 이동 디버깅 ==========")
         
-        # 이동 전 상태
-        print(f"{LOG_PREFIX} === 이동 전: {from_time} ===")
-        before_result = self.debug_specific_time_data(from_time)
-        
-        # 시간 이동
+        if isinstance(from_time, str):
+            from_dt = self._parse_timestamp(from_time)
+        else:
+            from_dt = from_time
         if isinstance(to_time, str):
             to_dt = self._parse_timestamp(to_time)
         else:
             to_dt = to_time
         
-        print(f"\n{LOG_PREFIX} === 시간 이동 실행: {from_time} -> {to_time} ===")
-        self.set_current_time(to_dt)
+        # 두 시점 전체 상태 대신 변경점 인덱스 비교로 바뀐 랙만 계산
+        changes = self.diff_state(from_dt, to_dt)
         
-        # 이동 후 상태
-        print(f"{LOG_PREFIX} === 이동 후: {to_time} ===")
-        after_result = self.debug_specific_time_data(to_time)
+        print(f"{LOG_PREFIX} === 시간 이동 실행: {from_time} -> {to_time} ===")
+        self.set_current_time(to_dt)
         
         # 비교 결과
-        print(f"\n{LOG_PREFIX} === 이동 결과 비교 ===")
-        print(f"{LOG_PREFIX} 이동 전 데이터 있음: {before_result['would_update']}")
-        print(f"{LOG_PREFIX} 이동 후 데이터 있음: {after_result['would_update']}")
-        
-        if before_result['would_update'] != after_result['would_update']:
-            print(f"{LOG_PREFIX} ⚠️  데이터 상태 변화 감지!")
-        
-        return before_result, after_result       
+        print(f"\n{LOG_PREFIX} === 이동 결과 비교: 변경된 랙 {len(changes)}/{len(self._rack_paths)} ===")
+        for rack_path, columns in changes.items():
+            rack_name = rack_path.split('/')[-1]
+            details = ", ".join(f"{column} {change['from']:.2f}->{change['to']:.2f} ({change['delta']:+.2f})"
+                                for column, change in columns.items())
+            print(f"{LOG_PREFIX}   {rack_name}: {details}")
+        
+        return changes
     
-    def _update_all_racks_with_debug(self):
-        """디버깅이 추가된 _update_all_racks"""
-        current_second = self._current_time.strftime("%Y-%m-%dT%H:%M:%SZ")
-        
-        print(f"\n{LOG_PREFIX} == _update_all_racks 실행 ==")
-        print(f"{LOG_PREFIX} 현재 시간: {current_second}")
-        
-        # second_data 조회
-        second_data = self._second_timeline.get(current_second)
+    def diff_state(self, from_time, to_time):
+        """
+        {rack_path: {column: {'from', 'to', 'delta'}}} for the racks whose
+        last-known value differs between from_time and to_time.
+        """
+        if isinstance(from_time, str):
+            from_time = self._parse_timestamp(from_time)
+        if isinstance(to_time, str):
+            to_time = self._parse_timestamp(to_time)
         
-        if second_data:
-            print(f"{LOG_PREFIX} ✅ second_data 발견: {len(second_data)}개 센서")
-            updated_count = 0
-            maintained_count = 0
-            failed_count = 0
-            
-            for rack_path in self._rack_paths: # 이런거 병령처리 되나?
-                sensor_id = self.get_sensor_id_for_rack(rack_path) 
-                
-                if sensor_id and sensor_id in second_data:
-                    rack_data = second_data[sensor_id]
-                    self._last_known_values[rack_path] = rack_data
-                    self._update_rack_attributes(rack_path, rack_data)
-                    updated_count += 1
-                    
-                elif rack_path in self._last_known_values:
-                    rack_data = self._last_known_values[rack_path]
-                    self._update_rack_attributes(rack_path, rack_data)
-                    maintained_count += 1
-                    
-                else:
-                    self._update_rack_attributes(rack_path, None)
-                    failed_count += 1
-            
-            print(f"{LOG_PREFIX} 업데이트 결과: 새 데이터 {updated_count}, LKV 유지 {maintained_count}, 실패 {failed_count}")
-            return updated_count
-            
-        else:
-            print(f"{LOG_PREFIX} ❌ second_data 없음: {current_second}")
-            
-            # # 주변 시간 확인
-            # target_dt = self._current_time
-            # for offset in [-2, -1, 1, 2]:
-            #     check_time = target_dt + datetime.timedelta(seconds=offset)
-            #     check_str = check_time.strftime("%Y-%m-%dT%H:%M:%SZ")
-            #     check_data = self._second_timeline.get(check_str)
-            #     status = "있음" if check_data else "없음"
-            #     print(f"{LOG_PREFIX} {offset:+2d}초 ({check_str}): {status}")
-            # target_str = self._current_time.strftime("%Y-%m-%dT%H:%M:%SZ")
-            # target_data = self._second_timeline.get(target_str)
-
-            # if target_data:
-            #     print(f"{LOG_PREFIX} ✅ {target_str}: {len(target_data)}개 센서")
-            #     # 센서 ID들도 출력하고 싶다면
-            #     sensor_ids = list(target_data.keys())[:3]  # 처음 3개만
-            #     print(f"{LOG_PREFIX}   센서 예시: {sensor_ids}")
-            # else:
-            #     print(f"{LOG_PREFIX} ❌ {target_str}: 데이터 없음")
-            # return 0
+        return self._engine.diff(from_time, to_time)
     
     def _datetime_to_timecode_value(self, dt_obj):
         """datetime을 USD 타임코드 값(실수)으로 변환"""
@@ -1138,98 +911,70 @@ class TimeController:
             delta_seconds = (dt_obj - base_dt).total_seconds()
             return delta_seconds
         except Exception as e:
-            print(f"{LOG_PREFIX} 시간 변환 오류: {e}")
+            logger.error("시간 변환 오류: %s", e)
             return 0.0
     
-    def _update_stage_time(self):
-        """현재 시간에 따라 USD Stage 시간 업데이트 및 센서 데이터 적용"""
+    def _update_stage_time(self, changed_only=False):
+        """현재 시간에 따라 USD Stage 시간 업데이트 및 센서 데이터 적용 (changed_only: 값이 바뀐 랙만)"""
+        # 시간 쓰기 + 랙 업데이트는 엔진이 수행 (시간 이동은 바뀐 랙만)
+        updated_count = self._engine.apply(changed_only)
+        if updated_count > 0:
+            logger.debug("새로 업데이트된 랙 수: %d", updated_count)
+        return updated_count
+    
+    # ========== StageWriter (엔진 출력 -> USD) ==========
+    
+    def write_time(self, current_time):
+        """타임라인 인터페이스 (타임 슬라이더 UI)와 시간 관리자 메타데이터 업데이트"""
         # 날짜/시간에서 타임코드 값(실수)으로 직접 변환
-        timecode_value = self._datetime_to_timecode_value(self._current_time)
+        timecode_value = self._datetime_to_timecode_value(current_time)
         
-        # 타임라인 인터페이스 (타임 슬라이더 UI)를 self._current_time으로 업데이트
         try:
             self._timeline.set_current_time(timecode_value)
-            print(f"{LOG_PREFIX} 타임라인 시간 설정: {timecode_value}")
+            if logger.debug_enabled:
+                logger.debug("타임라인 시간 설정: %s", timecode_value)
         except Exception as e:
-            print(f"{LOG_PREFIX} 타임라인 업데이트 오류: {e}")
+            logger.error("타임라인 업데이트 오류: %s", e)
         
-        # 시간 관리자 업데이트 (메타데이터 업데이트트)
+        # 시간 관리자 업데이트 (메타데이터 업데이트)
         try:
             stage = self._get_stage()
             if stage:
                 time_prim = stage.GetPrimAtPath(self._time_manager_path)
                 if time_prim and time_prim.IsValid():
                     # 센티초 단위 시간 포맷 사용
-                    time_str = self._current_time.strftime("%Y-%m-%dT%H:%M:%S.%f")[:-4] + "Z"
+                    time_str = current_time.strftime("%Y-%m-%dT%H:%M:%S.%f")[:-4] + "Z"
                     time_prim.SetCustomDataByKey("currentTime", time_str)
                     time_prim.SetCustomDataByKey("lastUpdated", datetime.datetime.now().strftime("%Y-%m-%dT%H:%M:%S.%f")[:-4] + "Z")
-                    
-                    # 모든 랙 업데이트 
-                    updated_count = self._update_all_racks()
-                    if updated_count > 0:
-                        print(f"{LOG_PREFIX} 새로 업데이트된 랙 수: {updated_count}")
         except Exception as e:
-            print(f"{LOG_PREFIX} 시간 관리자 업데이트 오류: {e}")
+            logger.error("시간 관리자 업데이트 오류: %s", e)
+    
+    def write_racks(self, updates):
+        """랙별 센서 값을 USD 속성/메타데이터/컬러맵에 반영"""
+        for rack_path, data_entry in updates.items():
+            self._update_rack_attributes(rack_path, data_entry)
     
     # ========== 시간 제어 메서드들 ==========
     
     def set_time_range(self, start_time, end_time):
-        """시간 범위 설정"""
-        self._start_time = start_time
-        self._end_time = end_time
-        # 현재 시간이 범위 내에 있는지 확인
-        if self._current_time < self._start_time:
-            self._current_time = self._start_time
-        elif self._current_time > self._end_time:
-            self._current_time = self._end_time
+        """시간 범위 설정 (현재 시간은 범위 안으로)"""
+        self._engine.clock.set_range(start_time, end_time)
         self._update_stage_time()
     
     def set_current_time(self, current_time):
-        # """현재 시간 설정"""
-        # if current_time < self._start_time:
-        #     self._current_time = self._start_time
-        # elif current_time > self._end_time:
-        #     self._current_time = self._end_time
-        # else:
-        #     self._current_time = current_time
-        # self._update_stage_time()
-    
-        """현재 시간 설정 - 디버깅 추가"""
-        if current_time < self._start_time:
-            self._current_time = self._start_time
-        elif current_time > self._end_time:
-            self._current_time = self._end_time
-        else:
-            self._current_time = current_time
-        
-        # 🔍 디버깅 추가
-        print(f"{LOG_PREFIX} === 타임 슬라이더 이동: {self._current_time.strftime('%Y-%m-%dT%H:%M:%SZ')} ===")
-        self.debug_specific_time_data()  # 자동 디버깅
-        
-        self._update_stage_time()
+        """현재 시간 설정 - 전체 상태 대신 변경분만 계산/적용"""
+        self._engine.seek(current_time)
+        logger.info("타임 슬라이더 이동: %s", self._current_time)
 
     def set_progress(self, progress):
         """진행도(0.0-1.0)를 기반으로 현재 시간 설정"""
-        if progress < 0.0:
-            progress = 0.0
-        elif progress > 1.0:
-            progress = 1.0
-        
-        # 진행도에 따른 시간 계산
-        delta = self._end_time - self._start_time
-        seconds = delta.total_seconds() * progress
-        self._current_time = self._start_time + datetime.timedelta(seconds=seconds)
-        self._update_stage_time()
+        with tracer.span(SCRUB):
+            self._current_time = self._engine.clock.time_at_progress(progress)
+            self._update_stage_time()
     
     def get_progress(self):
         """현재 진행도(0.0-1.0) 가져오기"""
-        if self._end_time == self._start_time:
-            return 0.0
-        
-        delta = self._current_time - self._start_time
-        total_delta = self._end_time - self._start_time
-        
-        return delta.total_seconds() / total_delta.total_seconds()
+        return self._engine.clock.get_progress()
     
     def set_to_present(self):
         """가장 최근 시간(종료 시간)으로 설정"""
@@ -1238,37 +983,16 @@ class TimeController:
     
     def toggle_playback(self):
         """재생 상태 토글"""
-        self._is_playing = not self._is_playing
-        if self._is_playing:
-            self._last_update_time = time.time()
+        self._engine.clock.toggle()
     
     def set_playback_speed(self, speed):
         """재생 속도 설정"""
-        self._playback_speed = speed
+        self._engine.clock.speed = speed
     
     def update(self):
         """애니메이션을 위한 프레임별 업데이트 함수"""
-        if not self._is_playing:
-            return
-        
-        # 경과 시간 계산
-        current_time = time.time()
-        elapsed = (current_time - self._last_update_time) * self._playback_speed
-        self._last_update_time = current_time
-        
-        # 현재 시간 업데이트
-        delta = datetime.timedelta(seconds=elapsed)
-        new_time = self._current_time + delta
-        
-        # 종료 시간 도달 확인
-        if new_time >= self._end_time:
-            self._current_time = self._end_time
-            self._is_playing = False  # 재생 중지
-        else:
-            self._current_time = new_time
-        
-        # Stage 업데이트
-        self._update_stage_time()
+        # 경과 시간만큼 시계 이동 (종료 시간 도달 시 재생 중지) 후 Stage 업데이트 - 일시정지면 아무것도 안 함
+        self._engine.tick()
     
     # ========== Getter 메서드들 ==========
     
@@ -1303,16 +1027,36 @@ class TimeController:
         
         return current_time_str
     
+    def next_event(self, t=None, rack=None):
+        """
+        Next time after t (default: the current time) at which any sensor,
+        or the sensor of rack, reported a new value. None when there is none
+        within the active time range.
+        """
+        return self._find_event(t, rack, forward=True)
+    
+    def prev_event(self, t=None, rack=None):
+        """Like next_event, but the last change before t"""
+        return self._find_event(t, rack, forward=False)
+    
+    def _find_event(self, t, rack, forward):
+        return self._engine.find_event(t, rack, forward)
+    
+    def range_stats(self, rack_path, start_time=None, end_time=None):
+        """
+        랙 센서의 구간 통계 (count/min/max/mean/std/적분) - 기본 구간은 현재 시간 범위.
+        
+        Time Window의 Range stats 패널이 사용 (OptimizedTimeController.range_stats와 같은 형식).
+        """
+        return self._engine.range_stats(rack_path, start_time, end_time)
+    
     def get_rack_count(self):
         """매핑된 랙 수 가져오기"""
         return len(self._rack_to_sensor_map)
     
     def get_sensor_count(self):
-        """센서 데이터가 있는 센서 수 가져오기"""
-        unique_sensors = set()
-        for sensors_at_time in self._sensor_data.values():
-            unique_sensors.update(sensors_at_time.keys())
-        return len(unique_sensors)
+        """센서 데이터가 있는 센서 수 가져오기 (로딩 시 계산된 요약 - O(1))"""
+        return self._timeline_index.summary['sensors']
     
     # ========== 디버깅 및 정보 메서드들 ==========
     
@@ -1321,13 +1065,11 @@ class TimeController:
         return self._sensor_data.get(target_time_str, {})
     
     def get_available_timestamps_around(self, target_time_str, window=5):
-        """특정 시간 주변의 사용 가능한 timestamp 반환 (디버깅용)"""
-        if target_time_str in self._sorted_timestamps:
-            idx = self._sorted_timestamps.index(target_time_str)
-            start = max(0, idx - window)
-            end = min(len(self._sorted_timestamps), idx + window + 1)
-            return self._sorted_timestamps[start:end]
-        return []
+        """특정 시간 주변의 사용 가능한 timestamp 반환 (디버깅용) - 정렬된 int64 인덱스에서 이진 탐색"""
+        target_dt = self._parse_timestamp(target_time_str)
+        if not target_dt:
+            return []
+        return self._timeline_index.timestamps_around(SensorTimelineIndex.to_ms(target_dt), window)
     
     def get_last_known_values_summary(self):
         """Last known values 상태 요약 (디버깅용)"""
@@ -1341,20 +1083,20 @@ class TimeController:
     def force_refresh_all_racks(self):
         """모든 랙의 last known values를 강제로 새로고침"""
         print(f"{LOG_PREFIX} 모든 랙 강제 새로고침 시작...")
-        self._last_known_values.clear()
+        self._engine.reset_applied()
         updated_count = self._update_all_racks()
         print(f"{LOG_PREFIX} 강제 새로고침 완료: {updated_count}개 랙 업데이트")
         return updated_count
     
     def get_current_matching_status(self):
         """현재 시간의 매칭 상태 정보 반환 (디버깅용)"""
-        current_stage_time = self._current_time.strftime("%Y-%m-%dT%H:%M:%S.%f")[:-4] + "Z"
+        current_stage_time = self._current_time.strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
         
         status = {
             "current_stage_time": current_stage_time,
             "exact_match_exists": current_stage_time in self._sensor_data,
             "sensor_count_at_time": len(self._sensor_data.get(current_stage_time, {})),
-            "total_timestamps": len(self._sorted_timestamps),
+            "total_timestamps": self._timeline_index.summary['timestamps'],
             "last_known_values_count": len(self._last_known_values)
         }
         
@@ -1366,12 +1108,14 @@ class TimeController:
     def print_timestamp_samples(self, count=10):
         """사용 가능한 timestamp 샘플 출력 (디버깅용)"""
         print(f"{LOG_PREFIX} === 사용 가능한 Timestamp 샘플 (처음 {count}개) ===")
-        for i, ts in enumerate(self._sorted_timestamps[:count]):
-            sensor_count = len(self._sensor_data[ts])
+        timestamps_ms = self._timeline_index.timestamps_ms
+        for i, ms in enumerate(timestamps_ms[:count]):
+            ts = SensorTimelineIndex.format_ms(ms)
+            sensor_count = len(self._sensor_data.get(ts, {}))
             print(f"{LOG_PREFIX} {i+1:2d}. {ts} ({sensor_count}개 센서)")
         
-        if len(self._sorted_timestamps) > count:
-            print(f"{LOG_PREFIX} ... (총 {len(self._sorted_timestamps)}개 timestamp)")
+        if len(timestamps_ms) > count:
+            print(f"{LOG_PREFIX} ... (총 {len(timestamps_ms)}개 timestamp)")
     
     # ========== 종료 및 정리 메서드들 ==========
     
@@ -1398,12 +1142,10 @@ class TimeController:
         print(f"{LOG_PREFIX} 총 랙 경로 수: {len(self._rack_paths)}")
         print(f"{LOG_PREFIX} 매핑된 랙 수: {len(self._rack_to_sensor_map)}")
         print(f"{LOG_PREFIX} 센서 데이터 타임스탬프 수: {len(self._sensor_data)}")
-        print(f"{LOG_PREFIX} 정렬된 타임스탬프 수: {len(self._sorted_timestamps)}")
+        print(f"{LOG_PREFIX} 정렬된 타임스탬프 수: {self._timeline_index.summary['timestamps']}")
         
         # 사용 가능한 센서 ID 확인
-        available_sensors = set()
-        for sensors_at_time in self._sensor_data.values():
-            available_sensors.update(sensors_at_time.keys())
+        available_sensors = set(self._timeline_index.sensor_ids)
         print(f"{LOG_PREFIX} 사용 가능한 센서 ID: {sorted(available_sensors)}")
         
         # 매핑 상세 정보
@@ -1416,13 +1158,14 @@ class TimeController:
             print(f"{LOG_PREFIX}   ... (총 {len(self._rack_to_sensor_map)}개 매핑)")
         
         # 첫 번째와 마지막 타임스탬프 정보
-        if self._sorted_timestamps:
-            print(f"{LOG_PREFIX} 첫 번째 타임스탬프: {self._sorted_timestamps[0]}")
-            print(f"{LOG_PREFIX} 마지막 타임스탬프: {self._sorted_timestamps[-1]}")
+        timestamps_ms = self._timeline_index.timestamps_ms
+        if len(timestamps_ms):
+            first_timestamp = SensorTimelineIndex.format_ms(timestamps_ms[0])
+            print(f"{LOG_PREFIX} 첫 번째 타임스탬프: {first_timestamp}")
+            print(f"{LOG_PREFIX} 마지막 타임스탬프: {SensorTimelineIndex.format_ms(timestamps_ms[-1])}")
             
             # 첫 번째 타임스탬프의 센서 데이터 확인
-            first_timestamp = self._sorted_timestamps[0]
-            sensors_at_first_time = self._sensor_data[first_timestamp]
+            sensors_at_first_time = self._sensor_data.get(first_timestamp, {})
             print(f"{LOG_PREFIX} 첫 번째 타임스탬프 ({first_timestamp})의 센서: {list(sensors_at_first_time.keys())[:5]}")
         
         # Last known values 상태
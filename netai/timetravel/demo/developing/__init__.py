@@ -4,12 +4,17 @@ Omniverse Time Travel Extension for Datacenter Digital Twin
 High-performance time travel with sensor data visualization
 """
 
-from .extension import NetaiTimetravelDemoExtension
-from .optimized_controller import OptimizedTimeController
-from .window import TimeWindowUI
 from .config import Config
 from .data_model import SensorDataCache, OptimizedSensorData
 
+# Kit/USD 의존 모듈 - Kit 밖(테스트, 워커 프로세스)에서는 데이터 모듈만 사용
+try:
+    from .extension import NetaiTimetravelDemoExtension
+    from .optimized_controller import OptimizedTimeController
+    from .window import TimeWindowUI
+except ImportError:
+    pass
+
 __all__ = [
     'NetaiTimetravelDemoExtension',
     'OptimizedTimeController', 
@@ -19,4 +24,4 @@ __all__ = [
     'OptimizedSensorData'
 ]
 
-__version__ = "1.0.0"
\ No newline at end of file
+__version__ = "1.0.0"
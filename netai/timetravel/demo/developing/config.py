@@ -2,6 +2,7 @@
 """
 Configuration and sensor-rack mapping for Time Travel extension
 """
+import os
 from typing import Dict, List, Optional
 from dataclasses import dataclass
 
@@ -27,6 +28,47 @@ class ConfigSettings:
     # Parquet file
     PARQUET_FILE: str = "week_04_20250522_20250528_kst.parquet"
     
+    # Local object cache (MinIO 객체 디스크 캐시)
+    CACHE_ENABLED: bool = True
+    CACHE_DIR: str = os.path.join(os.path.expanduser("~"), ".cache", "netai_timetravel", "objects")
+    CACHE_MAX_BYTES: int = 4 * 1024 * 1024 * 1024  # 4 GB
+    CACHE_WARM_ON_START: bool = False  # 켜면 별도 스레드에서 MINIO_PREFIX 전체를 미리 받음
+    
+    # Ranged GET / connection pool tuning
+    FETCH_POOL_SIZE: int = 16
+    FETCH_MAX_WORKERS: int = 8
+    FETCH_PART_SIZE: int = 8 * 1024 * 1024  # 8 MB
+    FETCH_HEDGE_AFTER_S: float = 0.75  # 이 시간보다 오래 걸리면 중복 요청
+    FETCH_MAX_RETRIES: int = 3
+    
+    # Time-tiled sensor cache (타일 단위 on-demand 로딩 + 재생 방향 선행 로딩)
+    TILE_CACHE_ENABLED: bool = False
+    TILE_SECONDS: int = 3600  # 1시간 타일
+    TILE_CACHE_MAX_BYTES: int = 512 * 1024 * 1024  # 512 MB
+    TILE_PREFETCH_LOOKAHEAD_S: float = 10.0  # 실제 시간 기준 몇 초 앞까지 미리 로딩할지
+    TILE_PREFETCH_MAX_TILES: int = 6
+    
+    # Progressive loading (시간순으로 청크 단위 공개 - 로딩 중에도 재생 가능)
+    PROGRESSIVE_CHUNK_S: int = 6 * 3600
+    
+    # Aggregate pyramid (넓은 구간 스크러빙용 min/max/mean/last 다중 해상도 집계)
+    PYRAMID_ENABLED: bool = True
+    PYRAMID_LEVELS_S: tuple = (1, 10, 60, 600, 3600)
+    
+    # High-speed playback (프레임이 건너뛴 구간 전체를 reducer로 집계해서 표시)
+    PLAYBACK_REDUCER: Optional[str] = "max"  # max / min / mean / last, None이면 도착 시점 값만 표시
+    PLAYBACK_AGGREGATE_MIN_STEP_S: float = 60.0  # 프레임 간격(시뮬레이션 초)이 이 이상일 때만 집계
+    RANGE_INDEX_BLOCK_SIZE: int = 32
+    
+    # Keyframe + delta LKV store (보간 대신 마지막 값 유지 방식으로 조회)
+    KEYFRAME_STORE_ENABLED: bool = False
+    KEYFRAME_EVERY_CHANGES: int = 256
+    KEYFRAME_EVERY_S: Optional[float] = None
+    
+    # Threshold exceedance intervals (알람 검색 - (채널, 임계값) 쌍마다 초과 구간을 로딩 시 계산)
+    THRESHOLD_INDEX_ENABLED: bool = True
+    ALARM_THRESHOLDS: tuple = (("temperature_hot", 24.0), ("temperature_cold", 24.0))
+    
 class Config:
     """Main configuration class"""
     
@@ -46,6 +88,31 @@ class Config:
     MINIO_SECURE = _settings.MINIO_SECURE
     LOCAL_DATA_PATH = _settings.LOCAL_DATA_PATH
     PARQUET_FILE = _settings.PARQUET_FILE
+    CACHE_ENABLED = _settings.CACHE_ENABLED
+    CACHE_DIR = _settings.CACHE_DIR
+    CACHE_MAX_BYTES = _settings.CACHE_MAX_BYTES
+    CACHE_WARM_ON_START = _settings.CACHE_WARM_ON_START
+    FETCH_POOL_SIZE = _settings.FETCH_POOL_SIZE
+    FETCH_MAX_WORKERS = _settings.FETCH_MAX_WORKERS
+    FETCH_PART_SIZE = _settings.FETCH_PART_SIZE
+    FETCH_HEDGE_AFTER_S = _settings.FETCH_HEDGE_AFTER_S
+    FETCH_MAX_RETRIES = _settings.FETCH_MAX_RETRIES
+    TILE_CACHE_ENABLED = _settings.TILE_CACHE_ENABLED
+    TILE_SECONDS = _settings.TILE_SECONDS
+    TILE_CACHE_MAX_BYTES = _settings.TILE_CACHE_MAX_BYTES
+    TILE_PREFETCH_LOOKAHEAD_S = _settings.TILE_PREFETCH_LOOKAHEAD_S
+    TILE_PREFETCH_MAX_TILES = _settings.TILE_PREFETCH_MAX_TILES
+    PROGRESSIVE_CHUNK_S = _settings.PROGRESSIVE_CHUNK_S
+    PYRAMID_ENABLED = _settings.PYRAMID_ENABLED
+    PYRAMID_LEVELS_S = _settings.PYRAMID_LEVELS_S
+    PLAYBACK_REDUCER = _settings.PLAYBACK_REDUCER
+    PLAYBACK_AGGREGATE_MIN_STEP_S = _settings.PLAYBACK_AGGREGATE_MIN_STEP_S
+    RANGE_INDEX_BLOCK_SIZE = _settings.RANGE_INDEX_BLOCK_SIZE
+    KEYFRAME_STORE_ENABLED = _settings.KEYFRAME_STORE_ENABLED
+    KEYFRAME_EVERY_CHANGES = _settings.KEYFRAME_EVERY_CHANGES
+    KEYFRAME_EVERY_S = _settings.KEYFRAME_EVERY_S
+    THRESHOLD_INDEX_ENABLED = _settings.THRESHOLD_INDEX_ENABLED
+    ALARM_THRESHOLDS = _settings.ALARM_THRESHOLDS
     
     @classmethod
     def get_rack_to_sensor_map(cls) -> Dict[str, str]:
@@ -7,6 +7,11 @@ from dataclasses import dataclass
 from typing import Dict, List, Optional, Tuple, Union
 import datetime
 
+# 배열 기반 조회 결과의 채널 순서 ([..., channels] 축) - 헤드리스 엔진의 구간 인덱스와 공유
+from ..engine.range_index import CHANNELS
+
+BATCH_MODES = ('lkv', 'nearest', 'linear')
+
 @dataclass
 class SensorReading:
     """Single sensor reading"""
@@ -182,6 +187,57 @@ class OptimizedSensorData:
                 'humidity_hot': self._lerp(self.humidity_hot[idx-1], self.humidity_hot[idx], alpha)
             }
             
+    def values_at(self, times_ns: np.ndarray, mode: str = 'linear') -> np.ndarray:
+        """
+        Values at many timestamps at once as a [times, channels] float32 array.
+        
+        mode 'lkv' takes the last sample at or before each time (NaN before
+        the first sample), 'nearest' the closest sample (ties go to the
+        earlier one) and 'linear' interpolates like get_interpolated_at_time,
+        holding the first/last value outside the data.
+        """
+        if mode not in BATCH_MODES:
+            raise ValueError(f"Unknown batch mode: {mode} (expected one of {BATCH_MODES})")
+        times_ns = np.asarray(times_ns, dtype=np.int64)
+        out = np.full((len(times_ns), len(CHANNELS)), np.nan, dtype=np.float32)
+        if self.size == 0 or len(times_ns) == 0:
+            return out
+        self._ensure_sorted()
+        
+        n = self.size
+        timestamps = self.timestamps[:n]
+        channels = (self.temp_cold, self.temp_hot, self.humidity_cold, self.humidity_hot)
+        
+        if mode == 'lkv':
+            idx = np.searchsorted(timestamps, times_ns, side='right') - 1
+            known = idx >= 0
+            for c, channel in enumerate(channels):
+                out[known, c] = channel[idx[known]]
+            return out
+        
+        if n == 1:
+            left = right = np.zeros(len(times_ns), dtype=np.int64)
+        else:
+            right = np.clip(np.searchsorted(timestamps, times_ns, side='left'), 1, n - 1)
+            left = right - 1
+        if mode == 'nearest':
+            use_right = np.abs(timestamps[right] - times_ns) < np.abs(times_ns - timestamps[left])
+            idx = np.where(use_right, right, left)
+            for c, channel in enumerate(channels):
+                out[:, c] = channel[idx]
+            return out
+        
+        # linear: 구간 밖은 alpha를 0/1로 잘라서 첫/마지막 값 유지
+        t0 = timestamps[left]
+        span = (timestamps[right] - t0).astype(np.float64)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            alpha = np.where(span > 0, (times_ns - t0) / span, 0.0)
+        alpha = np.clip(alpha, 0.0, 1.0)
+        for c, channel in enumerate(channels):
+            v0 = channel[left].astype(np.float64)
+            out[:, c] = v0 + (channel[right] - v0) * alpha
+        return out
+        
     def _get_values_at_index(self, idx: int) -> Dict:
         """Get values at specific index"""
         return {
@@ -212,6 +268,79 @@ class OptimizedSensorData:
             self.humidity_cold = self.humidity_cold[:self.size].copy()
             self.humidity_hot = self.humidity_hot[:self.size].copy()
             self.capacity = self.size
+            
+    def trim_to_range(self, start_ns: int, end_ns: int) -> int:
+        """Keep only samples within [start_ns, end_ns]; returns number of removed samples"""
+        if self.size == 0:
+            return 0
+        self._ensure_sorted()
+        lo = int(np.searchsorted(self.timestamps[:self.size], start_ns, side='left'))
+        hi = int(np.searchsorted(self.timestamps[:self.size], end_ns, side='right'))
+        removed = self.size - (hi - lo)
+        if removed == 0:
+            return 0
+        
+        self._take(np.arange(lo, hi))
+        return removed
+        
+    def drop_range(self, start_ns: int, end_ns: int) -> int:
+        """Remove samples within [start_ns, end_ns]; returns number of removed samples"""
+        if self.size == 0:
+            return 0
+        self._ensure_sorted()
+        lo = int(np.searchsorted(self.timestamps[:self.size], start_ns, side='left'))
+        hi = int(np.searchsorted(self.timestamps[:self.size], end_ns, side='right'))
+        if hi <= lo:
+            return 0
+        self._take(np.concatenate([np.arange(0, lo), np.arange(hi, self.size)]))
+        return hi - lo
+        
+    def _take(self, indices: np.ndarray):
+        """Replace arrays with the selected rows (새 배열을 만든 뒤 한 번에 교체)"""
+        self.timestamps = self.timestamps[indices]
+        self.temp_cold = self.temp_cold[indices]
+        self.temp_hot = self.temp_hot[indices]
+        self.humidity_cold = self.humidity_cold[indices]
+        self.humidity_hot = self.humidity_hot[indices]
+        self.size = len(indices)
+        self.capacity = self.size
+        
+    def merge_from(self, other: "OptimizedSensorData"):
+        """Merge another container's samples into this one, keeping time order"""
+        if other.size == 0:
+            return
+        other._ensure_sorted()
+        self._ensure_sorted()
+        n = self.size
+        m = other.size
+        
+        if n == 0 or other.timestamps[0] >= self.timestamps[n - 1]:
+            # 시간순 청크 로딩의 일반적인 경우 - 뒤에 이어 붙이기만 (용량은 2배씩 증가)
+            if n + m > self.capacity:
+                self._grow_arrays(n + m)
+            self.timestamps[n:n + m] = other.timestamps[:m]
+            self.temp_cold[n:n + m] = other.temp_cold[:m]
+            self.temp_hot[n:n + m] = other.temp_hot[:m]
+            self.humidity_cold[n:n + m] = other.humidity_cold[:m]
+            self.humidity_hot[n:n + m] = other.humidity_hot[:m]
+            self.size = n + m
+            return
+        
+        timestamps = np.concatenate([self.timestamps[:n], other.timestamps[:other.size]])
+        order = np.argsort(timestamps, kind='stable')
+        self.timestamps = timestamps[order]
+        self.temp_cold = np.concatenate([self.temp_cold[:n], other.temp_cold[:other.size]])[order]
+        self.temp_hot = np.concatenate([self.temp_hot[:n], other.temp_hot[:other.size]])[order]
+        self.humidity_cold = np.concatenate([self.humidity_cold[:n], other.humidity_cold[:other.size]])[order]
+        self.humidity_hot = np.concatenate([self.humidity_hot[:n], other.humidity_hot[:other.size]])[order]
+        self.size = n + other.size
+        self.capacity = self.size
+        self._is_sorted = True
+        
+    def nbytes(self) -> int:
+        """Memory held by the backing arrays"""
+        return (self.timestamps.nbytes + self.temp_cold.nbytes + self.temp_hot.nbytes +
+                self.humidity_cold.nbytes + self.humidity_hot.nbytes)
 
 class SensorDataCache:
     """
@@ -226,6 +355,10 @@ class SensorDataCache:
             self._sensors[sensor_id] = OptimizedSensorData(sensor_id)
         return self._sensors[sensor_id]
         
+    def find_sensor_data(self, sensor_id: int) -> Optional[OptimizedSensorData]:
+        """Get sensor data container without creating one"""
+        return self._sensors.get(sensor_id)
+        
     def clear(self):
         """Clear all sensor data"""
         for sensor_data in self._sensors.values():
@@ -243,4 +376,105 @@ class SensorDataCache:
         
     def get_sensor_ids(self) -> List[int]:
         """Get list of all sensor IDs"""
-        return list(self._sensors.keys())
\ No newline at end of file
+        return list(self._sensors.keys())
+        
+    def nbytes(self) -> int:
+        """Memory held by all sensor arrays"""
+        return sum(sensor_data.nbytes() for sensor_data in self._sensors.values())
+        
+    def query_batch(self, times_ns: np.ndarray, sensor_ids: Optional[List[int]] = None,
+                    mode: str = 'linear') -> np.ndarray:
+        """
+        Values of many sensors at many timestamps as a [times, sensors, channels] array.
+        
+        sensor_ids defaults to get_sensor_ids(); rows of unknown sensors are
+        NaN. Each sensor costs one vectorized searchsorted and gather, see
+        OptimizedSensorData.values_at for the modes.
+        """
+        if mode not in BATCH_MODES:
+            raise ValueError(f"Unknown batch mode: {mode} (expected one of {BATCH_MODES})")
+        if sensor_ids is None:
+            sensor_ids = self.get_sensor_ids()
+        times_ns = np.asarray(times_ns, dtype=np.int64)
+        out = np.full((len(times_ns), len(sensor_ids), len(CHANNELS)), np.nan, dtype=np.float32)
+        for s, sensor_id in enumerate(sensor_ids):
+            sensor_data = self._sensors.get(sensor_id)
+            if sensor_data is not None:
+                out[:, s, :] = sensor_data.values_at(times_ns, mode)
+        return out
+        
+    def apply_range_update(self, keep_start_ns: int, keep_end_ns: int,
+                           staged: Optional["SensorDataCache"] = None,
+                           loaded: Optional[List[Tuple[int, int]]] = None) -> Tuple[int, int]:
+        """
+        Trim every sensor to [keep_start_ns, keep_end_ns] and merge staged data.
+        
+        Staged samples inside the already loaded intervals are dropped so the
+        shared boundary samples are not duplicated. Returns (removed, added)
+        sample counts.
+        """
+        removed = 0
+        added = 0
+        for sensor_data in self._sensors.values():
+            removed += sensor_data.trim_to_range(keep_start_ns, keep_end_ns)
+        if staged is not None:
+            for sensor_id, staged_data in staged._sensors.items():
+                staged_data.trim_to_range(keep_start_ns, keep_end_ns)
+                for loaded_start, loaded_end in loaded or ():
+                    staged_data.drop_range(loaded_start, loaded_end)
+                added += staged_data.size
+                self.get_sensor_data(sensor_id).merge_from(staged_data)
+        return removed, added
+
+
+def missing_time_intervals(loaded: List[Tuple[int, int]], requested: Tuple[int, int]) -> Optional[List[Tuple[int, int]]]:
+    """
+    Gaps of requested not covered by any loaded interval (nanosecond bounds).
+    
+    Returns None when nothing overlaps (full reload needed). Gaps include
+    the shared boundary; apply_range_update(loaded=...) drops the duplicate
+    samples there.
+    """
+    req_start, req_end = requested
+    covered = [
+        (max(start, req_start), min(end, req_end))
+        for start, end in merge_time_intervals(loaded)
+        if end >= req_start and start <= req_end
+    ]
+    if not covered:
+        return None
+    
+    missing = []
+    cursor = req_start
+    for start, end in covered:
+        if start > cursor:
+            missing.append((cursor, start))
+        cursor = max(cursor, end)
+    if cursor < req_end:
+        missing.append((cursor, req_end))
+    return missing
+
+
+def merge_time_intervals(intervals: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """Sort and merge overlapping or touching intervals"""
+    merged: List[List[int]] = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+    return [(start, end) for start, end in merged]
+
+
+def split_time_intervals(intervals: List[Tuple[int, int]], chunk_ns: int) -> List[Tuple[int, int]]:
+    """Split intervals into time-ordered chunks of at most chunk_ns"""
+    chunks = []
+    for start, end in sorted(intervals):
+        pos = start
+        while True:
+            chunk_end = min(end, pos + chunk_ns)
+            chunks.append((pos, chunk_end))
+            if chunk_end >= end:
+                break
+            pos = chunk_end
+    return chunks
@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+"""
+Keyframe + delta sensor state store (video-codec style LKV timeline)
+"""
+import time
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from .data_model import CHANNELS, SensorDataCache
+
+
+def _last_per_row(rows: np.ndarray) -> np.ndarray:
+    """Positions of the last occurrence of each distinct value in rows"""
+    reversed_rows = rows[::-1]
+    _, first_in_reversed = np.unique(reversed_rows, return_index=True)
+    return len(rows) - 1 - first_in_reversed
+
+
+class KeyframeDeltaStore:
+    """
+    Last-known-value state of every sensor at any instant.
+
+    All samples are merged into one time-ordered delta list (time, sensor
+    row, values); samples that repeat the sensor's previous values are
+    dropped. A full [sensors, channels] keyframe is stored every
+    keyframe_every deltas (and optionally every keyframe_every_s seconds).
+    seek() binary-searches the delta list, copies the nearest keyframe and
+    applies at most keyframe_every deltas; advance() applies only the deltas
+    since the previous call, so sequential playback costs O(changes).
+    Sensors without a sample yet are NaN.
+    """
+
+    def __init__(self, sensor_ids: List[int], delta_times: np.ndarray, delta_rows: np.ndarray,
+                 delta_values: np.ndarray, keyframe_every: int = 256,
+                 keyframe_every_s: Optional[float] = None):
+        self.sensor_ids = list(sensor_ids)
+        self._row_of = {sensor_id: row for row, sensor_id in enumerate(self.sensor_ids)}
+        self._times = delta_times
+        self._rows = delta_rows
+        self._values = delta_values
+        self._keyframe_every = keyframe_every
+        n_channels = delta_values.shape[1]
+
+        # 키프레임 위치 (델타 인덱스): N개 변경마다 + 선택적으로 N초마다
+        positions = np.arange(0, len(delta_times), keyframe_every, dtype=np.int64)
+        if keyframe_every_s and len(delta_times):
+            step_ns = int(keyframe_every_s * 1_000_000_000)
+            marks = np.arange(int(delta_times[0]), int(delta_times[-1]) + 1, step_ns, dtype=np.int64)
+            positions = np.union1d(positions, np.searchsorted(delta_times, marks, side='left'))
+        self._keyframe_pos = positions if len(positions) else np.zeros(1, dtype=np.int64)
+
+        # keyframe k = 델타 [0, pos[k]) 적용 후 상태
+        t0 = time.perf_counter()
+        state = np.full((len(self.sensor_ids), n_channels), np.nan, dtype=np.float32)
+        keyframes = np.empty((len(self._keyframe_pos),) + state.shape, dtype=np.float32)
+        applied = 0
+        for k, pos in enumerate(self._keyframe_pos):
+            self._apply(state, applied, int(pos))
+            applied = int(pos)
+            keyframes[k] = state
+        self._keyframes = keyframes
+        self.build_seconds = time.perf_counter() - t0
+
+        # advance() 커서
+        self._cursor_state = state.copy()
+        self._cursor_pos = -1
+
+    @classmethod
+    def from_cache(cls, cache: SensorDataCache, keyframe_every: int = 256,
+                   keyframe_every_s: Optional[float] = None) -> "KeyframeDeltaStore":
+        """Build from every sensor of a SensorDataCache"""
+        t0 = time.perf_counter()
+        sensor_ids = sorted(sid for sid in cache.get_sensor_ids() if cache.find_sensor_data(sid).size)
+        times, rows, values = [], [], []
+        for row, sensor_id in enumerate(sensor_ids):
+            sensor = cache.find_sensor_data(sensor_id)
+            n = sensor.size
+            sensor_values = np.column_stack([
+                sensor.temp_cold[:n], sensor.temp_hot[:n], sensor.humidity_cold[:n], sensor.humidity_hot[:n]
+            ]).astype(np.float32)
+            # 직전 값과 같은 샘플은 상태를 바꾸지 않으므로 델타에서 제외
+            changed = np.ones(n, dtype=bool)
+            changed[1:] = (sensor_values[1:] != sensor_values[:-1]).any(axis=1)
+            times.append(sensor.timestamps[:n][changed])
+            rows.append(np.full(int(changed.sum()), row, dtype=np.int32))
+            values.append(sensor_values[changed])
+
+        if times:
+            delta_times = np.concatenate(times)
+            order = np.argsort(delta_times, kind='stable')
+            delta_times = delta_times[order]
+            delta_rows = np.concatenate(rows)[order]
+            delta_values = np.concatenate(values)[order]
+        else:
+            delta_times = np.zeros(0, dtype=np.int64)
+            delta_rows = np.zeros(0, dtype=np.int32)
+            delta_values = np.zeros((0, len(CHANNELS)), dtype=np.float32)
+
+        store = cls(sensor_ids, delta_times, delta_rows, delta_values, keyframe_every, keyframe_every_s)
+        store.build_seconds = time.perf_counter() - t0
+        return store
+
+    def _apply(self, state: np.ndarray, start: int, end: int):
+        """Apply deltas [start, end) to state in place"""
+        if end <= start:
+            return
+        if end - start == 1:
+            state[self._rows[start]] = self._values[start]
+            return
+        # 같은 센서가 여러 번 바뀌었으면 마지막 값만 반영
+        last = start + _last_per_row(self._rows[start:end])
+        state[self._rows[last]] = self._values[last]
+
+    def _position(self, t_ns: int) -> int:
+        """Number of deltas at or before t_ns"""
+        return int(np.searchsorted(self._times, t_ns, side='right'))
+
+    def seek(self, t_ns: int) -> np.ndarray:
+        """State at t_ns (a new [sensors, channels] array)"""
+        pos = self._position(t_ns)
+        k = int(np.searchsorted(self._keyframe_pos, pos, side='right')) - 1
+        state = self._keyframes[k].copy()
+        self._apply(state, int(self._keyframe_pos[k]), pos)
+        return state
+
+    def advance(self, t_ns: int) -> np.ndarray:
+        """
+        State at t_ns for sequential playback.
+
+        Moving forward applies only the deltas since the previous call;
+        moving backward or jumping further than a keyframe interval falls
+        back to seek(). The returned array is reused between calls.
+        """
+        pos = self._position(t_ns)
+        if self._cursor_pos < 0 or pos < self._cursor_pos or pos - self._cursor_pos > self._keyframe_every:
+            self._cursor_state = self.seek(t_ns)
+        else:
+            self._apply(self._cursor_state, self._cursor_pos, pos)
+        self._cursor_pos = pos
+        return self._cursor_state
+
+    def values_for(self, state: np.ndarray, sensor_id: int) -> Optional[Dict]:
+        """Channel dict for one sensor of a state array (None if unknown or not seen yet)"""
+        row = self._row_of.get(sensor_id)
+        if row is None or np.isnan(state[row, 0]):
+            return None
+        return {name: float(state[row, c]) for c, name in enumerate(CHANNELS)}
+
+    def nbytes(self) -> int:
+        return (self._times.nbytes + self._rows.nbytes + self._values.nbytes +
+                self._keyframes.nbytes + self._keyframe_pos.nbytes)
+
+    def get_stats(self) -> Dict:
+        return {
+            'sensors': len(self.sensor_ids),
+            'deltas': len(self._times),
+            'keyframes': len(self._keyframe_pos),
+            'keyframe_every': self._keyframe_every,
+            'build_seconds': self.build_seconds,
+            'nbytes': self.nbytes(),
+        }
@@ -0,0 +1,323 @@
+# -*- coding: utf-8 -*-
+"""
+Buffered metrics sink: a preallocated record ring drained by a background flusher
+"""
+import csv
+import itertools
+import json
+import math
+import threading
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+from ..ringlog import logger
+
+# 고정 폭 레코드 (바이너리 로그 한 행 = 48바이트)
+RECORD_DTYPE = np.dtype([
+    ('seq', '<i8'),
+    ('timestamp', '<f8'),
+    ('operation', '<u2'),
+    ('errors', '<u2'),
+    ('rack_count', '<i4'),
+    ('duration', '<f8'),
+    ('memory_mb', '<f4'),
+    ('cpu_percent', '<f4'),
+    ('data_points', '<i4'),
+    ('fps', '<f4'),
+])
+CSV_HEADER = ['timestamp', 'operation', 'duration_ms', 'memory_mb',
+              'cpu_percent', 'rack_count', 'data_points', 'fps', 'errors']
+LOG_FORMATS = ('csv', 'binary')
+
+
+class StreamingStats:
+    """
+    Count, mean, variance (Welford / Chan merge), min and max of durations,
+    plus memory/CPU means and maxima, updated a batch at a time. O(1) memory
+    per operation; merge() combines two of them exactly.
+    """
+
+    __slots__ = ('count', 'mean', 'm2', 'min', 'max', 'errors',
+                 'memory_sum', 'memory_max', 'cpu_sum', 'cpu_max')
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self.errors = 0
+        self.memory_sum = 0.0
+        self.memory_max = -math.inf
+        self.cpu_sum = 0.0
+        self.cpu_max = -math.inf
+
+    def update(self, records: np.ndarray):
+        """Add a batch of RECORD_DTYPE records"""
+        if not len(records):
+            return
+        durations = records['duration']
+        batch = StreamingStats()
+        batch.count = len(durations)
+        batch.mean = float(durations.mean())
+        batch.m2 = float(((durations - batch.mean) ** 2).sum())
+        batch.min = float(durations.min())
+        batch.max = float(durations.max())
+        batch.errors = int(records['errors'].sum())
+        batch.memory_sum = float(records['memory_mb'].sum(dtype=np.float64))
+        batch.memory_max = float(records['memory_mb'].max())
+        batch.cpu_sum = float(records['cpu_percent'].sum(dtype=np.float64))
+        batch.cpu_max = float(records['cpu_percent'].max())
+        self.merge(batch)
+
+    def merge(self, other: "StreamingStats"):
+        if not other.count:
+            return
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self.m2 += other.m2 + delta * delta * self.count * other.count / total
+        self.mean += delta * other.count / total
+        self.count = total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self.errors += other.errors
+        self.memory_sum += other.memory_sum
+        self.memory_max = max(self.memory_max, other.memory_max)
+        self.cpu_sum += other.cpu_sum
+        self.cpu_max = max(self.cpu_max, other.cpu_max)
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.m2 / (self.count - 1)) if self.count > 1 else 0.0
+
+    def as_dict(self) -> Dict:
+        if not self.count:
+            return {}
+        return {
+            'count': self.count,
+            'avg_duration_ms': self.mean * 1000,
+            'std_duration_ms': self.std * 1000,
+            'max_duration_ms': self.max * 1000,
+            'min_duration_ms': self.min * 1000,
+            'avg_memory_mb': self.memory_sum / self.count,
+            'max_memory_mb': self.memory_max,
+            'avg_cpu_percent': self.cpu_sum / self.count,
+            'max_cpu_percent': self.cpu_max,
+            'errors': self.errors,
+        }
+
+
+class MetricSink:
+    """
+    Lock-free recording into a preallocated ring, batched persistence off
+    the hot path.
+
+    record() claims a sequence number (itertools.count, atomic under the
+    GIL) and stores one fixed-arity tuple in its slot: no allocation beyond
+    the tuple, no I/O, no locks. A background thread drain()s every
+    flush_interval seconds: it packs the new slots into a RECORD_DTYPE
+    array, updates the per-operation StreamingStats, appends the batch to
+    the log (CSV rows or raw fixed-width binary) and calls on_batch.
+    Records overwritten before a drain reached them are counted as dropped.
+    """
+
+    def __init__(self, capacity: int = 65536, path: Optional[str] = None, log_format: str = 'csv',
+                 flush_interval: float = 0.5, on_batch: Optional[Callable] = None):
+        if capacity < 2:
+            raise ValueError(f"capacity must be >= 2, got {capacity}")
+        if log_format not in LOG_FORMATS:
+            raise ValueError(f"Unknown log format: {log_format} (expected one of {LOG_FORMATS})")
+        self.capacity = int(capacity)
+        self.path = path
+        self.log_format = log_format
+        self.flush_interval = flush_interval
+        self.on_batch = on_batch
+
+        self._slots = [None] * self.capacity
+        self._counter = itertools.count()
+        self._written = 0  # 기록된 레코드 수 (근사 - 슬롯의 seq로 검증)
+        self._flushed = 0  # drain이 처리한 다음 seq
+        self._dropped = 0
+        self._operations: Dict[str, int] = {}
+        self._operation_names: List[str] = []
+        self._operation_lock = threading.Lock()
+        self._drain_lock = threading.Lock()
+        self.stats: Dict[str, StreamingStats] = {}
+
+        self._file = None
+        self._writer = None
+        self._bytes_written = 0
+        self._flushes = 0
+        if path:
+            self._open_log()
+
+        self._stop = threading.Event()
+        self._thread = None
+
+    # ---------------------------------------------------------------- 기록 (핫 패스)
+    def operation_code(self, name: str) -> int:
+        code = self._operations.get(name)
+        if code is None:
+            with self._operation_lock:
+                code = self._operations.get(name)
+                if code is None:
+                    code = len(self._operation_names)
+                    self._operation_names.append(name)
+                    self._operations[name] = code
+        return code
+
+    def record(self, operation: str, duration: float, timestamp: float, memory_mb: float = 0.0,
+               cpu_percent: float = 0.0, rack_count: int = 0, data_points: int = 0,
+               fps: float = math.nan, errors: int = 0):
+        code = self._operations.get(operation)
+        if code is None:
+            code = self.operation_code(operation)
+        i = next(self._counter)
+        self._slots[i % self.capacity] = (i, timestamp, code, errors, rack_count, duration,
+                                          memory_mb, cpu_percent, data_points, fps)
+        self._written = i + 1
+
+    # ---------------------------------------------------------------- 배치 처리
+    def drain(self) -> np.ndarray:
+        """Pack, aggregate and persist everything recorded since the last drain"""
+        with self._drain_lock:
+            batch = self._collect()
+            if len(batch):
+                self._aggregate(batch)
+                self._persist(batch)
+                if self.on_batch is not None:
+                    self.on_batch(batch)
+            return batch
+
+    def _collect(self) -> np.ndarray:
+        end = self._written
+        start = max(self._flushed, end - self.capacity)
+        self._dropped += start - self._flushed
+        if end <= start:
+            self._flushed = start
+            return np.empty(0, RECORD_DTYPE)
+
+        first, last = start % self.capacity, end % self.capacity
+        if first < last:
+            slots = self._slots[first:last]
+        else:
+            slots = self._slots[first:] + self._slots[:last]
+        # 아직 쓰는 중인 슬롯(이전 바퀴 레코드/None)에서 멈춤 - 다음 drain에서 이어서
+        expected = start
+        for count, slot in enumerate(slots):
+            if slot is None or slot[0] != expected:
+                slots = slots[:count]
+                break
+            expected += 1
+        self._flushed = expected
+        fps_index = RECORD_DTYPE.names.index('fps')
+        return np.array([slot if slot[fps_index] is not None else slot[:fps_index] + (math.nan,)
+                         for slot in slots], dtype=RECORD_DTYPE)
+
+    def _aggregate(self, batch: np.ndarray):
+        codes = batch['operation']
+        for code in np.unique(codes):
+            name = self._operation_names[code]
+            stats = self.stats.get(name)
+            if stats is None:
+                stats = self.stats[name] = StreamingStats()
+            stats.update(batch[codes == code])
+
+    def _open_log(self):
+        if self.log_format == 'csv':
+            self._file = open(self.path, 'a', newline='')
+            self._writer = csv.writer(self._file)
+            if self._file.tell() == 0:
+                self._writer.writerow(CSV_HEADER)
+        else:
+            self._file = open(self.path, 'ab')
+
+    def _persist(self, batch: np.ndarray):
+        if self._file is None:
+            return
+        start = self._file.tell()
+        if self.log_format == 'csv':
+            names = self._operation_names
+            fps = batch['fps']
+            self._writer.writerows(zip(
+                batch['timestamp'].tolist(), [names[code] for code in batch['operation'].tolist()],
+                (batch['duration'] * 1000).tolist(), batch['memory_mb'].tolist(), batch['cpu_percent'].tolist(),
+                batch['rack_count'].tolist(), batch['data_points'].tolist(),
+                [None if math.isnan(value) else value for value in fps.tolist()], batch['errors'].tolist()))
+        else:
+            batch.tofile(self._file)
+            # 코드 -> 이름 매핑은 옆 파일에 (바이너리 레코드는 코드만 가짐)
+            with open(self.path + '.operations.json', 'w') as f:
+                json.dump(self._operation_names, f)
+        self._file.flush()
+        self._bytes_written += self._file.tell() - start
+        self._flushes += 1
+
+    # ---------------------------------------------------------------- 조회
+    def recent(self, operation: Optional[str] = None, limit: Optional[int] = None) -> np.ndarray:
+        """The newest records still in the ring (drained or not), optionally for one operation"""
+        end = self._written
+        start = max(0, end - self.capacity)
+        slots = [slot for slot in (self._slots[i % self.capacity] for i in range(start, end))
+                 if slot is not None and start <= slot[0] < end]
+        if operation is not None:
+            code = self._operations.get(operation)
+            slots = [slot for slot in slots if slot[2] == code]
+        if limit is not None:
+            slots = slots[-limit:] if limit > 0 else []
+        return np.array([tuple(math.nan if value is None else value for value in slot) for slot in slots],
+                        dtype=RECORD_DTYPE)
+
+    def operation_names(self) -> List[str]:
+        return list(self._operation_names)
+
+    def get_stats(self) -> Dict:
+        return {
+            'capacity': self.capacity,
+            'recorded': self._written,
+            'flushed': self._flushed,
+            'buffered': self._written - self._flushed,
+            'dropped': self._dropped,
+            'flushes': self._flushes,
+            'bytes_written': self._bytes_written,
+            'log_format': self.log_format,
+            'path': self.path,
+        }
+
+    # ---------------------------------------------------------------- 백그라운드 flush
+    def start(self) -> "MetricSink":
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="MetricSinkFlusher", daemon=True)
+            self._thread.start()
+        return self
+
+    def _run(self):
+        while not self._stop.wait(self.flush_interval):
+            try:
+                self.drain()
+            except Exception as e:
+                logger.error("[Performance] 메트릭 flush 오류: %s", e)
+
+    def stop(self):
+        """Stop the flusher and drain what is left"""
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+        self.drain()
+
+    def close(self):
+        self.stop()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            self._writer = None
+
+
+def read_binary_log(path: str):
+    """(RECORD_DTYPE records, operation names) of a binary metric log"""
+    with open(path + '.operations.json') as f:
+        names = json.load(f)
+    return np.fromfile(path, dtype=RECORD_DTYPE), names
@@ -0,0 +1,297 @@
+# -*- coding: utf-8 -*-
+"""
+Local content-addressed disk cache for MinIO objects (LRU eviction, mmap reads)
+"""
+import hashlib
+import logging
+import mmap
+import os
+import threading
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass, asdict
+from typing import Dict, Optional, Union
+
+logger = logging.getLogger("[netai.timetravel.demo]")
+
+# 다운로드 시 한 번에 읽을 크기
+_DOWNLOAD_CHUNK = 1024 * 1024
+
+
+@dataclass
+class CacheStats:
+    """Object cache counters"""
+    hits: int = 0
+    misses: int = 0
+    bytes_saved: int = 0      # 캐시 히트로 다운로드하지 않은 바이트
+    bytes_fetched: int = 0    # 실제로 MinIO에서 받은 바이트
+    evictions: int = 0
+    warmed: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def to_dict(self) -> Dict:
+        result = asdict(self)
+        result['hit_ratio'] = self.hit_ratio
+        return result
+
+
+class LocalObjectCache:
+    """
+    On-disk cache of MinIO objects keyed by bucket/key/ETag.
+
+    Files are stored under a SHA-256 digest of the key triple, so a changed
+    object (new ETag) never serves stale bytes. Cache hits are returned as a
+    read-only memory map of the local file.
+    """
+
+    def __init__(self, client, bucket: str, cache_dir: str, max_bytes: int, fetcher=None):
+        self._client = client
+        self._fetcher = fetcher  # RangedObjectFetcher가 있으면 병렬 ranged GET으로 다운로드
+        self._bucket = bucket
+        self._cache_dir = cache_dir
+        self._max_bytes = max_bytes
+
+        # digest -> size (앞쪽이 가장 오래 사용되지 않은 항목)
+        self._entries: "OrderedDict[str, int]" = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.RLock()
+        self._fetch_locks = defaultdict(threading.Lock)
+
+        # list_objects 결과로 알게 된 ETag (stat_object 호출 절약)
+        self._etags: Dict[str, str] = {}
+
+        self._stats = CacheStats()
+        self._stopped = threading.Event()
+
+        os.makedirs(self._cache_dir, exist_ok=True)
+        self._scan_existing()
+
+    # ---------------------------------------------------------------- keys
+    @staticmethod
+    def make_digest(bucket: str, key: str, etag: str) -> str:
+        """Content address for a bucket/key/ETag triple"""
+        return hashlib.sha256(f"{bucket}\0{key}\0{etag}".encode("utf-8")).hexdigest()
+
+    def _path_for(self, digest: str) -> str:
+        return os.path.join(self._cache_dir, digest[:2], digest)
+
+    def remember_etag(self, key: str, etag: Optional[str]):
+        """Record an ETag seen in a listing so get() can skip stat_object"""
+        if etag:
+            self._etags[key] = etag.strip('"')
+
+    def _resolve_etag(self, key: str, etag: Optional[str]) -> str:
+        if etag:
+            return etag.strip('"')
+        if key in self._etags:
+            return self._etags[key]
+        stat = self._client.stat_object(self._bucket, key)
+        etag = (stat.etag or "").strip('"')
+        self._etags[key] = etag
+        return etag
+
+    # ---------------------------------------------------------------- index
+    def _scan_existing(self):
+        """Rebuild the LRU index from files left by a previous session"""
+        found = []
+        for root, _dirs, files in os.walk(self._cache_dir):
+            for name in files:
+                path = os.path.join(root, name)
+                if name.endswith(".tmp"):
+                    # 중단된 다운로드 정리
+                    try:
+                        os.remove(path)
+                    except OSError:
+                        pass
+                    continue
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                found.append((st.st_mtime, name, st.st_size))
+
+        found.sort()
+        with self._lock:
+            for _mtime, digest, size in found:
+                self._entries[digest] = size
+                self._total_bytes += size
+            self._evict_locked()
+
+        if found:
+            logger.info(f"Object cache: {len(self._entries)} cached objects ({self._total_bytes / 1024 / 1024:.1f} MB)")
+
+    def _evict_locked(self, keep: Optional[str] = None):
+        """Evict least recently used entries until under the size cap"""
+        for digest in list(self._entries.keys()):
+            if self._total_bytes <= self._max_bytes:
+                break
+            if digest == keep:
+                continue
+            try:
+                os.remove(self._path_for(digest))
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                # Windows에서는 매핑 중인 파일을 지울 수 없음 - 다음 기회에 재시도
+                logger.debug(f"Object cache eviction skipped for {digest}: {e}")
+                continue
+            self._total_bytes -= self._entries.pop(digest)
+            self._stats.evictions += 1
+
+    # ---------------------------------------------------------------- reads
+    @staticmethod
+    def _map_file(path: str) -> Union[mmap.mmap, bytes]:
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return b""
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def contains(self, key: str, etag: Optional[str] = None) -> bool:
+        """Check whether an object is cached (does not touch LRU order)"""
+        digest = self.make_digest(self._bucket, key, self._resolve_etag(key, etag))
+        with self._lock:
+            return digest in self._entries
+
+    def get(self, key: str, etag: Optional[str] = None) -> Union[mmap.mmap, bytes]:
+        """
+        Return object contents, downloading on a miss.
+
+        The returned mmap should be closed by the caller once the data has
+        been consumed.
+        """
+        return self._get(key, etag, warming=False)
+
+    def _get(self, key: str, etag: Optional[str], warming: bool) -> Union[mmap.mmap, bytes]:
+        etag = self._resolve_etag(key, etag)
+        digest = self.make_digest(self._bucket, key, etag)
+        path = self._path_for(digest)
+
+        # 같은 객체를 warm 스레드와 로더가 동시에 받지 않도록 digest 단위 잠금
+        with self._fetch_locks[digest]:
+            with self._lock:
+                size = self._entries.get(digest)
+                if size is not None:
+                    self._entries.move_to_end(digest)
+
+            if size is not None:
+                try:
+                    os.utime(path, None)  # 재시작 후에도 LRU 순서 유지
+                    data = self._map_file(path)
+                    if not warming:
+                        with self._lock:
+                            self._stats.hits += 1
+                            self._stats.bytes_saved += size
+                    return data
+                except FileNotFoundError:
+                    # 외부에서 파일이 지워진 경우 - 다시 받기
+                    with self._lock:
+                        if digest in self._entries:
+                            self._total_bytes -= self._entries.pop(digest)
+
+            size = self._download(key, path)
+            with self._lock:
+                # warm으로 받은 객체는 히트율 계산에서 제외
+                if warming:
+                    self._stats.warmed += 1
+                else:
+                    self._stats.misses += 1
+                self._stats.bytes_fetched += size
+                oversized = size > self._max_bytes
+                if not oversized:
+                    self._entries[digest] = size
+                    self._total_bytes += size
+                    self._evict_locked(keep=digest)
+
+            if oversized:
+                # 캐시 용량보다 큰 객체는 저장하지 않음 (읽기는 전역 잠금 밖에서 - digest 잠금만 유지)
+                with open(path, "rb") as f:
+                    data = f.read()
+                os.remove(path)
+                return data
+            return self._map_file(path)
+
+    def _download(self, key: str, path: str) -> int:
+        """Stream an object into the cache directory, returning its size"""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        if self._fetcher is not None:
+            try:
+                data = self._fetcher.fetch_object(key)
+                with open(tmp_path, "wb") as f:
+                    f.write(data)
+                os.replace(tmp_path, path)
+            finally:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+            return len(data)
+
+        size = 0
+        response = self._client.get_object(self._bucket, key)
+        try:
+            with open(tmp_path, "wb") as f:
+                while True:
+                    chunk = response.read(_DOWNLOAD_CHUNK)
+                    if not chunk:
+                        break
+                    f.write(chunk)
+                    size += len(chunk)
+            os.replace(tmp_path, path)
+        finally:
+            response.close()
+            response.release_conn()
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        return size
+
+    # ---------------------------------------------------------------- warm-up
+    def warm(self, prefix: str, suffix: str = ".parquet") -> int:
+        """Download every object under prefix that is not cached yet"""
+        fetched = 0
+        try:
+            objects = self._client.list_objects(self._bucket, prefix=prefix, recursive=True)
+            for obj in objects:
+                if self._stopped.is_set():
+                    break
+                if suffix and not obj.object_name.endswith(suffix):
+                    continue
+                self.remember_etag(obj.object_name, obj.etag)
+                if self.contains(obj.object_name):
+                    continue
+
+                data = self._get(obj.object_name, obj.etag, warming=True)
+                if isinstance(data, mmap.mmap):
+                    data.close()
+                fetched += 1
+        except Exception as e:
+            logger.warning(f"Object cache warm-up failed for '{prefix}': {e}")
+
+        logger.info(f"Object cache warm-up for '{prefix}' finished: {fetched} objects fetched")
+        return fetched
+
+    def stop(self):
+        """Stop a running warm-up at the next object boundary"""
+        self._stopped.set()
+
+    # ---------------------------------------------------------------- info
+    def get_stats(self) -> Dict:
+        """Hit ratio, bytes saved and current occupancy"""
+        with self._lock:
+            stats = self._stats.to_dict()
+            stats['cached_objects'] = len(self._entries)
+            stats['cached_bytes'] = self._total_bytes
+            stats['max_bytes'] = self._max_bytes
+        return stats
+
+    def clear(self):
+        """Remove every cached object"""
+        with self._lock:
+            for digest in list(self._entries.keys()):
+                try:
+                    os.remove(self._path_for(digest))
+                except OSError:
+                    pass
+            self._entries.clear()
+            self._total_bytes = 0
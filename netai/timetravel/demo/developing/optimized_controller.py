@@ -6,18 +6,33 @@ from pxr import Usd, UsdGeom, Sdf, Gf
 import omni.usd
 import datetime
 import time
+import contextlib
 import omni.timeline
 import os
 import numpy as np
 import json
 import io
+import mmap
 import logging
 from typing import Dict, List, Optional, Tuple
 from concurrent.futures import ThreadPoolExecutor
 import threading
 from collections import defaultdict
-from .data_model import SensorDataCache, OptimizedSensorData
+from .data_model import (
+    SensorDataCache, OptimizedSensorData,
+    missing_time_intervals, merge_time_intervals, split_time_intervals
+)
+from .object_cache import LocalObjectCache
+from .range_fetcher import (RangedObjectFetcher, create_pooled_minio_client, make_time_row_group_filter,
+                            select_row_groups)
+from .tile_cache import TimeTileCache
+from .pyramid import SensorPyramidIndex
+from .keyframe_store import KeyframeDeltaStore
+from .threshold_index import ThresholdIntervalIndex
 from .config import Config, PARQUET_COLUMN_MAPPING
+from ..engine import NullStageWriter, PlaybackClock, StageWriter
+from ..engine.range_index import REDUCERS, SensorRangeIndex
+from ..tracing import ADVANCE, INDEX_BUILD, LOAD_FILE, LOAD_RANGE, LOAD_TILE, RESOLVE, SEEK, USD_APPLY, tracer
 
 # Parquet reading without pandas
 try:
@@ -41,14 +56,31 @@ class ParquetReader:
     """Lightweight parquet reader without pandas"""
     
     @staticmethod
-    def read_parquet_to_dict(file_data: bytes) -> Dict[str, List]:
-        """Read parquet file and return as dictionary of lists"""
+    def read_parquet_to_dict(file_data) -> Dict[str, List]:
+        """Read parquet file (bytes or mmap) and return as dictionary of lists"""
+        return ParquetReader.table_to_dict(ParquetReader.read_parquet_table(file_data))
+    
+    @staticmethod
+    def read_parquet_table(file_data, columns: Optional[List[str]] = None, row_group_filter=None):
+        """
+        Read parquet file (bytes or mmap) into a pyarrow table, optionally
+        only the given columns of the row groups passing row_group_filter
+        """
         if not PYARROW_AVAILABLE:
             raise ImportError("PyArrow is required for parquet reading")
             
-        # Read parquet file
-        table = pq.read_table(io.BytesIO(file_data))
-        
+        # Read parquet file (mmap은 복사 없이 그대로 사용)
+        source = pa.BufferReader(pa.py_buffer(file_data))
+        if columns is None and row_group_filter is None:
+            return pq.read_table(source)
+        # 필요한 row group / 컬럼만 디코딩 (footer 통계로 선택)
+        parquet_file = pq.ParquetFile(source)
+        row_groups, columns = select_row_groups(parquet_file, columns, row_group_filter)
+        return parquet_file.read_row_groups(row_groups, columns=columns)
+    
+    @staticmethod
+    def table_to_dict(table) -> Dict[str, List]:
+        """Convert a pyarrow table to dictionary of lists"""
         # Convert to dictionary of lists
         data_dict = {}
         for column in table.column_names:
@@ -122,6 +154,31 @@ class DataProcessor:
         
         return filtered_data
     
+    @staticmethod
+    def table_timestamps(table) -> Optional[np.ndarray]:
+        """KST timestamps of a parquet table as datetime64[ns] (vectorized parse)"""
+        timestamp_col = PARQUET_COLUMN_MAPPING['timestamp']
+        if timestamp_col in table.column_names:
+            return DataProcessor._column_to_datetime64(table.column(timestamp_col))
+        if 'timestamp_utc' in table.column_names:
+            # Convert UTC to KST (UTC+9)
+            return DataProcessor._column_to_datetime64(table.column('timestamp_utc')) + np.timedelta64(9, 'h')
+        return None
+    
+    @staticmethod
+    def _column_to_datetime64(column) -> np.ndarray:
+        values = column.to_numpy()
+        if values.dtype.kind == 'M':
+            return values.astype('datetime64[ns]')
+        return values.astype(str).astype('datetime64[ns]')
+    
+    @staticmethod
+    def slice_table_by_time(table, timestamps: np.ndarray,
+                            start_time: datetime.datetime, end_time: datetime.datetime):
+        """Rows of a table within [start_time, end_time]"""
+        mask = (timestamps >= np.datetime64(start_time)) & (timestamps <= np.datetime64(end_time))
+        return table.filter(pa.array(mask))
+    
     @staticmethod
     def group_by_sensor(data_dict: Dict[str, List]) -> Dict[str, Dict[str, List]]:
         """Group data by sensor ID"""
@@ -151,6 +208,30 @@ class DataProcessor:
             
         return grouped_data
 
+class UsdRackWriter(StageWriter):
+    """Writes per-rack channel values to the rack prims of a USD stage"""
+    
+    def __init__(self, stage):
+        self._stage = stage
+        
+    def write_time(self, current_time):
+        pass  # 이 컨트롤러는 타임라인 시간을 쓰지 않음
+        
+    def write_racks(self, updates: Dict[str, Dict]):
+        for rack_path, values in updates.items():
+            prim = self._stage.GetPrimAtPath(rack_path)
+            if prim and prim.IsValid():
+                # Batch attribute updates
+                if 'temperature_cold' in values:
+                    prim.GetAttribute("temperature_cold").Set(values['temperature_cold'])
+                if 'temperature_hot' in values:
+                    prim.GetAttribute("temperature_hot").Set(values['temperature_hot'])
+                if 'humidity_cold' in values:
+                    prim.GetAttribute("humidity_cold").Set(values['humidity_cold'])
+                if 'humidity_hot' in values:
+                    prim.GetAttribute("humidity_hot").Set(values['humidity_hot'])
+
+
 class OptimizedTimeController:
     """Ultra high-performance time controller without pandas dependency"""
     
@@ -164,33 +245,103 @@ class OptimizedTimeController:
         if not self._logger.handlers:  # 핸들러가 없을 때만 추가
             logging.basicConfig(level=logging.INFO)
         
-        # Time range
-        self._start_time = datetime.datetime.now() - datetime.timedelta(days=Config.DEFAULT_TIME_RANGE_DAYS)
-        self._end_time = datetime.datetime.now()
-        self._current_time = self._start_time
+        # Time range + playback state (실제 1초 = 시뮬레이션 1분 x speed)
+        now = datetime.datetime.now()
+        self._clock = PlaybackClock(now - datetime.timedelta(days=Config.DEFAULT_TIME_RANGE_DAYS), now,
+                                    speed=Config.DEFAULT_PLAYBACK_SPEED, time_scale=60)
         
-        # Playback state
-        self._is_playing = False
-        self._playback_speed = Config.DEFAULT_PLAYBACK_SPEED
-        self._last_update_time = time.time()
+        # 스테이지 출력 (set_stage 전에는 버림)
+        self._writer: StageWriter = NullStageWriter()
         
         # MinIO configuration (optional)
         self._minio_client = None
         if MINIO_AVAILABLE:
             try:
-                self._minio_client = Minio(
+                # 튜닝된 공유 urllib3 풀 사용 (병렬 ranged GET 대응)
+                self._minio_client = create_pooled_minio_client(
                     Config.MINIO_ENDPOINT,
                     access_key=os.getenv("MINIO_ACCESS_KEY", "minioadmin"),
                     secret_key=os.getenv("MINIO_SECRET_KEY", "minioadmin"),
-                    secure=False
+                    secure=False,
+                    pool_size=Config.FETCH_POOL_SIZE
                 )
             except Exception as e:
                 self._logger.warning(f"MinIO connection failed: {e}")
         
+        # Concurrent ranged GET fetcher (footer-first selective parquet reads)
+        self._range_fetcher = None
+        if self._minio_client:
+            self._range_fetcher = RangedObjectFetcher(
+                self._minio_client, Config.MINIO_BUCKET,
+                max_workers=Config.FETCH_MAX_WORKERS,
+                part_size=Config.FETCH_PART_SIZE,
+                hedge_after=Config.FETCH_HEDGE_AFTER_S,
+                max_retries=Config.FETCH_MAX_RETRIES
+            )
+        
+        # Thread pool for async operations
+        # (스레드 이름 = 트레이스 트랙 이름)
+        self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="parquet-loader")
+        self._loading_future = None
+        
+        # 구간 로딩 작업은 한 번에 하나씩 (파일 작업은 _executor에서 실행되므로 교착 없음)
+        self._range_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="range-loader")
+        self._range_generation = 0
+        self._loaded_intervals: List[Tuple[int, int]] = []  # _data_cache에 들어있는 (start_ns, end_ns) 구간
+        self._last_load_stats: Dict = {}
+        self._load_timings = defaultdict(list)  # mode -> [seconds] (전체 vs 증분 로딩 시간 비교용)
+        
+        # Local disk cache for MinIO objects (set_time_range마다 재다운로드 방지)
+        self._object_cache = None
+        self._warm_future = None
+        self._warm_executor = None
+        if self._minio_client and Config.CACHE_ENABLED:
+            try:
+                self._object_cache = LocalObjectCache(
+                    self._minio_client, Config.MINIO_BUCKET,
+                    Config.CACHE_DIR, Config.CACHE_MAX_BYTES,
+                    fetcher=self._range_fetcher
+                )
+                if Config.CACHE_WARM_ON_START:
+                    # 로더 풀과 분리된 단일 스레드 - warm이 실제 로딩 작업을 밀어내지 않도록
+                    self._warm_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="cache-warm")
+                    self._warm_future = self._warm_executor.submit(self._object_cache.warm, Config.MINIO_PREFIX)
+            except Exception as e:
+                self._logger.warning(f"Object cache disabled: {e}")
+                self._object_cache = None
+        
         # High-performance data cache
         self._data_cache = SensorDataCache()
         self._data_lock = threading.RLock()
         
+        # Time-tiled cache (활성화 시 구간 전체 로딩 대신 타일 단위 on-demand 로딩)
+        self._parquet_files = None
+        self._parquet_metadata: Dict[str, object] = {}  # 파일 -> footer 메타데이터 (타일 파일 선택용)
+        self._tile_cache = None
+        if Config.TILE_CACHE_ENABLED:
+            self._tile_cache = TimeTileCache(
+                self._load_tile,
+                tile_seconds=Config.TILE_SECONDS,
+                max_bytes=Config.TILE_CACHE_MAX_BYTES,
+                lookahead_s=Config.TILE_PREFETCH_LOOKAHEAD_S,
+                max_prefetch_tiles=Config.TILE_PREFETCH_MAX_TILES,
+                executor=self._executor
+            )
+        
+        # 로딩된 구간의 다중 해상도 집계 (로딩 완료 시 재빌드)
+        self._pyramid: Optional[SensorPyramidIndex] = None
+        
+        # 고속 재생: 프레임이 지나간 구간 [이전 시각, 현재 시각]을 reducer로 집계
+        self._range_index: Optional[SensorRangeIndex] = None
+        self._playback_reducer = Config.PLAYBACK_REDUCER
+        self._frame_start_time: Optional[datetime.datetime] = None
+        
+        # Keyframe + delta LKV 스토어 (활성화 시 보간 대신 사용)
+        self._keyframe_store: Optional[KeyframeDeltaStore] = None
+        
+        # 임계값 초과 구간 (알람 검색)
+        self._threshold_index: Optional[ThresholdIntervalIndex] = None
+        
         # Rack to sensor mapping from config
         self._rack_to_sensor_map = Config.get_rack_to_sensor_map()
         self._sensor_to_rack_map = Config.get_sensor_to_rack_map()
@@ -200,17 +351,51 @@ class OptimizedTimeController:
         self._last_batch_update = time.time()
         self._last_cache_values = {}
         
-        # Thread pool for async operations
-        self._executor = ThreadPoolExecutor(max_workers=4)
-        self._loading_future = None
-        
         # Statistics
         self._load_start_time = None
         self._load_end_time = None
         
+    # 시계 상태 (기존 속성 이름 유지)
+    @property
+    def _start_time(self) -> datetime.datetime:
+        return self._clock.start_time
+    
+    @_start_time.setter
+    def _start_time(self, value: datetime.datetime):
+        self._clock.start_time = value
+        
+    @property
+    def _end_time(self) -> datetime.datetime:
+        return self._clock.end_time
+    
+    @_end_time.setter
+    def _end_time(self, value: datetime.datetime):
+        self._clock.end_time = value
+        
+    @property
+    def _current_time(self) -> datetime.datetime:
+        return self._clock.current_time
+    
+    @_current_time.setter
+    def _current_time(self, value: datetime.datetime):
+        self._clock.current_time = value
+        
+    @property
+    def _is_playing(self) -> bool:
+        return self._clock.playing
+        
+    @property
+    def _playback_speed(self) -> float:
+        return self._clock.speed
+        
     def set_stage(self, stage):
         """Set the USD stage"""
         self._stage = stage
+        self._writer = UsdRackWriter(stage)
+        
+    def set_stage_writer(self, writer: StageWriter):
+        """Send rack updates to another StageWriter (headless runs, tests)"""
+        self._writer = writer
         self._setup_rack_attributes()
         
     def _setup_rack_attributes(self):
@@ -231,23 +416,61 @@ class OptimizedTimeController:
                 if not prim.HasAttribute("humidity_hot"):
                     prim.CreateAttribute("humidity_hot", Sdf.ValueTypeNames.Float).Set(0.0)
 
-    def _load_parquet_file(self, file_path: str, start_time: datetime.datetime, end_time: datetime.datetime):
+    def _load_parquet_file(self, file_path: str, start_time: datetime.datetime, end_time: datetime.datetime,
+                           target_cache: Optional[SensorDataCache] = None):
         """Load a single parquet file with optimized processing"""
+        table = self._read_parquet_table(file_path, start_time, end_time)
+        if table is not None:
+            self._index_parquet_rows(ParquetReader.table_to_dict(table), file_path,
+                                     start_time, end_time, target_cache)
+            
+    @staticmethod
+    def _time_row_group_filter(ranges: List[Tuple[datetime.datetime, datetime.datetime]]):
+        """Row group filter keeping groups that overlap any of the time ranges"""
+        filters = [make_time_row_group_filter(PARQUET_COLUMN_MAPPING['timestamp'], start, end)
+                   for start, end in ranges]
+        if len(filters) == 1:
+            return filters[0]
+        return lambda row_group: any(f(row_group) for f in filters)
+        
+    @tracer.traced(LOAD_FILE)
+    def _read_parquet_table(self, file_path: str, start_time: datetime.datetime, end_time: datetime.datetime,
+                            gaps: Optional[List[Tuple[datetime.datetime, datetime.datetime]]] = None):
+        """
+        Read the row groups of a parquet file that overlap the time range
+        (or, when given, only those overlapping one of the gaps inside it)
+        """
+        data = None
+        columns = self._parquet_columns()
+        row_group_filter = self._time_row_group_filter(gaps or [(start_time, end_time)])
         try:
-            # Download file from MinIO or read local file
-            if self._minio_client:
-                response = self._minio_client.get_object(Config.MINIO_BUCKET, file_path)
-                data = response.read()
-                response.close()
-                response.release_conn()
+            # Local cache hit -> mmap, otherwise ranged GETs; either way only the needed row groups/columns
+            if self._object_cache and self._object_cache.contains(file_path):
+                data = self._object_cache.get(file_path)
+                return ParquetReader.read_parquet_table(data, columns, row_group_filter)
+            elif self._range_fetcher:
+                return self._range_fetcher.read_table(file_path, columns=columns, row_group_filter=row_group_filter)
             else:
                 # Fallback to local file
                 with open(file_path, 'rb') as f:
                     data = f.read()
-            
-            # Read parquet data to dictionary
-            data_dict = ParquetReader.read_parquet_to_dict(data)
-            
+                return ParquetReader.read_parquet_table(data, columns, row_group_filter)
+        except Exception as e:
+            self._logger.error(f"Error loading {file_path}: {e}")
+            return None
+        finally:
+            if isinstance(data, mmap.mmap):
+                try:
+                    data.close()
+                except BufferError:
+                    # pyarrow가 아직 버퍼를 참조 중이면 GC 시 해제됨
+                    pass
+                    
+    def _index_parquet_rows(self, data_dict: Dict[str, List], file_path: str,
+                            start_time: datetime.datetime, end_time: datetime.datetime,
+                            target_cache: Optional[SensorDataCache] = None):
+        """Map, filter and group parquet rows into the sensor cache"""
+        try:
             # Apply column mapping
             data_dict = ParquetReader.apply_column_mapping(data_dict)
             
@@ -255,14 +478,14 @@ class OptimizedTimeController:
             if 'objid' in data_dict:
                 # 매핑에 있는 objId만 필터링
                 valid_objids = set(self._sensor_to_rack_map.keys())
-                self._logger.info(f"Found objId values: {set(data_dict['objid'])}")
-                self._logger.info(f"Valid objId values: {valid_objids}")
+                self._logger.debug(f"Found objId values: {set(data_dict['objid'])}")
+                self._logger.debug(f"Valid objId values: {valid_objids}")
                 
                 # 유효한 objId만 남기기
                 valid_indices = [i for i, objid in enumerate(data_dict['objid']) 
                                if objid in valid_objids]
                 
-                self._logger.info(f"Valid sensor records: {len(valid_indices)} / {len(data_dict['objid'])}")
+                self._logger.debug(f"Valid sensor records: {len(valid_indices)} / {len(data_dict['objid'])}")
                 
                 # 모든 컬럼에 필터 적용
                 for col_name, col_data in data_dict.items():
@@ -283,25 +506,36 @@ class OptimizedTimeController:
             # Group by sensor (objId를 직접 사용)
             grouped_data = DataProcessor.group_by_sensor(data_dict)
             
-            self._logger.info(f"Grouped data by objId: {list(grouped_data.keys())}")
+            self._logger.debug(f"Grouped data by objId: {list(grouped_data.keys())}")
             
             for objid, sensor_dict in grouped_data.items():
                 if len(sensor_dict.get('timestamp', [])) > 0:
                     # objId를 직접 캐시 키로 사용
-                    self._add_sensor_data_to_cache(objid, sensor_dict)
-                    self._logger.info(f"Added {len(sensor_dict.get('timestamp', []))} records for objId {objid}")
+                    self._add_sensor_data_to_cache(objid, sensor_dict, target_cache)
+                    self._logger.debug(f"Added {len(sensor_dict.get('timestamp', []))} records for objId {objid}")
                         
             record_count = len(data_dict.get('timestamp', []))
-            self._logger.info(f"Loaded {record_count} records from {file_path}")
+            self._logger.info(f"Loaded {record_count} records from {file_path} ({start_time} - {end_time})")
             
         except Exception as e:
-            self._logger.error(f"Error loading {file_path}: {e}")
+            self._logger.error(f"Error indexing {file_path}: {e}")
+            
+    @staticmethod
+    def _parquet_columns() -> List[str]:
+        """Parquet columns needed by the loader (file-side names)"""
+        columns = list(PARQUET_COLUMN_MAPPING.values())
+        columns.append('timestamp_utc')
+        return columns
             
-    def _add_sensor_data_to_cache(self, objid: int, sensor_dict: Dict[str, List]):
+    def _add_sensor_data_to_cache(self, objid: int, sensor_dict: Dict[str, List],
+                                  target_cache: Optional[SensorDataCache] = None):
         """Add sensor data to cache using objId directly"""
+        if target_cache is not None:
+            # 타일 전용 캐시는 로딩 스레드만 씀 - _data_lock을 잡으면 타일을 기다리는 update_stage_time과 교착
+            target_cache.get_sensor_data(objid).add_dataframe_dict(sensor_dict)
+            return
         with self._data_lock:
-            sensor_data = self._data_cache.get_sensor_data(objid)
-            sensor_data.add_dataframe_dict(sensor_dict)
+            self._data_cache.get_sensor_data(objid).add_dataframe_dict(sensor_dict)
 
     def _discover_parquet_files(self, start_time: datetime.datetime, end_time: datetime.datetime) -> List[str]:
         """Discover parquet files that contain data for the time range"""
@@ -313,6 +547,8 @@ class OptimizedTimeController:
                 for obj in objects:
                     if obj.object_name.endswith('.parquet'):
                         files.append(obj.object_name)
+                        if self._object_cache:
+                            self._object_cache.remember_etag(obj.object_name, obj.etag)
             else:
                 # Fallback to local directory
                 import glob
@@ -327,50 +563,316 @@ class OptimizedTimeController:
             
         return files
     
-    def load_data_for_time_range(self, start_time: datetime.datetime, end_time: datetime.datetime):
-        """Load sensor data for the specified time range"""
-        self._load_start_time = time.time()
-        self._logger.info(f"Loading data from {start_time} to {end_time}")
+    def _get_parquet_files(self) -> List[str]:
+        """Parquet file list, discovered once per time range"""
+        if self._parquet_files is None:
+            self._parquet_files = self._discover_parquet_files(self._start_time, self._end_time)
+        return self._parquet_files
         
-        # Clear existing data
-        with self._data_lock:
-            self._data_cache.clear()
+    def _get_parquet_metadata(self, file_path: str):
+        """Footer metadata of a parquet file, read once per time range (None if unreadable)"""
+        if file_path in self._parquet_metadata:
+            return self._parquet_metadata[file_path]
+        metadata = None
+        data = None
+        try:
+            if self._object_cache and self._object_cache.contains(file_path):
+                data = self._object_cache.get(file_path)
+                metadata = pq.read_metadata(pa.BufferReader(pa.py_buffer(data)))
+            elif self._range_fetcher:
+                metadata = self._range_fetcher.read_metadata(file_path)
+            else:
+                metadata = pq.read_metadata(file_path)
+        except Exception as e:
+            self._logger.warning(f"Could not read parquet metadata of {file_path}: {e}")
+        finally:
+            if isinstance(data, mmap.mmap):
+                try:
+                    data.close()
+                except BufferError:
+                    pass
+        # 여러 타일 스레드가 동시에 채워도 같은 값 - 잠금 불필요
+        self._parquet_metadata[file_path] = metadata
+        return metadata
         
-        # Discover parquet files
-        parquet_files = self._discover_parquet_files(start_time, end_time)
+    def _file_overlaps(self, file_path: str, ranges: List[Tuple[datetime.datetime, datetime.datetime]]) -> bool:
+        """Whether any row group of the file has time statistics overlapping one of the ranges"""
+        metadata = self._get_parquet_metadata(file_path)
+        if metadata is None:
+            return True  # 메타데이터를 못 읽으면 안전하게 포함 (읽기 단계에서 다시 판단)
+        row_group_filter = self._time_row_group_filter(ranges)
+        return any(row_group_filter(metadata.row_group(i)) for i in range(metadata.num_row_groups))
         
-        if not parquet_files:
-            self._logger.warning("No parquet files found for the time range")
-            return
-            
-        # Load files concurrently
-        futures = []
-        for file_path in parquet_files:
-            future = self._executor.submit(self._load_parquet_file, file_path, start_time, end_time)
-            futures.append(future)
+    def _files_overlapping(self, start_time: datetime.datetime, end_time: datetime.datetime) -> List[str]:
+        """Parquet files with at least one row group whose time statistics overlap the range"""
+        return [file_path for file_path in self._get_parquet_files()
+                if self._file_overlaps(file_path, [(start_time, end_time)])]
+        
+    @tracer.traced(LOAD_TILE)
+    def _load_tile(self, tile_start: datetime.datetime, tile_end: datetime.datetime) -> SensorDataCache:
+        """Tile loader: read the overlapping row groups of the files that cover one time tile"""
+        tile = SensorDataCache()
+        # 타일 로딩은 이미 executor 위에서 실행되므로 파일은 순차 처리 (풀 교착 방지)
+        for file_path in self._files_overlapping(tile_start, tile_end):
+            self._load_parquet_file(file_path, tile_start, tile_end, target_cache=tile)
+        return tile
+    
+    @staticmethod
+    def _to_ns(t: datetime.datetime) -> int:
+        return int(t.timestamp() * 1_000_000_000)
         
-        # Wait for all files to load
-        for future in futures:
-            future.result()
+    @staticmethod
+    def _from_ns(ns: int) -> datetime.datetime:
+        return datetime.datetime.fromtimestamp(ns / 1_000_000_000)
+    
+    @tracer.traced(LOAD_RANGE)
+    def load_data_for_time_range(self, start_time: datetime.datetime, end_time: datetime.datetime,
+                                 generation: Optional[int] = None):
+        """
+        Load sensor data for the specified time range.
+        
+        When the new range overlaps the loaded one only the missing intervals
+        are read; data outside the new range is trimmed. Missing intervals are
+        published in time order, one PROGRESSIVE_CHUNK_S chunk at a time, so
+        playback can start on the loaded prefix (see get_loaded_through).
+        Each chunk is staged separately and merged under the data lock, so
+        readers never see a half-indexed chunk.
+        """
+        if generation is not None and generation != self._range_generation:
+            return  # 더 최신 요청이 대기 중
             
-        # Optimize data structures after loading
+        self._load_start_time = time.time()
+        requested = (self._to_ns(start_time), self._to_ns(end_time))
+        with self._data_lock:
+            loaded = list(self._loaded_intervals)
+        missing = missing_time_intervals(loaded, requested)
+        full_reload = missing is None
+        intervals = [requested] if full_reload else missing
+        
+        self._logger.info(
+            f"Loading data from {start_time} to {end_time} "
+            f"({'full reload' if full_reload else f'{len(intervals)} missing interval(s)'})"
+        )
+        
+        # 범위 밖 데이터는 바로 정리 (전체 재로딩이면 빈 캐시에서 시작)
         with self._data_lock:
-            self._data_cache.optimize()
+            if full_reload:
+                self._data_cache = SensorDataCache()
+                self._loaded_intervals = []
+                self._pyramid = None
+                self._range_index = None
+                self._keyframe_store = None
+                self._threshold_index = None
+                removed = 0
+            else:
+                removed, _ = self._data_cache.apply_range_update(requested[0], requested[1])
+                self._loaded_intervals = [
+                    (max(a, requested[0]), min(b, requested[1]))
+                    for a, b in merge_time_intervals(loaded)
+                    if b >= requested[0] and a <= requested[1]
+                ]
+                
+        time_to_first_frame = 0.0 if self.get_loaded_through() is not None else None
+        added = 0
+        
+        if intervals:
+            parquet_files = self._discover_parquet_files(start_time, end_time)
+            if not parquet_files:
+                self._logger.warning("No parquet files found for the time range")
+                
+            # 파일은 한 번만 읽고 (병렬), 청크 단위로 시간순 인덱싱/공개
+            # 이미 로딩된 가운데 구간의 row group은 읽지 않음 (빠진 구간과 겹치는 것만)
+            gaps = [(self._from_ns(a), self._from_ns(b)) for a, b in intervals]
+            span_start, span_end = gaps[0][0], gaps[-1][1]
+            # footer는 병렬로 한 번씩 읽어서 파일별 시간 범위 판단에 재사용
+            list(self._executor.map(self._get_parquet_metadata, parquet_files))
+            parquet_files = [file_path for file_path in parquet_files if self._file_overlaps(file_path, gaps)]
+            table_futures = [
+                (file_path, self._executor.submit(self._read_parquet_table, file_path, span_start, span_end, gaps))
+                for file_path in parquet_files
+            ]
+            file_timestamps = {}
+            chunk_ns = int(Config.PROGRESSIVE_CHUNK_S * 1_000_000_000)
+            
+            for chunk_start, chunk_end in split_time_intervals(intervals, chunk_ns):
+                if generation is not None and generation != self._range_generation:
+                    self._logger.info(f"Stopping superseded load for {start_time} - {end_time}")
+                    for _file_path, future in table_futures:
+                        future.cancel()
+                    return
+                    
+                chunk_start_dt = self._from_ns(chunk_start)
+                chunk_end_dt = self._from_ns(chunk_end)
+                staged = SensorDataCache()
+                for file_path, future in table_futures:
+                    # 이 청크와 겹치는 파일만 기다림 (첫 청크가 모든 파일을 기다리지 않도록)
+                    if not self._file_overlaps(file_path, [(chunk_start_dt, chunk_end_dt)]):
+                        continue
+                    table = future.result()
+                    if table is None:
+                        continue
+                    if file_path not in file_timestamps:
+                        file_timestamps[file_path] = DataProcessor.table_timestamps(table)
+                    timestamps = file_timestamps[file_path]
+                    chunk_table = table if timestamps is None else DataProcessor.slice_table_by_time(
+                        table, timestamps, chunk_start_dt, chunk_end_dt)
+                    if chunk_table.num_rows:
+                        self._index_parquet_rows(ParquetReader.table_to_dict(chunk_table), file_path,
+                                                 chunk_start_dt, chunk_end_dt, staged)
+                        
+                staged.optimize()
+                with self._data_lock:
+                    _, chunk_added = self._data_cache.apply_range_update(
+                        requested[0], requested[1], staged, self._loaded_intervals)
+                    self._loaded_intervals = merge_time_intervals(
+                        self._loaded_intervals + [(chunk_start, chunk_end)])
+                added += chunk_added
+                
+                if time_to_first_frame is None and self.get_loaded_through() is not None:
+                    time_to_first_frame = time.time() - self._load_start_time
+                    self._logger.info(f"First frame available after {time_to_first_frame:.2f} seconds")
+            
+        self._rebuild_indexes()
             
         self._load_end_time = time.time()
         load_duration = self._load_end_time - self._load_start_time
-        self._logger.info(f"Data loading completed in {load_duration:.2f} seconds")
+        self._last_load_stats = {
+            'mode': 'full' if full_reload else ('incremental' if intervals else 'trim'),
+            'intervals': [(self._from_ns(a), self._from_ns(b)) for a, b in intervals],
+            'added_records': added,
+            'removed_records': removed,
+            'time_to_first_frame': time_to_first_frame,
+            'seconds': load_duration,
+        }
+        self._load_timings[self._last_load_stats['mode']].append(load_duration)
+        if time_to_first_frame is not None:
+            self._load_timings['first_frame'].append(time_to_first_frame)
+        self._logger.info(
+            f"Data loading completed in {load_duration:.2f} seconds "
+            f"({self._last_load_stats['mode']}: +{added} / -{removed} records)"
+        )
+        
+        if self._object_cache:
+            stats = self._object_cache.get_stats()
+            self._logger.info(
+                f"Object cache: hit ratio {stats['hit_ratio']:.1%}, "
+                f"{stats['bytes_saved'] / 1024 / 1024:.1f} MB saved, "
+                f"{stats['cached_bytes'] / 1024 / 1024:.1f} MB cached"
+            )
+            
+    @tracer.traced(INDEX_BUILD)
+    def _rebuild_indexes(self):
+        """Rebuild the derived indexes over everything currently loaded"""
+        if Config.PYRAMID_ENABLED:
+            self._build_pyramid()
+        # range_stats와 고속 재생 reducer가 함께 사용 - 항상 빌드
+        self._build_range_index()
+        if Config.KEYFRAME_STORE_ENABLED:
+            self._build_keyframe_store()
+        if Config.THRESHOLD_INDEX_ENABLED:
+            self._build_threshold_index()
+            
+    def _build_pyramid(self):
+        """Rebuild the aggregate pyramid over everything currently loaded"""
+        with self._data_lock:
+            pyramid = SensorPyramidIndex.build(self._data_cache, Config.PYRAMID_LEVELS_S)
+            self._pyramid = pyramid
+        stats = pyramid.get_stats()
+        self._logger.info(
+            f"Aggregate pyramid built in {stats['build_seconds'] * 1000:.1f} ms "
+            f"({stats['sensors']} sensors, {stats['nbytes'] / 1024 / 1024:.1f} MB)"
+        )
+        
+    def _build_range_index(self):
+        """Rebuild the range aggregates (range_stats, playback reducers) over everything currently loaded"""
+        with self._data_lock:
+            range_index = SensorRangeIndex.build(self._data_cache, Config.RANGE_INDEX_BLOCK_SIZE)
+            self._range_index = range_index
+        stats = range_index.get_stats()
+        self._logger.info(
+            f"Range index built in {stats['build_seconds'] * 1000:.1f} ms "
+            f"({stats['sensors']} sensors, {stats['nbytes'] / 1024 / 1024:.1f} MB)"
+        )
+        
+    def _build_threshold_index(self):
+        """Rebuild the threshold exceedance intervals over everything currently loaded"""
+        with self._data_lock:
+            threshold_index = ThresholdIntervalIndex.build(self._data_cache, Config.ALARM_THRESHOLDS)
+            self._threshold_index = threshold_index
+        stats = threshold_index.get_stats()
+        self._logger.info(
+            f"Threshold index built in {stats['build_seconds'] * 1000:.1f} ms "
+            f"({stats['intervals']} intervals, {stats['nbytes'] / 1024:.1f} KB)"
+        )
+        
+    def _build_keyframe_store(self):
+        """Rebuild the keyframe + delta LKV store over everything currently loaded"""
+        with self._data_lock:
+            store = KeyframeDeltaStore.from_cache(self._data_cache, Config.KEYFRAME_EVERY_CHANGES,
+                                                  Config.KEYFRAME_EVERY_S)
+            self._keyframe_store = store
+        stats = store.get_stats()
+        self._logger.info(
+            f"Keyframe store built in {stats['build_seconds'] * 1000:.1f} ms "
+            f"({stats['deltas']} deltas, {stats['keyframes']} keyframes, {stats['nbytes'] / 1024 / 1024:.1f} MB)"
+        )
+        
+    def is_loading(self) -> bool:
+        """Check if a range load is in progress"""
+        return self._loading_future is not None and not self._loading_future.done()
+        
+    def get_loaded_through(self) -> Optional[datetime.datetime]:
+        """End of the contiguous loaded prefix of the current range (None if the start is not loaded)"""
+        start_ns = self._to_ns(self._start_time)
+        end_ns = self._to_ns(self._end_time)
+        with self._data_lock:
+            for interval_start, interval_end in self._loaded_intervals:
+                if interval_start <= start_ns <= interval_end:
+                    return self._from_ns(min(interval_end, end_ns))
+        return None
+        
+    def get_loaded_regions(self) -> List[Tuple[float, float]]:
+        """Loaded parts of the current range as (start, end) progress fractions"""
+        start_ns = self._to_ns(self._start_time)
+        end_ns = self._to_ns(self._end_time)
+        if end_ns <= start_ns:
+            return []
+        span = end_ns - start_ns
+        with self._data_lock:
+            intervals = list(self._loaded_intervals)
+        return [
+            ((max(a, start_ns) - start_ns) / span, (min(b, end_ns) - start_ns) / span)
+            for a, b in intervals
+            if b >= start_ns and a <= end_ns
+        ]
+        
+    def _playable_end(self) -> datetime.datetime:
+        """Latest time playback/scrubbing may reach while data is still loading"""
+        if not self.is_loading():
+            return self._end_time
+        loaded_through = self.get_loaded_through()
+        return loaded_through if loaded_through is not None else self._start_time
 
     def set_time_range(self, start_time: datetime.datetime, end_time: datetime.datetime):
         """Set time range and load data"""
         self._start_time = start_time
         self._end_time = end_time
         self._current_time = start_time
+        self._parquet_files = None
+        self._parquet_metadata = {}
+        
+        if self._tile_cache:
+            # 타일은 시간 구간과 무관하게 유효하므로 유지하고, 첫 타일만 미리 로딩
+            self._tile_cache.set_bounds(start_time, end_time)
+            self._tile_cache.request_tile(start_time)
+            return
         
-        # Load data asynchronously
+        # Load data asynchronously (겹치는 구간은 다시 읽지 않음)
+        self._range_generation += 1
         if self._loading_future:
             self._loading_future.cancel()
-        self._loading_future = self._executor.submit(self.load_data_for_time_range, start_time, end_time)
+        self._loading_future = self._range_executor.submit(
+            self.load_data_for_time_range, start_time, end_time, self._range_generation)
         
     def set_current_time(self, target_time: datetime.datetime):
         """Set current time and update stage"""
@@ -379,8 +881,14 @@ class OptimizedTimeController:
         elif target_time > self._end_time:
             target_time = self._end_time
             
-        self._current_time = target_time
-        self.update_stage_time()
+        # 로딩 중에는 이미 로딩된 앞부분까지만 이동
+        if not self._tile_cache:
+            target_time = min(target_time, self._playable_end())
+            
+        with tracer.span(SEEK):
+            self._current_time = target_time
+            self._frame_start_time = None  # 스크럽은 집계하지 않고 해당 시점 값 표시
+            self.update_stage_time()
         
     def set_to_present(self):
         """Set time to present (end time)"""
@@ -388,74 +896,98 @@ class OptimizedTimeController:
         
     def toggle_playback(self):
         """Toggle playback state"""
-        self._is_playing = not self._is_playing
-        self._last_update_time = time.time()
+        self._clock.toggle()
         
     def set_playback_speed(self, speed: float):
         """Set playback speed"""
-        self._playback_speed = max(Config.MIN_PLAYBACK_SPEED, 
-                                  min(Config.MAX_PLAYBACK_SPEED, speed))
+        self._clock.speed = max(Config.MIN_PLAYBACK_SPEED, 
+                                min(Config.MAX_PLAYBACK_SPEED, speed))
         
-    def update_playback(self):
-        """Update playback time"""
-        if not self._is_playing:
-            return
+    def set_playback_reducer(self, reducer: Optional[str]):
+        """
+        Set how high-speed playback summarizes the interval a frame skips.
+        
+        One of 'max', 'min', 'mean', 'last'; None shows only the value at
+        the landing point.
+        """
+        if reducer is not None and reducer not in REDUCERS:
+            raise ValueError(f"Unknown reducer: {reducer} (expected one of {REDUCERS})")
+        self._playback_reducer = reducer
             
-        current_real_time = time.time()
-        delta_real = current_real_time - self._last_update_time
+    def get_playback_reducer(self) -> Optional[str]:
+        return self._playback_reducer
         
-        # Convert real time to simulation time (speed factor)
-        delta_sim = datetime.timedelta(seconds=delta_real * self._playback_speed * 60)
+    def update_playback(self):
+        """Update playback time"""
+        # 로딩 중에는 로딩된 구간 끝에서 대기 (재생 상태 유지)
+        limit = None if self._tile_cache else self._playable_end()
+        with tracer.span(ADVANCE):
+            previous = self._clock.advance(limit)
         
-        new_time = self._current_time + delta_sim
+        # 프레임이 지나간 구간 [이전 시각, 현재 시각] (고속 재생 집계용)
+        self._frame_start_time = previous
+        if previous is None:
+            return
         
-        if new_time > self._end_time:
-            new_time = self._end_time
-            self._is_playing = False
-            
-        self._current_time = new_time
-        self._last_update_time = current_real_time
+        if self._tile_cache and self._is_playing:
+            # 재생 속도에 비례해 앞쪽 타일 선행 로딩
+            self._tile_cache.prefetch(self._current_time, self._playback_speed * 60)
         
     def update_stage_time(self):
         """Update USD stage with current sensor data"""
-        if not self._stage:
+        if isinstance(self._writer, NullStageWriter):
             return
             
-        with self._data_lock:
-            # Batch update all racks
-            updates = {}
+        # 타일 모드는 타일 캐시의 락만 사용 - _data_lock을 잡은 채 로딩 중인 타일을 기다리지 않음
+        with self._range_data_lock():
+            with tracer.span(RESOLVE):
+                # Batch update all racks
+                updates = {}
+                frame = self._aggregate_frame()
+                store = self._keyframe_store
+                state = store.advance(self._to_ns(self._current_time)) if store else None
             
-            for rack_path, objid in self._rack_to_sensor_map.items():
-                sensor_data = self._data_cache.get_sensor_data(objid)
-                values = sensor_data.get_interpolated_at_time(self._current_time)
+                for rack_path, objid in self._rack_to_sensor_map.items():
+                    values = None
+                    if frame:
+                        values = self._range_index.reduce(objid, frame[0], frame[1], self._playback_reducer)
+                    if values is None and state is not None:
+                        values = store.values_for(state, objid)
+                    if values is None:
+                        values = self._lookup_values(objid, self._current_time)
                 
-                if values:
-                    # Check if values changed to avoid unnecessary updates
-                    cache_key = f"{rack_path}_{self._current_time}"
-                    if cache_key not in self._last_cache_values or self._last_cache_values[cache_key] != values:
-                        updates[rack_path] = values
-                        self._last_cache_values[cache_key] = values
+                    if values:
+                        # Check if values changed to avoid unnecessary updates
+                        cache_key = f"{rack_path}_{self._current_time}"
+                        if cache_key not in self._last_cache_values or self._last_cache_values[cache_key] != values:
+                            updates[rack_path] = values
+                            self._last_cache_values[cache_key] = values
             
             # Apply updates to stage
             self._apply_stage_updates(updates)
     
+    def _aggregate_frame(self) -> Optional[Tuple[int, int]]:
+        """
+        (start_ns, end_ns) the current playback frame skipped over, or None.
+        
+        Only for frames advanced by update_playback with a reducer set, and
+        only once a frame spans at least PLAYBACK_AGGREGATE_MIN_STEP_S of
+        simulated time; slower frames show the interpolated value at the
+        cursor as before.
+        """
+        if not (self._playback_reducer and self._range_index and self._frame_start_time):
+            return None
+        start, end = sorted((self._frame_start_time, self._current_time))
+        if (end - start).total_seconds() < Config.PLAYBACK_AGGREGATE_MIN_STEP_S:
+            return None
+        return self._to_ns(start), self._to_ns(end)
+        
     def _apply_stage_updates(self, updates: Dict[str, Dict]):
         """Apply sensor value updates to USD stage efficiently"""
         if not updates:
             return
-            
-        for rack_path, values in updates.items():
-            prim = self._stage.GetPrimAtPath(rack_path)
-            if prim and prim.IsValid():
-                # Batch attribute updates
-                if 'temperature_cold' in values:
-                    prim.GetAttribute("temperature_cold").Set(values['temperature_cold'])
-                if 'temperature_hot' in values:
-                    prim.GetAttribute("temperature_hot").Set(values['temperature_hot'])
-                if 'humidity_cold' in values:
-                    prim.GetAttribute("humidity_cold").Set(values['humidity_cold'])
-                if 'humidity_hot' in values:
-                    prim.GetAttribute("humidity_hot").Set(values['humidity_hot'])
+        with tracer.span(USD_APPLY, {'racks': len(updates)} if tracer.enabled else None):
+            self._writer.write_racks(updates)
     
     def get_rack_data_at_time(self, rack_path: str, target_time: datetime.datetime = None) -> Optional[Dict]:
         """Get sensor data for specific rack at given time"""
@@ -466,9 +998,159 @@ class OptimizedTimeController:
         if objid is None:
             return None
             
+        with self._range_data_lock():
+            return self._lookup_values(objid, target_time)
+            
+    def get_rack_data_batch(self, times, rack_paths: Optional[List[str]] = None,
+                            mode: str = 'linear') -> Tuple[np.ndarray, List[str]]:
+        """
+        Sensor values of many racks at many times in one call.
+        
+        times is an int64 array of epoch nanoseconds or a sequence of
+        datetimes; mode is 'lkv', 'nearest' or 'linear'. Returns a
+        [times, racks, channels] float32 array (channel order CHANNELS,
+        NaN where a rack has no value) and the rack paths along axis 1.
+        """
+        if isinstance(times, np.ndarray) and times.dtype == np.int64:
+            times_ns = times
+        else:
+            times_ns = np.array([self._to_ns(t) for t in times], dtype=np.int64)
+        if rack_paths is None:
+            rack_paths = list(self._rack_to_sensor_map.keys())
+        sensor_ids = [self._rack_to_sensor_map.get(path) for path in rack_paths]
+        
+        if self._tile_cache:
+            return self._tile_cache.query_batch(times_ns, sensor_ids, mode), rack_paths
         with self._data_lock:
-            sensor_data = self._data_cache.get_sensor_data(objid)
-            return sensor_data.get_interpolated_at_time(target_time)
+            return self._data_cache.query_batch(times_ns, sensor_ids, mode), rack_paths
+            
+    def _range_data_lock(self):
+        """_data_lock for lookups in the range cache; no lock in tile mode (tiles may still be loading)"""
+        return contextlib.nullcontext() if self._tile_cache else self._data_lock
+    
+    def _lookup_values(self, objid: int, target_time: datetime.datetime) -> Optional[Dict]:
+        """Interpolated values from the tile cache or the range cache"""
+        if self._tile_cache:
+            try:
+                return self._tile_cache.value_at(objid, target_time)
+            except Exception as e:
+                self._logger.error(f"Tile lookup failed at {target_time}: {e}")
+                return None
+        sensor_data = self._data_cache.get_sensor_data(objid)
+        return sensor_data.get_interpolated_at_time(target_time)
+    
+    def get_state_over(self, start_time: datetime.datetime, end_time: datetime.datetime,
+                       rack_path: Optional[str] = None) -> Dict:
+        """
+        Aggregated min/max/mean/last over [start_time, end_time] per rack.
+        
+        Answered from the coarsest pyramid level that fits the interval, so a
+        month-wide query costs about as much as a minute-wide one. Returns
+        {rack_path: state} (only the given rack when rack_path is set); racks
+        without samples in the interval are omitted.
+        """
+        pyramid = self._pyramid
+        if pyramid is None:
+            return {}
+        start_ns = self._to_ns(start_time)
+        end_ns = self._to_ns(end_time)
+        racks = {rack_path: self._rack_to_sensor_map.get(rack_path)} if rack_path else self._rack_to_sensor_map
+        
+        states = {}
+        for path, objid in racks.items():
+            if objid is None:
+                continue
+            state = pyramid.state_over(objid, start_ns, end_ns)
+            if state is not None:
+                states[path] = state
+        return states
+        
+    def range_stats(self, rack_path: str, start_time: Optional[datetime.datetime] = None,
+                    end_time: Optional[datetime.datetime] = None) -> Optional[Dict]:
+        """
+        count/min/max/mean/std/integral of a rack's sensor over [start_time, end_time].
+        
+        Defaults to the active time range. Answered from the range index in
+        constant time regardless of the interval length. Returns
+        {'count', 'duration_s', <aggregate>: {channel: value}}, or None when
+        the rack is unknown, the index is not built (tile mode) or no sample
+        falls inside.
+        """
+        range_index = self._range_index
+        objid = self._rack_to_sensor_map.get(rack_path)
+        if range_index is None or objid is None:
+            return None
+        start_ns = self._to_ns(start_time or self._start_time)
+        end_ns = self._to_ns(end_time or self._end_time)
+        return range_index.range_stats(objid, start_ns, end_ns)
+        
+    def get_scrub_states(self, progress: float, slider_width_px: int) -> Dict:
+        """
+        Aggregated state over the time span covered by one slider pixel.
+        
+        On week-long ranges a pixel spans hours; showing min/max over that
+        span keeps spikes visible that a single-second sample would miss.
+        """
+        progress = min(1.0, max(0.0, progress))
+        total_duration = self._end_time - self._start_time
+        half_pixel = total_duration / max(1, slider_width_px) / 2
+        center = self._start_time + total_duration * progress
+        return self.get_state_over(max(self._start_time, center - half_pixel),
+                                   min(self._end_time, center + half_pixel))
+        
+    def get_threshold_exceedances(self, channel: str, threshold: float,
+                                  start_time: Optional[datetime.datetime] = None,
+                                  end_time: Optional[datetime.datetime] = None,
+                                  rack_path: Optional[str] = None) -> Dict:
+        """
+        Racks whose channel went above threshold within [start_time, end_time].
+        
+        Defaults to the active time range. Returns {rack_path: {'intervals':
+        [(start, end), ...], 'seconds_over': float}} (only the given rack when
+        rack_path is set); the threshold must be one of Config.ALARM_THRESHOLDS.
+        """
+        threshold_index = self._threshold_index
+        if threshold_index is None:
+            return {}
+        start_ns = self._to_ns(start_time or self._start_time)
+        end_ns = self._to_ns(end_time or self._end_time)
+        over = threshold_index.sensors_over(channel, threshold, start_ns, end_ns)
+        racks = {rack_path: self._rack_to_sensor_map.get(rack_path)} if rack_path else self._rack_to_sensor_map
+        
+        result = {}
+        for path, objid in racks.items():
+            hit = over.get(objid)
+            if hit is None:
+                continue
+            result[path] = {
+                'intervals': [(self._from_ns(int(s)), self._from_ns(int(e))) for s, e in zip(hit['starts'], hit['ends'])],
+                'seconds_over': hit['seconds_over'],
+            }
+        return result
+        
+    def get_threshold_index_stats(self) -> Dict:
+        """Get threshold index size and build time"""
+        if self._threshold_index is None:
+            return {}
+        return self._threshold_index.get_stats()
+        
+    def get_keyframe_stats(self) -> Dict:
+        """Get keyframe store size and build time"""
+        if self._keyframe_store is None:
+            return {}
+        return self._keyframe_store.get_stats()
+        
+    def get_range_index_stats(self) -> Dict:
+        """Get range index build time and memory"""
+        if self._range_index is None:
+            return {}
+        return self._range_index.get_stats()
+        
+    def get_pyramid_stats(self) -> Dict:
+        """Get aggregate pyramid build time, memory and query latency"""
+        if self._pyramid is None:
+            return {}
+        return self._pyramid.get_stats()
     
     # Getter methods
     def get_start_time(self) -> datetime.datetime:
@@ -501,6 +1183,27 @@ class OptimizedTimeController:
         target_time = self._start_time + total_duration * progress
         self.set_current_time(target_time)
         
+    # 루트 TimeWindowUI / 익스텐션 업데이트 루프가 쓰는 이름 (CSV TimeController와 같은 API)
+    def get_progress(self) -> float:
+        return self.get_time_progress()
+        
+    def set_progress(self, progress: float):
+        """Scrub to a progress; while loading it stops at the loaded prefix"""
+        self.set_time_progress(progress)
+        
+    def get_sensor_id_for_rack(self, rack_path: str) -> Optional[int]:
+        return self._rack_to_sensor_map.get(rack_path)
+        
+    def update(self):
+        """One Kit update: advance playback (waiting at the loaded prefix) and apply it to the stage"""
+        if not self._is_playing:
+            return
+        self.update_playback()
+        self.update_stage_time()
+        
+    def on_shutdown(self):
+        self.destroy()
+        
     def get_stage_time(self) -> str:
         """Get formatted stage time string"""
         return self._current_time.strftime("%Y-%m-%d %H:%M:%S")
@@ -515,12 +1218,61 @@ class OptimizedTimeController:
         
     def is_data_loaded(self) -> bool:
         """Check if data is loaded"""
+        if self._tile_cache:
+            return len(self._tile_cache.resident_tiles()) > 0
         with self._data_lock:
             return self._data_cache.get_total_records() > 0
             
+    def get_cache_stats(self) -> Dict:
+        """Get local object cache statistics (hit ratio, bytes saved)"""
+        if not self._object_cache:
+            return {}
+        return self._object_cache.get_stats()
+        
+    def get_tile_stats(self) -> Dict:
+        """Get tile cache statistics (hits, prefetches, resident tiles)"""
+        if not self._tile_cache:
+            return {}
+        return self._tile_cache.get_stats()
+        
+    def get_load_stats(self) -> Dict:
+        """Get statistics of the last range load and mean duration per load mode"""
+        stats = dict(self._last_load_stats)
+        stats['mean_seconds_by_mode'] = {
+            mode: sum(samples) / len(samples) for mode, samples in self._load_timings.items()
+        }
+        stats['loads_by_mode'] = {mode: len(samples) for mode, samples in self._load_timings.items()}
+        stats['loaded_through'] = self.get_loaded_through()
+        return stats
+        
+    def get_fetch_stats(self) -> Dict:
+        """Get ranged GET statistics (requests, bytes, retries, hedges)"""
+        if not self._range_fetcher:
+            return {}
+        return self._range_fetcher.get_stats()
+        
+    def destroy(self):
+        """Stop background work and release the thread pool"""
+        if self._object_cache:
+            self._object_cache.stop()
+        if self._loading_future:
+            self._loading_future.cancel()
+        self._range_executor.shutdown(wait=False)
+        self._executor.shutdown(wait=False)
+        if self._warm_executor:
+            self._warm_executor.shutdown(wait=False)
+        if self._range_fetcher:
+            self._range_fetcher.shutdown()
+            
     def get_load_progress(self) -> str:
         """Get data loading progress string"""
-        if self._loading_future and not self._loading_future.done():
+        if self._tile_cache:
+            stats = self._tile_cache.get_stats()
+            return f"Tiles: {stats['resident_tiles']} resident, {stats['pending_tiles']} loading"
+        if self.is_loading():
+            loaded_through = self.get_loaded_through()
+            if loaded_through is not None:
+                return f"Loading... (playable through {loaded_through.strftime('%Y-%m-%d %H:%M')})"
             return "Loading..."
         elif self.is_data_loaded():
             return f"Loaded ({self._data_cache.get_total_records()} records)"
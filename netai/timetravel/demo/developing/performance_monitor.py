@@ -1,12 +1,15 @@
+import math
 import time
 import psutil
 import threading
-from collections import deque, defaultdict
+from collections import deque
 from dataclasses import dataclass
 from typing import Dict, List, Optional, Callable
-import json
-import csv
-from datetime import datetime, timedelta
+from datetime import datetime
+
+import numpy as np
+
+from .metric_sink import MetricSink, StreamingStats
 
 @dataclass
 class PerformanceMetric:
@@ -24,10 +27,9 @@ class PerformanceMetric:
 class PerformanceMonitor:
     """실시간 성능 모니터링 시스템"""
     
-    def __init__(self, window_size: int = 1000):
-        self.window_size = window_size
-        self.metrics_queue = deque(maxlen=window_size)
-        self.operation_stats = defaultdict(list)
+    def __init__(self, window_size: int = 1000, buffer_size: int = 65536, log_format: str = 'csv',
+                 flush_interval: float = 0.5, log_file: Optional[str] = None):
+        self.window_size = window_size  # 최근 구간 백분위수 계산 범위
         
         # 실시간 모니터링
         self.current_fps = 0.0
@@ -37,6 +39,7 @@ class PerformanceMonitor:
         # 메모리 및 CPU 모니터링
         self.process = psutil.Process()
         self.baseline_memory = self.process.memory_info().rss / 1024 / 1024  # MB
+        self._system_metrics = None  # flusher가 주기적으로 갱신 (기록 경로에서 psutil 호출 안 함)
         
         # 경고 임계값
         self.thresholds = {
@@ -46,39 +49,38 @@ class PerformanceMonitor:
             'operation_time_ms': 50
         }
         
-        # 로깅
-        self.log_file = f"performance_log_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-        self._init_log_file()
-        
-    def _init_log_file(self):
-        """로그 파일 초기화"""
-        with open(self.log_file, 'w', newline='') as f:
-            writer = csv.writer(f)
-            writer.writerow([
-                'timestamp', 'operation', 'duration_ms', 'memory_mb', 
-                'cpu_percent', 'rack_count', 'data_points', 'fps', 'errors'
-            ])
+        # 로깅 - 링 버퍼에 기록하고 백그라운드 스레드가 배치로 파일에 씀
+        extension = 'csv' if log_format == 'csv' else 'bin'
+        self.log_file = log_file or f"performance_log_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{extension}"
+        self.sink = MetricSink(buffer_size, self.log_file, log_format, flush_interval, on_batch=self._on_batch)
+        self.sink.start()
     
+    @property
+    def operation_stats(self) -> Dict:
+        """작업 이름 -> 누적 통계 (StreamingStats)"""
+        self.sink.drain()
+        return self.sink.stats
+        
     def start_operation(self, operation_name: str) -> 'OperationTimer':
         """작업 시작 (컨텍스트 매니저 반환)"""
         return OperationTimer(self, operation_name)
     
     def record_metric(self, metric: PerformanceMetric):
-        """메트릭 기록"""
-        self.metrics_queue.append(metric)
-        self.operation_stats[metric.operation].append(metric)
-        
-        # CSV 로그 기록
-        with open(self.log_file, 'a', newline='') as f:
-            writer = csv.writer(f)
-            writer.writerow([
-                metric.timestamp, metric.operation, metric.duration * 1000,
-                metric.memory_usage, metric.cpu_usage, metric.rack_count,
-                metric.data_points, metric.frame_rate, metric.errors
-            ])
-        
-        # 경고 체크
-        self._check_warnings(metric)
+        """메트릭 기록 (링 버퍼에 넣기만 함 - 파일 쓰기/통계/경고는 flusher)"""
+        self.sink.record(metric.operation, metric.duration, metric.timestamp, metric.memory_usage,
+                         metric.cpu_usage, metric.rack_count, metric.data_points,
+                         math.nan if metric.frame_rate is None else metric.frame_rate, metric.errors)
+    
+    def record(self, operation: str, duration: float, rack_count: int = 0, data_points: int = 0, errors: int = 0):
+        """PerformanceMetric 객체 없이 바로 기록 (시스템 메트릭은 최근 샘플 사용)"""
+        system = self._system_metrics or self._sample_system_metrics()
+        self.sink.record(operation, duration, time.time(), system['memory_mb'], system['cpu_percent'],
+                         rack_count, data_points, self.current_fps, errors)
+    
+    def _on_batch(self, batch: np.ndarray):
+        """flusher 스레드: 시스템 메트릭 갱신 + 배치 단위 경고 체크"""
+        self._sample_system_metrics()
+        self._check_warnings(batch)
     
     def update_frame_rate(self):
         """프레임레이트 업데이트"""
@@ -110,50 +112,61 @@ class PerformanceMonitor:
             print(f"[Performance] 시스템 메트릭 오류: {e}")
             return {'memory_mb': 0, 'memory_increase_mb': 0, 'cpu_percent': 0, 'fps': 0, 'frame_time_ms': 0}
     
-    def _check_warnings(self, metric: PerformanceMetric):
-        """성능 경고 체크"""
+    def _sample_system_metrics(self) -> Dict:
+        self._system_metrics = self.get_current_system_metrics()
+        return self._system_metrics
+    
+    def _check_warnings(self, batch: np.ndarray):
+        """성능 경고 체크 (배치 단위, 항목별 최악의 값 하나만 출력)"""
         warnings = []
+        names = self.sink.operation_names()
         
-        if metric.duration * 1000 > self.thresholds['operation_time_ms']:
-            warnings.append(f"작업 시간 초과: {metric.operation} ({metric.duration*1000:.1f}ms)")
+        slow = batch[batch['duration'] * 1000 > self.thresholds['operation_time_ms']]
+        if len(slow):
+            worst = slow[np.argmax(slow['duration'])]
+            warnings.append(f"작업 시간 초과: {names[worst['operation']]} ({worst['duration']*1000:.1f}ms)"
+                            + (f" 외 {len(slow) - 1}건" if len(slow) > 1 else ""))
         
-        if metric.memory_usage - self.baseline_memory > self.thresholds['memory_increase_mb']:
-            warnings.append(f"메모리 사용량 증가: {metric.memory_usage - self.baseline_memory:.1f}MB")
+        memory_increase = float(batch['memory_mb'].max()) - self.baseline_memory
+        if memory_increase > self.thresholds['memory_increase_mb']:
+            warnings.append(f"메모리 사용량 증가: {memory_increase:.1f}MB")
         
-        if metric.cpu_usage > self.thresholds['cpu_usage_percent']:
-            warnings.append(f"CPU 사용률 높음: {metric.cpu_usage:.1f}%")
+        cpu = float(batch['cpu_percent'].max())
+        if cpu > self.thresholds['cpu_usage_percent']:
+            warnings.append(f"CPU 사용률 높음: {cpu:.1f}%")
         
-        if metric.frame_rate and metric.frame_rate < 60:
-            warnings.append(f"FPS 저하: {metric.frame_rate:.1f}")
+        fps = batch['fps'][batch['fps'] > 0]
+        if len(fps) and fps.min() < 60:
+            warnings.append(f"FPS 저하: {fps.min():.1f}")
         
         for warning in warnings:
             print(f"[Performance Warning] {warning}")
     
     def get_statistics(self, operation: Optional[str] = None) -> Dict:
-        """통계 정보 반환"""
+        """통계 정보 반환 (누적 통계 + 최근 window_size개 기준 P95)"""
+        self.sink.drain()
         if operation:
-            metrics = self.operation_stats.get(operation, [])
+            stats = self.sink.stats.get(operation)
+            if stats is None:
+                return {}
         else:
-            metrics = list(self.metrics_queue)
-        
-        if not metrics:
-            return {}
+            stats = StreamingStats()
+            for operation_stats in list(self.sink.stats.values()):
+                stats.merge(operation_stats)
         
-        durations = [m.duration * 1000 for m in metrics]  # ms 변환
-        memory_usage = [m.memory_usage for m in metrics]
-        cpu_usage = [m.cpu_usage for m in metrics]
-        
-        return {
-            'count': len(metrics),
-            'avg_duration_ms': sum(durations) / len(durations),
-            'max_duration_ms': max(durations),
-            'min_duration_ms': min(durations),
-            'p95_duration_ms': sorted(durations)[int(len(durations) * 0.95)] if len(durations) > 20 else max(durations),
-            'avg_memory_mb': sum(memory_usage) / len(memory_usage),
-            'max_memory_mb': max(memory_usage),
-            'avg_cpu_percent': sum(cpu_usage) / len(cpu_usage),
-            'max_cpu_percent': max(cpu_usage),
-        }
+        result = stats.as_dict()
+        if result:
+            recent = self.sink.recent(operation, self.window_size)['duration'] * 1000
+            result['p95_duration_ms'] = float(np.percentile(recent, 95)) if len(recent) > 20 else result['max_duration_ms']
+        return result
+    
+    def get_sink_stats(self) -> Dict:
+        """링 버퍼 / flusher 상태 (기록, 드롭, 파일 크기)"""
+        return self.sink.get_stats()
+    
+    def close(self):
+        """flusher 정지, 남은 메트릭 기록 후 로그 파일 닫기"""
+        self.sink.close()
     
     def print_report(self):
         """성능 리포트 출력"""
@@ -175,7 +188,7 @@ class PerformanceMonitor:
         print("-" * 40)
         
         # 작업별 통계
-        for operation in self.operation_stats.keys():
+        for operation in list(self.operation_stats.keys()):
             stats = self.get_statistics(operation)
             print(f"{operation}:")
             print(f"  횟수: {stats['count']}")
@@ -205,31 +218,18 @@ class OperationTimer:
         self.errors = 0
     
     def __enter__(self):
-        self.start_time = time.time()
+        self.start_time = time.perf_counter()
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         if self.start_time:
-            duration = time.time() - self.start_time
-            system_metrics = self.monitor.get_current_system_metrics()
+            duration = time.perf_counter() - self.start_time
             
             # 에러 카운트
             if exc_type is not None:
                 self.errors += 1
             
-            metric = PerformanceMetric(
-                timestamp=time.time(),
-                operation=self.operation_name,
-                duration=duration,
-                memory_usage=system_metrics['memory_mb'],
-                cpu_usage=system_metrics['cpu_percent'],
-                rack_count=self.rack_count,
-                data_points=self.data_points,
-                frame_rate=system_metrics['fps'],
-                errors=self.errors
-            )
-            
-            self.monitor.record_metric(metric)
+            self.monitor.record(self.operation_name, duration, self.rack_count, self.data_points, self.errors)
     
     def set_data_info(self, rack_count: int, data_points: int):
         """처리된 데이터 정보 설정"""
@@ -275,4 +275,5 @@ if __name__ == "__main__":
         
         monitor.update_frame_rate()
     
-    monitor.print_report()
\ No newline at end of file
+    monitor.print_report()
+    monitor.close()
\ No newline at end of file
@@ -0,0 +1,250 @@
+# -*- coding: utf-8 -*-
+"""
+Multi-resolution min/max/mean/last aggregate pyramid for wide-range scrubbing
+"""
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .data_model import CHANNELS, OptimizedSensorData, SensorDataCache
+
+NS_PER_SECOND = 1_000_000_000
+DEFAULT_LEVELS_S = (1, 10, 60, 600, 3600)
+RAW_SCAN_MAX_SAMPLES = 512  # 이 이하의 짧은 구간은 원본을 바로 스캔하는 편이 더 빠름
+
+
+@dataclass
+class PyramidLevel:
+    """Aggregates of one bucket size; only non-empty buckets are stored"""
+    bucket_s: int
+    ids: np.ndarray      # int64 bucket index (timestamp_ns // bucket_ns)
+    min: np.ndarray      # float32 [buckets, channels]
+    max: np.ndarray      # float32 [buckets, channels]
+    sum: np.ndarray      # float64 [buckets, channels]
+
+    @property
+    def bucket_ns(self) -> int:
+        return self.bucket_s * NS_PER_SECOND
+
+    def nbytes(self) -> int:
+        return self.ids.nbytes + self.min.nbytes + self.max.nbytes + self.sum.nbytes
+
+
+def _reduce_runs(ids: np.ndarray, mins: np.ndarray, maxs: np.ndarray, sums: np.ndarray, bucket_s: int) -> PyramidLevel:
+    """Collapse runs of equal (sorted) bucket ids with reduceat"""
+    if len(ids) == 0:
+        return PyramidLevel(bucket_s, ids, mins, maxs, sums)
+    starts = np.flatnonzero(np.concatenate(([True], ids[1:] != ids[:-1])))
+    return PyramidLevel(
+        bucket_s=bucket_s,
+        ids=ids[starts],
+        min=np.minimum.reduceat(mins, starts, axis=0),
+        max=np.maximum.reduceat(maxs, starts, axis=0),
+        sum=np.add.reduceat(sums, starts, axis=0),
+    )
+
+
+class AggregatePyramid:
+    """
+    Per-sensor min/max/sum pyramid over the raw columnar samples.
+
+    Each level is reduced from the finest level kept so far (or from the raw
+    samples) with reduceat, so the build is a few vectorized passes. A level
+    is kept only if it has at most half as many buckets as the data below
+    it: with one-minute readings the 1 s/10 s/1 min levels would just copy
+    the samples. count and last come straight from the raw timestamps, and
+    the parts of a query that no stored bucket covers are read from the raw
+    arrays, so results are exact.
+    """
+
+    def __init__(self, timestamps_ns: np.ndarray, channels: List[np.ndarray], levels: List[PyramidLevel]):
+        self.timestamps = timestamps_ns
+        self.channels = channels
+        self.levels = levels
+
+    @classmethod
+    def build(cls, timestamps_ns: np.ndarray, channels: Sequence[np.ndarray],
+              levels_s: Sequence[int] = DEFAULT_LEVELS_S) -> "AggregatePyramid":
+        """Build from sorted int64 timestamps and one float array per channel (arrays are referenced, not copied)"""
+        levels_s = sorted(levels_s)
+        for fine, coarse in zip(levels_s, levels_s[1:]):
+            if coarse % fine:
+                raise ValueError(f"Pyramid level {coarse}s is not a multiple of {fine}s")
+
+        timestamps_ns = np.asarray(timestamps_ns, dtype=np.int64)
+        channels = [np.asarray(channel) for channel in channels]
+        if len(timestamps_ns) > 1 and (timestamps_ns[1:] < timestamps_ns[:-1]).any():
+            raise ValueError("Pyramid timestamps must be sorted")
+
+        levels: List[PyramidLevel] = []
+        raw = None
+        for bucket_s in levels_s:
+            if levels:
+                below = levels[-1]
+                level = _reduce_runs(below.ids // (bucket_s // below.bucket_s),
+                                     below.min, below.max, below.sum, bucket_s)
+                below_count = len(below.ids)
+            else:
+                if raw is None:
+                    raw = np.column_stack(channels).astype(np.float32) if channels else None
+                if raw is None or len(raw) == 0:
+                    break
+                level = _reduce_runs(timestamps_ns // (bucket_s * NS_PER_SECOND),
+                                     raw, raw, raw.astype(np.float64), bucket_s)
+                below_count = len(raw)
+            # 버킷 수가 절반 이하로 줄지 않는 레벨은 원본 복사본에 불과하므로 건너뜀
+            if len(level.ids) * 2 <= below_count:
+                levels.append(level)
+        return cls(timestamps_ns, channels, levels)
+
+    @classmethod
+    def from_sensor_data(cls, sensor: OptimizedSensorData,
+                         levels_s: Sequence[int] = DEFAULT_LEVELS_S) -> "AggregatePyramid":
+        n = sensor.size
+        return cls.build(sensor.timestamps[:n],
+                         [sensor.temp_cold[:n], sensor.temp_hot[:n], sensor.humidity_cold[:n], sensor.humidity_hot[:n]],
+                         levels_s)
+
+    def nbytes(self) -> int:
+        """Memory held by the aggregate levels (the raw arrays belong to the sensor)"""
+        return sum(level.nbytes() for level in self.levels)
+
+    def _cover(self, start_ns: int, end_ns: int) -> Tuple[List[Tuple[PyramidLevel, int, int]], List[Tuple[int, int]]]:
+        """
+        Split [start_ns, end_ns) into stored bucket runs, coarsest level first.
+
+        Each level takes the buckets lying fully inside the remaining pieces
+        and hands the uncovered edges down; returns (bucket runs, raw edges).
+        """
+        parts = []
+        pending = [(start_ns, end_ns)]
+        for level in reversed(self.levels):
+            bucket_ns = level.bucket_ns
+            remaining = []
+            for lo, hi in pending:
+                first, last = -(-lo // bucket_ns), hi // bucket_ns
+                if first >= last:
+                    remaining.append((lo, hi))
+                    continue
+                i0 = int(np.searchsorted(level.ids, first, side='left'))
+                i1 = int(np.searchsorted(level.ids, last, side='left'))
+                if i1 > i0:
+                    parts.append((level, i0, i1))
+                if lo < first * bucket_ns:
+                    remaining.append((lo, first * bucket_ns))
+                if last * bucket_ns < hi:
+                    remaining.append((last * bucket_ns, hi))
+            pending = remaining
+            if not pending:
+                break
+        return parts, pending
+
+    def state_over(self, start_ns: int, end_ns: int) -> Optional[Dict]:
+        """
+        Aggregated state over [start_ns, end_ns] (inclusive).
+
+        Returns {'count', 'level_s', 'min', 'max', 'mean', 'last'} where the
+        aggregate entries map channel name to value and level_s is the
+        coarsest bucket size used (0 when answered from raw samples only);
+        None when the interval has no samples.
+        """
+        start_ns, end_ns = int(start_ns), int(end_ns)
+        lo = int(np.searchsorted(self.timestamps, start_ns, side='left'))
+        hi = int(np.searchsorted(self.timestamps, end_ns, side='right'))
+        if hi <= lo:
+            return None
+
+        if hi - lo <= RAW_SCAN_MAX_SAMPLES:
+            parts, edges = [], [(start_ns, end_ns + 1)]
+        else:
+            parts, edges = self._cover(start_ns, end_ns + 1)
+        mins, maxs, sums = [], [], []
+        for level, i0, i1 in parts:
+            mins.append(level.min[i0:i1].min(axis=0))
+            maxs.append(level.max[i0:i1].max(axis=0))
+            sums.append(level.sum[i0:i1].sum(axis=0))
+        for edge_start, edge_end in edges:
+            e0 = int(np.searchsorted(self.timestamps, edge_start, side='left'))
+            e1 = int(np.searchsorted(self.timestamps, edge_end, side='left'))
+            if e1 > e0:
+                rows = np.column_stack([channel[e0:e1] for channel in self.channels])
+                mins.append(rows.min(axis=0))
+                maxs.append(rows.max(axis=0))
+                sums.append(rows.sum(axis=0, dtype=np.float64))
+
+        count = hi - lo
+        minimum = np.min(mins, axis=0)
+        maximum = np.max(maxs, axis=0)
+        mean = np.sum(sums, axis=0) / count
+        return {
+            'count': count,
+            'level_s': parts[0][0].bucket_s if parts else 0,
+            'min': {name: float(minimum[c]) for c, name in enumerate(CHANNELS)},
+            'max': {name: float(maximum[c]) for c, name in enumerate(CHANNELS)},
+            'mean': {name: float(mean[c]) for c, name in enumerate(CHANNELS)},
+            'last': {name: float(channel[hi - 1]) for name, channel in zip(CHANNELS, self.channels)},
+        }
+
+
+class SensorPyramidIndex:
+    """Aggregate pyramids for every sensor of a SensorDataCache, with build/query statistics"""
+
+    def __init__(self, levels_s: Sequence[int] = DEFAULT_LEVELS_S):
+        self._levels_s = tuple(sorted(levels_s))
+        self._pyramids: Dict[int, AggregatePyramid] = {}
+        self._build_seconds = 0.0
+        self._source_records = 0
+        self._queries = 0
+        self._query_seconds = 0.0
+        self._max_query_seconds = 0.0
+
+    @classmethod
+    def build(cls, cache: SensorDataCache, levels_s: Sequence[int] = DEFAULT_LEVELS_S) -> "SensorPyramidIndex":
+        index = cls(levels_s)
+        t0 = time.perf_counter()
+        for sensor_id in cache.get_sensor_ids():
+            sensor = cache.find_sensor_data(sensor_id)
+            if sensor is None or sensor.size == 0:
+                continue
+            index._pyramids[sensor_id] = AggregatePyramid.from_sensor_data(sensor, index._levels_s)
+            index._source_records += sensor.size
+        index._build_seconds = time.perf_counter() - t0
+        return index
+
+    def get_pyramid(self, sensor_id: int) -> Optional[AggregatePyramid]:
+        return self._pyramids.get(sensor_id)
+
+    def state_over(self, sensor_id: int, start_ns: int, end_ns: int) -> Optional[Dict]:
+        """Aggregated state of one sensor over [start_ns, end_ns]"""
+        pyramid = self._pyramids.get(sensor_id)
+        if pyramid is None:
+            return None
+        t0 = time.perf_counter()
+        state = pyramid.state_over(start_ns, end_ns)
+        elapsed = time.perf_counter() - t0
+        self._queries += 1
+        self._query_seconds += elapsed
+        self._max_query_seconds = max(self._max_query_seconds, elapsed)
+        return state
+
+    def nbytes(self) -> int:
+        return sum(pyramid.nbytes() for pyramid in self._pyramids.values())
+
+    def get_stats(self) -> Dict:
+        buckets = {level_s: 0 for level_s in self._levels_s}
+        for pyramid in self._pyramids.values():
+            for level in pyramid.levels:
+                buckets[level.bucket_s] += len(level.ids)  # 건너뛴 레벨은 0
+        return {
+            'sensors': len(self._pyramids),
+            'source_records': self._source_records,
+            'levels_s': list(self._levels_s),
+            'buckets_by_level': buckets,
+            'build_seconds': self._build_seconds,
+            'nbytes': self.nbytes(),
+            'queries': self._queries,
+            'mean_query_us': self._query_seconds / self._queries * 1e6 if self._queries else 0.0,
+            'max_query_us': self._max_query_seconds * 1e6,
+        }
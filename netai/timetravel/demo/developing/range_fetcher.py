@@ -0,0 +1,397 @@
+# -*- coding: utf-8 -*-
+"""
+Concurrent ranged GETs for MinIO objects (parquet footer-first selective reads)
+"""
+import bisect
+import datetime
+import io
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from ..ringlog import logger
+
+try:
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# 푸터를 한 번에 받기 위한 추정 크기 (대부분의 파일은 64KB 안에 메타데이터가 들어감)
+_FOOTER_GUESS = 64 * 1024
+_PARQUET_MAGIC = b"PAR1"
+
+
+def create_pooled_minio_client(endpoint: str, access_key: str, secret_key: str,
+                               secure: bool = False, pool_size: int = 16,
+                               connect_timeout: float = 5.0, read_timeout: float = 30.0,
+                               region: Optional[str] = None):
+    """Create a Minio client backed by a tuned, shared urllib3 connection pool"""
+    import urllib3
+    from minio import Minio
+
+    http_client = urllib3.PoolManager(
+        num_pools=4,
+        maxsize=pool_size,   # 동시 ranged GET 수만큼 keep-alive 연결 유지
+        block=True,          # 풀이 가득 차면 새 연결을 만들지 않고 대기
+        timeout=urllib3.Timeout(connect=connect_timeout, read=read_timeout),
+        retries=urllib3.Retry(total=3, backoff_factor=0.2, status_forcelist=[500, 502, 503, 504]),
+    )
+    return Minio(
+        endpoint,
+        access_key=access_key,
+        secret_key=secret_key,
+        secure=secure,
+        region=region,
+        http_client=http_client,
+    )
+
+
+def coalesce_ranges(ranges: Iterable[Tuple[int, int]], max_gap: int,
+                    part_size: int) -> List[Tuple[int, int]]:
+    """
+    Merge (offset, length) ranges separated by at most max_gap bytes, then
+    split anything larger than part_size so parts can be fetched in parallel.
+    """
+    merged: List[List[int]] = []
+    for offset, length in sorted(r for r in ranges if r[1] > 0):
+        end = offset + length
+        if merged and offset - merged[-1][1] <= max_gap:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([offset, end])
+
+    parts = []
+    for start, end in merged:
+        pos = start
+        while pos < end:
+            length = min(part_size, end - pos)
+            parts.append((pos, length))
+            pos += length
+    return parts
+
+
+class _SparseFile(io.RawIOBase):
+    """
+    Read-only file view over the byte ranges fetched so far.
+
+    pyarrow reads the parquet footer and column chunks through this object;
+    any read outside the prefetched ranges falls back to a synchronous
+    ranged GET so correctness never depends on the range planning.
+    """
+
+    def __init__(self, size: int, fetch_fn: Callable[[int, int], bytes]):
+        self._size = size
+        self._fetch_fn = fetch_fn
+        self._starts: List[int] = []
+        self._chunks: List[bytes] = []
+        self._pos = 0
+        self.fallback_reads = 0
+
+    def add(self, offset: int, data: bytes):
+        idx = bisect.bisect_left(self._starts, offset)
+        self._starts.insert(idx, offset)
+        self._chunks.insert(idx, data)
+
+    def _lookup(self, offset: int, length: int) -> Optional[memoryview]:
+        idx = bisect.bisect_right(self._starts, offset) - 1
+        if idx < 0:
+            return None
+        start = self._starts[idx]
+        chunk = self._chunks[idx]
+        if offset + length <= start + len(chunk):
+            return memoryview(chunk)[offset - start:offset - start + length]
+
+        # part_size로 나뉜 인접 청크에 걸친 읽기는 이어 붙여서 반환
+        covered = start + len(chunk)
+        if covered <= offset:
+            return None
+        pieces = [memoryview(chunk)[offset - start:]]
+        for nxt in range(idx + 1, len(self._starts)):
+            if self._starts[nxt] != covered:
+                return None
+            nxt_chunk = self._chunks[nxt]
+            need = offset + length - covered
+            pieces.append(memoryview(nxt_chunk)[:need])
+            covered += len(nxt_chunk)
+            if covered >= offset + length:
+                return memoryview(b"".join(pieces))
+        return None
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_SET:
+            self._pos = offset
+        elif whence == io.SEEK_CUR:
+            self._pos += offset
+        else:
+            self._pos = self._size + offset
+        return self._pos
+
+    def tell(self):
+        return self._pos
+
+    def readinto(self, buffer):
+        length = min(len(buffer), self._size - self._pos)
+        if length <= 0:
+            return 0
+        view = self._lookup(self._pos, length)
+        if view is None:
+            self.fallback_reads += 1
+            data = self._fetch_fn(self._pos, length)
+            self.add(self._pos, data)
+            view = memoryview(data)
+        buffer[:length] = view
+        self._pos += length
+        return length
+
+
+class RangedObjectFetcher:
+    """
+    Parallel HTTP range fetcher with retries and hedged requests.
+
+    All requests go through one shared thread pool (and therefore one shared
+    urllib3 connection pool on the client). A request that has been running
+    longer than hedge_after seconds gets a duplicate; whichever finishes
+    first wins, which trims the latency tail caused by slow connections.
+    """
+
+    def __init__(self, client, bucket: str, max_workers: int = 8,
+                 part_size: int = 8 * 1024 * 1024, coalesce_gap: int = 1024 * 1024,
+                 hedge_after: Optional[float] = 0.75, max_retries: int = 3,
+                 retry_backoff: float = 0.2):
+        self._client = client
+        self._bucket = bucket
+        self._part_size = part_size
+        self._coalesce_gap = coalesce_gap
+        self._hedge_after = hedge_after
+        self._max_retries = max_retries
+        self._retry_backoff = retry_backoff
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="ranged-get")
+
+        self._stats_lock = threading.Lock()
+        self._stats = {
+            'requests': 0,
+            'bytes': 0,
+            'retries': 0,
+            'hedges': 0,
+            'hedge_wins': 0,
+            'fallback_reads': 0,
+        }
+
+    def _count(self, key: str, amount: int = 1):
+        with self._stats_lock:
+            self._stats[key] += amount
+
+    # ---------------------------------------------------------------- single range
+    def fetch_range(self, key: str, offset: int, length: int) -> bytes:
+        """Fetch one byte range, retrying transient failures with backoff"""
+        attempt = 0
+        while True:
+            response = None
+            try:
+                response = self._client.get_object(self._bucket, key, offset=offset, length=length)
+                data = response.read()
+                self._count('requests')
+                self._count('bytes', len(data))
+                return data
+            except Exception as e:
+                attempt += 1
+                if attempt > self._max_retries:
+                    raise
+                self._count('retries')
+                delay = self._retry_backoff * (2 ** (attempt - 1)) * (0.5 + random.random())
+                logger.debug("Ranged GET %s [%d+%d] failed (%s), retry %d in %.2fs", key, offset, length, e, attempt, delay)
+                time.sleep(delay)
+            finally:
+                if response is not None:
+                    response.close()
+                    response.release_conn()
+
+    # ---------------------------------------------------------------- many ranges
+    def fetch_ranges(self, key: str, ranges: Sequence[Tuple[int, int]]) -> List[bytes]:
+        """Fetch ranges concurrently, hedging requests that run too long"""
+        if not ranges:
+            return []
+
+        results: List[Optional[bytes]] = [None] * len(ranges)
+        started: Dict[int, float] = {}
+        pending: Dict = {}
+        hedged = set()
+
+        def run(idx: int, is_hedge: bool):
+            # 큐에서 대기한 시간은 제외하고 실제 요청 시작 시각 기준으로 헤지
+            if not is_hedge:
+                started[idx] = time.monotonic()
+            offset, length = ranges[idx]
+            return self.fetch_range(key, offset, length)
+
+        for idx in range(len(ranges)):
+            pending[self._executor.submit(run, idx, False)] = (idx, False)
+
+        remaining = len(ranges)
+        while remaining:
+            timeout = self._hedge_after if self._hedge_after else None
+            done, _ = wait(list(pending.keys()), timeout=timeout, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                idx, is_hedge = pending.pop(future)
+                if results[idx] is not None:
+                    continue
+                error = future.exception()
+                if error is None:
+                    results[idx] = future.result()
+                    remaining -= 1
+                    if is_hedge:
+                        self._count('hedge_wins')
+                elif not any(i == idx for i, _ in pending.values()):
+                    # 재시도까지 실패했고 대기 중인 헤지 요청도 없음
+                    raise error
+
+            if self._hedge_after:
+                now = time.monotonic()
+                for idx, start in list(started.items()):
+                    if results[idx] is None and idx not in hedged and now - start >= self._hedge_after:
+                        hedged.add(idx)
+                        self._count('hedges')
+                        pending[self._executor.submit(run, idx, True)] = (idx, True)
+
+        return results
+
+    def fetch_object(self, key: str, size: Optional[int] = None) -> bytes:
+        """Download a whole object as parallel part-sized range requests"""
+        if size is None:
+            size = self._client.stat_object(self._bucket, key).size
+        if size == 0:
+            return b""
+        parts = coalesce_ranges([(0, size)], 0, self._part_size)
+        return b"".join(self.fetch_ranges(key, parts))
+
+    # ---------------------------------------------------------------- parquet
+    def _open_parquet(self, key: str, size: int) -> Tuple["pq.ParquetFile", _SparseFile]:
+        """Fetch the footer (usually one request) and open the file metadata"""
+        sparse = _SparseFile(size, lambda offset, length: self.fetch_range(key, offset, length))
+
+        tail_len = min(size, _FOOTER_GUESS)
+        tail = self.fetch_range(key, size - tail_len, tail_len)
+        if tail[-4:] != _PARQUET_MAGIC:
+            raise ValueError(f"{key} is not a parquet file")
+        footer_len = int.from_bytes(tail[-8:-4], "little")
+        if footer_len + 8 > tail_len:
+            # 메타데이터가 추정 크기보다 크면 나머지를 한 번 더 요청
+            extra = footer_len + 8 - tail_len
+            tail = self.fetch_range(key, size - tail_len - extra, extra) + tail
+            tail_len += extra
+        sparse.add(size - tail_len, tail)
+
+        # 병합은 fetcher가 이미 했으므로 pyarrow 자체 pre-buffer 병합은 끔
+        return pq.ParquetFile(sparse, pre_buffer=False), sparse
+
+    @staticmethod
+    def _chunk_ranges(metadata, row_groups: Sequence[int], columns: Optional[Sequence[str]]) -> List[Tuple[int, int]]:
+        """Byte ranges of the selected column chunks"""
+        ranges = []
+        for rg_idx in row_groups:
+            rg = metadata.row_group(rg_idx)
+            for col_idx in range(rg.num_columns):
+                chunk = rg.column(col_idx)
+                if columns is not None and chunk.path_in_schema.split(".")[0] not in columns:
+                    continue
+                start = chunk.data_page_offset
+                if chunk.has_dictionary_page and chunk.dictionary_page_offset:
+                    start = min(start, chunk.dictionary_page_offset)
+                ranges.append((start, chunk.total_compressed_size))
+        return ranges
+
+    def read_metadata(self, key: str):
+        """Parquet footer metadata of an object (usually a single ranged GET)"""
+        if not PYARROW_AVAILABLE:
+            raise ImportError("PyArrow is required for parquet reading")
+
+        size = self._client.stat_object(self._bucket, key).size
+        parquet_file, _sparse = self._open_parquet(key, size)
+        return parquet_file.metadata
+
+    def read_table(self, key: str, columns: Optional[Sequence[str]] = None,
+                   row_group_filter: Optional[Callable] = None):
+        """
+        Read only the needed row groups and columns of a parquet object.
+
+        The footer is fetched first; the column chunk byte ranges it
+        describes are then coalesced and fetched in parallel.
+        """
+        if not PYARROW_AVAILABLE:
+            raise ImportError("PyArrow is required for parquet reading")
+
+        size = self._client.stat_object(self._bucket, key).size
+        parquet_file, sparse = self._open_parquet(key, size)
+        metadata = parquet_file.metadata
+        row_groups, columns = select_row_groups(parquet_file, columns, row_group_filter)
+
+        parts = coalesce_ranges(self._chunk_ranges(metadata, row_groups, columns),
+                                self._coalesce_gap, self._part_size)
+        for (offset, _length), data in zip(parts, self.fetch_ranges(key, parts)):
+            sparse.add(offset, data)
+
+        table = parquet_file.read_row_groups(row_groups, columns=columns)
+        self._count('fallback_reads', sparse.fallback_reads)
+        return table
+
+    # ---------------------------------------------------------------- info
+    def get_stats(self) -> Dict:
+        with self._stats_lock:
+            return dict(self._stats)
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False)
+
+
+def select_row_groups(parquet_file, columns: Optional[Sequence[str]] = None,
+                      row_group_filter: Optional[Callable] = None) -> Tuple[List[int], Optional[List[str]]]:
+    """Row groups passing the filter and the requested columns the file actually has"""
+    if columns is not None:
+        available = set(parquet_file.schema_arrow.names)
+        columns = [c for c in columns if c in available]
+    metadata = parquet_file.metadata
+    row_groups = [
+        i for i in range(metadata.num_row_groups)
+        if row_group_filter is None or row_group_filter(metadata.row_group(i))
+    ]
+    return row_groups, columns
+
+
+def make_time_row_group_filter(column: str, start_time, end_time) -> Callable:
+    """Row group filter that keeps groups whose column statistics overlap a time range"""
+
+    def _normalize(value):
+        # 문자열 타임스탬프는 datetime으로 파싱해서 비교 - 문자열 비교는 소수점 자릿수가 다르면
+        # ("2025-03-28 00:00:00.000" > "2025-03-28 00:00:00") 경계 시각의 row group을 건너뜀
+        if isinstance(value, str):
+            return datetime.datetime.fromisoformat(value.replace("T", " ").rstrip("Z"))
+        return value
+
+    def _filter(row_group) -> bool:
+        for col_idx in range(row_group.num_columns):
+            chunk = row_group.column(col_idx)
+            if chunk.path_in_schema != column:
+                continue
+            stats = chunk.statistics
+            if stats is None or not stats.has_min_max:
+                return True
+            try:
+                lo, hi = _normalize(stats.min), _normalize(stats.max)
+                if hasattr(lo, "tzinfo") and lo.tzinfo is not None and start_time.tzinfo is None:
+                    lo, hi = lo.replace(tzinfo=None), hi.replace(tzinfo=None)
+                return not (hi < start_time or lo > end_time)
+            except (TypeError, ValueError):
+                return True
+        return True
+
+    return _filter
@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+"""
+Threshold exceedance intervals per sensor, channel and threshold (alarm search)
+"""
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from .data_model import CHANNELS, OptimizedSensorData, SensorDataCache
+
+# (채널, 임계값) 쌍 - 로딩 시 미리 계산
+DEFAULT_THRESHOLDS = (
+    ('temperature_hot', 24.0),
+    ('temperature_cold', 24.0),
+)
+
+
+def exceedance_intervals(timestamps_ns: np.ndarray, values: np.ndarray,
+                         thresholds: np.ndarray) -> List[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Intervals where values > threshold, one (starts_ns, ends_ns) pair per threshold.
+
+    One vectorized pass over value - threshold for all thresholds: a sign
+    change between two samples is a crossing, placed by linear
+    interpolation (the curve playback shows). An interval still open at
+    the first or last sample starts or ends there.
+    """
+    n = len(timestamps_ns)
+    if n == 0:
+        empty = np.zeros(0, dtype=np.int64)
+        return [(empty, empty) for _ in thresholds]
+
+    diff = values.astype(np.float64)[:, None] - thresholds[None, :]  # [n, K]
+    above = diff > 0
+    # 인접 샘플 사이 부호 변화 = 교차
+    rows, cols = np.nonzero(above[1:] != above[:-1])
+    d0 = diff[rows, cols]
+    d1 = diff[rows + 1, cols]
+    t0 = timestamps_ns[rows].astype(np.float64)
+    span = (timestamps_ns[rows + 1] - timestamps_ns[rows]).astype(np.float64)
+    crossing = (t0 + span * (d0 / (d0 - d1))).astype(np.int64)
+    rising = above[rows + 1, cols]
+
+    result = []
+    for k in range(len(thresholds)):
+        mine = cols == k
+        starts = crossing[mine & rising]
+        ends = crossing[mine & ~rising]
+        if above[0, k]:
+            starts = np.concatenate([timestamps_ns[:1], starts])
+        if above[-1, k]:
+            ends = np.concatenate([ends, timestamps_ns[-1:]])
+        result.append((starts, ends))
+    return result
+
+
+class ThresholdIntervalIndex:
+    """
+    Sorted exceedance intervals for every sensor of a SensorDataCache.
+
+    Intervals of one sensor never overlap, so both their starts and ends
+    are sorted; the intervals overlapping [t0, t1] are one searchsorted on
+    the ends and one on the starts. "All racks over threshold in [t0, t1]"
+    is therefore two binary searches per sensor, independent of how many
+    months are loaded.
+    """
+
+    def __init__(self, thresholds: Iterable[Tuple[str, float]] = DEFAULT_THRESHOLDS):
+        self.thresholds = tuple((channel, float(threshold)) for channel, threshold in thresholds)
+        for channel, _ in self.thresholds:
+            if channel not in CHANNELS:
+                raise ValueError(f"Unknown channel: {channel} (expected one of {CHANNELS})")
+        # (채널, 임계값) -> 센서 ID -> (starts_ns, ends_ns)
+        self._intervals: Dict[Tuple[str, float], Dict[int, Tuple[np.ndarray, np.ndarray]]] = {
+            key: {} for key in self.thresholds
+        }
+        self._build_seconds = 0.0
+
+    @classmethod
+    def build(cls, cache: SensorDataCache,
+              thresholds: Iterable[Tuple[str, float]] = DEFAULT_THRESHOLDS) -> "ThresholdIntervalIndex":
+        index = cls(thresholds)
+        t0 = time.perf_counter()
+        for sensor_id in cache.get_sensor_ids():
+            sensor = cache.find_sensor_data(sensor_id)
+            if sensor is None or sensor.size == 0:
+                continue
+            index.add_sensor(sensor_id, sensor)
+        index._build_seconds = time.perf_counter() - t0
+        return index
+
+    def add_sensor(self, sensor_id: int, sensor: OptimizedSensorData):
+        n = sensor.size
+        columns = {
+            'temperature_cold': sensor.temp_cold, 'temperature_hot': sensor.temp_hot,
+            'humidity_cold': sensor.humidity_cold, 'humidity_hot': sensor.humidity_hot,
+        }
+        for channel in CHANNELS:
+            keys = [key for key in self.thresholds if key[0] == channel]
+            if not keys:
+                continue
+            levels = np.array([threshold for _, threshold in keys], dtype=np.float64)
+            per_threshold = exceedance_intervals(sensor.timestamps[:n], columns[channel][:n], levels)
+            for key, intervals in zip(keys, per_threshold):
+                self._intervals[key][sensor_id] = intervals
+
+    def _table(self, channel: str, threshold: float) -> Dict[int, Tuple[np.ndarray, np.ndarray]]:
+        table = self._intervals.get((channel, float(threshold)))
+        if table is None:
+            raise ValueError(f"Threshold {channel} > {threshold} is not indexed (configured: {self.thresholds})")
+        return table
+
+    def intervals(self, sensor_id: int, channel: str, threshold: float,
+                  start_ns: Optional[int] = None, end_ns: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """(starts_ns, ends_ns) of the exceedances overlapping [start_ns, end_ns] (unclipped)"""
+        empty = np.zeros(0, dtype=np.int64)
+        starts, ends = self._table(channel, threshold).get(sensor_id, (empty, empty))
+        lo = 0 if start_ns is None else int(np.searchsorted(ends, start_ns, side='left'))
+        hi = len(starts) if end_ns is None else int(np.searchsorted(starts, end_ns, side='right'))
+        return starts[lo:hi], ends[lo:hi]
+
+    def sensors_over(self, channel: str, threshold: float, start_ns: int, end_ns: int) -> Dict[int, Dict]:
+        """
+        Sensors above threshold at some point in [start_ns, end_ns]:
+        {sensor_id: {'starts', 'ends', 'seconds_over'}}, the time over the
+        threshold counted only inside the window.
+        """
+        result = {}
+        for sensor_id in self._table(channel, threshold):
+            starts, ends = self.intervals(sensor_id, channel, threshold, start_ns, end_ns)
+            if len(starts) == 0:
+                continue
+            clipped = np.minimum(ends, end_ns) - np.maximum(starts, start_ns)
+            result[sensor_id] = {
+                'starts': starts,
+                'ends': ends,
+                'seconds_over': float(np.maximum(clipped, 0).sum()) / 1e9,
+            }
+        return result
+
+    def nbytes(self) -> int:
+        return sum(starts.nbytes + ends.nbytes
+                   for table in self._intervals.values() for starts, ends in table.values())
+
+    def get_stats(self) -> Dict:
+        return {
+            'thresholds': list(self.thresholds),
+            'sensors': len({sensor_id for table in self._intervals.values() for sensor_id in table}),
+            'intervals': sum(len(starts) for table in self._intervals.values() for starts, _ in table.values()),
+            'build_seconds': self._build_seconds,
+            'nbytes': self.nbytes(),
+        }
@@ -0,0 +1,311 @@
+# -*- coding: utf-8 -*-
+"""
+Time-tiled sensor cache with on-demand loading and playback prefetch
+"""
+import datetime
+import logging
+import math
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from dataclasses import dataclass, asdict
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .data_model import CHANNELS, SensorDataCache
+
+logger = logging.getLogger("[netai.timetravel.demo]")
+
+# loader(tile_start, tile_end) -> SensorDataCache
+TileLoader = Callable[[datetime.datetime, datetime.datetime], SensorDataCache]
+
+
+@dataclass
+class TileCacheStats:
+    """Tile cache counters"""
+    hits: int = 0
+    misses: int = 0             # 커서 위치의 타일을 동기 로딩한 횟수
+    prefetches: int = 0         # 선행 로딩을 예약한 타일 수
+    prefetch_hits: int = 0      # 요청 시점에 선행 로딩으로 이미 준비(또는 진행 중)였던 타일
+    loads: int = 0
+    load_seconds: float = 0.0
+    evictions: int = 0
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+
+class TimeTileCache:
+    """
+    LRU cache of fixed-length time tiles, each holding per-sensor arrays.
+
+    A tile covers [index * tile_seconds, (index + 1) * tile_seconds) in epoch
+    seconds and is loaded through the loader callback the first time it is
+    needed. During playback prefetch() schedules the tiles ahead of the
+    cursor on the executor; the lookahead grows with playback speed.
+    """
+
+    def __init__(self, loader: TileLoader, tile_seconds: int = 3600,
+                 max_bytes: int = 512 * 1024 * 1024, lookahead_s: float = 10.0,
+                 max_prefetch_tiles: int = 6, executor=None):
+        self._loader = loader
+        self._tile_seconds = tile_seconds
+        self._max_bytes = max_bytes
+        self._lookahead_s = lookahead_s
+        self._max_prefetch_tiles = max_prefetch_tiles
+        self._executor = executor
+
+        # tile index -> SensorDataCache (앞쪽이 가장 오래 사용되지 않은 타일)
+        self._tiles: "OrderedDict[int, SensorDataCache]" = OrderedDict()
+        self._tile_bytes: Dict[int, int] = {}
+        self._total_bytes = 0
+        self._pending: Dict[int, Future] = {}
+        self._prefetched = set()
+        self._lock = threading.RLock()
+
+        # clear() 이후 끝난 이전 로딩 결과는 버리기 위한 세대 번호
+        self._generation = 0
+        self._bounds: Optional[Tuple[int, int]] = None
+        self._stats = TileCacheStats()
+
+    # ---------------------------------------------------------------- tiles
+    @property
+    def tile_seconds(self) -> int:
+        return self._tile_seconds
+
+    def tile_index(self, t: datetime.datetime) -> int:
+        return int(math.floor(t.timestamp())) // self._tile_seconds
+
+    def tile_bounds(self, index: int) -> Tuple[datetime.datetime, datetime.datetime]:
+        start = datetime.datetime.fromtimestamp(index * self._tile_seconds)
+        return start, start + datetime.timedelta(seconds=self._tile_seconds)
+
+    def set_bounds(self, start_time: Optional[datetime.datetime], end_time: Optional[datetime.datetime]):
+        """Restrict prefetch to tiles overlapping the active time range"""
+        with self._lock:
+            if start_time is None or end_time is None:
+                self._bounds = None
+            else:
+                self._bounds = (self.tile_index(start_time), self.tile_index(end_time))
+
+    def _in_bounds(self, index: int) -> bool:
+        return self._bounds is None or self._bounds[0] <= index <= self._bounds[1]
+
+    def is_resident(self, index: int) -> bool:
+        with self._lock:
+            return index in self._tiles
+
+    def resident_tiles(self) -> List[int]:
+        with self._lock:
+            return sorted(self._tiles.keys())
+
+    # ---------------------------------------------------------------- loading
+    def _claim(self, index: int) -> Tuple[Optional[Future], bool]:
+        """Return (future, owner) for a tile that is not resident yet"""
+        with self._lock:
+            if index in self._tiles:
+                return None, False
+            future = self._pending.get(index)
+            if future is not None:
+                return future, False
+            future = Future()
+            self._pending[index] = future
+            return future, True
+
+    def _run_load(self, index: int, future: Future, generation: int):
+        start, end = self.tile_bounds(index)
+        t0 = time.perf_counter()
+        try:
+            tile = self._loader(start, end)
+            tile.optimize()
+        except BaseException as e:
+            with self._lock:
+                self._pending.pop(index, None)
+                self._prefetched.discard(index)
+            future.set_exception(e)
+            logger.warning(f"Tile {start} load failed: {e}")
+            return
+
+        size = tile.nbytes()
+        with self._lock:
+            self._pending.pop(index, None)
+            self._stats.loads += 1
+            self._stats.load_seconds += time.perf_counter() - t0
+            if generation == self._generation:
+                self._tiles[index] = tile
+                self._tile_bytes[index] = size
+                self._total_bytes += size
+                self._evict_locked(keep=index)
+        future.set_result(tile)
+
+    def get_tile(self, index: int) -> SensorDataCache:
+        """Return a tile, loading it synchronously if it is not resident"""
+        with self._lock:
+            tile = self._tiles.get(index)
+            if tile is not None:
+                self._tiles.move_to_end(index)
+                self._stats.hits += 1
+                if index in self._prefetched:
+                    self._prefetched.discard(index)
+                    self._stats.prefetch_hits += 1
+                return tile
+            generation = self._generation
+
+        future, owner = self._claim(index)
+        if future is None:
+            return self.get_tile(index)
+        if owner:
+            with self._lock:
+                self._stats.misses += 1
+            self._run_load(index, future, generation)
+        else:
+            # 선행 로딩 중인 타일 - 끝날 때까지 대기
+            with self._lock:
+                self._stats.prefetch_hits += 1
+                self._prefetched.discard(index)
+        return future.result()
+
+    def ensure_range(self, start_time: datetime.datetime, end_time: datetime.datetime):
+        """Load every tile overlapping [start_time, end_time]"""
+        for index in range(self.tile_index(start_time), self.tile_index(end_time) + 1):
+            self.get_tile(index)
+
+    def prefetch(self, cursor: datetime.datetime, sim_seconds_per_second: float,
+                 direction: int = 1) -> List[int]:
+        """
+        Schedule tiles ahead of the cursor in the play direction.
+
+        The lookahead covers lookahead_s seconds of wall-clock playback, so
+        faster playback prefetches more tiles (capped at max_prefetch_tiles).
+        Returns the newly scheduled tile indices.
+        """
+        if self._executor is None:
+            return []
+        ahead_s = abs(sim_seconds_per_second) * self._lookahead_s
+        count = min(self._max_prefetch_tiles, max(1, math.ceil(ahead_s / self._tile_seconds)))
+        step = 1 if direction >= 0 else -1
+        current = self.tile_index(cursor)
+
+        scheduled = []
+        for i in range(1, count + 1):
+            index = current + step * i
+            if not self._in_bounds(index):
+                break
+            if self._schedule(index):
+                scheduled.append(index)
+        return scheduled
+
+    def request_tile(self, t: datetime.datetime) -> bool:
+        """Start loading the tile containing t in the background"""
+        if self._executor is None:
+            return False
+        return self._schedule(self.tile_index(t))
+
+    def _schedule(self, index: int) -> bool:
+        future, owner = self._claim(index)
+        if not owner:
+            return False
+        with self._lock:
+            generation = self._generation
+            self._prefetched.add(index)
+            self._stats.prefetches += 1
+        self._executor.submit(self._run_load, index, future, generation)
+        return True
+
+    # ---------------------------------------------------------------- eviction
+    def _evict_locked(self, keep: Optional[int] = None):
+        """Evict least recently used tiles until under the memory cap"""
+        for index in list(self._tiles.keys()):
+            if self._total_bytes <= self._max_bytes:
+                break
+            if index == keep:
+                continue
+            del self._tiles[index]
+            self._total_bytes -= self._tile_bytes.pop(index)
+            self._prefetched.discard(index)
+            self._stats.evictions += 1
+
+    def clear(self):
+        """Drop every tile (in-flight loads finish but are discarded)"""
+        with self._lock:
+            self._generation += 1
+            self._tiles.clear()
+            self._tile_bytes.clear()
+            self._total_bytes = 0
+            self._prefetched.clear()
+
+    # ---------------------------------------------------------------- values
+    def value_at(self, sensor_id: int, target_time: datetime.datetime) -> Optional[Dict]:
+        """
+        Interpolated sensor values at target_time.
+
+        Loads the tile under the cursor if needed. Across a tile boundary the
+        neighbouring tile is used when it is already resident; otherwise the
+        nearest sample inside the tile is returned.
+        """
+        index = self.tile_index(target_time)
+        tile = self.get_tile(index)
+        sensor = tile.find_sensor_data(sensor_id)
+        if sensor is None or sensor.size == 0:
+            return None
+
+        target_ns = int(target_time.timestamp() * 1_000_000_000)
+        first_ns = sensor.timestamps[0]
+        last_ns = sensor.timestamps[sensor.size - 1]
+
+        if target_ns < first_ns:
+            neighbour = self._resident_sensor(index - 1, sensor_id)
+            if neighbour is not None:
+                return self._lerp_between(neighbour, neighbour.size - 1, sensor, 0, target_ns)
+        elif target_ns > last_ns:
+            neighbour = self._resident_sensor(index + 1, sensor_id)
+            if neighbour is not None:
+                return self._lerp_between(sensor, sensor.size - 1, neighbour, 0, target_ns)
+        return sensor.get_interpolated_at_time(target_time)
+
+    def query_batch(self, times_ns, sensor_ids: List[int], mode: str = 'linear'):
+        """
+        [times, sensors, channels] values, loading every tile the times touch.
+        
+        Each tile answers its own times, so interpolation does not cross
+        tile boundaries (times past a tile's last sample hold that value).
+        """
+        times_ns = np.asarray(times_ns, dtype=np.int64)
+        out = np.full((len(times_ns), len(sensor_ids), len(CHANNELS)), np.nan, dtype=np.float32)
+        tile_ids = np.floor_divide(times_ns, self._tile_seconds * 1_000_000_000)
+        for index in np.unique(tile_ids):
+            mask = tile_ids == index
+            out[mask] = self.get_tile(int(index)).query_batch(times_ns[mask], sensor_ids, mode)
+        return out
+        
+    def _resident_sensor(self, index: int, sensor_id: int):
+        with self._lock:
+            tile = self._tiles.get(index)
+        if tile is None:
+            return None
+        sensor = tile.find_sensor_data(sensor_id)
+        return sensor if sensor is not None and sensor.size > 0 else None
+
+    @staticmethod
+    def _lerp_between(a, ia: int, b, ib: int, target_ns: int) -> Dict:
+        t0 = a.timestamps[ia]
+        t1 = b.timestamps[ib]
+        alpha = (target_ns - t0) / (t1 - t0) if t1 != t0 else 0.0
+        return {
+            'temperature_cold': float(a.temp_cold[ia] + (b.temp_cold[ib] - a.temp_cold[ia]) * alpha),
+            'temperature_hot': float(a.temp_hot[ia] + (b.temp_hot[ib] - a.temp_hot[ia]) * alpha),
+            'humidity_cold': float(a.humidity_cold[ia] + (b.humidity_cold[ib] - a.humidity_cold[ia]) * alpha),
+            'humidity_hot': float(a.humidity_hot[ia] + (b.humidity_hot[ib] - a.humidity_hot[ia]) * alpha),
+        }
+
+    # ---------------------------------------------------------------- info
+    def get_stats(self) -> Dict:
+        with self._lock:
+            stats = self._stats.to_dict()
+            stats['resident_tiles'] = len(self._tiles)
+            stats['pending_tiles'] = len(self._pending)
+            stats['resident_bytes'] = self._total_bytes
+            stats['max_bytes'] = self._max_bytes
+        return stats
@@ -7,6 +7,8 @@ import os
 import csv
 from datetime import datetime as dt
 import random
+
+import numpy as np
 '''
 개선된 LKV (Last Known Value) 방식 TimeController
 target_time에 정확히 일치하는 timestamp가 있을 때만 데이터 업데이트
@@ -47,6 +49,10 @@ class TimeController:
         
         # 센서 데이터 초기화
         self._sensor_data = {}  # timestamp 기준으로 그룹화된 센서 데이터
+        self._timestamp_ms = np.zeros(0, dtype=np.int64)  # 정렬된 int64 타임스탬프 인덱스
+        self._timestamp_keys = []  # _timestamp_ms와 같은 순서의 _sensor_data 키
+        self._sensor_positions = {}  # 센서 ID -> 데이터가 있는 인덱스 위치 (정렬됨)
+        self._data_summary = {'timestamps': 0, 'entries': 0, 'sensors': 0}
         self._load_sensor_data()
         
         # 센서 데이터 기반으로 시간 범위 초기화
@@ -81,9 +87,7 @@ class TimeController:
         print(f"{LOG_PREFIX} 단순 LKV 시스템 초기화 중...")
         
         # 모든 센서의 초기 상태를 "데이터 없음"으로 설정
-        all_sensor_ids = set()
-        for sensors_at_time in self._sensor_data.values():
-            all_sensor_ids.update(sensors_at_time.keys())
+        all_sensor_ids = set(self._sensor_positions.keys())
         
         for sensor_id in all_sensor_ids:
             self._last_known_values[sensor_id] = None
@@ -93,38 +97,63 @@ class TimeController:
     
     def _find_latest_data_before_or_at(self, target_time):
         """target_time 이전 또는 같은 시간 중에서 가장 최근 데이터를 가진 타임스탬프들 찾기"""
-        if not self._sensor_data:
-            return {}
-        
-        # 모든 타임스탬프를 datetime으로 변환하여 정렬
-        timestamp_pairs = []
-        for timestamp_str in self._sensor_data.keys():
-            timestamp_dt = self._parse_timestamp(timestamp_str)
-            if timestamp_dt and timestamp_dt <= target_time:
-                timestamp_pairs.append((timestamp_dt, timestamp_str))
-        
-        if not timestamp_pairs:
+        # 정렬된 int64 인덱스에서 이진 탐색 - 센서당 O(log n)
+        limit = int(np.searchsorted(self._timestamp_ms, self._to_ms(target_time), side='right'))
+        if limit == 0:
             return {}
         
-        # 시간순 정렬
-        timestamp_pairs.sort()
-        
-        # 각 센서별로 가장 최근 데이터 찾기
+        # 각 센서별로 limit 이전 마지막 위치가 가장 최근 데이터
         sensor_latest_data = {}
-        
-        for timestamp_dt, timestamp_str in timestamp_pairs:
-            sensors_at_time = self._sensor_data[timestamp_str]
-            
-            # 이 시간에 데이터가 있는 센서들의 값을 최신으로 업데이트
-            for sensor_id, data_entry in sensors_at_time.items():
-                sensor_latest_data[sensor_id] = {
-                    'data': data_entry,
-                    'timestamp': timestamp_dt,
-                    'timestamp_str': timestamp_str
-                }
+        for sensor_id, positions in self._sensor_positions.items():
+            j = int(np.searchsorted(positions, limit, side='left')) - 1
+            if j < 0:
+                continue
+            idx = int(positions[j])
+            timestamp_str = self._timestamp_keys[idx]
+            sensor_latest_data[sensor_id] = {
+                'data': self._sensor_data[timestamp_str][sensor_id],
+                'timestamp': self._from_ms(self._timestamp_ms[idx]),
+                'timestamp_str': timestamp_str
+            }
         
         return sensor_latest_data
     
+    _EPOCH = dt(1970, 1, 1)
+    
+    @classmethod
+    def _to_ms(cls, time_value):
+        """datetime -> int64 밀리초"""
+        delta = time_value - cls._EPOCH
+        return delta.days * 86_400_000 + delta.seconds * 1000 + delta.microseconds // 1000
+    
+    @classmethod
+    def _from_ms(cls, ms):
+        return cls._EPOCH + datetime.timedelta(milliseconds=int(ms))
+    
+    def _build_timestamp_index(self):
+        """_sensor_data 키를 한 번만 파싱/정렬해서 int64 인덱스와 요약 통계 생성"""
+        pairs = []
+        for timestamp_str in self._sensor_data.keys():
+            timestamp_dt = self._parse_timestamp(timestamp_str)
+            if timestamp_dt:
+                pairs.append((self._to_ms(timestamp_dt), timestamp_str))
+        pairs.sort()
+        
+        self._timestamp_ms = np.array([ms for ms, _ in pairs], dtype=np.int64)
+        self._timestamp_keys = [timestamp_str for _, timestamp_str in pairs]
+        
+        positions = {}
+        for idx, timestamp_str in enumerate(self._timestamp_keys):
+            for sensor_id in self._sensor_data[timestamp_str]:
+                positions.setdefault(sensor_id, []).append(idx)
+        self._sensor_positions = {sensor_id: np.array(p, dtype=np.int64) for sensor_id, p in positions.items()}
+        
+        self._data_summary = {
+            'timestamps': len(self._timestamp_keys),
+            'entries': sum(len(p) for p in positions.values()),
+            'sensors': len(positions),
+        }
+    
     def _format_target_time_to_sensor_format(self, target_time):
         """target_time을 센서 데이터의 실제 형식에 맞춰 변환 - 밀리초 3자리"""
         # 센서 데이터 형식: 2025-03-27T00:00:01.018Z (밀리초 3자리)
@@ -509,27 +538,25 @@ class TimeController:
                 # 해당 시간에 센서 ID별 데이터 저장
                 self._sensor_data[normalized_timestamp][obj_id] = entry
             
-            # 결과 요약
-            total_timestamps = len(self._sensor_data)
-            total_entries = sum(len(sensors) for sensors in self._sensor_data.values())
-            unique_sensors = set()
-            for sensors in self._sensor_data.values():
-                unique_sensors.update(sensors.keys())
+            # 정렬된 타임스탬프 인덱스 + 요약 통계 (헬퍼 / UI 카운터용)
+            self._build_timestamp_index()
             
-            print(f"{LOG_PREFIX} 로드된 센서 데이터 (2자리 정규화): {total_entries}개 데이터, {total_timestamps}개 타임스탬프, {len(unique_sensors)}개 센서")
+            # 결과 요약
+            summary = self._data_summary
+            print(f"{LOG_PREFIX} 로드된 센서 데이터 (2자리 정규화): {summary['entries']}개 데이터, {summary['timestamps']}개 타임스탬프, {summary['sensors']}개 센서")
             
             # 센서 ID 목록 출력
-            sensor_ids = sorted(unique_sensors)
+            sensor_ids = sorted(self._sensor_positions.keys())
             print(f"{LOG_PREFIX} 센서 ID: {', '.join(sensor_ids[:10])}{'...' if len(sensor_ids) > 10 else ''}")
             
             # 시간 범위 출력 (정규화된 형식)
-            if self._sensor_data:
-                timestamps = sorted(self._sensor_data.keys())
-                print(f"{LOG_PREFIX} 시간 범위 (2자리): {timestamps[0]} ~ {timestamps[-1]}")
+            if self._timestamp_keys:
+                print(f"{LOG_PREFIX} 시간 범위 (2자리): {self._timestamp_keys[0]} ~ {self._timestamp_keys[-1]}")
             
         except Exception as e:
             print(f"{LOG_PREFIX} 센서 데이터 로드 오류: {e}")
             self._sensor_data = {}
+            self._build_timestamp_index()
     
     def _normalize_timestamp_to_2_decimals(self, timestamp_str):
         """타임스탬프를 소수점 아래 2자리로 정규화"""
@@ -558,14 +585,10 @@ class TimeController:
         """센서 데이터 기반으로 시간 범위 초기화"""
         try:
             # timestamp key들에서 최초/최후 타임스탬프 찾기
-            if self._sensor_data:
-                timestamps = sorted(self._sensor_data.keys())
-                first_timestamp = timestamps[0]
-                last_timestamp = timestamps[-1]
-                
-                # 타임스탬프 파싱
-                self._start_time = self._parse_timestamp(first_timestamp)
-                self._end_time = self._parse_timestamp(last_timestamp)
+            if len(self._timestamp_ms):
+                # 정렬된 인덱스의 처음/끝
+                self._start_time = self._from_ms(self._timestamp_ms[0])
+                self._end_time = self._from_ms(self._timestamp_ms[-1])
                 self._current_time = self._start_time
                 
                 print(f"{LOG_PREFIX} 시간 범위 설정: {self._start_time} ~ {self._end_time}")
@@ -969,11 +992,8 @@ class TimeController:
         return len(self._rack_to_sensor_map)
     
     def get_sensor_count(self):
-        """센서 데이터가 있는 센서 수 가져오기"""
-        unique_sensors = set()
-        for sensors_at_time in self._sensor_data.values():
-            unique_sensors.update(sensors_at_time.keys())
-        return len(unique_sensors)
+        """센서 데이터가 있는 센서 수 가져오기 (로딩 시 계산된 요약 - O(1))"""
+        return self._data_summary['sensors']
     
     def get_lkv_status(self):
         """LKV 상태 정보 가져오기 (디버깅용)"""
@@ -1098,7 +1118,7 @@ class TimeController:
     
     def get_available_timestamps(self):
         """사용 가능한 모든 타임스탬프 목록 가져오기 (정렬됨)"""
-        return sorted(self._sensor_data.keys())
+        return list(self._timestamp_keys)
     
     def has_data_at_time(self, target_time):
         """특정 시간에 데이터가 있는지 확인 (소수점 2자리 방식)"""
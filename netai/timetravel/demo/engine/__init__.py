@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+"""
+Headless time-travel engine: sensor loading, indexing, queries and the
+playback clock in plain Python/NumPy, importable without Kit or pxr.
+
+The Kit controllers are adapters that implement StageWriter on top of it.
+"""
+from .clock import PlaybackClock
+from .core import TimelineEngine, default_time_range, resolve_sensor_id
+from .loader import load_timeline_index, parse_timestamp, read_csv_readings
+from .range_index import CHANNELS, REDUCERS, RangeIndex, SensorRangeIndex
+from .stage_writer import NullStageWriter, RecordingStageWriter, StageWriter
+from .timeline import VALUE_COLUMNS, SensorTimelineIndex, TimestampRows
+
+__all__ = [
+    'PlaybackClock',
+    'TimelineEngine',
+    'default_time_range',
+    'resolve_sensor_id',
+    'load_timeline_index',
+    'parse_timestamp',
+    'read_csv_readings',
+    'CHANNELS',
+    'REDUCERS',
+    'RangeIndex',
+    'SensorRangeIndex',
+    'NullStageWriter',
+    'RecordingStageWriter',
+    'StageWriter',
+    'VALUE_COLUMNS',
+    'SensorTimelineIndex',
+    'TimestampRows',
+]
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+"""
+Playback clock: the current time inside [start, end] and real-time advance while playing
+"""
+import datetime
+import time
+
+
+class PlaybackClock:
+    """
+    Current time, range, speed and play state shared by both controllers.
+
+    advance() moves the current time by the wall-clock time since the last
+    call x speed x time_scale simulated seconds, and stops playback at the
+    end of the range. `now` is injectable so tests and headless tools can
+    drive the clock deterministically.
+    """
+
+    def __init__(self, start_time, end_time, speed=1.0, time_scale=1.0, now=time.time):
+        self.start_time = start_time
+        self.end_time = end_time
+        self.current_time = start_time
+        self.playing = False
+        self.speed = speed
+        self.time_scale = time_scale  # 실제 1초당 시뮬레이션 초 (x speed)
+        self._now = now
+        self.last_update_time = now()
+
+    def clamp(self, target_time):
+        if target_time < self.start_time:
+            return self.start_time
+        if target_time > self.end_time:
+            return self.end_time
+        return target_time
+
+    def set_range(self, start_time, end_time):
+        """Change the range, keeping the current time inside it"""
+        self.start_time = start_time
+        self.end_time = end_time
+        self.current_time = self.clamp(self.current_time)
+
+    def seek(self, target_time):
+        self.current_time = self.clamp(target_time)
+        return self.current_time
+
+    def get_progress(self):
+        """Current time as 0.0-1.0 of the range"""
+        total = (self.end_time - self.start_time).total_seconds()
+        if total <= 0:
+            return 0.0
+        return min(1.0, max(0.0, (self.current_time - self.start_time).total_seconds() / total))
+
+    def time_at_progress(self, progress):
+        progress = min(1.0, max(0.0, progress))
+        return self.start_time + (self.end_time - self.start_time) * progress
+
+    def toggle(self):
+        self.playing = not self.playing
+        if self.playing:
+            self.last_update_time = self._now()
+        return self.playing
+
+    def advance(self, limit=None):
+        """
+        Advance by the elapsed wall-clock time while playing. Returns the
+        previous time, or None when paused. With limit (e.g. the end of the
+        data loaded so far) the clock waits there instead of stopping.
+        """
+        if not self.playing:
+            return None
+        now = self._now()
+        elapsed = (now - self.last_update_time) * self.speed * self.time_scale
+        self.last_update_time = now
+
+        previous = self.current_time
+        new_time = previous + datetime.timedelta(seconds=elapsed)
+        if new_time >= self.end_time:
+            new_time = self.end_time
+            self.playing = False  # 종료 시간 도달 - 재생 중지
+        elif limit is not None:
+            new_time = min(new_time, max(previous, limit))
+        self.current_time = new_time
+        return previous
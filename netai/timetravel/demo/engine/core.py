@@ -0,0 +1,271 @@
+# -*- coding: utf-8 -*-
+"""
+TimelineEngine: sensor timeline, rack mapping, LKV state and playback clock without Kit
+"""
+import datetime
+from datetime import datetime as dt
+
+from ..config import DEFAULT_TIME_CONFIG, SENSOR_DATA_CONFIG
+from ..ringlog import logger
+from ..tracing import ADVANCE, DIFF, FRAME, RESOLVE, SEEK, USD_APPLY, USD_TIME, tracer
+from .clock import PlaybackClock
+from .loader import load_timeline_index
+from .range_index import SensorRangeIndex
+from .stage_writer import NullStageWriter
+from .timeline import SensorTimelineIndex
+
+
+def resolve_sensor_id(rack_path, rack_to_sensor_map):
+    """Sensor ID of rack_path: exact path, then same rack name, then with/without /World"""
+    # 직접 매핑 확인
+    if rack_path in rack_to_sensor_map:
+        return rack_to_sensor_map.get(rack_path)
+
+    # 끝부분 비교
+    rack_name = rack_path.split('/')[-1] if '/' in rack_path else rack_path
+    for path, sensor_id in rack_to_sensor_map.items():
+        if path.endswith('/' + rack_name):
+            return sensor_id
+
+    # 경로 변형 시도
+    variations = []
+    if rack_path.startswith('/World/'):
+        variations.append(rack_path[6:])
+    elif not rack_path.startswith('/World'):
+        variations.append('/World' + rack_path)
+
+    for var_path in variations:
+        if var_path in rack_to_sensor_map:
+            return rack_to_sensor_map.get(var_path)
+
+    return None
+
+
+def default_time_range():
+    """(start, end) from DEFAULT_TIME_CONFIG, used when there is no sensor data"""
+    return (dt.strptime(DEFAULT_TIME_CONFIG["default_start"], "%Y-%m-%dT%H:%M:%S"),
+            dt.strptime(DEFAULT_TIME_CONFIG["default_end"], "%Y-%m-%dT%H:%M:%S"))
+
+
+class TimelineEngine:
+    """
+    Everything the CSV TimeController computes, minus USD.
+
+    Holds the SensorTimelineIndex, the rack -> sensor mapping, the
+    last-known value per rack and a PlaybackClock. apply() resolves the
+    state at the clock's time and hands it to a StageWriter: the full
+    state, or only the racks whose value changed since the last applied
+    time. Runs in plain CPython (tests, process pools, CLI tools).
+    """
+
+    def __init__(self, index=None, rack_paths=(), rack_to_sensor_map=None, writer=None,
+                 clock=None):
+        self.index = index if index is not None else SensorTimelineIndex()
+        self.rack_paths = list(rack_paths)
+        self.rack_to_sensor_map = dict(rack_to_sensor_map or {})
+        self.writer = writer if writer is not None else NullStageWriter()
+        self.last_known_values = {}  # 각 랙의 마지막 알려진 값
+        self.applied_time = None  # writer에 전체 상태가 반영된 시각 (변경분만 적용하는 기준)
+        self._range_index = None  # 구간 통계용 SensorRangeIndex (처음 조회할 때 빌드)
+        if clock is None:
+            start_time, end_time = self.index.time_range() or default_time_range()
+            clock = PlaybackClock(start_time, end_time)
+        self.clock = clock
+
+    @classmethod
+    def from_csv(cls, csv_path, config=SENSOR_DATA_CONFIG, **kwargs):
+        return cls(load_timeline_index(csv_path, config), **kwargs)
+
+    def set_index(self, index):
+        """Replace the timeline (e.g. after reloading) and reset the clock range to its data"""
+        self.index = index
+        self.applied_time = None
+        self._range_index = None
+        time_range = index.time_range()
+        if time_range:
+            self.clock.set_range(*time_range)
+            self.clock.current_time = time_range[0]
+
+    @property
+    def rows_by_timestamp(self):
+        """정규화된 timestamp -> {센서 ID: entry} (정확 매치 디버깅 헬퍼용, 조회할 때 이진 탐색)"""
+        return self.index.rows_by_timestamp()
+
+    # ========== 랙 매핑 ==========
+
+    def sensor_id_for_rack(self, rack_path):
+        return resolve_sensor_id(rack_path, self.rack_to_sensor_map)
+
+    def racks_by_sensor(self):
+        """센서 ID -> 매핑된 랙 경로 목록"""
+        racks = {}
+        for rack_path in self.rack_paths:
+            sensor_id = self.sensor_id_for_rack(rack_path)
+            if sensor_id:
+                racks.setdefault(sensor_id, []).append(rack_path)
+        return racks
+
+    # ========== 조회 ==========
+
+    def state_at(self, time_value):
+        """{sensor_id: entry} of the last reading at or before time_value"""
+        return self.index.at(time_value)
+
+    def diff(self, from_time, to_time):
+        """
+        {rack_path: {column: {'from', 'to', 'delta'}}} for the racks whose
+        last-known value differs between from_time and to_time.
+        """
+        sensor_diff = self.index.diff(from_time, to_time)
+        result = {}
+        for sensor_id, rack_paths in self.racks_by_sensor().items():
+            if sensor_id in sensor_diff:
+                for rack_path in rack_paths:
+                    result[rack_path] = sensor_diff[sensor_id]
+        return result
+
+    def range_index(self):
+        """SensorRangeIndex over the timeline, built on first use after each set_index()"""
+        if self._range_index is None:
+            self._range_index = SensorRangeIndex.from_series(
+                (sensor_id, times_ms * 1_000_000, values)
+                for sensor_id, times_ms, values in self.index.sensor_series())
+        return self._range_index
+
+    def range_stats(self, rack_path, start_time=None, end_time=None):
+        """
+        count/min/max/mean/std/integral of a rack's sensor over
+        [start_time, end_time] (default: the clock range) in the
+        SensorRangeIndex.range_stats format; None when the rack has no
+        sensor or no reading falls inside.
+        """
+        sensor_id = self.sensor_id_for_rack(rack_path)
+        if not sensor_id:
+            return None
+        start_ns = SensorTimelineIndex.to_ms(start_time or self.clock.start_time) * 1_000_000
+        end_ns = SensorTimelineIndex.to_ms(end_time or self.clock.end_time) * 1_000_000
+        return self.range_index().range_stats(str(sensor_id), start_ns, end_ns)
+
+    def find_event(self, t=None, rack=None, forward=True):
+        """
+        Next (or previous) time after t (default: the clock time) at which
+        any sensor, or the sensor of rack, reported a new value; None when
+        there is none within the clock's range.
+        """
+        sensor_id = None
+        if rack:
+            sensor_id = self.sensor_id_for_rack(rack)
+            if not sensor_id:
+                return None
+
+        # 가장 가까운 밀리초로 반올림 - 슬라이더 progress 왕복으로 생긴 마이크로초 오차에 같은 이벤트가 반복되지 않도록
+        t_ms = SensorTimelineIndex.to_ms((t or self.clock.current_time) + datetime.timedelta(microseconds=500))
+        if forward:
+            event_ms = self.index.next_change(t_ms, sensor_id)
+        else:
+            event_ms = self.index.prev_change(t_ms, sensor_id)
+        if event_ms is None:
+            return None
+
+        event_time = SensorTimelineIndex.from_ms(event_ms)
+        if event_time < self.clock.start_time or event_time > self.clock.end_time:
+            return None
+        return event_time
+
+    # ========== 적용 ==========
+
+    def apply(self, changed_only=False):
+        """Write the clock time and the rack state at it; returns the number of racks written"""
+        with tracer.span(USD_TIME):
+            self.writer.write_time(self.clock.current_time)
+        if changed_only:
+            return self.apply_changes()
+        return self.apply_all()
+
+    def apply_all(self):
+        """
+        Write every rack: its sensor's value at the clock time, or its last
+        known value when the sensor has none.
+        """
+        current_time = self.clock.current_time
+        debug = logger.debug_enabled
+        if debug:
+            logger.debug("_update_all_racks 실행 - 현재 시간: %s", current_time)
+
+        with tracer.span(RESOLVE):
+            # second_data 조회 - 밀리초 단위 LKV (이진 탐색 / 재생 커서)
+            second_data = self.index.at(current_time)
+            if not second_data:
+                logger.warning_once("second_data 없음", "second_data 없음: %s", current_time)
+                return 0
+
+            if debug:
+                logger.debug("second_data 발견: %d개 센서", len(second_data))
+            updates = {}
+            updated_count = 0
+            maintained_count = 0
+            for rack_path in self.rack_paths:
+                sensor_id = self.sensor_id_for_rack(rack_path)
+                if sensor_id and sensor_id in second_data:
+                    updates[rack_path] = self.last_known_values[rack_path] = second_data[sensor_id]
+                    updated_count += 1
+                elif rack_path in self.last_known_values:
+                    updates[rack_path] = self.last_known_values[rack_path]
+                    maintained_count += 1
+
+        self._write_racks(updates)
+        if debug:
+            logger.debug("업데이트 결과: 새 데이터 %d, LKV 유지 %d, 실패 %d",
+                         updated_count, maintained_count, len(self.rack_paths) - len(updates))
+        self.applied_time = current_time
+        return updated_count
+
+    def apply_changes(self):
+        """
+        Write only the racks whose sensor changed value since the last
+        applied time; falls back to apply_all() when nothing was applied yet.
+        """
+        if self.applied_time is None:
+            return self.apply_all()
+
+        current_time = self.clock.current_time
+        with tracer.span(DIFF):
+            changes = self.index.changed_positions(self.applied_time, current_time)
+            racks = self.racks_by_sensor() if changes else {}
+            updates = {}
+            for sensor_id, position in changes:
+                rack_data = self.index.entry(position)
+                for rack_path in racks.get(sensor_id, ()):
+                    updates[rack_path] = self.last_known_values[rack_path] = rack_data
+
+        self._write_racks(updates)
+        if logger.debug_enabled:
+            logger.debug("변경분 적용: 센서 %d개, 랙 %d개", len(changes), len(updates))
+        self.applied_time = current_time
+        return len(updates)
+
+    def _write_racks(self, updates):
+        with tracer.span(USD_APPLY, {'racks': len(updates)} if tracer.enabled else None):
+            self.writer.write_racks(updates)
+
+    def reset_applied(self):
+        """Forget the applied state so the next apply() rewrites everything"""
+        self.last_known_values.clear()
+        self.applied_time = None
+
+    # ========== 시간 이동 ==========
+
+    def seek(self, target_time):
+        """Move the clock (clamped to its range) and apply only what changed"""
+        with tracer.span(SEEK):
+            self.clock.seek(target_time)
+            return self.apply(changed_only=True)
+
+    def tick(self):
+        """One playback frame: advance the clock and apply; None when paused"""
+        if not self.clock.playing:
+            return None
+        with tracer.span(FRAME):
+            with tracer.span(ADVANCE):
+                self.clock.advance()
+            return self.apply()
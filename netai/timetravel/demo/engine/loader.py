@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+"""
+CSV sensor-data loading without Kit: rows -> (milliseconds, sensor_id, values) readings
+"""
+import csv
+from datetime import datetime as dt
+
+from ..config import SENSOR_DATA_CONFIG
+from .timeline import SensorTimelineIndex, VALUE_COLUMNS
+
+
+def parse_timestamp(timestamp_str):
+    """
+    '2025-03-27T00:00:01.018Z', '...:01Z' or '...:01' -> datetime.
+    Raises ValueError for any other format.
+    """
+    if "." in timestamp_str and timestamp_str.endswith("Z"):
+        return dt.strptime(timestamp_str, "%Y-%m-%dT%H:%M:%S.%fZ")
+    elif timestamp_str.endswith("Z"):
+        return dt.strptime(timestamp_str, "%Y-%m-%dT%H:%M:%SZ")
+    return dt.strptime(timestamp_str, "%Y-%m-%dT%H:%M:%S")
+
+
+def read_csv_readings(csv_path, config=SENSOR_DATA_CONFIG):
+    """
+    (milliseconds, sensor_id, [values in VALUE_COLUMNS order]) for every CSV
+    row with a parseable timestamp; unparseable values become 0.0.
+    """
+    timestamp_column = config["timestamp_column"]
+    obj_id_column = config["obj_id_column"]
+    readings = []  # (밀리초, 센서 ID, 값) - ingest 버킷팅 입력
+    with open(csv_path, 'r') as file:
+        for entry in csv.DictReader(file):
+            original_timestamp = entry.get(timestamp_column)
+            if not original_timestamp:
+                continue
+            try:
+                # 같은 초의 여러 측정값을 보존하도록 밀리초 단위로 정규화
+                timestamp_ms = SensorTimelineIndex.to_ms(parse_timestamp(original_timestamp))
+            except ValueError:
+                continue
+
+            values = []
+            for field in VALUE_COLUMNS:
+                try:
+                    values.append(float(entry.get(field, 0.0)))
+                except (ValueError, TypeError):
+                    values.append(0.0)
+            readings.append((timestamp_ms, entry.get(obj_id_column, "unknown"), values))
+    return readings
+
+
+def load_timeline_index(csv_path, config=SENSOR_DATA_CONFIG):
+    """Read a sensor CSV and build its SensorTimelineIndex with the configured ingest buckets"""
+    readings = read_csv_readings(csv_path, config)
+    return SensorTimelineIndex.build(readings, config.get("bucket_ms", 1), config.get("bucket_reducer", "last"))
@@ -0,0 +1,253 @@
+# -*- coding: utf-8 -*-
+"""
+Range aggregates in a fixed number of numpy calls: sums and integrals via prefix arrays (O(1)),
+min/max via block sparse tables (O(block_size) rows at the ends of the range)
+"""
+import time
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+# 집계 결과의 채널 이름과 순서 ([..., channels] 축)
+CHANNELS = ('temperature_cold', 'temperature_hot', 'humidity_cold', 'humidity_hot')
+REDUCERS = ('max', 'min', 'mean', 'last')
+DEFAULT_BLOCK_SIZE = 32
+NS_PER_SECOND = 1_000_000_000
+
+
+class BlockSparseTable:
+    """
+    Range min or max over the rows of a [samples, channels] matrix.
+
+    Samples are grouped into fixed-size blocks. A sparse table over the
+    per-block results answers any run of whole blocks with two overlapping
+    lookups, and the partial blocks at either end are reduced directly.
+    A query is therefore O(block_size), not O(1): it takes at most three
+    numpy calls but scans up to 2 * (block_size - 1) rows. In exchange
+    the table needs only n / block_size * log2(n / block_size) rows.
+    A row-level O(1) table would need n * log2(block_size) more rows,
+    which is several times the source data for a month of readings.
+    """
+
+    def __init__(self, values: np.ndarray, op=np.maximum, block_size: int = DEFAULT_BLOCK_SIZE):
+        self._values = values
+        self._op = op
+        self._block = block_size
+
+        n, channels = values.shape
+        n_blocks = -(-n // block_size)
+        identity = -np.inf if op is np.maximum else np.inf
+        padded = np.full((n_blocks * block_size, channels), identity, dtype=values.dtype)
+        padded[:n] = values
+        level = op.reduce(padded.reshape(n_blocks, block_size, channels), axis=1)
+
+        # table[k][i] = op over blocks [i, i + 2^k)
+        self._table = [level]
+        span = 1
+        while span * 2 <= n_blocks:
+            level = op(level[:-span], level[span:])
+            self._table.append(level)
+            span *= 2
+
+    def query(self, lo: int, hi: int) -> np.ndarray:
+        """Reduce rows [lo, hi) per channel (hi > lo)"""
+        block = self._block
+        op = self._op
+        first_block = lo // block
+        last_block = (hi - 1) // block
+        if first_block == last_block:
+            return op.reduce(self._values[lo:hi], axis=0)
+
+        result = op(op.reduce(self._values[lo:(first_block + 1) * block], axis=0),
+                    op.reduce(self._values[last_block * block:hi], axis=0))
+        inner_lo, inner_hi = first_block + 1, last_block
+        if inner_hi > inner_lo:
+            k = (inner_hi - inner_lo).bit_length() - 1
+            level = self._table[k]
+            result = op(result, op(level[inner_lo], level[inner_hi - (1 << k)]))
+        return result
+
+    def nbytes(self) -> int:
+        return sum(level.nbytes for level in self._table)
+
+
+class RangeIndex:
+    """
+    Per-sensor range aggregates over the columnar samples.
+
+    Built once per load: block sparse tables for min/max, prefix sums of
+    the values and their squares, and a prefix of trapezoid areas for the
+    time integral (the count is the index difference). A query finds the
+    sample run with two binary searches; mean/std/integral are then O(1)
+    and min/max O(block_size), however long the interval is.
+    """
+
+    def __init__(self, timestamps_ns: np.ndarray, values: np.ndarray, block_size: int = DEFAULT_BLOCK_SIZE):
+        self.timestamps = timestamps_ns
+        self.values = values
+        self._max = BlockSparseTable(values, np.maximum, block_size)
+        self._min = BlockSparseTable(values, np.minimum, block_size)
+
+        n, channels = values.shape
+        values64 = values.astype(np.float64)
+        self._prefix_sum = np.zeros((n + 1, channels), dtype=np.float64)
+        np.cumsum(values64, axis=0, out=self._prefix_sum[1:])
+        self._prefix_sq = np.zeros((n + 1, channels), dtype=np.float64)
+        np.cumsum(values64 * values64, axis=0, out=self._prefix_sq[1:])
+
+        # _prefix_area[i] = 첫 샘플부터 i번째 샘플까지 선형 보간 곡선의 적분 (값 x 초)
+        self._prefix_area = np.zeros((n, channels), dtype=np.float64)
+        if n > 1:
+            dt_s = np.diff(timestamps_ns).astype(np.float64)[:, None] / NS_PER_SECOND
+            np.cumsum((values64[1:] + values64[:-1]) * 0.5 * dt_s, axis=0, out=self._prefix_area[1:])
+
+    @classmethod
+    def from_sensor_data(cls, sensor, block_size: int = DEFAULT_BLOCK_SIZE) -> "RangeIndex":
+        """From columnar sensor samples (size, timestamps and one array per channel, e.g. OptimizedSensorData)"""
+        n = sensor.size
+        values = np.column_stack([
+            sensor.temp_cold[:n], sensor.temp_hot[:n], sensor.humidity_cold[:n], sensor.humidity_hot[:n]
+        ]).astype(np.float32)
+        return cls(sensor.timestamps[:n], values, block_size)
+
+    def index_range(self, start_ns: int, end_ns: int) -> Tuple[int, int]:
+        """Sample indices [lo, hi) with start_ns <= timestamp <= end_ns"""
+        lo = int(np.searchsorted(self.timestamps, start_ns, side='left'))
+        hi = int(np.searchsorted(self.timestamps, end_ns, side='right'))
+        return lo, hi
+
+    def reduce(self, start_ns: int, end_ns: int, reducer: str = 'max') -> Optional[np.ndarray]:
+        """Per-channel reducer over [start_ns, end_ns]; None when no sample falls inside"""
+        lo, hi = self.index_range(start_ns, end_ns)
+        if hi <= lo:
+            return None
+        if reducer == 'max':
+            return self._max.query(lo, hi)
+        if reducer == 'min':
+            return self._min.query(lo, hi)
+        if reducer == 'mean':
+            return (self._prefix_sum[hi] - self._prefix_sum[lo]) / (hi - lo)
+        if reducer == 'last':
+            return self.values[hi - 1]
+        raise ValueError(f"Unknown reducer: {reducer}")
+
+    def _area_until(self, t_ns: int) -> np.ndarray:
+        """Integral of the interpolated curve from the first sample to t_ns (inside the data)"""
+        n = len(self.timestamps)
+        i = min(max(int(np.searchsorted(self.timestamps, t_ns, side='right')) - 1, 0), n - 1)
+        if i == n - 1:
+            return self._prefix_area[i]
+        t0 = int(self.timestamps[i])
+        span = int(self.timestamps[i + 1]) - t0
+        alpha = (t_ns - t0) / span if span else 0.0
+        v0 = self.values[i].astype(np.float64)
+        v_t = v0 + (self.values[i + 1] - v0) * alpha
+        return self._prefix_area[i] + (v0 + v_t) * 0.5 * ((t_ns - t0) / NS_PER_SECOND)
+
+    def stats(self, start_ns: int, end_ns: int) -> Optional[Dict[str, np.ndarray]]:
+        """
+        count/min/max/mean/std over the samples in [start_ns, end_ns], plus
+        the time integral (value x seconds) of the linearly interpolated
+        curve over the part of the interval covered by data and its
+        time-weighted mean. None when no sample falls inside.
+        """
+        lo, hi = self.index_range(start_ns, end_ns)
+        if hi <= lo:
+            return None
+        count = hi - lo
+        mean = (self._prefix_sum[hi] - self._prefix_sum[lo]) / count
+        mean_sq = (self._prefix_sq[hi] - self._prefix_sq[lo]) / count
+        std = np.sqrt(np.maximum(mean_sq - mean * mean, 0.0))
+
+        a = min(max(int(start_ns), int(self.timestamps[0])), int(self.timestamps[-1]))
+        b = min(max(int(end_ns), int(self.timestamps[0])), int(self.timestamps[-1]))
+        integral = self._area_until(b) - self._area_until(a)
+        duration_s = (b - a) / NS_PER_SECOND
+        return {
+            'count': count,
+            'min': self._min.query(lo, hi),
+            'max': self._max.query(lo, hi),
+            'mean': mean,
+            'std': std,
+            'integral': integral,
+            'duration_s': duration_s,
+            'time_weighted_mean': integral / duration_s if duration_s > 0 else mean,
+        }
+
+    def nbytes(self) -> int:
+        """Memory held by the index (the timestamps belong to the sensor)"""
+        return (self.values.nbytes + self._max.nbytes() + self._min.nbytes() +
+                self._prefix_sum.nbytes + self._prefix_sq.nbytes + self._prefix_area.nbytes)
+
+
+class SensorRangeIndex:
+    """Range reducers for every sensor of a SensorDataCache, with build statistics"""
+
+    def __init__(self, block_size: int = DEFAULT_BLOCK_SIZE):
+        self._block_size = block_size
+        self._indexes: Dict[int, RangeIndex] = {}
+        self._build_seconds = 0.0
+
+    @classmethod
+    def build(cls, cache, block_size: int = DEFAULT_BLOCK_SIZE) -> "SensorRangeIndex":
+        """From a SensorDataCache-like cache (get_sensor_ids / find_sensor_data)"""
+        index = cls(block_size)
+        t0 = time.perf_counter()
+        for sensor_id in cache.get_sensor_ids():
+            sensor = cache.find_sensor_data(sensor_id)
+            if sensor is None or sensor.size == 0:
+                continue
+            index._indexes[sensor_id] = RangeIndex.from_sensor_data(sensor, block_size)
+        index._build_seconds = time.perf_counter() - t0
+        return index
+
+    @classmethod
+    def from_series(cls, series, block_size: int = DEFAULT_BLOCK_SIZE) -> "SensorRangeIndex":
+        """Build from (sensor_id, timestamps_ns, values[samples, channels]) tuples in time order"""
+        index = cls(block_size)
+        t0 = time.perf_counter()
+        for sensor_id, timestamps_ns, values in series:
+            if len(timestamps_ns):
+                index._indexes[sensor_id] = RangeIndex(timestamps_ns, values.astype(np.float32), block_size)
+        index._build_seconds = time.perf_counter() - t0
+        return index
+
+    def get_index(self, sensor_id: int) -> Optional[RangeIndex]:
+        return self._indexes.get(sensor_id)
+
+    def reduce(self, sensor_id: int, start_ns: int, end_ns: int, reducer: str = 'max') -> Optional[Dict]:
+        """Reducer over [start_ns, end_ns] as a channel -> value dict"""
+        index = self._indexes.get(sensor_id)
+        if index is None:
+            return None
+        values = index.reduce(start_ns, end_ns, reducer)
+        if values is None:
+            return None
+        return {name: float(values[c]) for c, name in enumerate(CHANNELS)}
+
+    def range_stats(self, sensor_id: int, start_ns: int, end_ns: int) -> Optional[Dict]:
+        """
+        RangeIndex.stats as {'count', 'duration_s', <aggregate>: {channel: value}}
+        for one sensor; None if the sensor has no samples in the interval.
+        """
+        index = self._indexes.get(sensor_id)
+        if index is None:
+            return None
+        stats = index.stats(start_ns, end_ns)
+        if stats is None:
+            return None
+        result = {'count': stats.pop('count'), 'duration_s': stats.pop('duration_s')}
+        for key, values in stats.items():
+            result[key] = {name: float(values[c]) for c, name in enumerate(CHANNELS)}
+        return result
+
+    def nbytes(self) -> int:
+        return sum(index.nbytes() for index in self._indexes.values())
+
+    def get_stats(self) -> Dict:
+        return {
+            'sensors': len(self._indexes),
+            'block_size': self._block_size,
+            'build_seconds': self._build_seconds,
+            'nbytes': self.nbytes(),
+        }
@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+"""
+The narrow interface between the engine and whatever displays its state (USD, tests, tools)
+"""
+
+
+class StageWriter:
+    """
+    Receives the engine's output. The USD adapters implement it with
+    timeline / prim writes; headless callers use NullStageWriter or
+    RecordingStageWriter.
+    """
+
+    def write_time(self, current_time):
+        """The playback time changed"""
+        raise NotImplementedError
+
+    def write_racks(self, updates):
+        """{rack_path: values} for the racks whose values should be (re)applied"""
+        raise NotImplementedError
+
+
+class NullStageWriter(StageWriter):
+    """Discards everything (benchmarks, worker processes)"""
+
+    def write_time(self, current_time):
+        pass
+
+    def write_racks(self, updates):
+        pass
+
+
+class RecordingStageWriter(StageWriter):
+    """Keeps the latest values per rack and counts writes (tests, CLI tools)"""
+
+    def __init__(self):
+        self.current_time = None
+        self.racks = {}
+        self.time_writes = 0
+        self.rack_writes = 0
+
+    def write_time(self, current_time):
+        self.current_time = current_time
+        self.time_writes += 1
+
+    def write_racks(self, updates):
+        self.racks.update(updates)
+        self.rack_writes += len(updates)
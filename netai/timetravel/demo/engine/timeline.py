@@ -0,0 +1,312 @@
+# -*- coding: utf-8 -*-
+"""
+Millisecond last-known-value timeline over the ingested CSV readings
+"""
+import datetime
+from collections.abc import Mapping
+from datetime import datetime as dt
+
+import numpy as np
+
+from ..config import SENSOR_DATA_CONFIG
+from ..ingest import bucket_readings
+
+# 센서 값 컬럼 순서 (cold/hot 온도, cold/hot 습도) - 타임라인 인덱스의 values 열 순서
+VALUE_COLUMNS = (
+    SENSOR_DATA_CONFIG["temperature_columns"]["cold"],
+    SENSOR_DATA_CONFIG["temperature_columns"]["hot"],
+    SENSOR_DATA_CONFIG["humidity_columns"]["cold"],
+    SENSOR_DATA_CONFIG["humidity_columns"]["hot"],
+)
+
+
+class SensorTimelineIndex:
+    """
+    Last-known-value lookup over the ingested readings at millisecond precision.
+    
+    Readings are stored column-wise (int64 millisecond time, sensor code,
+    float32 values), one row per sensor and ingest bucket, so coarser
+    buckets shrink the index. at() resolves any instant with one binary
+    search per sensor; during forward playback it applies only the rows
+    since the previous call. Before a sensor's first reading its first
+    reading is used, as the per-second timeline did.
+    """
+    
+    EPOCH = dt(1970, 1, 1)
+    # 변경 키 = 센서 코드 << CODE_SHIFT | 밀리초 (2^42 ms = 2109년까지)
+    CODE_SHIFT = 42
+    
+    def __init__(self, sensor_ids=(), times_ms=None, sensor_codes=None, values=None):
+        self._sensor_ids = list(sensor_ids)
+        self._event_ms = times_ms if times_ms is not None else np.zeros(0, dtype=np.int64)
+        self._event_codes = sensor_codes if sensor_codes is not None else np.zeros(0, dtype=np.int32)
+        self._event_values = values if values is not None else np.zeros((0, len(VALUE_COLUMNS)), dtype=np.float32)
+        
+        # 센서별 정렬된 시각과 해당 행 위치 (seek용)
+        order = np.argsort(self._event_codes, kind='stable')
+        bounds = np.searchsorted(self._event_codes[order], np.arange(len(self._sensor_ids) + 1))
+        self._sensor_positions = [order[bounds[c]:bounds[c + 1]] for c in range(len(self._sensor_ids))]
+        self._sensor_ms = [self._event_ms[positions] for positions in self._sensor_positions]
+        
+        # 값이 실제로 바뀐 시점 (센서별 + 전체 병합) - 이벤트 이동용, 같은 값 반복은 제외
+        changed = np.zeros(len(self._event_ms), dtype=bool)
+        for positions in self._sensor_positions:
+            if len(positions):
+                sensor_values = self._event_values[positions]
+                flags = np.ones(len(positions), dtype=bool)
+                flags[1:] = (sensor_values[1:] != sensor_values[:-1]).any(axis=1)
+                changed[positions] = flags
+        self._code_of = {sensor_id: code for code, sensor_id in enumerate(self._sensor_ids)}
+        self._sensor_change_ms = [self._event_ms[positions][changed[positions]] for positions in self._sensor_positions]
+        self._change_ms = np.unique(self._event_ms[changed])
+        
+        # 상태 diff용: 센서별 변경 행 위치를 (센서 코드, 시각) 키 하나로 이어 붙임
+        # -> 모든 센서의 "t 시점 마지막 변경 행"이 searchsorted 한 번
+        change_positions = [positions[changed[positions]] for positions in self._sensor_positions]
+        self._change_offsets = np.zeros(len(self._sensor_ids) + 1, dtype=np.int64)
+        self._change_offsets[1:] = np.cumsum([len(positions) for positions in change_positions])
+        self._change_rows = np.concatenate(change_positions + [np.zeros(0, dtype=np.int64)]).astype(np.int64)
+        self._code_keys = np.arange(len(self._sensor_ids), dtype=np.int64) << self.CODE_SHIFT
+        self._change_keys = self._event_ms[self._change_rows] + (self._event_codes[self._change_rows].astype(np.int64) << self.CODE_SHIFT)
+        self._has_changes = self._change_offsets[1:] > self._change_offsets[:-1]
+        
+        # 서로 다른 측정 시각 (정렬된 int64) + 요약 통계 - 디버깅 헬퍼 / UI 카운터가 O(1)/O(log n)으로 조회
+        self._timestamps_ms = np.unique(self._event_ms)
+        self.summary = {
+            'rows': len(self._event_ms),
+            'timestamps': len(self._timestamps_ms),
+            'sensors': len(self._sensor_ids),
+            'changes': int(changed.sum()),
+            'rows_per_sensor': {sensor_id: len(positions)
+                                for sensor_id, positions in zip(self._sensor_ids, self._sensor_positions)},
+        }
+        
+        self._cursor_pos = -1
+        self._cursor_ms = None
+        self._cursor_state = {}
+    
+    @classmethod
+    def to_ms(cls, time_value):
+        """datetime -> int64 milliseconds (timezone-naive, like the CSV timestamps)"""
+        delta = time_value - cls.EPOCH
+        return delta.days * 86_400_000 + delta.seconds * 1000 + delta.microseconds // 1000
+    
+    @classmethod
+    def from_ms(cls, ms):
+        return cls.EPOCH + datetime.timedelta(milliseconds=int(ms))
+    
+    @classmethod
+    def format_ms(cls, ms):
+        """int64 milliseconds -> normalized timestamp key (2025-03-27T00:00:01.018Z)"""
+        return cls.from_ms(ms).strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
+    
+    @classmethod
+    def build(cls, readings, bucket_ms=1, reducer='last'):
+        """
+        Build from (milliseconds, sensor_id, values) tuples in any order,
+        bucketed per sensor with ingest.bucket_readings.
+        """
+        if not readings:
+            return cls()
+        times_ms = np.array([reading[0] for reading in readings], dtype=np.int64)
+        sensor_ids, codes = np.unique(np.array([reading[1] for reading in readings], dtype=object).astype(str),
+                                      return_inverse=True)
+        values = np.array([reading[2] for reading in readings], dtype=np.float32)
+        times_ms, codes, values = bucket_readings(times_ms, codes.astype(np.int32), values, bucket_ms, reducer)
+        return cls(sensor_ids.tolist(), times_ms, codes, values)
+    
+    def __len__(self):
+        return len(self._event_ms)
+    
+    @property
+    def sensor_ids(self):
+        return list(self._sensor_ids)
+    
+    def nbytes(self):
+        return self._event_ms.nbytes + self._event_codes.nbytes + self._event_values.nbytes
+    
+    @property
+    def timestamps_ms(self):
+        """Sorted distinct reading times (int64 milliseconds)"""
+        return self._timestamps_ms
+    
+    def timestamps_around(self, t_ms, window):
+        """
+        Timestamp keys within window positions of t_ms, or [] when no reading
+        is stamped exactly t_ms.
+        """
+        idx = int(np.searchsorted(self._timestamps_ms, t_ms, side='left'))
+        if idx == len(self._timestamps_ms) or self._timestamps_ms[idx] != t_ms:
+            return []
+        around = self._timestamps_ms[max(0, idx - window):idx + window + 1]
+        return [self.format_ms(ms) for ms in around]
+    
+    def sensor_series(self):
+        """(sensor_id, times_ms, values) of every sensor with readings, in time order"""
+        for code, sensor_id in enumerate(self._sensor_ids):
+            positions = self._sensor_positions[code]
+            if len(positions):
+                yield sensor_id, self._sensor_ms[code], self._event_values[positions]
+    
+    def rows_at_ms(self, t_ms):
+        """{sensor_id: entry} of the rows stamped exactly t_ms ({} when there are none)"""
+        lo = int(np.searchsorted(self._event_ms, t_ms, side='left'))
+        hi = int(np.searchsorted(self._event_ms, t_ms, side='right'))
+        rows = {}
+        for position in range(lo, hi):
+            rows[self._sensor_ids[self._event_codes[position]]] = self.entry(position)
+        return rows
+    
+    def rows_by_timestamp(self):
+        """Read-only {normalized timestamp: {sensor_id: entry}} view (see TimestampRows)"""
+        return TimestampRows(self)
+    
+    def _change_times(self, sensor_id):
+        if sensor_id is None:
+            return self._change_ms
+        code = self._code_of.get(str(sensor_id))
+        return self._sensor_change_ms[code] if code is not None else self._change_ms[:0]
+    
+    def next_change(self, t_ms, sensor_id=None):
+        """First time after t_ms at which any sensor (or sensor_id) changed value, None if there is none"""
+        times = self._change_times(sensor_id)
+        i = int(np.searchsorted(times, t_ms, side='right'))
+        return int(times[i]) if i < len(times) else None
+    
+    def prev_change(self, t_ms, sensor_id=None):
+        """Last time before t_ms at which any sensor (or sensor_id) changed value, None if there is none"""
+        times = self._change_times(sensor_id)
+        i = int(np.searchsorted(times, t_ms, side='left')) - 1
+        return int(times[i]) if i >= 0 else None
+    
+    def _state_rows(self, t_ms):
+        """Row of each sensor's last value change at or before t_ms (its first reading before that)"""
+        idx = np.searchsorted(self._change_keys, self._code_keys + t_ms, side='right') - 1
+        return self._change_rows[np.maximum(idx, self._change_offsets[:-1])[self._has_changes]]
+    
+    def changed_positions(self, from_time, to_time):
+        """
+        (sensor_id, row position) for every sensor whose value changed
+        between the two times; the row is the change point holding the
+        value at to_time.
+        
+        Compares the index of each sensor's last change point instead of
+        values, so the cost is one vectorized search per sensor however far
+        apart the times are. A value that changes and comes back within the
+        gap still counts as a change.
+        """
+        rows_from = self._state_rows(self.to_ms(from_time))
+        rows_to = self._state_rows(self.to_ms(to_time))
+        moved = np.flatnonzero(rows_from != rows_to)
+        codes = self._event_codes[rows_to[moved]]
+        return [(self._sensor_ids[code], int(row)) for code, row in zip(codes, rows_to[moved])]
+    
+    def diff(self, from_time, to_time):
+        """
+        {sensor_id: {column: {'from', 'to', 'delta'}}} for the sensors and
+        value columns whose last-known value differs between the two times.
+        """
+        rows_from = self._state_rows(self.to_ms(from_time))
+        rows_to = self._state_rows(self.to_ms(to_time))
+        moved = np.flatnonzero(rows_from != rows_to)
+        before = self._event_values[rows_from[moved]]
+        after = self._event_values[rows_to[moved]]
+        delta = after - before
+        result = {}
+        for k, code in enumerate(self._event_codes[rows_to[moved]]):
+            columns = {column: {'from': float(before[k, c]), 'to': float(after[k, c]), 'delta': float(delta[k, c])}
+                       for c, column in enumerate(VALUE_COLUMNS) if delta[k, c] != 0}
+            if columns:  # 변경 후 원래 값으로 돌아온 센서는 제외
+                result[self._sensor_ids[code]] = columns
+        return result
+    
+    def time_range(self):
+        """(first, last) reading time as datetimes, or None when empty"""
+        if not len(self._event_ms):
+            return None
+        return self.from_ms(self._event_ms[0]), self.from_ms(self._event_ms[-1])
+    
+    def entry(self, position):
+        """CSV-row style dict for one stored row (what _update_rack_attributes reads)"""
+        row = self._event_values[position]
+        entry = {column: float(row[c]) for c, column in enumerate(VALUE_COLUMNS)}
+        entry[SENSOR_DATA_CONFIG["obj_id_column"]] = self._sensor_ids[self._event_codes[position]]
+        entry['normalized_timestamp'] = self.format_ms(self._event_ms[position])
+        return entry
+    
+    def _seek(self, t_ms):
+        state = {}
+        for code, times in enumerate(self._sensor_ms):
+            i = int(np.searchsorted(times, t_ms, side='right')) - 1
+            state[self._sensor_ids[code]] = self.entry(self._sensor_positions[code][max(i, 0)])
+        return state
+    
+    def at(self, time_value):
+        """
+        {sensor_id: entry} of the last reading at or before time_value.
+        
+        Moving forward applies only the readings since the previous call;
+        moving backward or jumping far ahead seeks every sensor. The
+        returned dict is reused between calls.
+        """
+        t_ms = self.to_ms(time_value)
+        if self._cursor_pos >= 0 and t_ms >= self._cursor_ms:
+            # 재생 중 대부분의 프레임은 새 측정값이 없음 - 다음 이벤트 하나만 확인
+            if self._cursor_pos == len(self._event_ms) or self._event_ms[self._cursor_pos] > t_ms:
+                self._cursor_ms = t_ms
+                return self._cursor_state
+        pos = int(np.searchsorted(self._event_ms, t_ms, side='right'))
+        if self._cursor_pos < 0 or pos < self._cursor_pos or pos - self._cursor_pos > 4 * len(self._sensor_ids):
+            self._cursor_state = self._seek(t_ms)
+        else:
+            for i in range(self._cursor_pos, pos):
+                self._cursor_state[self._sensor_ids[self._event_codes[i]]] = self.entry(i)
+        self._cursor_pos = pos
+        self._cursor_ms = t_ms
+        return self._cursor_state
+
+
+class TimestampRows(Mapping):
+    """
+    {normalized timestamp: {sensor_id: entry}} over a SensorTimelineIndex
+    for the exact-match debugging helpers. Nothing is materialized: a
+    lookup parses the key and binary-searches the row times, iteration
+    formats timestamps_ms on the fly.
+    """
+    
+    def __init__(self, index):
+        self._index = index
+    
+    def _key_ms(self, key):
+        if not isinstance(key, str):
+            raise KeyError(key)
+        try:
+            t_ms = SensorTimelineIndex.to_ms(dt.strptime(key, "%Y-%m-%dT%H:%M:%S.%fZ"))
+        except ValueError:
+            raise KeyError(key) from None
+        # 정규화된 키 형식(밀리초 3자리)만 인정 - 다른 표기는 dict와 마찬가지로 없는 키
+        if SensorTimelineIndex.format_ms(t_ms) != key:
+            raise KeyError(key)
+        return t_ms
+    
+    def __getitem__(self, key):
+        rows = self._index.rows_at_ms(self._key_ms(key))
+        if not rows:
+            raise KeyError(key)
+        return rows
+    
+    def __contains__(self, key):
+        try:
+            t_ms = self._key_ms(key)
+        except KeyError:
+            return False
+        timestamps = self._index.timestamps_ms
+        i = int(np.searchsorted(timestamps, t_ms, side='left'))
+        return i < len(timestamps) and timestamps[i] == t_ms
+    
+    def __iter__(self):
+        for t_ms in self._index.timestamps_ms:
+            yield SensorTimelineIndex.format_ms(t_ms)
+    
+    def __len__(self):
+        return len(self._index.timestamps_ms)
@@ -1,10 +1,12 @@
 import omni.ext
 import omni.ui as ui
+import omni.usd
 from pxr import Usd, UsdGeom, Sdf
 import datetime
 
 # 추가 모듈 임포트
 from .window import TimeWindowUI
+from .config import CONTROLLER_CONFIG
 from .controller import TimeController
 from .performance_monitor import PerformanceMonitorWindow
 
@@ -16,7 +18,7 @@ class NetaiTimetravelDemoExtension(omni.ext.IExt):
         print("[netai.timetravel.demo] Time Travel Demo 시작")
         
         # 시간 컨트롤러 초기화
-        self._time_controller = TimeController()
+        self._time_controller = self._create_controller(CONTROLLER_CONFIG["backend"])
         
         # UI 윈도우 생성
         self._window = TimeWindowUI(self._time_controller)
@@ -32,6 +34,20 @@ class NetaiTimetravelDemoExtension(omni.ext.IExt):
             self._on_update, name="time_travel_update"
         )
     
+    def _create_controller(self, backend):
+        """CSV TimeController, or the parquet OptimizedTimeController loading its default range in the background"""
+        if backend == "csv":
+            return TimeController()
+        if backend == "parquet":
+            from .developing.optimized_controller import OptimizedTimeController
+            
+            controller = OptimizedTimeController()
+            controller.set_stage(omni.usd.get_context().get_stage())
+            # 로딩된 앞부분부터 바로 재생/스크럽 가능 (슬라이더 아래 띠에 로딩된 구간 표시)
+            controller.set_time_range(controller.get_start_time(), controller.get_end_time())
+            return controller
+        raise ValueError(f"Unknown controller backend: {backend} (expected 'csv' or 'parquet')")
+    
     def _add_performance_monitor_menu(self):
         """성능 모니터 메뉴 추가"""
         try:
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+"""
+Ingest stage: collapse raw sensor readings to one row per (sensor, time bucket)
+"""
+from typing import Tuple
+
+import numpy as np
+
+# 버킷 안 여러 측정값을 하나로 합치는 방식
+REDUCERS = ('last', 'mean', 'max')
+
+
+def bucket_readings(times_ms: np.ndarray, sensor_codes: np.ndarray, values: np.ndarray,
+                    bucket_ms: int = 1, reducer: str = 'last') -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Reduce readings that share a sensor and a bucket_ms-wide time bucket.
+
+    times_ms (int64 [n]), sensor_codes (int [n]) and values (float [n, C])
+    may be in any order. Within a bucket 'last' keeps the latest reading
+    (file order breaks ties), 'mean' and 'max' reduce every channel.
+    Each output row is stamped with the time of the bucket's latest reading,
+    so playback never shows a value before it was measured. Returns
+    (times_ms, sensor_codes, values) sorted by time, then sensor.
+    """
+    if reducer not in REDUCERS:
+        raise ValueError(f"Unknown reducer: {reducer} (expected one of {REDUCERS})")
+    if bucket_ms < 1:
+        raise ValueError(f"bucket_ms must be >= 1, got {bucket_ms}")
+
+    times_ms = np.asarray(times_ms, dtype=np.int64)
+    sensor_codes = np.asarray(sensor_codes)
+    values = np.asarray(values, dtype=np.float32)
+    n = len(times_ms)
+    if n == 0:
+        return times_ms, sensor_codes, values.reshape(0, values.shape[1] if values.ndim == 2 else 0)
+
+    buckets = times_ms // bucket_ms
+    # 버킷 -> 센서 -> 시각 -> 파일 순서로 정렬하면 그룹의 마지막 행이 최신 측정값
+    order = np.lexsort((np.arange(n), times_ms, sensor_codes, buckets))
+    buckets = buckets[order]
+    codes = sensor_codes[order]
+    times = times_ms[order]
+    values = values[order]
+
+    boundary = np.empty(n, dtype=bool)
+    boundary[0] = True
+    boundary[1:] = (buckets[1:] != buckets[:-1]) | (codes[1:] != codes[:-1])
+    starts = np.flatnonzero(boundary)
+    lasts = np.append(starts[1:], n) - 1
+
+    if reducer == 'last':
+        reduced = values[lasts]
+    elif reducer == 'mean':
+        counts = np.diff(np.append(starts, n))
+        reduced = (np.add.reduceat(values.astype(np.float64), starts, axis=0) / counts[:, None]).astype(np.float32)
+    else:
+        reduced = np.maximum.reduceat(values, starts, axis=0)
+
+    # 같은 버킷 안에서 센서마다 마지막 측정 시각이 다르므로 시각 기준으로 다시 정렬
+    out_times = times[lasts]
+    out_codes = codes[starts]
+    resort = np.lexsort((out_codes, out_times))
+    return out_times[resort], out_codes[resort], reduced[resort]
@@ -0,0 +1,269 @@
+# -*- coding: utf-8 -*-
+"""
+Log-bucketed (HDR-style) latency histograms for Go To, scrub, frame and load times
+"""
+import json
+import math
+import threading
+import time
+
+from .tracing import FRAME, GOTO, LOAD_RANGE, LOAD_TILE, SCRUB, tracer
+
+DEFAULT_PERCENTILES = (50.0, 90.0, 99.0, 99.9)
+
+
+class LatencyHistogram:
+    """
+    Millisecond latencies counted in log-linear buckets of integer
+    microseconds, like HdrHistogram.
+
+    Values below 2**significant_bits us get a bucket each; above that
+    every power-of-two range is split into 2**(significant_bits - 1)
+    equal buckets, so a bucket is never wider than 2**(1 - significant_bits)
+    of its values (about 1.6% with the default 7 bits). record() is a
+    bit_length, a shift and a list increment; values above highest_ms
+    are counted in the last bucket (min, max and the mean stay exact).
+    Histograms with the same layout merge by adding counts, and
+    to_dict()/from_dict() round-trip them through JSON. Every read and
+    write holds the histogram's lock, since loader threads record into
+    the same histogram the UI reads.
+    """
+
+    def __init__(self, highest_ms=3_600_000.0, significant_bits=7):
+        if not 2 <= significant_bits <= 16:
+            raise ValueError(f"significant_bits must be in [2, 16], got {significant_bits}")
+        if highest_ms <= 0:
+            raise ValueError(f"highest_ms must be > 0, got {highest_ms}")
+        self.highest_ms = float(highest_ms)
+        self.significant_bits = int(significant_bits)
+        self._sub_count = 1 << self.significant_bits
+        self._half_count = self._sub_count >> 1
+        self._highest_us = max(int(self.highest_ms * 1000), 1)
+        self._lock = threading.RLock()
+        self._counts = [0] * (self._index(self._highest_us) + 1)
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self._counts = [0] * len(self._counts)
+            self.count = 0
+            self.total_ms = 0.0
+            self.min_ms = math.inf
+            self.max_ms = -math.inf
+            self.overflow = 0
+
+    # ---------------------------------------------------------------- 버킷
+    def _index(self, value_us):
+        if value_us < self._sub_count:
+            return value_us
+        shift = value_us.bit_length() - self.significant_bits
+        return self._sub_count + (shift - 1) * self._half_count + (value_us >> shift) - self._half_count
+
+    def _bucket_bounds(self, index):
+        """[low, high) of a bucket in microseconds"""
+        if index < self._sub_count:
+            return index, index + 1
+        shift, offset = divmod(index - self._sub_count, self._half_count)
+        shift += 1
+        low = (offset + self._half_count) << shift
+        return low, low + (1 << shift)
+
+    # ---------------------------------------------------------------- 기록
+    def record(self, value_ms):
+        """Count one latency (milliseconds; negative values count as 0)"""
+        if value_ms < 0:
+            value_ms = 0.0
+        value_us = int(value_ms * 1000)
+        overflow = value_us > self._highest_us
+        if overflow:
+            value_us = self._highest_us
+        index = self._index(value_us)
+        with self._lock:
+            self.overflow += overflow
+            self._counts[index] += 1
+            self.count += 1
+            self.total_ms += value_ms
+            if value_ms < self.min_ms:
+                self.min_ms = value_ms
+            if value_ms > self.max_ms:
+                self.max_ms = value_ms
+
+    def _check_layout(self, other):
+        if (other.highest_ms, other.significant_bits) != (self.highest_ms, self.significant_bits):
+            raise ValueError(f"Histogram layouts differ: ({self.highest_ms}, {self.significant_bits}) vs "
+                             f"({other.highest_ms}, {other.significant_bits})")
+
+    def merge(self, other):
+        """Add another histogram with the same layout into this one"""
+        self._check_layout(other)
+        # 상대의 일관된 상태를 먼저 떠 두고 내 락만 잡음 - 두 락을 겹쳐 잡지 않아 교착 없음
+        with other._lock:
+            other_counts = [(index, count) for index, count in enumerate(other._counts) if count]
+            other_state = (other.count, other.total_ms, other.min_ms, other.max_ms, other.overflow)
+        count, total_ms, min_ms, max_ms, overflow = other_state
+        with self._lock:
+            counts = self._counts
+            for index, bucket_count in other_counts:
+                counts[index] += bucket_count
+            self.count += count
+            self.total_ms += total_ms
+            self.min_ms = min(self.min_ms, min_ms)
+            self.max_ms = max(self.max_ms, max_ms)
+            self.overflow += overflow
+        return self
+
+    def copy(self):
+        snapshot = LatencyHistogram(self.highest_ms, self.significant_bits)
+        return snapshot.merge(self)
+
+    # ---------------------------------------------------------------- 조회
+    @property
+    def mean_ms(self):
+        with self._lock:
+            return self.total_ms / self.count if self.count else 0.0
+
+    def percentiles(self, percentiles=DEFAULT_PERCENTILES):
+        """
+        {percentile: ms} in one pass over the buckets. A value is the
+        midpoint of the bucket holding that rank, clamped to the exact
+        min/max; 0.0 for every percentile while empty.
+        """
+        for p in percentiles:
+            if not 0.0 <= p <= 100.0:
+                raise ValueError(f"percentile must be in [0, 100], got {p}")
+        result = {p: 0.0 for p in percentiles}
+        with self._lock:
+            if not self.count:
+                return result
+            # 각 백분위의 순위 (1부터) - 정렬해서 누적 합을 한 번만 훑음
+            targets = sorted((max(1, math.ceil(p / 100.0 * self.count)), p) for p in percentiles)
+            position = 0
+            seen = 0
+            for index, count in enumerate(self._counts):
+                if not count:
+                    continue
+                seen += count
+                while position < len(targets) and targets[position][0] <= seen:
+                    low, high = self._bucket_bounds(index)
+                    value = (low + high) / 2000.0
+                    result[targets[position][1]] = min(max(value, self.min_ms), self.max_ms)
+                    position += 1
+                if position == len(targets):
+                    break
+            return result
+
+    def percentile(self, p):
+        return self.percentiles((p,))[p]
+
+    def summary(self, percentiles=DEFAULT_PERCENTILES):
+        """count/min/mean/max and the percentiles, keyed like 'p99.9'"""
+        with self._lock:
+            summary = {
+                'count': self.count,
+                'min_ms': self.min_ms if self.count else 0.0,
+                'mean_ms': self.mean_ms,
+                'max_ms': self.max_ms if self.count else 0.0,
+            }
+            for p, value in self.percentiles(percentiles).items():
+                summary[f"p{p:g}"] = value
+        return summary
+
+    # ---------------------------------------------------------------- 직렬화
+    def to_dict(self):
+        """JSON-ready snapshot: the layout, the summary and the non-empty buckets as [index, count]"""
+        with self._lock:
+            return {
+                'highest_ms': self.highest_ms,
+                'significant_bits': self.significant_bits,
+                'summary': self.summary(),
+                'total_ms': self.total_ms,
+                'overflow': self.overflow,
+                'buckets': [[index, count] for index, count in enumerate(self._counts) if count],
+            }
+
+    @classmethod
+    def from_dict(cls, data):
+        histogram = cls(data['highest_ms'], data['significant_bits'])
+        for index, count in data['buckets']:
+            histogram._counts[index] += count
+        summary = data['summary']
+        histogram.count = summary['count']
+        histogram.total_ms = data['total_ms']
+        histogram.overflow = data.get('overflow', 0)
+        if histogram.count:
+            histogram.min_ms = summary['min_ms']
+            histogram.max_ms = summary['max_ms']
+        return histogram
+
+
+class LatencyTracker:
+    """
+    Per-interaction LatencyHistograms fed by tracer spans:
+    'goto' (Go button), 'scrub' (time slider), 'frame' (one playback
+    frame: advance + apply) and 'load' (range / tile loads on the loader
+    threads). Recording only runs while started (it subscribes to the
+    tracer). Spans are recorded on the thread that finished them: 'load'
+    gets LOAD_TILE from the tile loader pool and LOAD_RANGE from the
+    range loader at the same time, so each histogram locks its own
+    record/merge/copy.
+    """
+
+    SPAN_HISTOGRAMS = {GOTO: 'goto', SCRUB: 'scrub', FRAME: 'frame', LOAD_RANGE: 'load', LOAD_TILE: 'load'}
+
+    def __init__(self, source=None, highest_ms=3_600_000.0, significant_bits=7):
+        self._tracer = source if source is not None else tracer
+        self.histograms = {name: LatencyHistogram(highest_ms, significant_bits)
+                           for name in dict.fromkeys(self.SPAN_HISTOGRAMS.values())}
+        self.active = False
+
+    def start(self):
+        if not self.active:
+            self.active = True
+            self._tracer.subscribe(self._on_span)
+        return self
+
+    def stop(self):
+        if self.active:
+            self.active = False
+            self._tracer.unsubscribe(self._on_span)
+
+    def _on_span(self, span):
+        name = self.SPAN_HISTOGRAMS.get(span.name)
+        if name is not None:
+            self.histograms[name].record(span.duration_ms)
+
+    def reset(self):
+        for histogram in self.histograms.values():
+            histogram.reset()
+
+    def snapshot(self):
+        """{name: LatencyHistogram copy} - safe to merge / export while recording continues"""
+        return {name: histogram.copy() for name, histogram in self.histograms.items()}
+
+    def merge(self, other):
+        for name, histogram in other.histograms.items():
+            self.histograms[name].merge(histogram)
+        return self
+
+    def summary(self):
+        return {name: histogram.summary() for name, histogram in self.histograms.items()}
+
+    def to_dict(self):
+        return {
+            'created': time.strftime("%Y-%m-%dT%H:%M:%S"),
+            'histograms': {name: histogram.to_dict() for name, histogram in self.snapshot().items()},
+        }
+
+    def export(self, path):
+        """Write to_dict() as JSON; returns the total number of recorded latencies"""
+        data = self.to_dict()
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2)
+        return sum(histogram['summary']['count'] for histogram in data['histograms'].values())
+
+
+def load_histograms(path):
+    """{name: LatencyHistogram} from a file written by LatencyTracker.export"""
+    with open(path, encoding='utf-8') as f:
+        data = json.load(f)
+    return {name: LatencyHistogram.from_dict(histogram) for name, histogram in data['histograms'].items()}
@@ -1,24 +1,39 @@
 # -*- coding: utf-8 -*-
 import omni.ui as ui
+import os
+import tempfile
 import time
-import statistics
 from collections import deque
 
+from .latency import LatencyTracker
+from .ringlog import logger
+from .tracing import ADVANCE, FRAME, GOTO, SCRUB, UI_REFRESH, TraceRecorder, tracer
+
 class PerformanceMonitorWindow:
-    """Go To 성능 측정 전용 윈도우"""
+    """Go To 성능 측정 전용 윈도우 (컨트롤러 파이프라인 트레이스 스팬 구독)"""
+    
+    # 재생 중 매 프레임 나오는 스팬 - Go To 구간 분해에 쓰지 않음
+    _IGNORED_SPANS = (FRAME, ADVANCE, UI_REFRESH)
+    DEFAULT_TRACE_SECONDS = 10
+    # 백분위 표 갱신 간격 (재생/스크럽 중 프레임마다 다시 그리지 않음)
+    PERCENTILE_REFRESH_NS = 500_000_000
     
-    def __init__(self, controller, time_window=None):
+    def __init__(self, controller):
         """성능 모니터 윈도우 초기화"""
         self._controller = controller
-        self._time_window = time_window
         self._is_monitoring = False
         
         # Go To 측정 데이터
         self._goto_measurements = deque(maxlen=100)
+        # Go To 안쪽 구간 분해용 최근 하위 스팬 (seek/diff/usd_apply/colormap ...)
+        self._child_spans = deque(maxlen=512)
         
-        # 측정 상태
-        self._measuring = False
-        self._measurement_start_time = None
+        # Go To / 스크럽 / 프레임 / 로딩 지연 히스토그램 (모니터링 중에만 기록)
+        self._latency = LatencyTracker()
+        self._next_percentile_refresh_ns = 0
+        
+        # 프레임 파이프라인 트레이스 기록 (Chrome trace-event JSON 내보내기)
+        self._trace_recorder = TraceRecorder()
         
         # 윈도우 생성
         self._window = ui.Window("Go To Performance Monitor", width=600, height=600)
@@ -26,77 +41,7 @@ class PerformanceMonitorWindow:
         
         # 초기 로그
         self._add_log("Go To Performance Monitor initialized.")
-        self._add_log("Measuring: Go button click → Time Window rack data change")
-        
-        # Time Window 찾기 시도
-        self._find_time_window()
-    
-    def _find_time_window(self):
-        """Time Window 인스턴스 찾기 - controller를 통한 역추적"""
-        if self._time_window:
-            self._add_log("Time Window already provided")
-            self._time_window_status.text = "Provided"
-            return
-        
-        try:
-            # 방법 1: UI 윈도우 매니저를 통해 찾기
-            import omni.ui as ui
-            
-            # 모든 윈도우 검색
-            found_windows = []
-            try:
-                # 현재 열린 모든 UI 윈도우 검색
-                for i in range(1000):  # 임의의 큰 수로 검색
-                    try:
-                        window = ui.Window.get_window(f"Time Travel")
-                        if window:
-                            found_windows.append(window)
-                            break
-                    except:
-                        continue
-            except:
-                pass
-            
-            # 방법 2: 전역 객체 검색
-            # Python의 gc 모듈을 사용해서 TimeWindowUI 인스턴스 찾기
-            import gc
-            for obj in gc.get_objects():
-                if hasattr(obj, '__class__') and obj.__class__.__name__ == 'TimeWindowUI':
-                    # 같은 controller를 사용하는 TimeWindowUI 찾기
-                    if hasattr(obj, '_controller') and obj._controller is self._controller:
-                        self._time_window = obj
-                        self._add_log("Time Window found via garbage collection!")
-                        self._time_window_status.text = "Found (GC)"
-                        return
-            
-            # 방법 3: 모듈 검색
-            import sys
-            for module_name, module in sys.modules.items():
-                if 'timetravel' in module_name.lower() or 'window' in module_name.lower():
-                    for attr_name in dir(module):
-                        attr = getattr(module, attr_name, None)
-                        if (hasattr(attr, '__class__') and 
-                            attr.__class__.__name__ == 'TimeWindowUI' and
-                            hasattr(attr, '_controller') and 
-                            attr._controller is self._controller):
-                            self._time_window = attr
-                            self._add_log("Time Window found via module search!")
-                            self._time_window_status.text = "Found (Module)"
-                            return
-            
-            self._add_log("Time Window not found - will use alternative hooks")
-            self._time_window_status.text = "Not Found"
-            
-        except Exception as e:
-            self._add_log(f"Time Window search error: {e}")
-            self._time_window_status.text = "Search Error"
-    
-    def set_time_window(self, time_window):
-        """Time Window 인스턴스 설정 (나중에 호출 가능)"""
-        self._time_window = time_window
-        self._add_log("Time Window instance set externally")
-        if self._is_monitoring:
-            self._setup_event_hooks()
+        self._add_log("Measuring: Go button click → rack data applied and shown ('goto' span)")
     
     def _add_log(self, message):
         """로그 추가"""
@@ -118,7 +63,7 @@ class PerformanceMonitorWindow:
             with ui.VStack(spacing=10):
                 # 제목
                 ui.Label("Go To Performance Monitor", style={"font_size": 18})
-                ui.Label("Measures: Go Click → Time Window Data Change", style={"font_size": 12, "color": 0xFF888888})
+                ui.Label("Measures: Go Click → Rack Data Applied (trace spans)", style={"font_size": 12, "color": 0xFF888888})
                 ui.Separator()
                 
                 # 제어 버튼
@@ -129,28 +74,40 @@ class PerformanceMonitorWindow:
                     ui.Spacer(width=10)
                     self._clear_button = ui.Button("Clear Data", width=100)
                     self._clear_button.set_clicked_fn(self._clear_measurements)
+
+                
+                # 컨트롤러 로그 링 버퍼
+                with ui.HStack(height=30):
+                    self._dump_log_button = ui.Button("Dump Log", width=100)
+                    self._dump_log_button.set_clicked_fn(self._dump_log)
+                    
+                    ui.Spacer(width=10)
+                    self._debug_log_button = ui.Button("Debug Log: Off", width=120)
+                    self._debug_log_button.set_clicked_fn(self._toggle_debug_log)
+                
+                # 트레이스 기록 (N초) / 내보내기
+                with ui.HStack(height=30):
+                    ui.Label("Trace (s):", width=60)
+                    self._trace_seconds_field = ui.IntField(width=50)
+                    self._trace_seconds_field.model.set_value(self.DEFAULT_TRACE_SECONDS)
                     
                     ui.Spacer(width=10)
-                    self._find_window_button = ui.Button("Find Time Window", width=120)
-                    self._find_window_button.set_clicked_fn(self._manual_find_time_window)
+                    self._record_trace_button = ui.Button("Record Trace", width=100)
+                    self._record_trace_button.set_clicked_fn(self._start_trace)
+                    
+                    ui.Spacer(width=10)
+                    self._export_trace_button = ui.Button("Export Trace", width=100)
+                    self._export_trace_button.set_clicked_fn(self._export_trace)
                 
                 # 현재 상태
                 ui.Separator()
-                with ui.HStack(height=25):
-                    ui.Label("Time Window:", width=100, style={"font_size": 12, "color": 0xFFFFFF00})
-                    self._time_window_status = ui.Label("Not Found", width=100, style={"font_size": 12})
-                
                 with ui.HStack(height=25):
                     ui.Label("Status:", width=100, style={"font_size": 12, "color": 0xFFFFFF00})
                     self._status_label = ui.Label("Ready", width=150, style={"font_size": 12})
                 
                 with ui.HStack(height=25):
-                    ui.Label("Measuring:", width=100, style={"font_size": 12, "color": 0xFFFFFF00})
-                    self._measuring_label = ui.Label("No", width=100, style={"font_size": 12})
-                
-                with ui.HStack(height=25):
-                    ui.Label("Hooks Active:", width=100, style={"font_size": 12, "color": 0xFFFFFF00})
-                    self._hooks_label = ui.Label("None", width=300, style={"font_size": 10})
+                    ui.Label("Tracing:", width=100, style={"font_size": 12, "color": 0xFFFFFF00})
+                    self._tracing_label = ui.Label("Off", width=300, style={"font_size": 10})
                 
                 ui.Separator()
                 
@@ -175,8 +132,29 @@ class PerformanceMonitorWindow:
                     ui.Label("Last:", width=100)
                     self._last_label = ui.Label("0.00 ms", width=80)
                     ui.Spacer(width=20)
-                    ui.Label("Std Dev:", width=60)
-                    self._std_label = ui.Label("0.00 ms", width=80)
+                    ui.Label("P99:", width=60)
+                    self._p99_label = ui.Label("0.00 ms", width=80)
+                
+                with ui.HStack(height=25):
+                    ui.Label("Breakdown:", width=100)
+                    self._breakdown_label = ui.Label("-", style={"font_size": 10})
+                
+                ui.Separator()
+                
+                # 지연 히스토그램 백분위 (log 버킷)
+                with ui.HStack(height=25):
+                    ui.Label("Latency Percentiles (ms):", style={"font_size": 14, "color": 0xFFFFFF00})
+                    self._export_histograms_button = ui.Button("Export Histograms", width=130)
+                    self._export_histograms_button.set_clicked_fn(self._export_histograms)
+                with ui.HStack(height=20):
+                    for title, width in (("", 60), ("count", 60), ("p50", 70), ("p90", 70), ("p99", 70), ("p99.9", 70), ("max", 70)):
+                        ui.Label(title, width=width, style={"font_size": 11, "color": 0xFF888888})
+                self._percentile_labels = {}
+                for name in self._latency.histograms:
+                    with ui.HStack(height=20):
+                        ui.Label(name, width=60, style={"font_size": 11})
+                        self._percentile_labels[name] = [ui.Label("-", width=60 if i == 0 else 70, style={"font_size": 11})
+                                                         for i in range(6)]
                 
                 ui.Separator()
                 
@@ -185,344 +163,167 @@ class PerformanceMonitorWindow:
                 with ui.ScrollingFrame(height=200):
                     self._log_layout = ui.VStack()
     
-    def _setup_alternative_hooks(self):
-        """Time Window가 없을 때 대안 후킹 시스템"""
-        hooks_active = []
-        
-        # 1. Controller의 set_current_time 직접 후킹 (Go 버튼 대신)
-        if self._setup_set_current_time_hook():
-            hooks_active.append("set_current_time")
-        
-        # 2. Controller의 _update_all_racks 후킹 (데이터 변화 감지)
-        if self._setup_rack_update_hook():
-            hooks_active.append("Rack Update")
-        
-        # 3. Controller의 _update_stage_time 후킹
-        if self._setup_controller_hook():
-            hooks_active.append("Stage Update")
-        
-        return hooks_active
+    def _dump_log(self):
+        """링 버퍼 로그를 파일로 저장하고 마지막 몇 줄을 표시"""
+        try:
+            path = os.path.join(tempfile.gettempdir(), f"timetravel_log_{time.strftime('%Y%m%d_%H%M%S')}.txt")
+            count = logger.dump_to_file(path)
+            stats = logger.get_stats()
+            self._add_log(f"Log dumped: {count} lines ({stats['dropped']} dropped) -> {path}")
+            for line in logger.dump(limit=10):
+                self._add_log(line)
+        except Exception as e:
+            self._add_log(f"Log dump error: {e}")
     
-    def _setup_set_current_time_hook(self):
-        """Controller의 set_current_time 메서드 후킹 (Go 버튼 대신)"""
+    def _toggle_debug_log(self):
+        """DEBUG 레벨 기록 on/off (콘솔 출력 레벨은 그대로)"""
+        if logger.debug_enabled:
+            logger.set_level("INFO")
+            self._debug_log_button.text = "Debug Log: Off"
+        else:
+            logger.set_level("DEBUG")
+            self._debug_log_button.text = "Debug Log: On"
+        self._add_log(f"Log level: {logger.get_stats()['level']}")
+    
+    def _start_trace(self):
+        """N초 동안 모든 스팬 기록 시작 (기존 기록은 버림)"""
         try:
-            if hasattr(self._controller, 'set_current_time'):
-                if not hasattr(self, '_original_set_current_time'):
-                    self._original_set_current_time = self._controller.set_current_time
-                
-                def hooked_set_current_time(current_time):
-                    if self._is_monitoring:
-                        self._on_go_equivalent_event()
-                    
-                    return self._original_set_current_time(current_time)
-                
-                self._controller.set_current_time = hooked_set_current_time
-                self._add_log("Controller set_current_time hooked (Go equivalent)")
-                return True
-            else:
-                self._add_log("Controller set_current_time method not found")
-                return False
+            seconds = self._trace_seconds_field.model.get_value_as_int()
+            self._trace_recorder.start(seconds if seconds and seconds > 0 else None)
+            self._add_log(f"Trace recording started ({seconds or 'until export'} s, "
+                          f"max {self._trace_recorder.capacity} spans)")
         except Exception as e:
-            self._add_log(f"set_current_time hook error: {e}")
-            return False
+            self._add_log(f"Trace start error: {e}")
     
-    def _on_go_equivalent_event(self):
-        """Go 버튼과 동등한 이벤트 (set_current_time 호출)"""
-        self._measurement_start_time = time.time()
-        self._measuring = True
-        self._measuring_label.text = "Yes"
-        
-        self._add_log("=== SET_CURRENT_TIME CALLED (Go equivalent) ===")
-        self._add_log("Measurement started - waiting for data change event...")
+    def _export_trace(self):
+        """기록 중이면 멈추고 chrome://tracing / Perfetto용 JSON으로 저장"""
+        try:
+            self._trace_recorder.stop()
+            path = os.path.join(tempfile.gettempdir(), f"timetravel_trace_{time.strftime('%Y%m%d_%H%M%S')}.json")
+            count = self._trace_recorder.export(path)
+            stats = self._trace_recorder.get_stats()
+            self._add_log(f"Trace exported: {count} spans over {stats['seconds']:.1f}s, "
+                          f"{stats['threads']} threads ({stats['dropped']} dropped) -> {path}")
+            return path
+        except Exception as e:
+            self._add_log(f"Trace export error: {e}")
     
     def _toggle_monitoring(self):
-        """모니터링 on/off"""
+        """모니터링 on/off - 트레이서 구독/해제"""
         self._is_monitoring = not self._is_monitoring
         
         if self._is_monitoring:
+            # 히스토그램이 먼저 구독 - goto 스팬 처리 시 이미 기록되어 있음
+            self._latency.start()
+            tracer.subscribe(self._on_span)
             self._monitor_button.text = "Stop Monitoring"
             self._status_label.text = "Monitoring Active"
             self._add_log("=== MONITORING STARTED ===")
-            self._setup_event_hooks()
         else:
+            tracer.unsubscribe(self._on_span)
+            self._latency.stop()
+            self._child_spans.clear()
             self._monitor_button.text = "Start Monitoring"
             self._status_label.text = "Monitoring Stopped"
-            self._measuring_label.text = "No"
             self._add_log("=== MONITORING STOPPED ===")
-            self._remove_event_hooks()
-            
-            # 진행 중인 측정 중지
-            if self._measuring:
-                self._measuring = False
-                self._measurement_start_time = None
-    
-    def _setup_event_hooks(self):
-        """이벤트 후킹 설정"""
-        hooks_active = []
-        
-        # Time Window가 있는 경우 - 직접 후킹
-        if self._time_window:
-            if self._setup_go_button_hook():
-                hooks_active.append("Go Button")
-            if self._setup_data_update_hook():
-                hooks_active.append("Time Window Update")
-            self._add_log("Using direct Time Window hooks")
-        else:
-            # Time Window가 없는 경우 - 대안 후킹
-            self._add_log("Time Window not available - using alternative hooks")
-            alt_hooks = self._setup_alternative_hooks()
-            hooks_active.extend(alt_hooks)
-        
-        # 공통 후킹 (항상 설정)
-        if self._setup_controller_hook():
-            hooks_active.append("Controller Update")
-        
-        if self._setup_rack_update_hook():
-            hooks_active.append("Rack Update")
-        
-        self._hooks_label.text = ", ".join(hooks_active) if hooks_active else "None"
-        self._add_log(f"Active hooks: {', '.join(hooks_active)}")
-        
-        if not hooks_active:
-            self._add_log("WARNING: No hooks active! Monitoring may not work.")
-        else:
-            self._add_log("SUCCESS: Hooks are active and ready!")
+        self._tracing_label.text = f"On ({tracer.subscriber_count()} subscribers)" if tracer.enabled else "Off"
     
-    def _manual_find_time_window(self):
-        """수동으로 Time Window 찾기"""
-        self._find_time_window()
-        
-        # 찾았으면 다시 후킹 설정
-        if self._time_window and self._is_monitoring:
-            self._add_log("Re-setting up hooks with found Time Window...")
-            self._remove_event_hooks()
-            self._setup_event_hooks()
-    
-    def _setup_go_button_hook(self):
-        """Go 버튼 후킹"""
-        try:
-            if self._time_window and hasattr(self._time_window, '_goto_button'):
-                button = self._time_window._goto_button
-                
-                if not hasattr(self, '_original_goto_callback'):
-                    self._original_goto_callback = self._time_window._on_goto_clicked
-                
-                def hooked_goto_callback():
-                    if self._is_monitoring:
-                        self._on_go_button_clicked()
-                    
-                    try:
-                        return self._original_goto_callback()
-                    except Exception as e:
-                        self._add_log(f"Go button callback error: {e}")
-                        raise
-                
-                button.set_clicked_fn(hooked_goto_callback)
-                self._add_log("Go button hooked successfully")
-                self._time_window_status.text = "Found & Hooked"
-                return True
-            else:
-                self._add_log("ERROR: Go button not found!")
-                return False
-        except Exception as e:
-            self._add_log(f"Go button hooking error: {e}")
-            return False
-    
-    def _setup_data_update_hook(self):
-        """Time Window 데이터 업데이트 메서드 후킹"""
-        try:
-            if self._time_window and hasattr(self._time_window, '_update_selected_rack_data'):
-                if not hasattr(self, '_original_update_rack_data'):
-                    self._original_update_rack_data = self._time_window._update_selected_rack_data
-                
-                def hooked_update_rack_data():
-                    result = self._original_update_rack_data()
-                    
-                    if self._is_monitoring and self._measuring:
-                        self._on_time_window_data_update()
-                    
-                    return result
-                
-                self._time_window._update_selected_rack_data = hooked_update_rack_data
-                self._add_log("Time Window data update method hooked")
-                return True
-            else:
-                self._add_log("Time Window data update method not found")
-                return False
-        except Exception as e:
-            self._add_log(f"Data update hook error: {e}")
-            return False
-    
-    def _setup_controller_hook(self):
-        """Controller 업데이트 메서드 후킹"""
-        try:
-            if hasattr(self._controller, '_update_stage_time'):
-                if not hasattr(self, '_original_update_stage_time'):
-                    self._original_update_stage_time = self._controller._update_stage_time
-                
-                def hooked_update_stage_time():
-                    result = self._original_update_stage_time()
-                    
-                    if self._is_monitoring and self._measuring:
-                        self._on_controller_update_event()
-                    
-                    return result
-                
-                self._controller._update_stage_time = hooked_update_stage_time
-                self._add_log("Controller _update_stage_time hooked")
-                return True
-            else:
-                self._add_log("Controller _update_stage_time method not found")
-                return False
-        except Exception as e:
-            self._add_log(f"Controller hook error: {e}")
-            return False
-    
-    def _setup_rack_update_hook(self):
-        """Controller의 랙 업데이트 메서드 후킹"""
-        try:
-            if hasattr(self._controller, '_update_all_racks'):
-                if not hasattr(self, '_original_update_all_racks'):
-                    self._original_update_all_racks = self._controller._update_all_racks
-                
-                def hooked_update_all_racks():
-                    result = self._original_update_all_racks()
-                    
-                    if self._is_monitoring and self._measuring:
-                        self._on_rack_update_event()
-                    
-                    return result
-                
-                self._controller._update_all_racks = hooked_update_all_racks
-                self._add_log("Controller _update_all_racks hooked")
-                return True
-            else:
-                self._add_log("Controller _update_all_racks method not found")
-                return False
-        except Exception as e:
-            self._add_log(f"Rack update hook error: {e}")
-            return False
+    def _on_span(self, span):
+        """트레이서 콜백 - 스팬을 끝낸 스레드에서 호출됨 (자식 스팬이 부모보다 먼저 옴)"""
+        if span.name == GOTO:
+            self._complete_measurement(span)
+        elif span.name not in self._IGNORED_SPANS:
+            self._child_spans.append(span)
+        # 프레임/스크럽은 메인 스레드 - 일정 간격으로만 백분위 표 갱신
+        if span.name in (FRAME, SCRUB) and span.end_ns >= self._next_percentile_refresh_ns:
+            self._next_percentile_refresh_ns = span.end_ns + self.PERCENTILE_REFRESH_NS
+            self._update_percentiles()
     
-    def _remove_event_hooks(self):
-        """이벤트 후킹 해제"""
-        try:
-            # Go 버튼 후킹 해제
-            if hasattr(self, '_original_goto_callback') and self._time_window:
-                self._time_window._goto_button.set_clicked_fn(self._original_goto_callback)
-            
-            # Time Window 데이터 업데이트 후킹 해제
-            if hasattr(self, '_original_update_rack_data') and self._time_window:
-                self._time_window._update_selected_rack_data = self._original_update_rack_data
-            
-            # Controller 후킹 해제
-            if hasattr(self, '_original_update_stage_time'):
-                self._controller._update_stage_time = self._original_update_stage_time
-            
-            # Rack 업데이트 후킹 해제
-            if hasattr(self, '_original_update_all_racks'):
-                self._controller._update_all_racks = self._original_update_all_racks
-            
-            # set_current_time 후킹 해제
-            if hasattr(self, '_original_set_current_time'):
-                self._controller.set_current_time = self._original_set_current_time
-            
-            self._hooks_label.text = "None"
-            self._add_log("All hooks removed")
-        except Exception as e:
-            self._add_log(f"Hook removal error: {e}")
+    def _breakdown(self, goto_span):
+        """Go To 스팬 안에서 같은 스레드가 끝낸 하위 스팬의 이름별 합계 (ms)"""
+        totals = {}
+        for span in list(self._child_spans):  # 다른 스레드가 추가 중일 수 있음
+            if span.thread_id == goto_span.thread_id and span.start_ns >= goto_span.start_ns \
+                    and span.end_ns <= goto_span.end_ns:
+                totals[span.name] = totals.get(span.name, 0.0) + span.duration_ms
+        self._child_spans.clear()
+        return totals
     
-    def _on_go_button_clicked(self):
-        """Go 버튼 클릭 이벤트"""
-        self._measurement_start_time = time.time()
-        self._measuring = True
-        self._measuring_label.text = "Yes"
-        
-        self._add_log("=== GO BUTTON CLICKED ===")
-        self._add_log("Measurement started - waiting for data change event...")
-    
-    def _on_time_window_data_update(self):
-        """Time Window 데이터 업데이트 이벤트"""
-        if not self._measuring or not self._measurement_start_time:
-            return
-        
-        end_time = time.time()
-        delay = (end_time - self._measurement_start_time) * 1000  # ms
-        
-        self._complete_measurement(delay, "Time Window Data Update")
-    
-    def _on_controller_update_event(self):
-        """Controller 업데이트 이벤트"""
-        if not self._measuring or not self._measurement_start_time:
-            return
-        
-        end_time = time.time()
-        delay = (end_time - self._measurement_start_time) * 1000  # ms
-        
-        self._complete_measurement(delay, "Controller Stage Update")
-    
-    def _on_rack_update_event(self):
-        """Rack 업데이트 이벤트"""
-        if not self._measuring or not self._measurement_start_time:
-            return
-        
-        end_time = time.time()
-        delay = (end_time - self._measurement_start_time) * 1000  # ms
-        
-        self._complete_measurement(delay, "Rack Data Update")
-    
-    def _complete_measurement(self, delay, event_type):
+    def _complete_measurement(self, span):
         """측정 완료"""
+        delay = span.duration_ms
+        breakdown = self._breakdown(span)
+        
         # 측정 결과 저장
         measurement = {
             'delay_ms': delay,
             'timestamp': time.time(),
-            'event_type': event_type
+            'breakdown': breakdown,
         }
         
         self._goto_measurements.append(measurement)
         
         # 로그 출력
+        breakdown_text = ", ".join(f"{name} {ms:.2f}" for name, ms in breakdown.items()) or "-"
         self._add_log("=== MEASUREMENT COMPLETED ===")
-        self._add_log(f"Event type: {event_type}")
-        self._add_log(f"Go To delay: {delay:.2f}ms")
+        self._add_log(f"Go To delay: {delay:.2f}ms ({breakdown_text})")
         self._add_log(f"Total measurements: {len(self._goto_measurements)}")
-        
-        # 상태 초기화
-        self._measuring = False
-        self._measurement_start_time = None
-        self._measuring_label.text = "No"
+        self._breakdown_label.text = f"{breakdown_text} ms"
         
         # UI 업데이트
         self._update_statistics()
     
     def _update_statistics(self):
-        """통계 UI 업데이트"""
+        """통계 UI 업데이트 (Go To 히스토그램 기준)"""
         try:
-            count = len(self._goto_measurements)
-            if count > 0:
-                delays = [m['delay_ms'] for m in self._goto_measurements]
+            goto = self._latency.histograms['goto'].summary()
+            if goto['count'] > 0:
+                self._count_label.text = str(goto['count'])
+                self._avg_label.text = f"{goto['mean_ms']:.2f} ms"
+                self._min_label.text = f"{goto['min_ms']:.2f} ms"
+                self._max_label.text = f"{goto['max_ms']:.2f} ms"
+                self._last_label.text = f"{self._goto_measurements[-1]['delay_ms']:.2f} ms" if self._goto_measurements else "-"
+                self._p99_label.text = f"{goto['p99']:.2f} ms"
                 
-                self._count_label.text = str(count)
-                self._avg_label.text = f"{statistics.mean(delays):.2f} ms"
-                self._min_label.text = f"{min(delays):.2f} ms"
-                self._max_label.text = f"{max(delays):.2f} ms"
-                self._last_label.text = f"{delays[-1]:.2f} ms"
-                self._std_label.text = f"{statistics.stdev(delays) if len(delays) > 1 else 0:.2f} ms"
-                
-                self._add_log(f"Statistics updated: avg={statistics.mean(delays):.2f}ms")
+                self._add_log(f"Statistics updated: avg={goto['mean_ms']:.2f}ms p50={goto['p50']:.2f}ms p99={goto['p99']:.2f}ms")
             else:
                 self._count_label.text = "0"
                 self._avg_label.text = "0.00 ms"
                 self._min_label.text = "0.00 ms"
                 self._max_label.text = "0.00 ms"
                 self._last_label.text = "0.00 ms"
-                self._std_label.text = "0.00 ms"
+                self._p99_label.text = "0.00 ms"
+            self._update_percentiles()
         except Exception as e:
             self._add_log(f"Statistics update error: {e}")
     
+    def _update_percentiles(self):
+        """히스토그램별 count / p50 / p90 / p99 / p99.9 / max 표 갱신"""
+        for name, summary in self._latency.summary().items():
+            labels = self._percentile_labels[name]
+            if not summary['count']:
+                for label in labels:
+                    label.text = "-"
+                continue
+            labels[0].text = str(summary['count'])
+            for label, key in zip(labels[1:], ('p50', 'p90', 'p99', 'p99.9', 'max_ms')):
+                label.text = f"{summary[key]:.2f}"
+    
+    def _export_histograms(self):
+        """지연 히스토그램을 JSON으로 저장 (릴리스 간 비교용)"""
+        try:
+            path = os.path.join(tempfile.gettempdir(), f"timetravel_latency_{time.strftime('%Y%m%d_%H%M%S')}.json")
+            count = self._latency.export(path)
+            self._add_log(f"Histograms exported: {count} latencies -> {path}")
+            return path
+        except Exception as e:
+            self._add_log(f"Histogram export error: {e}")
+    
     def _clear_measurements(self):
         """측정 데이터 초기화"""
         self._goto_measurements.clear()
+        self._latency.reset()
+        self._breakdown_label.text = "-"
         self._update_statistics()
         
         # 로그도 초기화
@@ -535,7 +336,9 @@ class PerformanceMonitorWindow:
     def destroy(self):
         """윈도우 정리"""
         self._is_monitoring = False
-        self._remove_event_hooks()
+        tracer.unsubscribe(self._on_span)
+        self._latency.stop()
+        self._trace_recorder.stop()
         
         if self._window:
             self._window = None
\ No newline at end of file
@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+"""
+Leveled hot-path logging: an in-memory ring buffer with rate-limited console output
+"""
+import datetime
+import itertools
+import time
+
+from .config import LOG_CONFIG, LOG_PREFIX
+
+DEBUG = 10
+INFO = 20
+WARNING = 30
+ERROR = 40
+LEVELS = {'DEBUG': DEBUG, 'INFO': INFO, 'WARNING': WARNING, 'ERROR': ERROR}
+_LEVEL_NAMES = {value: name for name, value in LEVELS.items()}
+
+
+def _level(level):
+    if isinstance(level, str):
+        if level.upper() not in LEVELS:
+            raise ValueError(f"Unknown log level: {level} (expected one of {tuple(LEVELS)})")
+        return LEVELS[level.upper()]
+    return int(level)
+
+
+class RingLogger:
+    """
+    Keeps the last `capacity` records in memory and echoes only some of them
+    to the console.
+
+    A record below `level` costs one integer comparison. Hot loops should
+    guard on the precomputed flags (`if logger.debug_enabled:`) so the
+    message is not even formatted. Records at or above `level` are stored
+    unformatted as (time, level, message, args); the %-formatting happens
+    in dump(). Records at or above `echo_level` are also printed, at most
+    `echo_per_second` per second. Anything over that limit is counted and
+    reported with the next printed line. warning_once() is for conditions
+    hit every frame (a rack without a mapping, a missing prim): the first
+    occurrence per key is a warning, repeats are debug records.
+    """
+
+    def __init__(self, prefix=LOG_PREFIX, level=INFO, echo_level=WARNING, capacity=4096, echo_per_second=20):
+        if capacity < 1:
+            raise ValueError(f"capacity must be >= 1, got {capacity}")
+        self.prefix = prefix
+        self._capacity = int(capacity)
+        self._records = [None] * self._capacity
+        # next()는 GIL 아래에서 원자적 - 로더 스레드와 메인 스레드가 락 없이 슬롯을 나눠 씀
+        self._counter = itertools.count()
+        self._count = 0  # 지금까지 기록된 총 레코드 수
+        self.echo_per_second = echo_per_second
+        self._echo_window = 0
+        self._echo_in_window = 0
+        self._suppressed = 0
+        self._warned = set()  # warning_once()로 이미 경고한 키
+        self.set_level(level, echo_level)
+
+    @classmethod
+    def from_config(cls, config=LOG_CONFIG):
+        return cls(level=_level(config.get("level", INFO)),
+                   echo_level=_level(config.get("echo_level", WARNING)),
+                   capacity=config.get("capacity", 4096),
+                   echo_per_second=config.get("echo_per_second", 20))
+
+    def set_level(self, level=None, echo_level=None):
+        """Change the record and/or console thresholds (names or numbers)"""
+        if level is not None:
+            self.level = _level(level)
+        if echo_level is not None:
+            self.echo_level = _level(echo_level)
+        # 핫 루프 가드용 플래그 - 속성 조회 한 번으로 끝남
+        self.debug_enabled = self.level <= DEBUG
+        self.info_enabled = self.level <= INFO
+
+    def log(self, level, message, *args):
+        if level < self.level:
+            return
+        now = time.time()
+        i = next(self._counter)
+        self._records[i % self._capacity] = (now, level, message, args)
+        self._count = i + 1
+        if level >= self.echo_level:
+            self._echo(now, level, message, args)
+
+    def debug(self, message, *args):
+        if self.debug_enabled:
+            self.log(DEBUG, message, *args)
+
+    def info(self, message, *args):
+        if self.info_enabled:
+            self.log(INFO, message, *args)
+
+    def warning(self, message, *args):
+        self.log(WARNING, message, *args)
+
+    def warning_once(self, key, message, *args):
+        """Warn the first time `key` is seen (until clear()), log repeats at DEBUG"""
+        if key in self._warned:
+            if self.debug_enabled:
+                self.log(DEBUG, message, *args)
+            return
+        self._warned.add(key)
+        self.log(WARNING, message, *args)
+
+    def error(self, message, *args):
+        self.log(ERROR, message, *args)
+
+    def _echo(self, now, level, message, args):
+        # 1초 창 단위 출력 제한 - 초과분은 개수만 세었다가 다음 출력에 표시
+        window = int(now)
+        if window != self._echo_window:
+            self._echo_window = window
+            self._echo_in_window = 0
+        if self.echo_per_second and self._echo_in_window >= self.echo_per_second:
+            self._suppressed += 1
+            return
+        self._echo_in_window += 1
+        line = self._format((now, level, message, args))
+        if self._suppressed:
+            line += f" (+{self._suppressed} suppressed)"
+            self._suppressed = 0
+        print(line)
+
+    def _format(self, record):
+        created, level, message, args = record
+        if args:
+            try:
+                message = message % args
+            except (TypeError, ValueError):
+                message = f"{message} {args}"
+        stamp = datetime.datetime.fromtimestamp(created).strftime("%H:%M:%S.%f")[:-3]
+        return f"{stamp} {self.prefix} {_LEVEL_NAMES.get(level, level)} {message}"
+
+    def records(self):
+        """Buffered records, oldest first"""
+        count = self._count
+        if count <= self._capacity:
+            return self._records[:count]
+        start = count % self._capacity
+        return self._records[start:] + self._records[:start]
+
+    def dump(self, limit=None):
+        """Formatted buffered lines, oldest first (the newest `limit` if given)"""
+        records = self.records()
+        if limit is not None:
+            records = records[-limit:] if limit > 0 else []
+        return [self._format(record) for record in records]
+
+    def dump_to_file(self, path):
+        lines = self.dump()
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write("\n".join(lines) + ("\n" if lines else ""))
+        return len(lines)
+
+    def clear(self):
+        self._records = [None] * self._capacity
+        self._counter = itertools.count()
+        self._count = 0
+        self._warned.clear()
+
+    def get_stats(self):
+        return {
+            'level': _LEVEL_NAMES.get(self.level, self.level),
+            'echo_level': _LEVEL_NAMES.get(self.echo_level, self.echo_level),
+            'capacity': self._capacity,
+            'buffered': min(self._count, self._capacity),
+            'total': self._count,
+            'dropped': max(0, self._count - self._capacity),
+        }
+
+
+# 확장 전체에서 공유하는 로거
+logger = RingLogger.from_config()
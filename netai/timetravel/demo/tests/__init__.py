@@ -1 +1,21 @@
-from .test_hello_world import *
\ No newline at end of file
+from .test_hello_world import *
+from .test_object_cache import *
+from .test_range_fetcher import *
+from .test_tile_cache import *
+from .test_range_update import *
+from .test_pyramid import *
+from .test_range_index import *
+from .test_keyframe_store import *
+from .test_batch_query import *
+from .test_timeline_index import *
+from .test_ingest import *
+from .test_threshold_index import *
+from .test_ringlog import *
+from .test_engine import *
+from .test_synthetic_fms import *
+from .test_usd_standin import *
+from .test_metric_sink import *
+from .test_tracing import *
+from .test_latency import *
+from .test_optimized_controller import *
+from .test_window import *
@@ -0,0 +1,66 @@
+# NOTE:
+#   omni.kit.test - std python's unittest module with additional wrapping to add suport for async/await tests
+#   For most things refer to unittest docs: https://docs.python.org/3/library/unittest.html
+import datetime
+
+import numpy as np
+
+import omni.kit.test
+
+from netai.timetravel.demo.developing.data_model import CHANNELS, SensorDataCache
+
+BASE = datetime.datetime(2025, 5, 22)
+NS = 1_000_000_000
+
+
+def _cache():
+    cache = SensorDataCache()
+    for objid, offset in ((20, 0), (21, 30)):
+        rng = np.random.default_rng(objid)
+        timestamps = [BASE + datetime.timedelta(seconds=offset + 60 * m) for m in range(100)]
+        data = {'timestamp': timestamps}
+        for name in CHANNELS:
+            data[name] = list(rng.normal(22.0, 1.0, len(timestamps)))
+        cache.get_sensor_data(objid).add_dataframe_dict(data)
+    cache.optimize()
+    return cache
+
+
+def _ns(t: datetime.datetime) -> int:
+    return int(t.timestamp() * NS)
+
+
+class TestBatchQuery(omni.kit.test.AsyncTestCase):
+    async def test_linear_matches_single_point_queries(self):
+        cache = _cache()
+        rng = np.random.default_rng(0)
+        times = [BASE + datetime.timedelta(seconds=float(s)) for s in rng.uniform(-120, 6200, 200)]
+
+        batch = cache.query_batch(np.array([_ns(t) for t in times]), [20, 21, 99], mode='linear')
+        self.assertEqual(batch.shape, (200, 3, len(CHANNELS)))
+        self.assertTrue(np.isnan(batch[:, 2]).all())
+        for i, t in enumerate(times):
+            for s, objid in enumerate((20, 21)):
+                expected = cache.get_sensor_data(objid).get_interpolated_at_time(t)
+                for c, name in enumerate(CHANNELS):
+                    self.assertAlmostEqual(float(batch[i, s, c]), expected[name], places=3)
+
+    async def test_lkv_and_nearest(self):
+        cache = _cache()
+        sensor = cache.get_sensor_data(21)  # 매 분 30초에 샘플
+        times = np.array([_ns(BASE + datetime.timedelta(seconds=s)) for s in (0, 30, 89, 91, 10000)])
+
+        lkv = cache.query_batch(times, [21], mode='lkv')[:, 0, 0]
+        self.assertTrue(np.isnan(lkv[0]))
+        self.assertEqual(lkv[1], sensor.temp_cold[0])
+        self.assertEqual(lkv[2], sensor.temp_cold[0])
+        self.assertEqual(lkv[3], sensor.temp_cold[1])
+        self.assertEqual(lkv[4], sensor.temp_cold[99])
+
+        nearest = cache.query_batch(times, [21], mode='nearest')[:, 0, 0]
+        self.assertEqual(nearest[0], sensor.temp_cold[0])
+        self.assertEqual(nearest[2], sensor.temp_cold[1])
+        self.assertEqual(nearest[4], sensor.temp_cold[99])
+
+        with self.assertRaises(ValueError):
+            cache.query_batch(times, [21], mode='cubic')
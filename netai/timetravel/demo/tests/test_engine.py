@@ -0,0 +1,140 @@
+# NOTE:
+#   omni.kit.test - std python's unittest module with additional wrapping to add suport for async/await tests
+#   For most things refer to unittest docs: https://docs.python.org/3/library/unittest.html
+import datetime
+import os
+import pickle
+import subprocess
+import sys
+import tempfile
+
+import omni.kit.test
+
+from netai.timetravel.demo.engine import PlaybackClock, RecordingStageWriter, TimelineEngine
+
+BASE = datetime.datetime(2025, 3, 27)
+HEADER = "@timestamp,objId,TEMPERATURE1,TEMPERATURE,HUMIDITY1,HUMIDITY\n"
+
+
+def _write_csv(path):
+    # 센서 20: 0/10/20초, 센서 21: 5초 한 번 (15초에 같은 값 반복)
+    rows = [
+        ("2025-03-27T00:00:00.000Z", "20", 20.0),
+        ("2025-03-27T00:00:05.000Z", "21", 30.0),
+        ("2025-03-27T00:00:10.000Z", "20", 21.0),
+        ("2025-03-27T00:00:15.000Z", "21", 30.0),
+        ("2025-03-27T00:00:20.000Z", "20", 22.0),
+        ("not a timestamp", "20", 99.0),
+    ]
+    with open(path, "w") as f:
+        f.write(HEADER)
+        for timestamp, obj_id, value in rows:
+            f.write(f"{timestamp},{obj_id},{value},{value + 5},40,45\n")
+
+
+class _FakeNow:
+    def __init__(self):
+        self.t = 1000.0
+
+    def __call__(self):
+        return self.t
+
+
+class TestTimelineEngine(omni.kit.test.AsyncTestCase):
+    def setUp(self):
+        self._dir = tempfile.TemporaryDirectory()
+        self._csv = os.path.join(self._dir.name, "sensors.csv")
+        _write_csv(self._csv)
+
+    def tearDown(self):
+        self._dir.cleanup()
+
+    def _engine(self):
+        return TimelineEngine.from_csv(
+            self._csv,
+            rack_paths=["/World/Root/datacenter/RACK_A1", "/Root/datacenter/RACK_A3", "/Root/datacenter/RACK_X"],
+            rack_to_sensor_map={"/Root/datacenter/RACK_A1": "20", "/Root/datacenter/RACK_A3": "21"},
+            writer=RecordingStageWriter())
+
+    async def test_apply_seek_and_events_without_kit(self):
+        engine = self._engine()
+        writer = engine.writer
+        self.assertEqual((engine.clock.start_time, engine.clock.end_time),
+                         (BASE, BASE + datetime.timedelta(seconds=20)))
+        self.assertEqual(engine.sensor_id_for_rack("/World/Root/datacenter/RACK_A1"), "20")  # 랙 이름으로 매칭
+
+        self.assertEqual(engine.apply(), 2)
+        self.assertEqual(writer.racks["/World/Root/datacenter/RACK_A1"]["TEMPERATURE1"], 20.0)
+        self.assertEqual(writer.racks["/Root/datacenter/RACK_A3"]["TEMPERATURE1"], 30.0)  # 첫 측정 이전은 첫 측정값
+
+        # 15초의 반복값은 변경이 아님 -> 센서 20의 랙만 다시 씀
+        writes = writer.rack_writes
+        self.assertEqual(engine.seek(BASE + datetime.timedelta(seconds=17)), 1)
+        self.assertEqual(writer.rack_writes - writes, 1)
+        self.assertEqual(writer.racks["/World/Root/datacenter/RACK_A1"]["TEMPERATURE1"], 21.0)
+        self.assertEqual(writer.current_time, BASE + datetime.timedelta(seconds=17))
+
+        self.assertEqual(engine.seek(BASE + datetime.timedelta(hours=1)), 1)  # 범위 끝으로 제한
+        self.assertEqual(engine.clock.current_time, engine.clock.end_time)
+        self.assertEqual(engine.diff(BASE, engine.clock.end_time),
+                         {"/World/Root/datacenter/RACK_A1": {"TEMPERATURE1": {"from": 20.0, "to": 22.0, "delta": 2.0},
+                                                              "TEMPERATURE": {"from": 25.0, "to": 27.0, "delta": 2.0}}})
+
+        self.assertEqual(engine.find_event(BASE, forward=True), BASE + datetime.timedelta(seconds=5))
+        self.assertEqual(engine.find_event(BASE, rack="/Root/datacenter/RACK_A1"), BASE + datetime.timedelta(seconds=10))
+        self.assertIsNone(engine.find_event(engine.clock.end_time))
+        self.assertIsNone(engine.find_event(BASE, rack="/Root/datacenter/RACK_X"))
+
+        # 인덱스는 프로세스 풀로 넘길 수 있어야 함
+        restored = pickle.loads(pickle.dumps(engine.index))
+        self.assertEqual(restored.diff(BASE, engine.clock.end_time), engine.index.diff(BASE, engine.clock.end_time))
+
+    async def test_rows_by_timestamp_is_an_exact_match_view(self):
+        engine = self._engine()
+        self.assertFalse(hasattr(engine, "_index_rows_by_timestamp"))
+        rows = engine.rows_by_timestamp
+        self.assertEqual(len(rows), len(engine.index.timestamps_ms))
+        self.assertEqual(list(rows)[:2], ["2025-03-27T00:00:00.000Z", "2025-03-27T00:00:05.000Z"])
+
+        at_10s = rows["2025-03-27T00:00:10.000Z"]
+        self.assertEqual(list(at_10s), ["20"])
+        self.assertEqual(at_10s["20"]["TEMPERATURE1"], 21.0)
+        self.assertEqual(at_10s["20"]["normalized_timestamp"], "2025-03-27T00:00:10.000Z")
+        self.assertIn("2025-03-27T00:00:20.000Z", rows)
+        # 행이 없는 시각, 다른 표기, 문자열이 아닌 키는 없는 키
+        for key in ("2025-03-27T00:00:11.000Z", "2025-03-27T00:00:10Z", "not a timestamp", None):
+            self.assertNotIn(key, rows)
+            self.assertEqual(rows.get(key, {}), {})
+
+    async def test_playback_clock_advances_and_stops_at_end(self):
+        now = _FakeNow()
+        engine = self._engine()
+        engine.clock = PlaybackClock(engine.clock.start_time, engine.clock.end_time, speed=2.0, now=now)
+        self.assertIsNone(engine.tick())  # 정지 상태
+
+        engine.clock.toggle()
+        now.t += 3.0
+        engine.tick()
+        self.assertEqual(engine.clock.current_time, BASE + datetime.timedelta(seconds=6))
+        self.assertEqual(engine.writer.racks["/Root/datacenter/RACK_A3"]["TEMPERATURE1"], 30.0)
+
+        # 로딩 경계(limit)에서는 대기, 범위 끝에서는 재생 중지
+        now.t += 2.0
+        self.assertEqual(engine.clock.advance(limit=BASE + datetime.timedelta(seconds=8)), BASE + datetime.timedelta(seconds=6))
+        self.assertEqual(engine.clock.current_time, BASE + datetime.timedelta(seconds=8))
+        now.t += 10.0
+        engine.tick()
+        self.assertEqual(engine.clock.current_time, engine.clock.end_time)
+        self.assertFalse(engine.clock.playing)
+        self.assertAlmostEqual(engine.clock.get_progress(), 1.0)
+
+    async def test_engine_imports_without_kit(self):
+        # Kit 모듈도, 실험용 developing 패키지도 끌어오지 않음 (구간 통계 포함)
+        code = ("import sys; import netai.timetravel.demo.engine as engine; engine.TimelineEngine().range_index(); "
+                "print(sorted({m.split('.')[0] for m in sys.modules} & {'omni', 'pxr', 'carb'} | "
+                "{m for m in sys.modules if m.startswith('netai.timetravel.demo.developing')}))")
+        root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "..", ".."))
+        env = dict(os.environ, PYTHONPATH=root)
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env=env, cwd=root)
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(result.stdout.strip().splitlines()[-1], "[]")
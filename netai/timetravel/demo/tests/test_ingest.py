@@ -0,0 +1,56 @@
+# NOTE:
+#   omni.kit.test - std python's unittest module with additional wrapping to add suport for async/await tests
+#   For most things refer to unittest docs: https://docs.python.org/3/library/unittest.html
+import numpy as np
+
+import omni.kit.test
+
+from netai.timetravel.demo.ingest import REDUCERS, bucket_readings
+
+
+def _readings(n=2000, seed=3):
+    rng = np.random.default_rng(seed)
+    times = rng.integers(0, 120_000, n).astype(np.int64)  # 2분, 밀리초
+    times[::7] = times[1::7][:len(times[::7])]  # 같은 밀리초 중복
+    codes = rng.integers(0, 5, n).astype(np.int32)
+    values = rng.normal(22.0, 2.0, (n, 4)).astype(np.float32)
+    return times, codes, values
+
+
+class TestBucketReadings(omni.kit.test.AsyncTestCase):
+    async def test_reducers_match_brute_force(self):
+        times, codes, values = _readings()
+        for bucket_ms in (1, 1000, 5000, 60_000):
+            for reducer in REDUCERS:
+                out_times, out_codes, out_values = bucket_readings(times, codes, values, bucket_ms, reducer)
+
+                groups = {}
+                for i in range(len(times)):
+                    groups.setdefault((int(times[i]) // bucket_ms, int(codes[i])), []).append(i)
+                self.assertEqual(len(out_times), len(groups))
+                self.assertTrue((np.diff(out_times) >= 0).all())
+
+                for t, code, row in zip(out_times, out_codes, out_values):
+                    members = groups[(int(t) // bucket_ms, int(code))]
+                    latest = max(members, key=lambda i: (times[i], i))  # 동률은 파일 순서
+                    self.assertEqual(t, times[latest])
+                    if reducer == 'last':
+                        np.testing.assert_array_equal(row, values[latest])
+                    elif reducer == 'max':
+                        np.testing.assert_array_equal(row, values[members].max(axis=0))
+                    else:
+                        np.testing.assert_allclose(row, values[members].astype(np.float64).mean(axis=0), rtol=1e-6)
+
+    async def test_coarser_buckets_store_fewer_rows(self):
+        times, codes, values = _readings()
+        sizes = [len(bucket_readings(times, codes, values, bucket_ms)[0]) for bucket_ms in (1, 1000, 60_000)]
+        self.assertEqual(sizes[-1], 2 * 5)
+        self.assertGreater(sizes[0], sizes[1])
+        self.assertGreater(sizes[1], sizes[2])
+
+    async def test_invalid_arguments(self):
+        times, codes, values = _readings(10)
+        with self.assertRaises(ValueError):
+            bucket_readings(times, codes, values, 1000, 'median')
+        with self.assertRaises(ValueError):
+            bucket_readings(times, codes, values, 0)
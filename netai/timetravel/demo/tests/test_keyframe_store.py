@@ -0,0 +1,73 @@
+# NOTE:
+#   omni.kit.test - std python's unittest module with additional wrapping to add suport for async/await tests
+#   For most things refer to unittest docs: https://docs.python.org/3/library/unittest.html
+import numpy as np
+
+import omni.kit.test
+
+from netai.timetravel.demo.developing.data_model import SensorDataCache
+from netai.timetravel.demo.developing.keyframe_store import KeyframeDeltaStore
+
+NS = 1_000_000_000
+SENSORS = (20, 21, 22)
+
+
+def _cache():
+    """Three sensors reporting every 60 s with different phases; values repeat in runs"""
+    rng = np.random.default_rng(2)
+    cache = SensorDataCache()
+    for i, objid in enumerate(SENSORS):
+        sensor = cache.get_sensor_data(objid)
+        steps = 500
+        sensor.timestamps = (1000 + 20 * i + np.arange(steps, dtype=np.int64) * 60) * NS
+        values = np.repeat(rng.normal(22.0, 1.0, steps // 5), 5).astype(np.float32)
+        sensor.temp_cold = values
+        sensor.temp_hot = values + 1
+        sensor.humidity_cold = values + 2
+        sensor.humidity_hot = values + 3
+        sensor.size = sensor.capacity = steps
+    return cache
+
+
+def _lkv(cache, objid, t_ns):
+    sensor = cache.find_sensor_data(objid)
+    idx = int(np.searchsorted(sensor.timestamps, t_ns, side='right')) - 1
+    return None if idx < 0 else float(sensor.temp_cold[idx])
+
+
+class TestKeyframeDeltaStore(omni.kit.test.AsyncTestCase):
+    async def test_seek_matches_last_known_values(self):
+        cache = _cache()
+        store = KeyframeDeltaStore.from_cache(cache, keyframe_every=16)
+        rng = np.random.default_rng(4)
+
+        for t in rng.integers(0, 32000, size=300) * NS:
+            state = store.seek(int(t))
+            for objid in SENSORS:
+                values = store.values_for(state, objid)
+                expected = _lkv(cache, objid, int(t))
+                if expected is None:
+                    self.assertIsNone(values)
+                else:
+                    self.assertEqual(values['temperature_cold'], expected)
+                    self.assertEqual(values['humidity_hot'], expected + 3)
+
+    async def test_repeated_values_are_not_stored_as_deltas(self):
+        store = KeyframeDeltaStore.from_cache(_cache(), keyframe_every=16)
+        stats = store.get_stats()
+        self.assertLessEqual(stats['deltas'], 3 * 100)
+        self.assertGreater(stats['keyframes'], 1)
+
+    async def test_sequential_advance_equals_seek(self):
+        store = KeyframeDeltaStore.from_cache(_cache(), keyframe_every=16)
+        times = list(range(900, 31000, 7)) + [5000, 4000, 20000]  # 순차 재생 후 뒤로/앞으로 점프
+        for t in times:
+            np.testing.assert_array_equal(store.advance(t * NS), store.seek(t * NS))
+
+    async def test_time_based_keyframes(self):
+        cache = _cache()
+        by_changes = KeyframeDeltaStore.from_cache(cache, keyframe_every=1 << 20)
+        by_time = KeyframeDeltaStore.from_cache(cache, keyframe_every=1 << 20, keyframe_every_s=3600)
+        self.assertEqual(by_changes.get_stats()['keyframes'], 1)
+        self.assertGreater(by_time.get_stats()['keyframes'], 8)
+        np.testing.assert_array_equal(by_time.seek(20000 * NS), by_changes.seek(20000 * NS))
@@ -0,0 +1,111 @@
+# NOTE:
+#   omni.kit.test - std python's unittest module with additional wrapping to add suport for async/await tests
+#   For most things refer to unittest docs: https://docs.python.org/3/library/unittest.html
+import math
+import os
+import random
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+import omni.kit.test
+
+from netai.timetravel.demo import tracing
+from netai.timetravel.demo.latency import LatencyHistogram, LatencyTracker, load_histograms
+from netai.timetravel.demo.performance_monitor import PerformanceMonitorWindow
+
+
+def _exact_percentile(values, p):
+    ordered = sorted(values)
+    return ordered[max(1, math.ceil(p / 100.0 * len(ordered))) - 1]
+
+
+class TestLatencyHistogram(omni.kit.test.AsyncTestCase):
+    async def test_percentiles_within_bucket_precision_and_merge(self):
+        rng = random.Random(7)
+        values = [rng.lognormvariate(1.0, 1.5) for _ in range(20000)]
+        first, second = LatencyHistogram(), LatencyHistogram()
+        for i, value in enumerate(values):
+            (first if i % 2 else second).record(value)
+
+        merged = first.copy().merge(second)
+        self.assertEqual(merged.count, len(values))
+        self.assertEqual((merged.min_ms, merged.max_ms), (min(values), max(values)))
+        self.assertAlmostEqual(merged.mean_ms, sum(values) / len(values), places=6)
+        for p, value in merged.percentiles().items():
+            exact = _exact_percentile(values, p)
+            # 7비트 -> 버킷 폭 <= 값의 1/64, 1us 절단 포함
+            self.assertLessEqual(abs(value - exact), exact / 64 + 0.001, p)
+        self.assertEqual(first.count, 10000)  # copy()는 원본을 바꾸지 않음
+
+        # 범위 밖 값은 마지막 버킷, 최대값은 정확히 유지
+        small = LatencyHistogram(highest_ms=10.0)
+        small.record(50.0)
+        self.assertEqual((small.overflow, small.max_ms, small.percentile(99.9)), (1, 50.0, 50.0))
+        with self.assertRaises(ValueError):
+            first.merge(small)
+        with self.assertRaises(ValueError):
+            first.percentile(101)
+        self.assertEqual(LatencyHistogram().percentiles(), {50.0: 0.0, 90.0: 0.0, 99.0: 0.0, 99.9: 0.0})
+
+    async def test_tracker_records_spans_and_round_trips_json(self):
+        tracer = tracing.Tracer()
+        tracker = LatencyTracker(tracer).start()
+        for name in (tracing.GOTO, tracing.SCRUB, tracing.SCRUB, tracing.FRAME, tracing.LOAD_RANGE,
+                     tracing.LOAD_TILE, tracing.RESOLVE):
+            with tracer.span(name):
+                pass
+        tracker.stop()
+        self.assertFalse(tracer.enabled)
+        counts = {name: summary['count'] for name, summary in tracker.summary().items()}
+        self.assertEqual(counts, {'goto': 1, 'scrub': 2, 'frame': 1, 'load': 2})
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "latency.json")
+            self.assertEqual(tracker.export(path), 6)
+            loaded = load_histograms(path)
+        self.assertEqual(set(loaded), set(tracker.histograms))
+        for name, histogram in tracker.histograms.items():
+            self.assertEqual(loaded[name].summary(), histogram.summary())
+
+    async def test_load_histogram_counts_every_span_from_loader_threads(self):
+        tracer = tracing.Tracer()
+        tracker = LatencyTracker(tracer).start()
+
+        def load(name):
+            for _ in range(2000):
+                with tracer.span(name):
+                    pass
+
+        # 타일 로더 풀 4개 + 범위 로더 1개가 같은 'load' 히스토그램에 기록, 그 사이 UI가 스냅샷
+        names = [tracing.LOAD_TILE] * 4 + [tracing.LOAD_RANGE]
+        with ThreadPoolExecutor(max_workers=len(names)) as executor:
+            futures = [executor.submit(load, name) for name in names]
+            while not all(future.done() for future in futures):
+                snapshot = tracker.snapshot()['load']
+                self.assertEqual(sum(snapshot._counts), snapshot.count)
+            for future in futures:
+                future.result()
+        tracker.stop()
+
+        load_histogram = tracker.histograms['load']
+        self.assertEqual(load_histogram.count, 2000 * len(names))
+        self.assertEqual(sum(load_histogram._counts), load_histogram.count)
+
+    async def test_monitor_statistics_come_from_goto_histogram(self):
+        monitor = PerformanceMonitorWindow(controller=None)
+        monitor._toggle_monitoring()
+        for _ in range(3):
+            with tracing.tracer.span(tracing.GOTO):
+                pass
+        self.assertEqual(monitor._latency.histograms['goto'].count, 3)
+        self.assertEqual(monitor._count_label.text, "3")
+        self.assertEqual(monitor._percentile_labels['goto'][0].text, "3")
+
+        path = monitor._export_histograms()
+        self.addCleanup(os.remove, path)
+        self.assertEqual(load_histograms(path)['goto'].count, 3)
+
+        monitor._clear_measurements()
+        self.assertEqual(monitor._latency.histograms['goto'].count, 0)
+        monitor.destroy()
+        self.assertFalse(tracing.tracer.enabled)
@@ -0,0 +1,95 @@
+# NOTE:
+#   omni.kit.test - std python's unittest module with additional wrapping to add suport for async/await tests
+#   For most things refer to unittest docs: https://docs.python.org/3/library/unittest.html
+import csv
+import os
+import tempfile
+import threading
+from unittest import mock
+
+import numpy as np
+import omni.kit.test
+
+from netai.timetravel.demo.developing.metric_sink import MetricSink, StreamingStats, read_binary_log
+
+
+class TestMetricSink(omni.kit.test.AsyncTestCase):
+
+    async def test_streaming_stats_match_batch(self):
+        rng = np.random.default_rng(0)
+        durations = rng.exponential(0.01, 1000)
+        sink = MetricSink(256)
+        merged = StreamingStats()
+        for chunk in np.array_split(durations, 7):
+            for value in chunk:
+                sink.record('frame', float(value), 0.0, memory_mb=100.0)
+            merged.merge(_stats_of(sink.drain()))
+
+        stats = sink.stats['frame']
+        self.assertEqual(stats.count, 1000)
+        self.assertAlmostEqual(stats.mean, durations.mean())
+        self.assertAlmostEqual(stats.std, durations.std(ddof=1))
+        self.assertEqual(stats.max, durations.max())
+        self.assertAlmostEqual(merged.std, stats.std)
+        self.assertEqual(stats.as_dict()['avg_memory_mb'], 100.0)
+
+    async def test_overwrite_counts_drops(self):
+        sink = MetricSink(8)
+        for i in range(20):
+            sink.record('seek', 0.001 * i, float(i))
+        batch = sink.drain()
+        # 링보다 많이 기록되면 가장 오래된 것부터 버려짐
+        self.assertEqual(batch['seq'].tolist(), list(range(12, 20)))
+        self.assertEqual(sink.get_stats()['dropped'], 12)
+        self.assertEqual(len(sink.recent('seek', 3)), 3)
+        self.assertEqual(len(sink.drain()), 0)
+
+    async def test_flusher_writes_csv_and_binary(self):
+        with tempfile.TemporaryDirectory() as directory:
+            csv_path = os.path.join(directory, "metrics.csv")
+            sink = MetricSink(1024, csv_path, 'csv', flush_interval=0.01).start()
+            threads = [threading.Thread(target=lambda: [sink.record('frame', 0.002, 1.0) for _ in range(200)])
+                       for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            sink.record('goto', 0.05, 2.0, fps=None)
+            sink.close()
+            with open(csv_path) as f:
+                rows = list(csv.DictReader(f))
+            self.assertEqual(len(rows), 801)
+            self.assertEqual(rows[-1]['operation'], 'goto')
+            self.assertEqual(float(rows[0]['duration_ms']), 2.0)
+
+            binary_path = os.path.join(directory, "metrics.bin")
+            sink = MetricSink(16, binary_path, 'binary')
+            sink.record('frame', 0.002, 1.0, rack_count=24)
+            sink.record('goto', 0.05, 2.0)
+            sink.close()
+            records, names = read_binary_log(binary_path)
+            self.assertEqual([names[code] for code in records['operation']], ['frame', 'goto'])
+            self.assertEqual(records['rack_count'][0], 24)
+
+        with self.assertRaises(ValueError):
+            MetricSink(16, log_format='parquet')
+
+    async def test_flusher_reports_errors_through_ring_logger(self):
+        sink = MetricSink(16, flush_interval=0.01)
+        reported = threading.Event()
+        with mock.patch.object(sink, 'drain', side_effect=OSError("disk full")), \
+                mock.patch("netai.timetravel.demo.developing.metric_sink.logger") as logger:
+            logger.error.side_effect = lambda *args: reported.set()
+            sink.start()
+            self.assertTrue(reported.wait(2.0))
+            sink._stop.set()
+            sink._thread.join()
+        message, error = logger.error.call_args[0]
+        self.assertIn("flush", message)
+        self.assertIsInstance(error, OSError)
+
+
+def _stats_of(batch):
+    stats = StreamingStats()
+    stats.update(batch)
+    return stats
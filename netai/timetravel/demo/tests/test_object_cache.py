@@ -0,0 +1,163 @@
+# NOTE:
+#   omni.kit.test - std python's unittest module with additional wrapping to add suport for async/await tests
+#   For most things refer to unittest docs: https://docs.python.org/3/library/unittest.html
+import mmap
+import os
+import shutil
+import tempfile
+
+import omni.kit.test
+
+from netai.timetravel.demo.developing.object_cache import LocalObjectCache
+
+
+class _FakeObject:
+    def __init__(self, object_name, etag, size):
+        self.object_name = object_name
+        self.etag = etag
+        self.size = size
+
+
+class _FakeResponse:
+    def __init__(self, data):
+        self._data = data
+        self._pos = 0
+
+    def read(self, amt=None):
+        end = len(self._data) if amt is None else self._pos + amt
+        chunk = self._data[self._pos:end]
+        self._pos += len(chunk)
+        return chunk
+
+    def close(self):
+        pass
+
+    def release_conn(self):
+        pass
+
+
+class FakeMinioClient:
+    """In-memory stand-in for the subset of the Minio API used by the cache"""
+
+    def __init__(self):
+        self.objects = {}
+        self.get_calls = 0
+        self.stat_calls = 0
+
+    def put(self, key, data, etag):
+        self.objects[key] = (data, etag)
+
+    def get_object(self, bucket, key, offset=0, length=0):
+        self.get_calls += 1
+        data, _etag = self.objects[key]
+        if length:
+            data = data[offset:offset + length]
+        elif offset:
+            data = data[offset:]
+        return _FakeResponse(data)
+
+    def stat_object(self, bucket, key):
+        self.stat_calls += 1
+        data, etag = self.objects[key]
+        return _FakeObject(key, f'"{etag}"', len(data))
+
+    def list_objects(self, bucket, prefix="", recursive=False):
+        return [
+            _FakeObject(key, etag, len(data))
+            for key, (data, etag) in sorted(self.objects.items())
+            if key.startswith(prefix)
+        ]
+
+
+def _read_all(data):
+    result = bytes(data)
+    if isinstance(data, mmap.mmap):
+        data.close()
+    return result
+
+
+class TestLocalObjectCache(omni.kit.test.AsyncTestCase):
+    async def setUp(self):
+        self._cache_dir = tempfile.mkdtemp()
+        self._client = FakeMinioClient()
+
+    async def tearDown(self):
+        shutil.rmtree(self._cache_dir, ignore_errors=True)
+
+    def _make_cache(self, max_bytes=1024 * 1024):
+        return LocalObjectCache(self._client, "bucket", self._cache_dir, max_bytes)
+
+    async def test_hit_is_served_from_disk_as_mmap(self):
+        self._client.put("2025-05/a.parquet", b"x" * 100, "e1")
+        cache = self._make_cache()
+
+        self.assertEqual(_read_all(cache.get("2025-05/a.parquet")), b"x" * 100)
+        data = cache.get("2025-05/a.parquet")
+        self.assertIsInstance(data, mmap.mmap)
+        self.assertEqual(_read_all(data), b"x" * 100)
+
+        self.assertEqual(self._client.get_calls, 1)
+        stats = cache.get_stats()
+        self.assertEqual(stats["hits"], 1)
+        self.assertEqual(stats["misses"], 1)
+        self.assertEqual(stats["bytes_saved"], 100)
+        self.assertAlmostEqual(stats["hit_ratio"], 0.5)
+
+    async def test_changed_etag_is_refetched(self):
+        self._client.put("a.parquet", b"old", "e1")
+        cache = self._make_cache()
+        _read_all(cache.get("a.parquet", etag="e1"))
+
+        self._client.put("a.parquet", b"new", "e2")
+        self.assertEqual(_read_all(cache.get("a.parquet", etag="e2")), b"new")
+        self.assertEqual(self._client.get_calls, 2)
+
+    async def test_lru_eviction_under_size_cap(self):
+        for name in ("a", "b", "c"):
+            self._client.put(name, name.encode() * 40, name)
+        cache = self._make_cache(max_bytes=100)
+
+        _read_all(cache.get("a"))
+        _read_all(cache.get("b"))
+        _read_all(cache.get("a"))  # a를 최근 사용으로 갱신
+        _read_all(cache.get("c"))  # b가 제거되어야 함
+
+        self.assertTrue(cache.contains("a"))
+        self.assertFalse(cache.contains("b"))
+        self.assertTrue(cache.contains("c"))
+        self.assertLessEqual(cache.get_stats()["cached_bytes"], 100)
+        self.assertEqual(cache.get_stats()["evictions"], 1)
+
+    async def test_index_survives_restart(self):
+        self._client.put("a", b"abc", "e1")
+        _read_all(self._make_cache().get("a"))
+
+        cache = self._make_cache()
+        self.assertEqual(_read_all(cache.get("a")), b"abc")
+        self.assertEqual(self._client.get_calls, 1)
+
+    async def test_warm_fetches_prefix_only(self):
+        self._client.put("2025-05/w1.parquet", b"1" * 10, "e1")
+        self._client.put("2025-05/w2.parquet", b"2" * 10, "e2")
+        self._client.put("2025-05/readme.txt", b"3" * 10, "e3")
+        self._client.put("2025-06/w1.parquet", b"4" * 10, "e4")
+        cache = self._make_cache()
+
+        self.assertEqual(cache.warm("2025-05/"), 2)
+        self.assertEqual(cache.warm("2025-05/"), 0)
+        self.assertEqual(self._client.stat_calls, 0)
+
+        _read_all(cache.get("2025-05/w1.parquet"))
+        stats = cache.get_stats()
+        self.assertEqual(stats["warmed"], 2)
+        self.assertEqual(stats["hits"], 1)
+        self.assertEqual(stats["misses"], 0)
+
+    async def test_oversized_object_is_returned_but_not_kept(self):
+        self._client.put("big", b"b" * 200, "e1")
+        cache = self._make_cache(max_bytes=100)
+
+        self.assertEqual(_read_all(cache.get("big")), b"b" * 200)
+        self.assertFalse(cache.contains("big"))
+        self.assertEqual(cache.get_stats()["cached_bytes"], 0)
+        self.assertEqual([files for _root, _dirs, files in os.walk(self._cache_dir) if files], [])
@@ -0,0 +1,173 @@
+# NOTE:
+#   omni.kit.test - std python's unittest module with additional wrapping to add suport for async/await tests
+#   For most things refer to unittest docs: https://docs.python.org/3/library/unittest.html
+import datetime
+import os
+import shutil
+import tempfile
+import threading
+import time
+from unittest import mock
+
+import omni.kit.test
+
+from netai.timetravel.demo.benchmarks import synthetic_fms
+from netai.timetravel.demo.developing import optimized_controller
+from netai.timetravel.demo.developing.config import Config
+from netai.timetravel.demo.engine import RecordingStageWriter
+
+# synthetic_fms 주간 파일 (KST): week_01 = 3/27 09시 ~ 4/2, week_02 = 4/3 ~ 4/5 09시
+START = datetime.datetime(2025, 3, 27)
+
+
+class TestOptimizedTimeController(omni.kit.test.AsyncTestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls._data_dir = tempfile.mkdtemp()
+        cls._files = synthetic_fms.generate(cls._data_dir, sensors=4, days=9, start=START,
+                                            formats=('parquet',), seed=1)['files']
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls._data_dir, ignore_errors=True)
+
+    def setUp(self):
+        # MinIO 없이 로컬 parquet 디렉터리에서 로딩
+        patches = [
+            mock.patch.object(optimized_controller, "MINIO_AVAILABLE", False),
+            mock.patch.object(Config, "LOCAL_DATA_PATH", os.path.join(self._data_dir, "parquet")),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+        self._controller = optimized_controller.OptimizedTimeController()
+        self.addCleanup(self._controller.destroy)
+        self._reads = []
+        self._read_gaps = []
+        read = self._controller._read_parquet_table
+
+        def record_read(file_path, start_time, end_time, gaps=None):
+            self._reads.append(os.path.basename(file_path))
+            self._read_gaps.append(gaps)
+            return read(file_path, start_time, end_time, gaps)
+        self._controller._read_parquet_table = record_read
+
+    async def test_tile_reads_only_files_overlapping_the_tile(self):
+        controller = self._controller
+        tile_start = datetime.datetime(2025, 4, 4, 12)
+        tile = controller._load_tile(tile_start, tile_start + datetime.timedelta(hours=1))
+        self.assertEqual(self._reads, [os.path.basename(self._files[1])])
+        self.assertGreater(tile.get_total_records(), 0)
+
+        # 메타데이터는 파일마다 한 번만 읽음
+        del self._reads[:]
+        tile_start = datetime.datetime(2025, 3, 29)
+        with mock.patch.object(optimized_controller.pq, "read_metadata") as read_metadata:
+            controller._load_tile(tile_start, tile_start + datetime.timedelta(hours=1))
+        read_metadata.assert_not_called()
+        self.assertEqual(self._reads, [os.path.basename(self._files[0])])
+
+        # 어느 파일과도 겹치지 않는 타일은 읽지 않음
+        del self._reads[:]
+        tile_start = datetime.datetime(2025, 5, 1)
+        tile = controller._load_tile(tile_start, tile_start + datetime.timedelta(hours=1))
+        self.assertEqual(tile.get_total_records(), 0)
+        self.assertEqual(self._reads, [])
+
+    async def test_overlapping_reload_reads_only_the_difference(self):
+        controller = self._controller
+        first = (datetime.datetime(2025, 3, 28), datetime.datetime(2025, 3, 30))
+        controller.load_data_for_time_range(*first)
+        first_records = controller._data_cache.get_total_records()
+        self.assertEqual(controller.get_load_stats()['mode'], 'full')
+
+        del self._reads[:]
+        del self._read_gaps[:]
+        requested = (datetime.datetime(2025, 3, 27, 12), datetime.datetime(2025, 3, 31))
+        controller.load_data_for_time_range(*requested)
+        gaps = [(requested[0], first[0]), (first[1], requested[1])]
+        stats = controller.get_load_stats()
+        self.assertEqual((stats['mode'], stats['intervals'], stats['removed_records']), ('incremental', gaps, 0))
+        # 파일 읽기도 양쪽 빠진 구간의 row group만 (이미 있는 가운데 구간 제외), 겹치지 않는 파일은 건너뜀
+        self.assertEqual(self._read_gaps, [gaps])
+        self.assertEqual(self._reads, [os.path.basename(self._files[0])])
+
+        fresh = optimized_controller.OptimizedTimeController()
+        self.addCleanup(fresh.destroy)
+        fresh.load_data_for_time_range(*requested)
+        self.assertEqual(controller._data_cache.get_total_records(), fresh._data_cache.get_total_records())
+        self.assertEqual(stats['added_records'], fresh._data_cache.get_total_records() - first_records)
+
+    async def test_chunks_are_published_in_time_order_without_waiting_for_later_files(self):
+        controller = self._controller
+        requested = (datetime.datetime(2025, 4, 1), datetime.datetime(2025, 4, 5))
+        controller._start_time, controller._end_time = requested
+        week_01, week_02 = (os.path.basename(path) for path in self._files)
+
+        # week_02 읽기는 첫 청크가 공개될 때까지 막힘 - 모든 파일을 기다리면 타임아웃
+        read = controller._read_parquet_table
+        timed_out = []
+
+        def blocking_read(file_path, start_time, end_time, gaps=None):
+            if os.path.basename(file_path) == week_02:
+                deadline = time.monotonic() + 5.0
+                while controller.get_loaded_through() is None and time.monotonic() < deadline:
+                    time.sleep(0.01)
+                timed_out.append(controller.get_loaded_through() is None)
+            return read(file_path, start_time, end_time, gaps)
+        controller._read_parquet_table = blocking_read
+
+        chunks = []
+        index_rows = controller._index_parquet_rows
+
+        def record_chunk(data_dict, file_path, start_time, end_time, target_cache=None):
+            chunks.append((start_time, os.path.basename(file_path)))
+            index_rows(data_dict, file_path, start_time, end_time, target_cache)
+        controller._index_parquet_rows = record_chunk
+
+        with mock.patch.object(Config, "PROGRESSIVE_CHUNK_S", 86400):
+            controller.load_data_for_time_range(*requested)
+
+        self.assertEqual(timed_out, [False])
+        starts = [start for start, _file in chunks]
+        self.assertEqual(starts, sorted(starts))
+        self.assertEqual(starts[0], requested[0])
+        # 4/3 이전 청크는 week_01만, 이후 청크는 week_02만 인덱싱
+        self.assertTrue(all(file == week_01 for start, file in chunks if start < datetime.datetime(2025, 4, 2)))
+        self.assertTrue(all(file == week_02 for start, file in chunks if start >= datetime.datetime(2025, 4, 3)))
+
+        stats = controller.get_load_stats()
+        self.assertEqual((stats['mode'], stats['intervals'], stats['removed_records']), ('full', [requested], 0))
+        self.assertEqual(stats['added_records'], controller._data_cache.get_total_records())
+        self.assertGreater(stats['added_records'], 0)
+        self.assertIsNotNone(stats['time_to_first_frame'])
+        self.assertLessEqual(stats['time_to_first_frame'], stats['seconds'])
+        self.assertEqual(stats['loaded_through'], requested[1])
+        self.assertEqual(stats['loads_by_mode'], {'full': 1, 'first_frame': 1})
+        self.assertEqual(controller._loaded_intervals, [tuple(controller._to_ns(t) for t in requested)])
+
+    async def test_seek_waits_for_a_prefetching_tile_without_deadlock(self):
+        with mock.patch.object(Config, "TILE_CACHE_ENABLED", True):
+            controller = optimized_controller.OptimizedTimeController()
+        self.addCleanup(controller.destroy)
+        writer = RecordingStageWriter()
+        controller.set_stage_writer(writer)
+
+        # 첫 타일 선행 로딩을 늦춰 seek이 로딩 중인 타일을 기다리게 함
+        load_tile = controller._tile_cache._loader
+
+        def slow_load_tile(tile_start, tile_end):
+            time.sleep(0.2)
+            return load_tile(tile_start, tile_end)
+        controller._tile_cache._loader = slow_load_tile
+
+        controller.set_time_range(datetime.datetime(2025, 3, 28), datetime.datetime(2025, 3, 29))
+        seek = threading.Thread(target=controller.set_current_time,
+                                args=(datetime.datetime(2025, 3, 28, 0, 30),), daemon=True)
+        seek.start()
+        seek.join(10.0)
+        self.assertFalse(seek.is_alive(), "set_current_time deadlocked on the prefetching tile")
+        self.assertGreater(controller.get_tile_stats()['prefetch_hits'], 0)
+        self.assertTrue(writer.racks)
+        rack_path, values = next(iter(writer.racks.items()))
+        self.assertEqual(controller.get_rack_data_at_time(rack_path), values)
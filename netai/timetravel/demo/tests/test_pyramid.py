@@ -0,0 +1,89 @@
+# NOTE:
+#   omni.kit.test - std python's unittest module with additional wrapping to add suport for async/await tests
+#   For most things refer to unittest docs: https://docs.python.org/3/library/unittest.html
+import datetime
+
+import numpy as np
+
+import omni.kit.test
+
+from netai.timetravel.demo.developing.data_model import SensorDataCache
+from netai.timetravel.demo.developing.pyramid import AggregatePyramid, SensorPyramidIndex
+
+NS = 1_000_000_000
+BASE_S = 1_748_000_000 - 1_748_000_000 % 3600  # 정시에서 시작
+
+
+def _week(seed: int = 3):
+    """Irregular whole-second samples over a week with one short spike"""
+    rng = np.random.default_rng(seed)
+    seconds = BASE_S + np.cumsum(rng.integers(1, 90, size=12000))
+    values = rng.normal(22.0, 0.5, size=(len(seconds), 4)).astype(np.float32)
+    values[5000, 1] = 40.0
+    return seconds.astype(np.int64) * NS, values
+
+
+class TestAggregatePyramid(omni.kit.test.AsyncTestCase):
+    async def test_matches_brute_force_on_random_intervals(self):
+        timestamps, values = _week()
+        pyramid = AggregatePyramid.build(timestamps, list(values.T))
+        rng = np.random.default_rng(11)
+
+        for _ in range(200):
+            a, b = sorted(rng.integers(timestamps[0] // NS - 100, timestamps[-1] // NS + 100, size=2))
+            state = pyramid.state_over(int(a) * NS, int(b) * NS)
+            mask = (timestamps >= a * NS) & (timestamps <= b * NS)
+            if not mask.any():
+                self.assertIsNone(state)
+                continue
+            window = values[mask]
+            self.assertEqual(state['count'], int(mask.sum()))
+            self.assertAlmostEqual(state['max']['temperature_hot'], float(window[:, 1].max()), places=5)
+            self.assertAlmostEqual(state['min']['humidity_cold'], float(window[:, 2].min()), places=5)
+            self.assertAlmostEqual(state['mean']['temperature_cold'], float(window[:, 0].astype(np.float64).mean()), places=4)
+            self.assertAlmostEqual(state['last']['humidity_hot'], float(window[-1, 3]), places=5)
+
+    async def test_wide_interval_uses_coarse_level_and_keeps_spike(self):
+        timestamps, values = _week()
+        pyramid = AggregatePyramid.build(timestamps, list(values.T))
+
+        state = pyramid.state_over(BASE_S * NS, (BASE_S + 5 * 86400) * NS)
+        self.assertEqual(state['level_s'], 3600)
+        self.assertEqual(state['max']['temperature_hot'], 40.0)
+
+        # 정시에 맞지 않는 12시간 구간: 가운데는 1시간 버킷, 양 끝은 10분 버킷과 원본
+        start = BASE_S + 3600 + 60
+        self.assertEqual(pyramid.state_over(start * NS, (start + 12 * 3600) * NS)['level_s'], 3600)
+
+    async def test_short_interval_is_answered_from_raw_samples(self):
+        timestamps, values = _week()
+        pyramid = AggregatePyramid.build(timestamps, list(values.T))
+        state = pyramid.state_over(int(timestamps[10]), int(timestamps[12]))
+        self.assertEqual(state['level_s'], 0)
+        self.assertEqual(state['count'], 3)
+
+    async def test_rejects_non_nested_levels(self):
+        timestamps, values = _week()
+        with self.assertRaises(ValueError):
+            AggregatePyramid.build(timestamps, list(values.T), levels_s=(1, 10, 25))
+
+    async def test_index_reports_build_memory_and_query_stats(self):
+        timestamps, values = _week()
+        cache = SensorDataCache()
+        sensor = cache.get_sensor_data(20)
+        for ts, row in zip(timestamps[:500], values[:500]):
+            sensor.add_data(datetime.datetime.fromtimestamp(int(ts) / NS), *row.tolist())
+        cache.optimize()
+
+        index = SensorPyramidIndex.build(cache)
+        self.assertIsNotNone(index.state_over(20, int(timestamps[0]), int(timestamps[499])))
+        self.assertIsNone(index.state_over(99, int(timestamps[0]), int(timestamps[499])))
+
+        stats = index.get_stats()
+        self.assertEqual(stats['sensors'], 1)
+        self.assertEqual(stats['source_records'], 500)
+        self.assertEqual(stats['queries'], 1)
+        self.assertGreater(stats['nbytes'], 0)
+        # 샘플 간격이 1초보다 넓으므로 1초 레벨은 원본 복사본 - 저장하지 않음
+        self.assertEqual(stats['buckets_by_level'][1], 0)
+        self.assertGreater(stats['buckets_by_level'][3600], 0)
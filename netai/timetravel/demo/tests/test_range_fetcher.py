@@ -0,0 +1,110 @@
+# NOTE:
+#   omni.kit.test - std python's unittest module with additional wrapping to add suport for async/await tests
+#   For most things refer to unittest docs: https://docs.python.org/3/library/unittest.html
+import datetime
+import io
+import shutil
+import tempfile
+
+import omni.kit.test
+
+from netai.timetravel.demo.developing.range_fetcher import (
+    RangedObjectFetcher, coalesce_ranges, make_time_row_group_filter
+)
+from netai.timetravel.demo.developing.object_cache import LocalObjectCache
+from netai.timetravel.demo.developing.optimized_controller import ParquetReader
+from .test_object_cache import FakeMinioClient
+
+
+def _weekly_parquet():
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    timestamps, obj_ids, temps, payload = [], [], [], []
+    for day in range(3):
+        for minute in range(1440):
+            ts = datetime.datetime(2025, 5, 22 + day) + datetime.timedelta(minutes=minute)
+            timestamps.append(ts.strftime("%Y-%m-%dT%H:%M:%S"))
+            obj_ids.append(20)
+            temps.append(20.0 + day)
+            payload.append(f"{day}{minute:0199d}")
+    table = pa.table({"timestamp": timestamps, "objId": obj_ids, "TEMPERATURE": temps, "payload": payload})
+    sink = io.BytesIO()
+    pq.write_table(table, sink, row_group_size=1440, compression="none")
+    return sink.getvalue()
+
+
+class TestRangedObjectFetcher(omni.kit.test.AsyncTestCase):
+    async def setUp(self):
+        self._client = FakeMinioClient()
+
+    async def test_coalesce_merges_small_gaps_and_splits_large_runs(self):
+        parts = coalesce_ranges([(0, 10), (15, 10), (100, 5)], max_gap=8, part_size=20)
+        self.assertEqual(parts, [(0, 20), (20, 5), (100, 5)])
+
+    async def test_fetch_object_reassembles_parts(self):
+        data = bytes(range(256)) * 40
+        self._client.put("a.bin", data, "e1")
+        fetcher = RangedObjectFetcher(self._client, "bucket", max_workers=4, part_size=1000)
+        try:
+            self.assertEqual(fetcher.fetch_object("a.bin"), data)
+            self.assertEqual(fetcher.get_stats()["requests"], 11)
+        finally:
+            fetcher.shutdown()
+
+    async def test_read_table_fetches_selected_row_groups_and_columns(self):
+        data = _weekly_parquet()
+        self._client.put("week.parquet", data, "e1")
+        fetcher = RangedObjectFetcher(self._client, "bucket", part_size=4096, coalesce_gap=0)
+        day = datetime.datetime(2025, 5, 23)
+        try:
+            table = fetcher.read_table(
+                "week.parquet", columns=["timestamp", "TEMPERATURE", "missing"],
+                row_group_filter=make_time_row_group_filter("timestamp", day, day + datetime.timedelta(hours=23))
+            )
+            stats = fetcher.get_stats()
+        finally:
+            fetcher.shutdown()
+
+        self.assertEqual(table.column_names, ["timestamp", "TEMPERATURE"])
+        self.assertEqual(table.num_rows, 1440)
+        self.assertEqual(set(table.column("TEMPERATURE").to_pylist()), {21.0})
+        # payload 컬럼과 다른 날짜의 row group은 받지 않음
+        self.assertLess(stats["bytes"], len(data) // 2)
+        self.assertEqual(stats["fallback_reads"], 0)
+
+    async def test_cache_hit_reads_selected_row_groups_and_columns(self):
+        self._client.put("week.parquet", _weekly_parquet(), "e1")
+        cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir, True)
+        cache = LocalObjectCache(self._client, "bucket", cache_dir, 64 * 1024 * 1024)
+        day = datetime.datetime(2025, 5, 24)
+
+        # 캐시 히트(mmap)에도 범위 요청과 같은 row group / 컬럼 선택 적용
+        data = cache.get("week.parquet")
+        table = ParquetReader.read_parquet_table(
+            data, ["timestamp", "TEMPERATURE", "missing"],
+            make_time_row_group_filter("timestamp", day, day + datetime.timedelta(hours=1)))
+        self.assertEqual(table.column_names, ["timestamp", "TEMPERATURE"])
+        self.assertEqual(table.num_rows, 1440)
+        self.assertEqual(set(table.column("TEMPERATURE").to_pylist()), {22.0})
+        self.assertEqual(ParquetReader.read_parquet_table(data).num_rows, 3 * 1440)
+
+    async def test_time_filter_keeps_row_groups_starting_exactly_at_the_end(self):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        # FMS 파일처럼 밀리초까지 있는 문자열 - 두 번째 row group의 최솟값 = 조회 끝 시각
+        day = datetime.datetime(2025, 3, 28)
+        times = [(day + datetime.timedelta(hours=hour)).strftime("%Y-%m-%d %H:%M:%S.%f")[:-3] for hour in range(4)]
+        sink = io.BytesIO()
+        pq.write_table(pa.table({"timestamp": times}), sink, row_group_size=2)
+        metadata = pq.ParquetFile(io.BytesIO(sink.getvalue())).metadata
+
+        def kept(start_time, end_time):
+            row_filter = make_time_row_group_filter("timestamp", start_time, end_time)
+            return [i for i in range(metadata.num_row_groups) if row_filter(metadata.row_group(i))]
+
+        self.assertEqual(kept(day, day + datetime.timedelta(hours=2)), [0, 1])
+        self.assertEqual(kept(day + datetime.timedelta(hours=1), day + datetime.timedelta(hours=1)), [0])
+        self.assertEqual(kept(day + datetime.timedelta(hours=1, milliseconds=1), day + datetime.timedelta(hours=2)), [1])
@@ -0,0 +1,89 @@
+# NOTE:
+#   omni.kit.test - std python's unittest module with additional wrapping to add suport for async/await tests
+#   For most things refer to unittest docs: https://docs.python.org/3/library/unittest.html
+import numpy as np
+
+import omni.kit.test
+
+from netai.timetravel.demo.engine.range_index import BlockSparseTable, RangeIndex
+
+NS = 1_000_000_000
+
+
+class TestRangeIndex(omni.kit.test.AsyncTestCase):
+    async def test_block_sparse_table_matches_brute_force(self):
+        rng = np.random.default_rng(5)
+        values = rng.normal(22.0, 2.0, size=(1000, 4)).astype(np.float32)
+        maximum = BlockSparseTable(values, np.maximum, block_size=8)
+        minimum = BlockSparseTable(values, np.minimum, block_size=8)
+
+        for _ in range(300):
+            lo = int(rng.integers(0, 1000))
+            hi = int(rng.integers(lo + 1, 1001))
+            np.testing.assert_array_equal(maximum.query(lo, hi), values[lo:hi].max(axis=0))
+            np.testing.assert_array_equal(minimum.query(lo, hi), values[lo:hi].min(axis=0))
+
+    async def test_reducers_over_time_interval(self):
+        timestamps = np.arange(0, 600, 60, dtype=np.int64) * NS  # 10분, 1분 간격
+        values = np.tile(np.arange(10, dtype=np.float32)[:, None], (1, 4))
+        index = RangeIndex(timestamps, values, block_size=4)
+
+        self.assertEqual(index.reduce(60 * NS, 300 * NS, 'max')[0], 5.0)
+        self.assertEqual(index.reduce(60 * NS, 300 * NS, 'min')[0], 1.0)
+        self.assertAlmostEqual(float(index.reduce(60 * NS, 300 * NS, 'mean')[0]), 3.0)
+        self.assertEqual(index.reduce(61 * NS, 299 * NS, 'last')[0], 4.0)
+        self.assertIsNone(index.reduce(61 * NS, 119 * NS, 'max'))
+        with self.assertRaises(ValueError):
+            index.reduce(0, 600 * NS, 'median')
+
+    async def test_fast_frames_keep_spike_that_point_sampling_misses(self):
+        # 1분 간격 하루치, 3시간 17분에 1분짜리 고온 스파이크
+        timestamps = np.arange(0, 86400, 60, dtype=np.int64) * NS
+        values = np.full((len(timestamps), 4), 22.0, dtype=np.float32)
+        spike = 197
+        values[spike, 1] = 35.0
+        index = RangeIndex(timestamps, values)
+
+        # 1000x 재생 (프레임당 1000초)에서 각 프레임 도착 시점만 보면 스파이크를 놓침
+        frame_edges = np.arange(0, 86400 + 1000, 1000, dtype=np.int64) * NS
+        landed = np.searchsorted(timestamps, frame_edges[1:], side='right') - 1
+        self.assertNotIn(spike, landed)
+
+        shown = [index.reduce(a, b, 'max')[1] for a, b in zip(frame_edges[:-1], frame_edges[1:])]
+        self.assertEqual(max(shown), 35.0)
+
+    async def test_stats_match_brute_force(self):
+        rng = np.random.default_rng(7)
+        timestamps = np.cumsum(rng.integers(30, 90, size=400)).astype(np.int64) * NS  # 불규칙 간격
+        values = rng.normal(22.0, 2.0, size=(400, 4)).astype(np.float32)
+        index = RangeIndex(timestamps, values, block_size=8)
+
+        for _ in range(100):
+            t0, t1 = np.sort(rng.integers(-1000, int(timestamps[-1] // NS) + 1000, size=2)) * NS
+            stats = index.stats(int(t0), int(t1))
+            inside = (timestamps >= t0) & (timestamps <= t1)
+            if not inside.any():
+                self.assertIsNone(stats)
+                continue
+            window = values[inside].astype(np.float64)
+            self.assertEqual(stats['count'], int(inside.sum()))
+            np.testing.assert_array_equal(stats['min'], values[inside].min(axis=0))
+            np.testing.assert_array_equal(stats['max'], values[inside].max(axis=0))
+            np.testing.assert_allclose(stats['mean'], window.mean(axis=0), rtol=1e-9)
+            np.testing.assert_allclose(stats['std'], window.std(axis=0), rtol=1e-6, atol=1e-6)
+
+            # 데이터가 있는 구간만 선형 보간 곡선으로 적분
+            a, b = max(t0, timestamps[0]), min(t1, timestamps[-1])
+            points = np.concatenate([[a], timestamps[(timestamps > a) & (timestamps < b)], [b]])
+            curve = np.column_stack([np.interp(points, timestamps, values[:, c]) for c in range(4)])
+            expected = ((curve[1:] + curve[:-1]) * 0.5 * (np.diff(points)[:, None] / NS)).sum(axis=0)
+            np.testing.assert_allclose(stats['integral'], expected, rtol=1e-6, atol=1e-6)
+
+    async def test_time_weighted_mean_follows_sample_spacing(self):
+        # 0~60초에 10, 60~600초에 20 유지: 샘플 평균과 시간 가중 평균이 다름
+        timestamps = np.array([0, 60, 600], dtype=np.int64) * NS
+        values = np.tile(np.array([10.0, 20.0, 20.0], dtype=np.float32)[:, None], (1, 4))
+        stats = RangeIndex(timestamps, values).stats(0, 600 * NS)
+        self.assertAlmostEqual(float(stats['mean'][0]), 50.0 / 3)
+        self.assertAlmostEqual(float(stats['integral'][0]), 15 * 60 + 20 * 540)
+        self.assertAlmostEqual(float(stats['time_weighted_mean'][0]), (900 + 10800) / 600)
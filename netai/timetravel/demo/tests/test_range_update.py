@@ -0,0 +1,125 @@
+# NOTE:
+#   omni.kit.test - std python's unittest module with additional wrapping to add suport for async/await tests
+#   For most things refer to unittest docs: https://docs.python.org/3/library/unittest.html
+import datetime
+
+import omni.kit.test
+
+from netai.timetravel.demo.developing.data_model import (
+    SensorDataCache, merge_time_intervals, missing_time_intervals, split_time_intervals
+)
+
+DAY_NS = 86400 * 1_000_000_000
+BASE = datetime.datetime(2025, 5, 22)
+
+
+def _ns(day: float) -> int:
+    return int((BASE + datetime.timedelta(days=day)).timestamp() * 1_000_000_000)
+
+
+def _hourly(days_from: float, days_to: float, objid: int = 20) -> SensorDataCache:
+    """Hourly readings in [days_from, days_to] with temperature = hours since BASE"""
+    cache = SensorDataCache()
+    hours = range(int(days_from * 24), int(days_to * 24) + 1)
+    timestamps = [BASE + datetime.timedelta(hours=h) for h in hours]
+    values = [float(h) for h in hours]
+    cache.get_sensor_data(objid).add_dataframe_dict({
+        'timestamp': timestamps,
+        'temperature_cold': values,
+        'temperature_hot': values,
+        'humidity_cold': values,
+        'humidity_hot': values,
+    })
+    cache.optimize()
+    return cache
+
+
+class TestRangeUpdate(omni.kit.test.AsyncTestCase):
+    async def test_diff_extension_and_shrink(self):
+        loaded = (_ns(0), _ns(7))
+        self.assertEqual(missing_time_intervals([loaded], (_ns(0), _ns(8))), [(_ns(7), _ns(8))])
+        self.assertEqual(missing_time_intervals([loaded], (_ns(-1), _ns(7))), [(_ns(-1), _ns(0))])
+        self.assertEqual(missing_time_intervals([loaded], (_ns(1), _ns(6))), [])
+        self.assertEqual(missing_time_intervals([loaded], (_ns(-1), _ns(8))), [(_ns(-1), _ns(0)), (_ns(7), _ns(8))])
+        self.assertIsNone(missing_time_intervals([loaded], (_ns(9), _ns(10))))
+        self.assertIsNone(missing_time_intervals([], (_ns(0), _ns(1))))
+
+    async def test_extension_loads_only_missing_day_without_duplicates(self):
+        loaded = (_ns(0), _ns(7))
+        cache = _hourly(0, 7)
+        requested = (_ns(1), _ns(8))
+
+        missing = missing_time_intervals([loaded], requested)
+        staged = _hourly(7, 8)  # 경계 샘플(7일 0시)을 포함해서 읽힘
+        removed, added = cache.apply_range_update(requested[0], requested[1], staged, [loaded])
+
+        self.assertEqual(missing, [(_ns(7), _ns(8))])
+        self.assertEqual(removed, 24)
+        self.assertEqual(added, 24)
+
+        sensor = cache.get_sensor_data(20)
+        self.assertEqual(sensor.size, 7 * 24 + 1)
+        self.assertEqual(int(sensor.timestamps[0]), _ns(1))
+        self.assertEqual(int(sensor.timestamps[sensor.size - 1]), _ns(8))
+        self.assertTrue((sensor.timestamps[1:sensor.size] > sensor.timestamps[:sensor.size - 1]).all())
+
+        # 기존 구간과 새 구간 모두 그대로 조회됨
+        values = sensor.get_interpolated_at_time(BASE + datetime.timedelta(days=7, minutes=30))
+        self.assertAlmostEqual(values['temperature_cold'], 7 * 24 + 0.5, places=4)
+
+    async def test_shrink_only_trims(self):
+        loaded = (_ns(0), _ns(7))
+        cache = _hourly(0, 7)
+        requested = (_ns(2), _ns(3))
+
+        self.assertEqual(missing_time_intervals([loaded], requested), [])
+        removed, added = cache.apply_range_update(requested[0], requested[1], None, [loaded])
+        self.assertEqual(added, 0)
+        self.assertEqual(cache.get_sensor_data(20).size, 25)
+        self.assertEqual(removed, 7 * 24 + 1 - 25)
+
+    async def test_missing_intervals_after_partial_progressive_load(self):
+        # 이전 로딩이 중간에 대체되어 앞부분 일부만 들어있는 경우
+        loaded = [(_ns(0), _ns(1)), (_ns(1), _ns(2.5)), (_ns(4), _ns(5))]
+        self.assertEqual(merge_time_intervals(loaded), [(_ns(0), _ns(2.5)), (_ns(4), _ns(5))])
+        self.assertEqual(missing_time_intervals(loaded, (_ns(1), _ns(7))),
+                         [(_ns(2.5), _ns(4)), (_ns(5), _ns(7))])
+        self.assertIsNone(missing_time_intervals(loaded, (_ns(6), _ns(7))))
+
+    async def test_chunks_are_time_ordered_and_cover_intervals(self):
+        chunks = split_time_intervals([(_ns(5), _ns(6)), (_ns(0), _ns(0.6))], DAY_NS // 4)
+        self.assertEqual(chunks[0], (_ns(0), _ns(0.25)))
+        self.assertEqual(chunks[2], (_ns(0.5), _ns(0.6)))
+        self.assertEqual(len(chunks), 3 + 4)
+        self.assertEqual([c[0] for c in chunks], sorted(c[0] for c in chunks))
+        self.assertEqual(merge_time_intervals(chunks), [(_ns(0), _ns(0.6)), (_ns(5), _ns(6))])
+
+    async def test_chunked_publish_has_no_boundary_duplicates(self):
+        cache = SensorDataCache()
+        loaded = []
+        requested = (_ns(0), _ns(2))
+        for start, end in split_time_intervals([requested], DAY_NS // 2):
+            # 각 청크는 양 끝 경계 샘플을 포함해서 읽힘
+            staged = _hourly((start - _ns(0)) / DAY_NS, (end - _ns(0)) / DAY_NS)
+            cache.apply_range_update(requested[0], requested[1], staged, loaded)
+            loaded = merge_time_intervals(loaded + [(start, end)])
+
+        sensor = cache.get_sensor_data(20)
+        self.assertEqual(sensor.size, 2 * 24 + 1)
+        self.assertEqual(loaded, [requested])
+
+    async def test_merge_appends_later_chunks_and_sorts_earlier_ones(self):
+        sensor = _hourly(0, 1).get_sensor_data(20)
+        sensor.merge_from(_hourly(1.5, 2).get_sensor_data(20))
+        self.assertEqual((sensor.size, sensor.capacity), (25 + 13, 50))  # 용량은 2배씩 증가
+        # 뒤에 오는 청크는 남은 용량에 이어 붙임 (재할당 없음)
+        timestamps = sensor.timestamps
+        sensor.merge_from(_hourly(2.5, 2.75).get_sensor_data(20))
+        self.assertIs(sensor.timestamps, timestamps)
+        self.assertEqual(sensor.size, 25 + 13 + 7)
+
+        sensor.merge_from(_hourly(1.25, 1.25).get_sensor_data(20))  # 앞쪽 구간은 정렬 병합
+        values = sensor.timestamps[:sensor.size]
+        self.assertEqual(sensor.size, 25 + 13 + 7 + 1)
+        self.assertTrue((values[1:] > values[:-1]).all())
+        self.assertEqual(float(sensor.temp_cold[sensor.size - 1]), 66.0)
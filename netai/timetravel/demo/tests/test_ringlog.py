@@ -0,0 +1,70 @@
+# NOTE:
+#   omni.kit.test - std python's unittest module with additional wrapping to add suport for async/await tests
+#   For most things refer to unittest docs: https://docs.python.org/3/library/unittest.html
+import contextlib
+import io
+
+import omni.kit.test
+
+from netai.timetravel.demo.ringlog import RingLogger
+
+
+class _Unprintable:
+    def __str__(self):
+        raise AssertionError("disabled level must not format its arguments")
+
+
+class TestRingLogger(omni.kit.test.AsyncTestCase):
+    async def test_ring_buffer_keeps_newest_records(self):
+        log = RingLogger(prefix="[t]", level="INFO", echo_level="ERROR", capacity=3)
+        for i in range(5):
+            log.info("frame %d", i)
+        log.debug("hidden %s", _Unprintable())
+
+        lines = log.dump()
+        self.assertEqual(len(lines), 3)
+        self.assertTrue(lines[0].endswith("[t] INFO frame 2"))
+        self.assertTrue(lines[-1].endswith("[t] INFO frame 4"))
+        self.assertEqual(len(log.dump(limit=1)), 1)
+        self.assertEqual(log.get_stats()['dropped'], 2)
+
+        log.set_level("DEBUG")
+        self.assertTrue(log.debug_enabled)
+        log.debug("visible %d", 7)
+        self.assertTrue(log.dump()[-1].endswith("DEBUG visible 7"))
+
+        with self.assertRaises(ValueError):
+            log.set_level("VERBOSE")
+
+    async def test_console_echo_is_rate_limited(self):
+        log = RingLogger(prefix="[t]", level="DEBUG", echo_level="WARNING", capacity=100, echo_per_second=2)
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            log.info("buffered only")
+            for i in range(10):
+                log.warning("hot %d", i)
+        printed = out.getvalue().splitlines()
+        # 같은 1초 창 안에서는 2줄만 출력 (창 경계에 걸리면 다음 창에서 억제 개수가 붙음)
+        self.assertLessEqual(len(printed), 4)
+        self.assertTrue(printed[0].endswith("WARNING hot 0"))
+        self.assertEqual(len(log.dump()), 11)
+
+    async def test_warning_once_per_key(self):
+        log = RingLogger(prefix="[t]", level="INFO", echo_level="WARNING", capacity=100)
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            for _ in range(60):  # 매 프레임 같은 랙 두 개
+                log.warning_once(("rack mapping", "/A"), "Rack path not found in mapping: %s", "/A")
+                log.warning_once(("rack mapping", "/B"), "Rack path not found in mapping: %s", "/B")
+        self.assertEqual(len(out.getvalue().splitlines()), 2)
+        self.assertEqual([line.split("WARNING ")[1] for line in log.dump()],
+                         ["Rack path not found in mapping: /A", "Rack path not found in mapping: /B"])
+
+        # 반복은 DEBUG 레벨에서만 기록, clear() 후에는 다시 경고
+        log.set_level("DEBUG")
+        log.warning_once(("rack mapping", "/A"), "Rack path not found in mapping: %s", "/A")
+        self.assertTrue(log.dump()[-1].endswith("DEBUG Rack path not found in mapping: /A"))
+        log.clear()
+        with contextlib.redirect_stdout(io.StringIO()):
+            log.warning_once(("rack mapping", "/A"), "Rack path not found in mapping: %s", "/A")
+        self.assertTrue(log.dump()[-1].endswith("WARNING Rack path not found in mapping: /A"))
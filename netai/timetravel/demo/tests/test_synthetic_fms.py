@@ -0,0 +1,62 @@
+# NOTE:
+#   omni.kit.test - std python's unittest module with additional wrapping to add suport for async/await tests
+#   For most things refer to unittest docs: https://docs.python.org/3/library/unittest.html
+import datetime
+import os
+import tempfile
+
+import numpy as np
+import omni.kit.test
+
+from netai.timetravel.demo.benchmarks import synthetic_fms
+from netai.timetravel.demo.config import SENSOR_DATA_CONFIG
+from netai.timetravel.demo.engine import SensorTimelineIndex, read_csv_readings
+
+
+class TestSyntheticFms(omni.kit.test.AsyncTestCase):
+
+    async def test_stream_quirks(self):
+        stream = synthetic_fms.SyntheticFmsStream(
+            synthetic_fms.make_sensor_ids(30), datetime.datetime(2025, 3, 27),
+            duplicate_rate=0.01, out_of_order_rate=0.01, gaps_per_day=4, seed=1)
+        chunks = list(stream.chunks(2 * 86400))
+        self.assertEqual(len(chunks), 2)
+        times = np.concatenate([chunk['times_ms'] for chunk in chunks])
+        obj_ids = np.concatenate([chunk['obj_ids'] for chunk in chunks])
+
+        # 중복 (센서, 시각), 역순 행, 결측이 모두 있어야 함
+        pairs = obj_ids * 10**13 + times
+        self.assertLess(len(np.unique(pairs)), len(pairs))
+        self.assertTrue(np.any(np.diff(times) < 0))
+        self.assertLess(len(np.unique(pairs)), 30 * 2 * 1440)
+        # 청크 사이에는 순서가 섞이지 않음
+        self.assertLess(chunks[0]['times_ms'].max(), chunks[1]['times_ms'].min())
+
+    async def test_generate_loads_in_both_schemas(self):
+        with tempfile.TemporaryDirectory() as out_dir:
+            formats = ('csv', 'parquet') if synthetic_fms.PYARROW_AVAILABLE else ('csv',)
+            summary = synthetic_fms.generate(out_dir, sensors=30, days=0.25, formats=formats, seed=2)
+            self.assertEqual(summary['sensors'], 30)
+            self.assertEqual(len(summary['files']), len(formats))
+
+            # CSV는 TimeController 로더로 그대로 읽힘
+            readings = read_csv_readings(os.path.join(out_dir, SENSOR_DATA_CONFIG["csv_file"]))
+            self.assertEqual(len(readings), summary['rows'])
+            index = SensorTimelineIndex.build(readings)
+            self.assertEqual(len(index.sensor_ids), 30)
+
+            with open(os.path.join(out_dir, "rack_sensor_map.txt")) as f:
+                mapped = [line.split()[1] for line in f if line.strip() and not line.startswith('#')]
+            self.assertEqual(sorted(mapped), sorted(index.sensor_ids))
+            with open(os.path.join(out_dir, "rack_directory.txt")) as f:
+                self.assertEqual(len(f.read().split()), 30)
+
+            if synthetic_fms.PYARROW_AVAILABLE:
+                import pyarrow.parquet as pq
+                table = pq.read_table(summary['files'][1])
+                self.assertEqual(table.num_rows, summary['rows'])
+                self.assertIn('timestamp_utc', table.column_names)
+
+    async def test_unknown_format(self):
+        with self.assertRaises(ValueError):
+            synthetic_fms.generate(tempfile.gettempdir(), formats=('xlsx',))
@@ -0,0 +1,73 @@
+# NOTE:
+#   omni.kit.test - std python's unittest module with additional wrapping to add suport for async/await tests
+#   For most things refer to unittest docs: https://docs.python.org/3/library/unittest.html
+import numpy as np
+
+import omni.kit.test
+
+from netai.timetravel.demo.developing.data_model import SensorDataCache
+from netai.timetravel.demo.developing.threshold_index import ThresholdIntervalIndex, exceedance_intervals
+
+NS = 1_000_000_000
+
+
+def _cache():
+    rng = np.random.default_rng(8)
+    cache = SensorDataCache()
+    for objid in (20, 21):
+        sensor = cache.get_sensor_data(objid)
+        steps = 2000
+        sensor.timestamps = (np.arange(steps, dtype=np.int64) * 60 + objid) * NS
+        sensor.temp_hot = (23.5 + np.cumsum(rng.normal(0, 0.2, steps))).astype(np.float32)
+        sensor.temp_cold = np.full(steps, 20.0, dtype=np.float32)
+        sensor.humidity_cold = sensor.humidity_hot = np.full(steps, 40.0, dtype=np.float32)
+        sensor.size = sensor.capacity = steps
+    return cache
+
+
+class TestThresholdIntervalIndex(omni.kit.test.AsyncTestCase):
+    async def test_crossings_are_interpolated(self):
+        timestamps = np.array([0, 10, 20, 30, 40], dtype=np.int64) * NS
+        values = np.array([25.0, 23.0, 23.0, 26.0, 25.0], dtype=np.float32)
+        (starts, ends), = exceedance_intervals(timestamps, values, np.array([24.0]))
+        # 0초에 이미 초과, 5초에 하강 교차, 20~30초 사이 1/3 지점 상승 교차, 끝까지 초과
+        np.testing.assert_array_equal(starts, [0, 23_333_333_333])
+        np.testing.assert_array_equal(ends, [5 * NS, 40 * NS])
+
+    async def test_intervals_match_dense_scan(self):
+        cache = _cache()
+        index = ThresholdIntervalIndex.build(cache, (('temperature_hot', 24.0), ('temperature_hot', 26.0)))
+        for objid in (20, 21):
+            sensor = cache.find_sensor_data(objid)
+            dense_t = np.arange(sensor.timestamps[0], sensor.timestamps[-1], NS, dtype=np.int64)
+            dense_v = np.interp(dense_t, sensor.timestamps, sensor.temp_hot.astype(np.float64))
+            for threshold in (24.0, 26.0):
+                starts, ends = index.intervals(objid, 'temperature_hot', threshold)
+                self.assertTrue((starts < ends).all())
+                self.assertTrue((ends[:-1] < starts[1:]).all())
+                inside = np.zeros(len(dense_t), dtype=bool)
+                for s, e in zip(starts, ends):
+                    inside |= (dense_t > s) & (dense_t < e)
+                # 교차 시각과 1초 이내인 점은 경계 오차 허용
+                near = np.zeros(len(dense_t), dtype=bool)
+                for edge in np.concatenate([starts, ends]):
+                    near |= np.abs(dense_t - edge) <= NS
+                np.testing.assert_array_equal(inside[~near], (dense_v > threshold)[~near])
+
+    async def test_sensors_over_window(self):
+        cache = _cache()
+        index = ThresholdIntervalIndex.build(cache, (('temperature_hot', 24.0), ('temperature_cold', 24.0)))
+        window = (30_000 * NS, 60_000 * NS)
+        over = index.sensors_over('temperature_hot', 24.0, *window)
+        for objid in (20, 21):
+            starts, ends = index.intervals(objid, 'temperature_hot', 24.0)
+            overlap = (starts <= window[1]) & (ends >= window[0])
+            self.assertEqual(objid in over, bool(overlap.any()))
+            if overlap.any():
+                expected = (np.minimum(ends, window[1]) - np.maximum(starts, window[0]))[overlap].sum() / 1e9
+                self.assertAlmostEqual(over[objid]['seconds_over'], expected, places=3)
+        self.assertEqual(index.sensors_over('temperature_cold', 24.0, *window), {})
+        with self.assertRaises(ValueError):
+            index.sensors_over('temperature_hot', 30.0, *window)
+        with self.assertRaises(ValueError):
+            ThresholdIntervalIndex((('pressure', 1.0),))
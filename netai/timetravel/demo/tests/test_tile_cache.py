@@ -0,0 +1,110 @@
+# NOTE:
+#   omni.kit.test - std python's unittest module with additional wrapping to add suport for async/await tests
+#   For most things refer to unittest docs: https://docs.python.org/3/library/unittest.html
+import datetime
+import random
+from concurrent.futures import ThreadPoolExecutor
+
+import omni.kit.test
+
+from netai.timetravel.demo.developing.data_model import SensorDataCache
+from netai.timetravel.demo.developing.tile_cache import TimeTileCache
+
+MONTH_START = datetime.datetime(2025, 5, 1)
+MONTH_END = datetime.datetime(2025, 6, 1)
+SENSORS = (20, 21)
+
+
+class MonthLoader:
+    """Synthetic one-minute readings for May; temperature = minutes since the month start"""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, start, end):
+        self.calls.append(start)
+        tile = SensorDataCache()
+        minutes = int((end - start).total_seconds() // 60)
+        for objid in SENSORS:
+            timestamps = [start + datetime.timedelta(minutes=m) for m in range(minutes)]
+            values = [(t - MONTH_START).total_seconds() / 60 for t in timestamps]
+            tile.get_sensor_data(objid).add_dataframe_dict({
+                'timestamp': timestamps,
+                'temperature_cold': values,
+                'temperature_hot': values,
+                'humidity_cold': values,
+                'humidity_hot': values,
+            })
+        return tile
+
+
+class TestTimeTileCache(omni.kit.test.AsyncTestCase):
+    async def setUp(self):
+        self._loader = MonthLoader()
+
+    async def test_seek_anywhere_in_month_loads_only_needed_tiles(self):
+        cache = TimeTileCache(self._loader, tile_seconds=3600)
+        rng = random.Random(7)
+        month_minutes = int((MONTH_END - MONTH_START).total_seconds() // 60)
+        seeks = [MONTH_START + datetime.timedelta(minutes=rng.randrange(month_minutes)) for _ in range(40)]
+
+        for t in seeks:
+            values = cache.value_at(20, t)
+            self.assertAlmostEqual(values['temperature_cold'], (t - MONTH_START).total_seconds() / 60, places=3)
+
+        needed = {cache.tile_index(t) for t in seeks}
+        self.assertEqual(sorted(cache.tile_index(s) for s in self._loader.calls), sorted(needed))
+        self.assertEqual(len(self._loader.calls), len(needed))
+        self.assertLess(len(needed), 31 * 24)
+
+    async def test_lru_eviction_under_memory_cap(self):
+        probe = TimeTileCache(MonthLoader(), tile_seconds=3600)
+        probe.get_tile(probe.tile_index(MONTH_START))
+        tile_bytes = probe.get_stats()['resident_bytes']
+
+        cache = TimeTileCache(self._loader, tile_seconds=3600, max_bytes=tile_bytes * 3)
+        first = cache.tile_index(MONTH_START)
+        for i in range(6):
+            cache.get_tile(first + i)
+        cache.get_tile(first + 3)  # 최근 사용으로 갱신
+
+        stats = cache.get_stats()
+        self.assertLessEqual(stats['resident_bytes'], tile_bytes * 3)
+        self.assertEqual(stats['evictions'], 3)
+        self.assertEqual(cache.resident_tiles(), [first + 3, first + 4, first + 5])
+
+    async def test_prefetch_scales_with_speed_and_direction(self):
+        executor = ThreadPoolExecutor(max_workers=2)
+        try:
+            cache = TimeTileCache(self._loader, tile_seconds=3600, lookahead_s=10.0,
+                                  max_prefetch_tiles=6, executor=executor)
+            cache.set_bounds(MONTH_START, MONTH_END)
+            cursor = MONTH_START + datetime.timedelta(days=10, minutes=30)
+            current = cache.tile_index(cursor)
+
+            # 1x (60 sim-s per s) -> 600 s ahead -> 1 tile
+            self.assertEqual(cache.prefetch(cursor, 60), [current + 1])
+            # 1000x -> capped at 6 tiles; already scheduled tile is skipped
+            self.assertEqual(cache.prefetch(cursor, 60_000), [current + i for i in range(2, 7)])
+            # backwards scrubbing
+            self.assertEqual(cache.prefetch(cursor, 60, direction=-1), [current - 1])
+
+            cache.get_tile(current + 1)
+            cache.get_tile(current - 1)
+            stats = cache.get_stats()
+            self.assertEqual(stats['misses'], 0)
+            self.assertEqual(stats['prefetch_hits'], 2)
+
+            # 시간 범위 밖으로는 선행 로딩하지 않음
+            self.assertEqual(cache.prefetch(MONTH_END, 60_000), [])
+        finally:
+            executor.shutdown(wait=True)
+
+    async def test_interpolates_across_resident_tile_boundary(self):
+        cache = TimeTileCache(self._loader, tile_seconds=3600)
+        boundary = MONTH_START + datetime.timedelta(hours=5)
+        cache.get_tile(cache.tile_index(boundary))
+        t = boundary - datetime.timedelta(seconds=30)
+
+        values = cache.value_at(21, t)
+        self.assertAlmostEqual(values['humidity_hot'], (t - MONTH_START).total_seconds() / 60, places=3)
@@ -0,0 +1,123 @@
+# NOTE:
+#   omni.kit.test - std python's unittest module with additional wrapping to add suport for async/await tests
+#   For most things refer to unittest docs: https://docs.python.org/3/library/unittest.html
+import datetime
+
+import omni.kit.test
+
+from netai.timetravel.demo.engine import SensorTimelineIndex
+
+BASE = datetime.datetime(2025, 3, 27)
+
+
+def _at(ms: int) -> datetime.datetime:
+    return BASE + datetime.timedelta(milliseconds=ms)
+
+
+def _readings():
+    # 센서 A는 같은 초 안에 세 번 측정, 센서 B는 1.5초 간격
+    readings = [(_at(ms), 'A', float(i)) for i, ms in enumerate((1018, 1240, 1999, 4000))]
+    readings += [(_at(ms), 'B', 100.0 + i) for i, ms in enumerate((0, 1500, 3000))]
+    return [(SensorTimelineIndex.to_ms(t), sensor_id, [value, 0.0, 0.0, 0.0])
+            for t, sensor_id, value in reversed(readings)]
+
+
+class TestSensorTimelineIndex(omni.kit.test.AsyncTestCase):
+    async def test_readings_in_same_second_resolve_at_millisecond_precision(self):
+        index = SensorTimelineIndex.build(_readings())
+        self.assertEqual(len(index), 7)
+        self.assertEqual(index.time_range(), (_at(0), _at(4000)))
+
+        expected_a = {1017: 0.0, 1018: 0.0, 1239: 0.0, 1240: 1.0, 1998: 1.0, 1999: 2.0, 3999: 2.0, 4000: 3.0}
+        for ms, value in expected_a.items():
+            self.assertEqual(index.at(_at(ms))['A']['TEMPERATURE1'], value, ms)
+        # 밀리초 미만 (마이크로초) 시각도 내림으로 해석
+        self.assertEqual(index.at(_at(1239) + datetime.timedelta(microseconds=999))['A']['TEMPERATURE1'], 0.0)
+
+    async def test_sequential_cursor_matches_seek(self):
+        index = SensorTimelineIndex.build(_readings())
+        fresh = SensorTimelineIndex.build(_readings())
+        times = list(range(-500, 5000, 37)) + [3000, 200, 4999]  # 순차 재생 후 뒤로 점프
+        for ms in times:
+            played = {sensor_id: entry['TEMPERATURE1'] for sensor_id, entry in index.at(_at(ms)).items()}
+            fresh._cursor_pos = -1
+            sought = {sensor_id: entry['TEMPERATURE1'] for sensor_id, entry in fresh.at(_at(ms)).items()}
+            self.assertEqual(played, sought, ms)
+
+    async def test_first_reading_fills_before_start(self):
+        index = SensorTimelineIndex.build(_readings())
+        state = index.at(_at(-1000))
+        self.assertEqual(state['A']['TEMPERATURE1'], 0.0)
+        self.assertEqual(state['B']['TEMPERATURE1'], 100.0)
+        self.assertEqual(SensorTimelineIndex.build([]).at(BASE), {})
+
+    async def test_coarse_buckets_shrink_the_index(self):
+        raw = SensorTimelineIndex.build(_readings())
+        per_second = SensorTimelineIndex.build(_readings(), bucket_ms=1000, reducer='mean')
+        self.assertEqual(len(per_second), 5)  # A의 1초 구간 세 측정값이 한 행으로
+        self.assertLess(per_second.nbytes(), raw.nbytes())
+        # 버킷 평균은 버킷의 마지막 측정 시각(1.999s)에 기록됨
+        self.assertEqual(per_second.time_range()[0], _at(0))
+        self.assertEqual(per_second.at(_at(1999))['A']['TEMPERATURE1'], 1.0)
+        self.assertEqual(per_second.at(_at(3999))['A']['TEMPERATURE1'], 1.0)
+        self.assertEqual(per_second.at(_at(4000))['A']['TEMPERATURE1'], 3.0)
+        self.assertEqual(per_second.at(_at(4000))['A']['objId'], 'A')
+
+    async def test_sorted_timestamps_and_summary(self):
+        index = SensorTimelineIndex.build(_readings())
+        self.assertEqual(index.summary['rows'], 7)
+        self.assertEqual(index.summary['timestamps'], 7)
+        self.assertEqual(index.summary['sensors'], 2)
+        self.assertEqual(index.summary['rows_per_sensor'], {'A': 4, 'B': 3})
+        self.assertTrue((index.timestamps_ms[1:] > index.timestamps_ms[:-1]).all())
+
+        around = index.timestamps_around(SensorTimelineIndex.to_ms(_at(1240)), 1)
+        self.assertEqual(around, ['2025-03-27T00:00:01.018Z', '2025-03-27T00:00:01.240Z', '2025-03-27T00:00:01.500Z'])
+        self.assertEqual(index.timestamps_around(SensorTimelineIndex.to_ms(_at(1241)), 1), [])
+        self.assertEqual(len(index.timestamps_around(SensorTimelineIndex.to_ms(_at(0)), 10)), 7)
+
+    async def test_change_events_skip_repeated_values(self):
+        readings = _readings()
+        readings.append((SensorTimelineIndex.to_ms(_at(2500)), 'A', [2.0, 0.0, 0.0, 0.0]))  # 직전 값 반복
+        index = SensorTimelineIndex.build(readings)
+        self.assertEqual(index.summary['changes'], 7)
+
+        to_ms = SensorTimelineIndex.to_ms
+        self.assertEqual(index.next_change(to_ms(_at(1999))), to_ms(_at(3000)))  # 2.5초 반복값은 건너뜀
+        self.assertEqual(index.next_change(to_ms(_at(1999)), 'A'), to_ms(_at(4000)))
+        self.assertEqual(index.prev_change(to_ms(_at(4000)), 'A'), to_ms(_at(1999)))
+        self.assertEqual(index.prev_change(to_ms(_at(1240))), to_ms(_at(1018)))
+        self.assertIsNone(index.next_change(to_ms(_at(4000))))
+        self.assertIsNone(index.prev_change(to_ms(_at(0)), 'B'))
+        self.assertIsNone(index.next_change(0, 'unknown'))
+
+    async def test_diff_matches_brute_force(self):
+        readings = _readings()
+        readings.append((SensorTimelineIndex.to_ms(_at(2500)), 'A', [2.0, 0.0, 0.0, 0.0]))  # 직전 값 반복
+        readings.append((SensorTimelineIndex.to_ms(_at(4500)), 'B', [101.0, 0.0, 0.0, 0.0]))  # 이전 값으로 복귀
+        index = SensorTimelineIndex.build(readings)
+        reference = SensorTimelineIndex.build(readings)
+
+        self.assertEqual(index.diff(_at(1999), _at(2999)), {})  # 반복값만 있는 구간
+        self.assertEqual(index.diff(_at(1500), _at(1999)),
+                         {'A': {'TEMPERATURE1': {'from': 1.0, 'to': 2.0, 'delta': 1.0}}})
+        # B는 1.5초 -> 4.5초 사이 값이 바뀌었다 돌아옴: 변경점은 다르지만 값 차이 없음
+        self.assertEqual([sensor_id for sensor_id, _ in index.changed_positions(_at(1500), _at(4500))], ['A', 'B'])
+        self.assertEqual(set(index.diff(_at(1500), _at(4500))), {'A'})
+
+        times = list(range(-500, 5000, 250))
+        for t1 in times:
+            for t2 in times:
+                state1 = {k: dict(v) for k, v in reference.at(_at(t1)).items()}
+                state2 = reference.at(_at(t2))
+                expected = {}
+                for sensor_id in state2:
+                    delta = state2[sensor_id]['TEMPERATURE1'] - state1[sensor_id]['TEMPERATURE1']
+                    if delta:
+                        expected[sensor_id] = {'TEMPERATURE1': {'from': state1[sensor_id]['TEMPERATURE1'],
+                                                                'to': state2[sensor_id]['TEMPERATURE1'],
+                                                                'delta': delta}}
+                self.assertEqual(index.diff(_at(t1), _at(t2)), expected, (t1, t2))
+                # 바뀐 센서의 위치는 t2 시점 값을 가진 행 (마지막 변경점)
+                for sensor_id, position in index.changed_positions(_at(t1), _at(t2)):
+                    self.assertEqual(index.entry(position)['TEMPERATURE1'], state2[sensor_id]['TEMPERATURE1'])
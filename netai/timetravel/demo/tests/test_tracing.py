@@ -0,0 +1,209 @@
+# NOTE:
+#   omni.kit.test - std python's unittest module with additional wrapping to add suport for async/await tests
+#   For most things refer to unittest docs: https://docs.python.org/3/library/unittest.html
+import datetime
+import json
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import omni.kit.test
+
+from netai.timetravel.demo import tracing
+from netai.timetravel.demo.engine import PlaybackClock, RecordingStageWriter, TimelineEngine
+from netai.timetravel.demo.performance_monitor import PerformanceMonitorWindow
+
+BASE = datetime.datetime(2025, 3, 27)
+
+
+class _FakeNow:
+    def __init__(self):
+        self.t = 1000.0
+
+    def __call__(self):
+        return self.t
+
+
+class TestTracing(omni.kit.test.AsyncTestCase):
+    def setUp(self):
+        self._spans = []
+        self._dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        tracing.tracer.unsubscribe(self._spans.append)
+        self._dir.cleanup()
+
+    async def test_spans_reach_subscribers_only_while_subscribed(self):
+        tracer = tracing.Tracer()
+        self.assertFalse(tracer.enabled)
+        self.assertIs(tracer.span(tracing.FRAME), tracer.span(tracing.SEEK))  # 구독자 없으면 공유 no-op
+
+        def broken(span):
+            raise RuntimeError("subscriber bug")
+        tracer.subscribe(broken)
+        tracer.subscribe(self._spans.append)
+        with tracer.span(tracing.SEEK):
+            with tracer.span(tracing.DIFF, {'sensors': 3}):
+                pass
+        # 자식이 먼저, 구독자 예외는 트레이스 대상 코드로 전파되지 않음
+        self.assertEqual([span.name for span in self._spans], [tracing.DIFF, tracing.SEEK])
+        diff, seek = self._spans
+        self.assertEqual(diff.args, {'sensors': 3})
+        self.assertTrue(seek.start_ns <= diff.start_ns <= diff.end_ns <= seek.end_ns)
+        self.assertGreaterEqual(seek.duration_ms, 0.0)
+
+        tracer.unsubscribe(broken)
+        tracer.unsubscribe(self._spans.append)
+        self.assertFalse(tracer.enabled)
+        with tracer.span(tracing.FRAME):
+            pass
+        self.assertEqual(len(self._spans), 2)
+
+    async def test_engine_pipeline_emits_stage_spans(self):
+        path = os.path.join(self._dir.name, "sensors.csv")
+        with open(path, "w") as f:
+            f.write("@timestamp,objId,TEMPERATURE1,TEMPERATURE,HUMIDITY1,HUMIDITY\n")
+            f.write("2025-03-27T00:00:00.000Z,20,20.0,25.0,40,45\n")
+            f.write("2025-03-27T00:00:10.000Z,20,21.0,26.0,40,45\n")
+        engine = TimelineEngine.from_csv(path, rack_paths=["/Root/datacenter/RACK_A1"],
+                                         rack_to_sensor_map={"/Root/datacenter/RACK_A1": "20"},
+                                         writer=RecordingStageWriter())
+        now = _FakeNow()
+        engine.clock = PlaybackClock(engine.clock.start_time, engine.clock.end_time, now=now)
+        tracing.tracer.subscribe(self._spans.append)
+
+        engine.apply()
+        self.assertEqual([span.name for span in self._spans],
+                         [tracing.USD_TIME, tracing.RESOLVE, tracing.USD_APPLY])
+        self.assertEqual(self._spans[-1].args, {'racks': 1})
+
+        del self._spans[:]
+        engine.seek(BASE + datetime.timedelta(seconds=12))
+        self.assertEqual([span.name for span in self._spans],
+                         [tracing.USD_TIME, tracing.DIFF, tracing.USD_APPLY, tracing.SEEK])
+
+        # 정지 중 tick은 스팬 없음, 재생 중에는 frame이 advance와 적용 단계를 감쌈
+        del self._spans[:]
+        engine.clock.seek(BASE)
+        self.assertIsNone(engine.tick())
+        self.assertEqual(self._spans, [])
+        engine.clock.toggle()
+        now.t += 1.0
+        engine.tick()
+        self.assertEqual([span.name for span in self._spans],
+                         [tracing.ADVANCE, tracing.USD_TIME, tracing.RESOLVE, tracing.USD_APPLY, tracing.FRAME])
+
+    async def test_recorder_exports_bounded_chrome_trace_with_loader_tracks(self):
+        tracer = tracing.Tracer()
+
+        @tracer.traced(tracing.LOAD_FILE)
+        def load(value):
+            return value * 2
+
+        self.assertEqual(load(2), 4)  # 구독자 없음 - 그냥 호출
+        recorder = tracing.TraceRecorder(tracer, capacity=3).start()
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="parquet-loader") as executor:
+            self.assertEqual(executor.submit(load, 3).result(), 6)
+        for _ in range(3):
+            with tracer.span(tracing.FRAME, {'racks': 2}):
+                pass
+        recorder.stop()
+        self.assertFalse(tracer.enabled)
+
+        # 용량 3 - 가장 오래된 스팬(로더)은 버려지고 개수만 남음
+        stats = recorder.get_stats()
+        self.assertEqual((stats['recorded'], stats['buffered'], stats['dropped'], stats['threads']), (4, 3, 1, 2))
+        path = os.path.join(self._dir.name, "trace.json")
+        self.assertEqual(recorder.export(path), 3)
+        with open(path) as f:
+            trace = json.load(f)
+        events = trace['traceEvents']
+        names = {event['args']['name'] for event in events if event['name'] == 'thread_name'}
+        self.assertTrue(any(name.startswith("parquet-loader") for name in names))
+        spans = [event for event in events if event['ph'] == 'X']
+        self.assertEqual([(event['name'], event['cat']) for event in spans], [(tracing.FRAME, 'pipeline')] * 3)
+        self.assertEqual(spans[0]['args'], {'racks': 2})
+        self.assertTrue(all(event['ts'] >= 0 and event['dur'] >= 0 for event in spans))
+
+        # 로더 스레드 스팬은 자체 트랙 + loader 카테고리
+        recorder = tracing.TraceRecorder(tracer).start()
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="parquet-loader") as executor:
+            executor.submit(load, 1).result()
+        with tracer.span(tracing.FRAME):
+            pass
+        recorder.stop()
+        spans = {event['name']: event for event in recorder.trace_events() if event['ph'] == 'X'}
+        self.assertEqual(spans[tracing.LOAD_FILE]['cat'], 'loader')
+        self.assertNotEqual(spans[tracing.LOAD_FILE]['tid'], spans[tracing.FRAME]['tid'])
+
+        # 기록 시간이 지나면 다음 스팬에서 멈춤
+        recorder = tracing.TraceRecorder(tracer).start(seconds=0.01)
+        time.sleep(0.02)
+        with tracer.span(tracing.FRAME):
+            pass
+        self.assertFalse(recorder.recording)
+        self.assertEqual(recorder.spans(), [])
+        with self.assertRaises(ValueError):
+            recorder.start(seconds=0)
+
+        # 스팬이 없어도 기한이 지나면 조회할 때 멈추고 구독을 해제, 기록 시간은 기한까지
+        recorder = tracing.TraceRecorder(tracer).start(seconds=0.01)
+        time.sleep(0.02)
+        self.assertTrue(tracer.enabled)
+        stats = recorder.get_stats()
+        self.assertFalse(stats['recording'])
+        self.assertFalse(tracer.enabled)
+        self.assertAlmostEqual(stats['seconds'], 0.01, places=6)
+
+    async def test_recorder_counts_spans_from_many_threads(self):
+        tracer = tracing.Tracer()
+        recorder = tracing.TraceRecorder(tracer, capacity=500).start()
+        seen = []
+
+        def finish_spans():
+            for _ in range(400):
+                with tracer.span(tracing.LOAD_TILE):
+                    pass
+                seen.append(recorder.get_stats()['recorded'])
+
+        with ThreadPoolExecutor(max_workers=4, thread_name_prefix="parquet-loader") as executor:
+            for future in [executor.submit(finish_spans) for _ in range(4)]:
+                future.result()
+        recorder.stop()
+
+        stats = recorder.get_stats()
+        self.assertEqual((stats['recorded'], stats['buffered'], stats['dropped']), (1600, 500, 1100))
+        self.assertGreater(stats['threads'], 1)
+        spans = recorder.spans()
+        self.assertEqual(len(spans), 500)
+        self.assertEqual(len({id(span) for span in spans}), 500)  # 슬롯을 덮어쓴 스팬 없음
+        self.assertEqual(max(seen), 1600)
+
+    async def test_monitor_window_measures_goto_spans(self):
+        monitor = PerformanceMonitorWindow(controller=None)
+        monitor._toggle_monitoring()
+        self.assertTrue(tracing.tracer.enabled)
+        tracer = tracing.tracer
+        with tracer.span(tracing.GOTO):
+            with tracer.span(tracing.SEEK):
+                with tracer.span(tracing.USD_APPLY):
+                    pass
+        with tracer.span(tracing.UI_REFRESH):
+            pass
+
+        self.assertEqual(len(monitor._goto_measurements), 1)
+        measurement = monitor._goto_measurements[-1]
+        self.assertEqual(set(measurement['breakdown']), {tracing.SEEK, tracing.USD_APPLY})
+        self.assertGreaterEqual(measurement['delay_ms'], measurement['breakdown'][tracing.SEEK])
+
+        monitor._start_trace()
+        with tracer.span(tracing.FRAME):
+            pass
+        path = monitor._export_trace()
+        self.addCleanup(os.remove, path)
+        with open(path) as f:
+            self.assertIn(tracing.FRAME, [event['name'] for event in json.load(f)['traceEvents']])
+
+        monitor.destroy()
+        self.assertFalse(tracing.tracer.enabled)
@@ -0,0 +1,105 @@
+# NOTE:
+#   omni.kit.test - std python's unittest module with additional wrapping to add suport for async/await tests
+#   For most things refer to unittest docs: https://docs.python.org/3/library/unittest.html
+import datetime
+import os
+import tempfile
+from unittest import mock
+
+import omni.kit.test
+import omni.usd
+
+from netai.timetravel.demo.benchmarks import synthetic_fms
+from netai.timetravel.demo.benchmarks.usd_standin import UsdStandIn
+from netai.timetravel.demo.config import SENSOR_DATA_CONFIG, USD_ATTRIBUTE_CONFIG
+from netai.timetravel.demo.engine import load_timeline_index
+
+
+def _entry(values, sensor_id="20"):
+    temps, hums = SENSOR_DATA_CONFIG["temperature_columns"], SENSOR_DATA_CONFIG["humidity_columns"]
+    return {temps["cold"]: values[0], temps["hot"]: values[1], hums["cold"]: values[2], hums["hot"]: values[3],
+            SENSOR_DATA_CONFIG["obj_id_column"]: sensor_id}
+
+
+class TestUsdStandIn(omni.kit.test.AsyncTestCase):
+
+    async def test_datacenter_layout(self):
+        standin = UsdStandIn(sensors=30, backend='mock')
+        stage = standin.stage
+        self.assertEqual(len(standin.racks), 30)
+        self.assertEqual(sum(standin.calls.values()), 0)
+
+        datacenter = stage.GetPrimAtPath("/Root/datacenter")
+        self.assertEqual(len(datacenter.GetChildren()), 30)
+        rack = stage.GetPrimAtPath("/Root/datacenter/RACK_A1")
+        for name in USD_ATTRIBUTE_CONFIG["rack_attributes"].values():
+            self.assertTrue(rack.GetAttribute(name).IsValid())
+        self.assertTrue(stage.GetPrimAtPath("/Root/datacenter/RACK_S01005").IsValid())
+        self.assertTrue(stage.GetPrimAtPath("/Root/Air_Rack/Steam_03/flowOffscreen/colormap").IsValid())
+        self.assertTrue(stage.GetPrimAtPath("/Root/Air_Rack_S01005/Steam_01/flowOffscreen/colormap").IsValid())
+        self.assertFalse(stage.GetPrimAtPath("/Root/datacenter/RACK_X").IsValid())
+        self.assertEqual(standin.calls['GetPrimAtPath'], 6)
+
+        with self.assertRaises(ValueError):
+            UsdStandIn(backend='hydra')
+
+    async def test_controller_write_path(self):
+        original = omni.usd.get_context
+        with UsdStandIn(sensors=24) as standin:
+            self.assertIs(omni.usd.get_context().get_stage(), standin.stage)
+            from netai.timetravel.demo.controller import TimeController
+
+            controller = TimeController()
+            rack_path = "/Root/datacenter/RACK_A1"
+            rack = standin.stage.GetPrimAtPath(rack_path)
+
+            standin.calls.clear()
+            controller._update_rack_attributes(rack_path, _entry((21.5, 25.0, 40.0, 35.0)))
+            self.assertEqual(rack.GetAttribute("temperature_cold").Get(), 21.5)
+            self.assertEqual(rack.GetCustomDataByKey("sensor_id"), "20")
+            self.assertEqual(standin.calls['Set'], 4 + 6)  # 랙 속성 4 + 컬러맵 3개 x (xPoints, rgbaPoints)
+
+            # 같은 값: 랙 속성은 다시 쓰지 않고 컬러맵만 갱신
+            standin.calls.clear()
+            controller._update_rack_attributes(rack_path, _entry((21.5, 25.0, 40.0, 35.0)))
+            self.assertEqual(standin.calls['Set'], 6)
+            self.assertEqual(standin.calls['SetCustomDataByKey'], 0)
+
+            time_manager = standin.stage.GetPrimAtPath(USD_ATTRIBUTE_CONFIG["time_manager_path"])
+            self.assertTrue(controller._ensure_base_time())
+            controller.write_time(datetime.datetime(2025, 3, 27, 12))
+            self.assertEqual(time_manager.GetCustomDataByKey("currentTime"), "2025-03-27T12:00:00.00Z")
+            self.assertGreater(standin.timeline.calls['set_current_time'], 0)
+        self.assertIs(omni.usd.get_context, original)
+
+    async def test_controller_playback_runs_through_the_engine(self):
+        with UsdStandIn(sensors=4, backend='mock') as standin, tempfile.TemporaryDirectory() as directory:
+            from netai.timetravel.demo import controller as controller_module
+
+            csv_path = os.path.join(directory, SENSOR_DATA_CONFIG["csv_file"])
+            synthetic_fms.generate(directory, sensors=4, days=0.1, formats=('csv',), seed=5)
+            # 절대 경로는 os.path.join이 그대로 사용
+            with mock.patch.dict(SENSOR_DATA_CONFIG, {"csv_file": csv_path}):
+                controller = controller_module.TimeController()
+            engine = controller.engine
+            # 로딩도 엔진 로더 경로 (같은 인덱스)
+            self.assertEqual(len(engine.index), len(load_timeline_index(csv_path)))
+            controller._rack_paths = list(standin.racks)
+            controller._rack_to_sensor_map = standin.rack_to_sensor_map()
+
+            with mock.patch.object(engine, "tick", wraps=engine.tick) as tick, \
+                    mock.patch.object(engine, "apply", wraps=engine.apply) as apply, \
+                    mock.patch.object(engine, "seek", wraps=engine.seek) as seek:
+                controller.update()  # 일시정지: 시계도 스테이지도 그대로
+                self.assertEqual((tick.call_count, apply.call_count), (1, 0))
+
+                controller.toggle_playback()
+                controller.update()
+                self.assertEqual((tick.call_count, apply.call_count), (2, 1))
+                self.assertGreater(standin.timeline.calls['set_current_time'], 0)
+
+                controller.set_current_time(controller.get_end_time())
+                seek.assert_called_once_with(controller.get_end_time())
+                self.assertEqual(apply.call_args, mock.call(changed_only=True))
+                self.assertEqual(engine.applied_time, controller.get_end_time())
+            controller.on_shutdown()
@@ -0,0 +1,112 @@
+# NOTE:
+#   omni.kit.test - std python's unittest module with additional wrapping to add suport for async/await tests
+#   For most things refer to unittest docs: https://docs.python.org/3/library/unittest.html
+import datetime
+import os
+import tempfile
+import threading
+import time
+from unittest import mock
+
+import numpy as np
+import omni.kit.test
+
+from netai.timetravel.demo.benchmarks import synthetic_fms
+from netai.timetravel.demo.benchmarks.usd_standin import UsdStandIn
+from netai.timetravel.demo.config import SENSOR_DATA_CONFIG
+from netai.timetravel.demo.engine import RecordingStageWriter, SensorTimelineIndex, load_timeline_index
+
+
+def _wait_for(condition, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+
+class TestTimeWindow(omni.kit.test.AsyncTestCase):
+    async def test_range_stats_panel_shows_csv_controller_stats(self):
+        with UsdStandIn(sensors=4, backend='mock') as standin, tempfile.TemporaryDirectory() as directory:
+            from netai.timetravel.demo.controller import TimeController
+            from netai.timetravel.demo.window import TimeWindowUI
+
+            controller = TimeController()
+            synthetic_fms.generate(directory, sensors=4, days=0.5, formats=('csv',), seed=3)
+            controller.engine.set_index(load_timeline_index(os.path.join(directory, SENSOR_DATA_CONFIG["csv_file"])))
+            controller._rack_paths = list(standin.racks)
+            controller._rack_to_sensor_map = standin.rack_to_sensor_map()
+            rack_path, sensor_id = next(iter(controller._rack_to_sensor_map.items()))
+            window = TimeWindowUI(controller)
+            try:
+                window._update_range_stats()
+                self.assertEqual(window._cold_stats_label.text, "N/A")  # 선택된 랙 없음
+
+                window._selected_rack_path = rack_path
+                window._update_range_stats()
+                series = {sid: values for sid, _times, values in controller.engine.index.sensor_series()}
+                cold = series[str(sensor_id)][:, 0].astype(np.float64)
+                self.assertEqual(window._stats_count_label.text, f"{len(cold)} over 12.0 h")
+                self.assertTrue(window._cold_stats_label.text.startswith(
+                    f"min {cold.min():.2f} / mean {cold.mean():.2f} / max {cold.max():.2f} °C"))
+
+                # 부분 구간도 같은 인덱스로 조회
+                times = {sid: times for sid, times, _values in controller.engine.index.sensor_series()}[str(sensor_id)]
+                mid = len(times) // 2
+                stats = controller.range_stats(rack_path, SensorTimelineIndex.from_ms(times[0]),
+                                               SensorTimelineIndex.from_ms(times[mid]))
+                self.assertEqual(stats['count'], mid + 1)
+                self.assertAlmostEqual(stats['max']['temperature_cold'], float(cold[:mid + 1].max()), places=4)
+                self.assertIsNone(controller.range_stats("/Root/datacenter/RACK_NONE"))
+            finally:
+                window.destroy()
+                controller.on_shutdown()
+
+    async def test_loaded_regions_strip_follows_a_progressive_parquet_load(self):
+        from netai.timetravel.demo.developing import optimized_controller
+        from netai.timetravel.demo.developing.config import Config
+
+        with UsdStandIn(sensors=4, backend='mock'), tempfile.TemporaryDirectory() as directory, \
+                mock.patch.object(optimized_controller, "MINIO_AVAILABLE", False), \
+                mock.patch.object(Config, "LOCAL_DATA_PATH", os.path.join(directory, "parquet")), \
+                mock.patch.object(Config, "PROGRESSIVE_CHUNK_S", 86400):
+            from netai.timetravel.demo.window import TimeWindowUI
+
+            # 주간 파일 2개 (week_01 = 3/27 09시 ~ 4/2, week_02 = 4/3 ~ 4/5 09시)
+            files = synthetic_fms.generate(directory, sensors=4, days=9, start=datetime.datetime(2025, 3, 27),
+                                           formats=('parquet',), seed=1)['files']
+            controller = optimized_controller.OptimizedTimeController()
+            controller.set_stage_writer(RecordingStageWriter())
+            window = TimeWindowUI(controller)
+
+            # week_02 읽기를 붙잡아 두어 앞부분만 로딩된 상태를 만듦
+            release = threading.Event()
+            read = controller._read_parquet_table
+
+            def held_read(file_path, start_time, end_time, gaps=None):
+                if file_path == files[1]:
+                    release.wait(10.0)
+                return read(file_path, start_time, end_time, gaps)
+            controller._read_parquet_table = held_read
+            try:
+                start, end = datetime.datetime(2025, 4, 1), datetime.datetime(2025, 4, 5)
+                controller.set_time_range(start, end)
+                self.assertTrue(_wait_for(lambda: controller.get_loaded_through() is not None))
+                window.update_ui()
+                self.assertEqual(len(window._loaded_regions), 1)
+                region_start, region_end = window._loaded_regions[0]
+                self.assertEqual(region_start, 0.0)
+                self.assertTrue(0.0 < region_end < 1.0, window._loaded_regions)
+
+                # 슬라이더 스크럽은 로딩된 앞부분 안에서 바로 동작
+                window._on_slider_changed(mock.Mock(get_value_as_float=lambda: 0.9))
+                self.assertLessEqual(controller.get_current_time(), controller.get_loaded_through())
+                self.assertGreater(controller.get_current_time(), start)
+
+                release.set()
+                self.assertTrue(_wait_for(lambda: not controller.is_loading()))
+                window.update_ui()
+                self.assertEqual(window._loaded_regions, [(0.0, 1.0)])
+            finally:
+                release.set()
+                window.destroy()
+                controller.on_shutdown()
@@ -0,0 +1,288 @@
+# -*- coding: utf-8 -*-
+"""
+Pipeline tracing spans: timed sections of the frame / seek pipeline delivered to
+subscribers, and a bounded recorder that exports them as Chrome trace-event JSON
+"""
+import functools
+import json
+import os
+import threading
+import time
+from collections import namedtuple
+
+from .ringlog import logger
+
+# 파이프라인 구간 이름 (생산자와 구독자가 같은 상수를 사용)
+FRAME = 'frame'            # 재생 프레임 하나 (TimeController.update / TimelineEngine.tick)
+ADVANCE = 'advance'        # 재생 시계 이동
+SEEK = 'seek'              # set_current_time (Go To / 이벤트 이동)
+SCRUB = 'scrub'            # set_progress (타임 슬라이더)
+GOTO = 'goto'              # Go 버튼 처리 전체 (UI 갱신 포함)
+RESOLVE = 'resolve'        # 현재 시각의 전체 랙 상태 조회
+DIFF = 'diff'              # 마지막 적용 시각 이후 바뀐 센서 계산
+COLORMAP = 'colormap'      # 온도 -> 색 계산 + 컬러맵 prim 쓰기 (랙 하나)
+USD_APPLY = 'usd_apply'    # 랙 속성/메타데이터 쓰기
+USD_TIME = 'usd_time'      # 타임라인 / TimeManager 시간 쓰기
+UI_REFRESH = 'ui_refresh'  # Time Window 갱신
+# 로더 스레드 구간 (OptimizedTimeController의 executor 작업)
+LOAD_RANGE = 'load_range'  # 시간 범위 하나 로딩 (구간 로더 스레드)
+LOAD_TILE = 'load_tile'    # 타임 타일 하나 로딩
+LOAD_FILE = 'load_file'    # parquet 파일 하나 읽기
+INDEX_BUILD = 'index_build'  # 로딩 후 집계 인덱스 재빌드
+LOADER_SPANS = (LOAD_RANGE, LOAD_TILE, LOAD_FILE, INDEX_BUILD)
+SPAN_NAMES = (FRAME, ADVANCE, SEEK, SCRUB, GOTO, RESOLVE, DIFF, COLORMAP, USD_APPLY, USD_TIME, UI_REFRESH) + LOADER_SPANS
+
+
+class Span(namedtuple('Span', 'name start_ns end_ns thread_id args')):
+    """One finished span: perf_counter_ns bounds, the thread that ran it and optional args"""
+
+    __slots__ = ()
+
+    @property
+    def duration_ms(self):
+        return (self.end_ns - self.start_ns) / 1e6
+
+
+class _NullSpan:
+    """What span() hands out while nobody listens - entering and leaving does nothing"""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _ActiveSpan:
+    __slots__ = ('_tracer', 'name', 'args', '_start')
+
+    def __init__(self, tracer, name, args):
+        self._tracer = tracer
+        self.name = name
+        self.args = args
+
+    def __enter__(self):
+        self._start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._tracer._finish(Span(self.name, self._start, time.perf_counter_ns(), threading.get_ident(), self.args))
+        return False
+
+
+class Tracer:
+    """
+    Times named sections of the pipeline and hands each finished Span to
+    the subscribed callbacks.
+
+    While nothing is subscribed `enabled` is False and span() returns a
+    shared no-op context manager, so an instrumented section costs one
+    method call. Code that would build span args, or that runs per rack,
+    should guard on the flag (`if tracer.enabled:`) like the logger's
+    debug_enabled. Callbacks run on the thread that finished the span,
+    children before their parents; an exception in one is logged and
+    does not reach the traced code.
+    """
+
+    def __init__(self):
+        self._subscribers = ()
+        self._lock = threading.Lock()
+        self.enabled = False
+
+    def span(self, name, args=None):
+        """Context manager timing the enclosed block as `name`"""
+        if not self.enabled:
+            return _NULL_SPAN
+        return _ActiveSpan(self, name, args)
+
+    def traced(self, name):
+        """Decorator timing every call of the function as `name` (one extra call while disabled)"""
+        def decorate(fn):
+            @functools.wraps(fn)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return fn(*args, **kwargs)
+                with _ActiveSpan(self, name, None):
+                    return fn(*args, **kwargs)
+            return wrapper
+        return decorate
+
+    def subscribe(self, callback):
+        """Deliver every finished Span to callback(span) until unsubscribed"""
+        with self._lock:
+            if callback not in self._subscribers:
+                # 새 튜플로 교체 - _finish는 락 없이 스냅샷을 순회
+                self._subscribers = self._subscribers + (callback,)
+            self.enabled = True
+        return callback
+
+    def unsubscribe(self, callback):
+        with self._lock:
+            self._subscribers = tuple(s for s in self._subscribers if s != callback)
+            self.enabled = bool(self._subscribers)
+
+    def subscriber_count(self):
+        return len(self._subscribers)
+
+    def _finish(self, span):
+        for callback in self._subscribers:
+            try:
+                callback(span)
+            except Exception as e:
+                logger.error("트레이스 구독자 오류 (%s): %s", span.name, e)
+
+
+# 확장 전체에서 공유하는 트레이서
+tracer = Tracer()
+
+
+class TraceRecorder:
+    """
+    Records the spans finished during a time window and writes them as
+    Chrome trace-event JSON (chrome://tracing, ui.perfetto.dev).
+
+    start(seconds) subscribes to the tracer; the recording ends with
+    stop() or at the deadline, noticed by the first span finishing after
+    it or by reading recording / spans() / get_stats(), so an idle
+    session does not stay subscribed. Spans are kept in a ring of
+    `capacity` entries, so a long recording keeps the newest spans and
+    counts the rest as dropped. Spans finish on any thread (loader
+    executors included), so the sequence number and the slot are taken
+    under one lock. Every thread gets its own track, named after the
+    thread; spans that began before start() are skipped.
+    """
+
+    def __init__(self, source=None, capacity=200_000):
+        if capacity < 1:
+            raise ValueError(f"capacity must be >= 1, got {capacity}")
+        self._tracer = source if source is not None else tracer
+        self.capacity = int(capacity)
+        self._slots = [None] * self.capacity
+        self._count = 0
+        self._lock = threading.Lock()
+        self._thread_names = {}
+        self._start_ns = None
+        self._stop_ns = None
+        self._deadline_ns = None
+        self._recording = False
+
+    def start(self, seconds=None):
+        """Clear and record until stop() or for `seconds` (None: until stop())"""
+        if seconds is not None and seconds <= 0:
+            raise ValueError(f"seconds must be > 0, got {seconds}")
+        self.stop()
+        with self._lock:
+            self._slots = [None] * self.capacity
+            self._count = 0
+            self._thread_names = {threading.get_ident(): threading.current_thread().name}
+            self._start_ns = time.perf_counter_ns()
+            self._stop_ns = None
+            self._deadline_ns = self._start_ns + int(seconds * 1e9) if seconds is not None else None
+            self._recording = True
+        self._tracer.subscribe(self._on_span)
+        return self
+
+    @property
+    def recording(self):
+        self._check_deadline()
+        return self._recording
+
+    def stop(self, stop_ns=None):
+        with self._lock:
+            if not self._recording:
+                return
+            self._recording = False
+            self._stop_ns = stop_ns if stop_ns is not None else time.perf_counter_ns()
+        self._tracer.unsubscribe(self._on_span)
+
+    def _check_deadline(self, now_ns=None):
+        """Stop (as of the deadline) once it has passed; True when stopped by it"""
+        if self._deadline_ns is None or not self._recording:
+            return False
+        if (now_ns if now_ns is not None else time.perf_counter_ns()) <= self._deadline_ns:
+            return False
+        self.stop(self._deadline_ns)
+        return True
+
+    def _on_span(self, span):
+        if self._check_deadline(span.end_ns) or span.start_ns < self._start_ns:
+            return
+        # 콜백은 스팬을 끝낸 스레드에서 실행됨 (로더 풀 포함) - 번호 확보와 슬롯 쓰기를 한 번에
+        with self._lock:
+            if not self._recording:
+                return
+            if span.thread_id not in self._thread_names:
+                self._thread_names[span.thread_id] = threading.current_thread().name
+            self._slots[self._count % self.capacity] = span
+            self._count += 1
+
+    def spans(self):
+        """Recorded spans, oldest first"""
+        self._check_deadline()
+        with self._lock:
+            count = self._count
+            if count <= self.capacity:
+                slots = self._slots[:count]
+            else:
+                start = count % self.capacity
+                slots = self._slots[start:] + self._slots[:start]
+        return [span for span in slots if span is not None]
+
+    def get_stats(self):
+        recording = self.recording
+        with self._lock:
+            count = self._count
+            threads = len(self._thread_names)
+        end_ns = self._stop_ns if self._stop_ns is not None else time.perf_counter_ns()
+        return {
+            'recording': recording,
+            'capacity': self.capacity,
+            'recorded': count,
+            'buffered': min(count, self.capacity),
+            'dropped': max(0, count - self.capacity),
+            'threads': threads,
+            'seconds': (end_ns - self._start_ns) / 1e9 if self._start_ns is not None else 0.0,
+        }
+
+    def trace_events(self):
+        """Chrome trace-event dicts: thread name metadata, then one complete ('X') event per span"""
+        pid = os.getpid()
+        main_id = threading.main_thread().ident
+        events = [{'name': 'process_name', 'ph': 'M', 'pid': pid, 'tid': 0,
+                   'args': {'name': 'netai.timetravel.demo'}}]
+        with self._lock:
+            thread_names = list(self._thread_names.items())
+        for thread_id, name in thread_names:
+            events.append({'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': thread_id, 'args': {'name': name}})
+            # 메인(프레임 파이프라인) 트랙을 맨 위에
+            events.append({'name': 'thread_sort_index', 'ph': 'M', 'pid': pid, 'tid': thread_id,
+                           'args': {'sort_index': 0 if thread_id == main_id else 1}})
+        origin = self._start_ns or 0
+        # 같은 시작 시각이면 바깥(긴) 스팬이 먼저
+        for span in sorted(self.spans(), key=lambda span: (span.start_ns, -span.end_ns)):
+            event = {
+                'name': span.name,
+                'cat': 'loader' if span.name in LOADER_SPANS else 'pipeline',
+                'ph': 'X',
+                'ts': (span.start_ns - origin) / 1000,
+                'dur': (span.end_ns - span.start_ns) / 1000,
+                'pid': pid,
+                'tid': span.thread_id,
+            }
+            if span.args:
+                event['args'] = span.args
+            events.append(event)
+        return events
+
+    def export(self, path):
+        """Write the trace JSON file; returns the number of span events written"""
+        events = self.trace_events()
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms', 'otherData': self.get_stats()},
+                      f, default=str)
+        return sum(1 for event in events if event['ph'] == 'X')
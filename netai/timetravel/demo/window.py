@@ -3,6 +3,8 @@ import omni.ui as ui
 import datetime
 import omni.usd
 from pxr import Usd, UsdGeom
+
+from .tracing import GOTO, UI_REFRESH, tracer
 #------------------------------------
 # 세로로 콤팩트하게 정열
 #------------------------------------
@@ -15,6 +17,15 @@ class TimeWindowUI:
         self._selected_rack_path = None
         self._selected_rack_data = None
         
+        # 로딩된 구간 (progress 비율) - progressive loading 미지원 컨트롤러는 전체 로딩으로 간주
+        self._loaded_regions = self._get_loaded_regions()
+        
+        # 선택 랙의 구간 통계 - (랙, 시작, 끝, 로딩 구간)이 바뀔 때만 다시 조회
+        self._range_stats_key = None
+        
+        # 코드에서 슬라이더를 맞추는 중 (값 변경 콜백이 set_progress로 다시 전체 적용하지 않도록)
+        self._syncing_slider = False
+        
         # 윈도우 생성
         self._window = ui.Window("Time Travel", width=550, height=500)
         
@@ -125,6 +136,12 @@ class TimeWindowUI:
                     self._speed_field = ui.FloatField(width=40)
                     self._speed_field.model.set_value(self._controller.get_playback_speed())
                     self._speed_field.model.add_end_edit_fn(self._on_speed_changed)
+                    ui.Spacer(width=10)
+                    # 값이 바뀐 다음/이전 시점으로 이동 (랙 선택 시 해당 랙 기준)
+                    self._prev_event_button = ui.Button("< Event", width=60)
+                    self._prev_event_button.set_clicked_fn(lambda: self._on_event_clicked(forward=False))
+                    self._next_event_button = ui.Button("Event >", width=60)
+                    self._next_event_button.set_clicked_fn(lambda: self._on_event_clicked(forward=True))
                 
                 # 3. 수평선 추가하여 섹션 구분
                 with ui.HStack(height=5):
@@ -174,6 +191,19 @@ class TimeWindowUI:
                                 self._hot_humidity_label = ui.Label("N/A", width=50)
                                 ui.Label("%", width=30)
                 
+                # 선택 랙의 현재 시간 범위 통계 (range index에서 바로 조회)
+                with ui.CollapsableFrame("Range Stats", height=70):
+                    with ui.VStack(spacing=5):
+                        with ui.HStack(height=20):
+                            ui.Label("Cold Temp:", width=85)
+                            self._cold_stats_label = ui.Label("N/A")
+                        with ui.HStack(height=20):
+                            ui.Label("Hot Temp:", width=85)
+                            self._hot_stats_label = ui.Label("N/A")
+                        with ui.HStack(height=20):
+                            ui.Label("Samples:", width=85)
+                            self._stats_count_label = ui.Label("N/A")
+                
                 # 5. 수평선 추가하여 섹션 구분
                 with ui.HStack(height=2):
                     ui.Spacer(width=10)
@@ -193,6 +223,13 @@ class TimeWindowUI:
                     # 오른쪽 여백
                     ui.Spacer(width=20)
                 
+                # 로딩된 구간 표시 (슬라이더 바로 아래)
+                with ui.HStack(height=4):
+                    ui.Spacer(width=10)
+                    self._loaded_regions_frame = ui.Frame(width=480)
+                    self._loaded_regions_frame.set_build_fn(self._build_loaded_regions)
+                    ui.Spacer(width=20)
+                
                 # 7. 데이터 요약 - 슬라이더 아래에 배치
                 with ui.HStack(height=10):
                     ui.Spacer(width=10)
@@ -203,6 +240,28 @@ class TimeWindowUI:
                     self._sensor_count_label = ui.Label(f"{self._controller.get_sensor_count()}", width=40)
                     ui.Spacer(width=10)
     
+    def _get_loaded_regions(self):
+        """Loaded parts of the time range as (start, end) progress fractions"""
+        get_regions = getattr(self._controller, "get_loaded_regions", None)
+        if get_regions is None:
+            return [(0.0, 1.0)]
+        return get_regions()
+    
+    def _build_loaded_regions(self):
+        """Draw the loaded regions strip under the slider"""
+        with ui.ZStack():
+            ui.Rectangle(style={"background_color": 0xFF333333})
+            with ui.HStack():
+                cursor = 0.0
+                for start, end in self._loaded_regions:
+                    if start > cursor:
+                        ui.Spacer(width=ui.Fraction(start - cursor))
+                    ui.Rectangle(width=ui.Fraction(max(end - max(start, cursor), 0.001)),
+                                 style={"background_color": 0xFF50AF4C})
+                    cursor = max(cursor, end)
+                if cursor < 1.0:
+                    ui.Spacer(width=ui.Fraction(1.0 - cursor))
+    
     def _setup_selection_listener(self):
         """선택 이벤트 리스너 설정"""
         # Omniverse 2023 버전 이상에서는 스테이지 이벤트를 사용
@@ -326,6 +385,30 @@ class TimeWindowUI:
         # 선택된 랙이 없거나 데이터를 찾을 수 없는 경우 UI 초기화
         self._clear_sensor_data_display()
     
+    def _update_range_stats(self):
+        """Show min/mean/max of the selected rack over the active time range"""
+        range_stats = getattr(self._controller, "range_stats", None)
+        key = (self._selected_rack_path, self._controller.get_start_time(),
+               self._controller.get_end_time(), tuple(self._loaded_regions))
+        if key == self._range_stats_key:
+            return
+        self._range_stats_key = key
+        
+        stats = range_stats(self._selected_rack_path) if range_stats and self._selected_rack_path else None
+        if not stats:
+            self._cold_stats_label.text = "N/A"
+            self._hot_stats_label.text = "N/A"
+            self._stats_count_label.text = "N/A"
+            return
+        
+        def _format(channel):
+            return (f"min {stats['min'][channel]:.2f} / mean {stats['mean'][channel]:.2f} / "
+                    f"max {stats['max'][channel]:.2f} °C  (time avg {stats['time_weighted_mean'][channel]:.2f})")
+        
+        self._cold_stats_label.text = _format("temperature_cold")
+        self._hot_stats_label.text = _format("temperature_hot")
+        self._stats_count_label.text = f"{stats['count']} over {stats['duration_s'] / 3600:.1f} h"
+    
     def _clear_sensor_data_display(self):
         """센서 데이터 표시 초기화"""
         self._cold_temp_label.text = "N/A"
@@ -376,45 +459,63 @@ class TimeWindowUI:
     
     def _on_goto_clicked(self):
         """Go to specific time handler"""
-        try:
-            # 년/월/일/시/분/초 모두 사용하여 새 시간 생성
-            goto_time = datetime.datetime(
-                self._goto_year.model.get_value_as_int(),
-                self._goto_month.model.get_value_as_int(),
-                self._goto_day.model.get_value_as_int(),
-                self._goto_hour.model.get_value_as_int(),
-                self._goto_minute.model.get_value_as_int(),
-                self._goto_second.model.get_value_as_int()
-            )
+        with tracer.span(GOTO):
+            try:
+                # 년/월/일/시/분/초 모두 사용하여 새 시간 생성
+                goto_time = datetime.datetime(
+                    self._goto_year.model.get_value_as_int(),
+                    self._goto_month.model.get_value_as_int(),
+                    self._goto_day.model.get_value_as_int(),
+                    self._goto_hour.model.get_value_as_int(),
+                    self._goto_minute.model.get_value_as_int(),
+                    self._goto_second.model.get_value_as_int()
+                )
             
-            # 시간 범위 내에 있는지 확인
-            start_time = self._controller.get_start_time()
-            end_time = self._controller.get_end_time()
+                # 시간 범위 내에 있는지 확인
+                start_time = self._controller.get_start_time()
+                end_time = self._controller.get_end_time()
             
-            # 시간 범위 체크
-            if goto_time < start_time:
-                print("[netai.timetravel.demo] Error: Time is before start range")
-                goto_time = start_time
-            elif goto_time > end_time:
-                print("[netai.timetravel.demo] Error: Time is after end range")
-                goto_time = end_time
+                # 시간 범위 체크
+                if goto_time < start_time:
+                    print("[netai.timetravel.demo] Error: Time is before start range")
+                    goto_time = start_time
+                elif goto_time > end_time:
+                    print("[netai.timetravel.demo] Error: Time is after end range")
+                    goto_time = end_time
             
-            # 컨트롤러에 시간 설정
-            self._controller.set_current_time(goto_time)
+                # 컨트롤러에 시간 설정
+                self._controller.set_current_time(goto_time)
             
-            # 슬라이더 업데이트
-            self._time_slider.model.set_value(self._controller.get_progress())
+                # 슬라이더 업데이트
+                self._sync_slider(self._controller.get_progress())
 
-            # UI 업데이트
-            self._update_selected_rack_data()
+                # UI 업데이트
+                self._update_selected_rack_data()
+            
+            except Exception as e:
+                print(f"[netai.timetravel.demo] Error setting specific time: {e}")
+    
+    def _on_event_clicked(self, forward):
+        """Jump to the next/previous time a sensor (the selected rack's, if any) reported a new value"""
+        find_event = getattr(self._controller, "next_event" if forward else "prev_event", None)
+        if find_event is None:
+            return
+        try:
+            event_time = find_event(self._controller.get_current_time(), self._selected_rack_path)
+            if event_time is None:
+                print("[netai.timetravel.demo] No change event in that direction")
+                return
             
+            self._controller.set_current_time(event_time)
+            self._sync_slider(self._controller.get_progress())
+            self._update_selected_rack_data()
         except Exception as e:
-            print(f"[netai.timetravel.demo] Error setting specific time: {e}")
+            print(f"[netai.timetravel.demo] Error jumping to change event: {e}")
     
     def _on_present_clicked(self):
         """Present button click handler"""
         self._controller.set_to_present()
-        self._time_slider.model.set_value(1.0)
+        self._sync_slider(1.0)
     
     def _on_play_clicked(self):
         """Play button click handler"""
@@ -424,8 +525,18 @@ class TimeWindowUI:
         else:
             self._play_button.text = "Play"
     
+    def _sync_slider(self, progress):
+        """Move the slider to the controller's position without re-applying it as a scrub"""
+        self._syncing_slider = True
+        try:
+            self._time_slider.model.set_value(progress)
+        finally:
+            self._syncing_slider = False
+    
     def _on_slider_changed(self, model):
         """Slider value change handler"""
+        if self._syncing_slider:
+            return
         # if not self._controller.is_playing():  # Only update when not playing
         progress = model.get_value_as_float()
         self._controller.set_progress(progress)
@@ -439,24 +550,34 @@ class TimeWindowUI:
     
     def update_ui(self):
         """Update UI elements"""
-        # Update stage time display
-        stage_time = self._controller.get_stage_time()
-        self._stage_time_label.text = stage_time
+        with tracer.span(UI_REFRESH):
+            # Update stage time display
+            stage_time = self._controller.get_stage_time()
+            self._stage_time_label.text = stage_time
         
-        # Update time slider when playing
-        if self._controller.is_playing():
-            self._time_slider.model.set_value(self._controller.get_progress())
+            # Update time slider when playing
+            if self._controller.is_playing():
+                self._sync_slider(self._controller.get_progress())
         
-        # Update play button text
-        if self._controller.is_playing():
-            self._play_button.text = "Pause"
-        else:
-            self._play_button.text = "Play"
+            # Update play button text
+            if self._controller.is_playing():
+                self._play_button.text = "Pause"
+            else:
+                self._play_button.text = "Play"
             
-        # Update rack data if a rack is selected
-        if self._selected_rack_path:
-            self._update_selected_rack_data()
+            # Update rack data if a rack is selected
+            if self._selected_rack_path:
+                self._update_selected_rack_data()
+        
+            # Update loaded regions strip (로딩 중에만 변함)
+            regions = self._get_loaded_regions()
+            if regions != self._loaded_regions:
+                self._loaded_regions = regions
+                self._loaded_regions_frame.rebuild()
+        
+            # Update range stats (키가 바뀔 때만 조회 - 프레임마다 스캔하지 않음)
+            self._update_range_stats()
         
-        # Update rack and sensor counts
-        self._rack_count_label.text = f"{self._controller.get_rack_count()}"
-        self._sensor_count_label.text = f"{self._controller.get_sensor_count()}"
\ No newline at end of file
+            # Update rack and sensor counts
+            self._rack_count_label.text = f"{self._controller.get_rack_count()}"
+            self._sensor_count_label.text = f"{self._controller.get_sensor_count()}"
\ No newline at end of file